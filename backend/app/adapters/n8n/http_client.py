@@ -0,0 +1,143 @@
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+import random
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Méthodes rejouables sans effet de bord supplémentaire
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Réponses transitoires de n8n ou du proxy devant lui
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class N8nHttpClient:
+    """
+    Client HTTP asynchrone partagé pour l'API n8n
+
+    - pool de connexions keep-alive (une connexion TCP réutilisée entre les appels)
+    - délai par défaut et délai spécifique par appel (ex. exécution de workflow)
+    - nombre de requêtes simultanées borné par un sémaphore
+    - reprises avec backoff exponentiel à jitter complet, uniquement pour les méthodes idempotentes
+    """
+
+    def __init__(self, base_url: Optional[str] = None, headers: Optional[Dict[str, str]] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                 max_connections: Optional[int] = None, max_keepalive_connections: Optional[int] = None,
+                 max_concurrency: Optional[int] = None, max_retries: Optional[int] = None,
+                 retry_backoff: Optional[float] = None, retry_max_backoff: Optional[float] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.base_url = base_url or settings.N8N_URL
+        self.headers = headers if headers is not None else self.default_headers()
+        self.connect_timeout = connect_timeout if connect_timeout is not None else settings.N8N_CONNECT_TIMEOUT
+        self.read_timeout = read_timeout if read_timeout is not None else settings.N8N_READ_TIMEOUT
+        self.max_connections = max_connections or settings.N8N_MAX_CONNECTIONS
+        self.max_keepalive_connections = max_keepalive_connections or settings.N8N_MAX_KEEPALIVE_CONNECTIONS
+        self.max_retries = max_retries if max_retries is not None else settings.N8N_MAX_RETRIES
+        self.retry_backoff = retry_backoff if retry_backoff is not None else settings.N8N_RETRY_BACKOFF
+        self.retry_max_backoff = retry_max_backoff if retry_max_backoff is not None else settings.N8N_RETRY_MAX_BACKOFF
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_concurrency or settings.N8N_MAX_CONCURRENCY)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def default_headers() -> Dict[str, str]:
+        """En-têtes communs aux appels n8n (clé d'API si configurée)"""
+        headers = {"Content-Type": "application/json"}
+        if settings.N8N_API_KEY:
+            headers["X-N8N-API-KEY"] = settings.N8N_API_KEY
+        return headers
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Client httpx sous-jacent, créé à la première utilisation"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections
+                ),
+                transport=self._transport
+            )
+        return self._client
+
+    async def request(self, method: str, url: str, timeout: Optional[float] = None,
+                      retry: Optional[bool] = None, **kwargs: Any) -> httpx.Response:
+        """
+        Envoie une requête à n8n
+
+        Args:
+            method: Méthode HTTP
+            url: Chemin relatif à l'URL de n8n, ou URL absolue (webhooks)
+            timeout: Délai de lecture spécifique à cet appel (par défaut read_timeout)
+            retry: Forcer ou interdire les reprises (par défaut : méthodes idempotentes uniquement)
+            **kwargs: Arguments transmis à httpx (json, params...)
+
+        Returns:
+            Dernière réponse reçue
+
+        Raises:
+            httpx.HTTPError si n8n reste injoignable après les reprises
+        """
+        method = method.upper()
+        if retry is None:
+            retry = method in IDEMPOTENT_METHODS
+        attempts = 1 + (self.max_retries if retry else 0)
+        request_timeout: Any = httpx.USE_CLIENT_DEFAULT
+        if timeout is not None:
+            request_timeout = httpx.Timeout(timeout, connect=self.connect_timeout)
+
+        for attempt in range(attempts):
+            try:
+                async with self._semaphore:
+                    response = await self.client.request(method, url, timeout=request_timeout, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == attempts - 1:
+                    raise
+                logger.warning(f"Appel n8n {method} {url} en échec ({e!r}), nouvelle tentative")
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == attempts - 1:
+                    return response
+                await response.aclose()
+                logger.warning(f"Appel n8n {method} {url} : statut {response.status_code}, nouvelle tentative")
+
+            await asyncio.sleep(self.backoff_delay(attempt))
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Délai avant la tentative suivante : backoff exponentiel à jitter complet"""
+        return random.uniform(0, min(self.retry_max_backoff, self.retry_backoff * (2 ** attempt)))
+
+    async def aclose(self) -> None:
+        """Ferme les connexions du pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Client partagé par le processus
+_n8n_http_client: Optional[N8nHttpClient] = None
+
+
+def get_n8n_http_client() -> N8nHttpClient:
+    """
+    Factory pour l'injection de dépendance du client HTTP n8n partagé
+    """
+    global _n8n_http_client
+    if _n8n_http_client is None:
+        _n8n_http_client = N8nHttpClient()
+    return _n8n_http_client
+
+
+async def close_n8n_http_client() -> None:
+    """Ferme le client HTTP n8n partagé (arrêt de l'application)"""
+    global _n8n_http_client
+    if _n8n_http_client is not None:
+        await _n8n_http_client.aclose()
+    _n8n_http_client = None
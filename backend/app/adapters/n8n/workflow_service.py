@@ -1,27 +1,44 @@
 from typing import Dict, Any, Optional, List
-import requests
-import json
+import httpx
 import os
 from fastapi import HTTPException, status
 
 from app.core.interfaces.n8n_integration_service import N8nIntegrationService
 from app.core.config import settings
+from app.adapters.n8n.http_client import N8nHttpClient, get_n8n_http_client
 
 class N8nWorkflowService(N8nIntegrationService):
     """
     Service d'intégration avec n8n pour l'exécution de workflows
     """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[N8nHttpClient] = None):
         self.n8n_base_url = f"http://{settings.N8N_HOST}:{settings.N8N_PORT}"
         self.api_key = settings.N8N_API_KEY
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        # Client partagé : connexions keep-alive réutilisées entre les instances du service
+        self.http_client = http_client or get_n8n_http_client()
+        self.headers = self.http_client.headers
+    
+    async def _request(self, method: str, url: str, error_message: str, connection_error_message: str,
+                       expected_status: tuple = (200,), timeout: Optional[float] = None,
+                       **kwargs: Any) -> httpx.Response:
+        """
+        Envoie une requête via le client partagé et convertit les erreurs en HTTPException
+        """
+        try:
+            response = await self.http_client.request(method, url, timeout=timeout, **kwargs)
+        except httpx.HTTPError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{connection_error_message}: {str(e)}"
+            )
         
-        # Ajouter l'API key si elle est configurée
-        if self.api_key:
-            self.headers["X-N8N-API-KEY"] = self.api_key
+        if response.status_code not in expected_status:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{error_message}: {response.text}"
+            )
+        return response
     
     async def execute_workflow(self, workflow_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -34,27 +51,14 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Résultat de l'exécution du workflow
         """
-        url = f"{self.n8n_base_url}/api/v1/workflows/{workflow_id}/execute"
-        
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json={"data": data}
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de l'exécution du workflow n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        response = await self._request(
+            "POST", f"/api/v1/workflows/{workflow_id}/execute",
+            "Erreur lors de l'exécution du workflow n8n",
+            "Erreur de connexion à n8n",
+            timeout=settings.N8N_EXECUTE_TIMEOUT,
+            json={"data": data}
+        )
+        return response.json()
     
     async def trigger_webhook(self, webhook_url: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -67,25 +71,15 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Résultat du déclenchement du webhook
         """
-        try:
-            response = requests.post(
-                webhook_url,
-                headers=self.headers,
-                json=data
-            )
-            
-            if response.status_code in [200, 201]:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors du déclenchement du webhook n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion au webhook n8n: {str(e)}"
-            )
+        response = await self._request(
+            "POST", webhook_url,
+            "Erreur lors du déclenchement du webhook n8n",
+            "Erreur de connexion au webhook n8n",
+            expected_status=(200, 201),
+            timeout=settings.N8N_EXECUTE_TIMEOUT,
+            json=data
+        )
+        return response.json()
     
     async def get_workflows(self) -> List[Dict[str, Any]]:
         """
@@ -94,26 +88,12 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Liste des workflows n8n
         """
-        url = f"{self.n8n_base_url}/api/v1/workflows"
-        
-        try:
-            response = requests.get(
-                url,
-                headers=self.headers
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de la récupération des workflows n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        response = await self._request(
+            "GET", "/api/v1/workflows",
+            "Erreur lors de la récupération des workflows n8n",
+            "Erreur de connexion à n8n"
+        )
+        return response.json()
     
     async def get_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """
@@ -125,26 +105,12 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Détails du workflow n8n
         """
-        url = f"{self.n8n_base_url}/api/v1/workflows/{workflow_id}"
-        
-        try:
-            response = requests.get(
-                url,
-                headers=self.headers
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de la récupération du workflow n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        response = await self._request(
+            "GET", f"/api/v1/workflows/{workflow_id}",
+            "Erreur lors de la récupération du workflow n8n",
+            "Erreur de connexion à n8n"
+        )
+        return response.json()
     
     async def create_workflow(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -156,27 +122,14 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Détails du workflow n8n créé
         """
-        url = f"{self.n8n_base_url}/api/v1/workflows"
-        
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=workflow_data
-            )
-            
-            if response.status_code in [200, 201]:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de la création du workflow n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        response = await self._request(
+            "POST", "/api/v1/workflows",
+            "Erreur lors de la création du workflow n8n",
+            "Erreur de connexion à n8n",
+            expected_status=(200, 201),
+            json=workflow_data
+        )
+        return response.json()
     
     async def update_workflow(self, workflow_id: str, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -189,27 +142,13 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Détails du workflow n8n mis à jour
         """
-        url = f"{self.n8n_base_url}/api/v1/workflows/{workflow_id}"
-        
-        try:
-            response = requests.put(
-                url,
-                headers=self.headers,
-                json=workflow_data
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de la mise à jour du workflow n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        response = await self._request(
+            "PUT", f"/api/v1/workflows/{workflow_id}",
+            "Erreur lors de la mise à jour du workflow n8n",
+            "Erreur de connexion à n8n",
+            json=workflow_data
+        )
+        return response.json()
     
     async def delete_workflow(self, workflow_id: str) -> bool:
         """
@@ -221,26 +160,13 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             True si la suppression a réussi, False sinon
         """
-        url = f"{self.n8n_base_url}/api/v1/workflows/{workflow_id}"
-        
-        try:
-            response = requests.delete(
-                url,
-                headers=self.headers
-            )
-            
-            if response.status_code in [200, 204]:
-                return True
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de la suppression du workflow n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        await self._request(
+            "DELETE", f"/api/v1/workflows/{workflow_id}",
+            "Erreur lors de la suppression du workflow n8n",
+            "Erreur de connexion à n8n",
+            expected_status=(200, 204)
+        )
+        return True
     
     async def get_workflow_executions(self, workflow_id: str) -> List[Dict[str, Any]]:
         """
@@ -252,27 +178,13 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Liste des exécutions du workflow
         """
-        url = f"{self.n8n_base_url}/api/v1/executions"
-        
-        try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params={"workflowId": workflow_id}
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de la récupération des exécutions du workflow n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        response = await self._request(
+            "GET", "/api/v1/executions",
+            "Erreur lors de la récupération des exécutions du workflow n8n",
+            "Erreur de connexion à n8n",
+            params={"workflowId": workflow_id}
+        )
+        return response.json()
     
     async def get_execution(self, execution_id: str) -> Dict[str, Any]:
         """
@@ -284,26 +196,12 @@ class N8nWorkflowService(N8nIntegrationService):
         Returns:
             Détails de l'exécution
         """
-        url = f"{self.n8n_base_url}/api/v1/executions/{execution_id}"
-        
-        try:
-            response = requests.get(
-                url,
-                headers=self.headers
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erreur lors de la récupération de l'exécution du workflow n8n: {response.text}"
-                )
-        except requests.RequestException as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erreur de connexion à n8n: {str(e)}"
-            )
+        response = await self._request(
+            "GET", f"/api/v1/executions/{execution_id}",
+            "Erreur lors de la récupération de l'exécution du workflow n8n",
+            "Erreur de connexion à n8n"
+        )
+        return response.json()
     
     async def process_cv(self, cv_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -352,7 +250,7 @@ class N8nWorkflowService(N8nIntegrationService):
         result = await self.execute_workflow(workflow_id, {"tender_id": tender_id})
         return result.get("matches", [])
     
-    async def initiate_collaboration(self, initiator_company_id: int, partner_company_id: int, 
+    async def initiate_collaboration(self, initiator_company_id: int, partner_company_id: int,
                                    terms: Dict[str, Any]) -> Dict[str, Any]:
         """
         Initie une collaboration entre deux entreprises via un workflow n8n
@@ -0,0 +1,275 @@
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import select, delete as sql_delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from fastapi import HTTPException, status
+
+from app.core.entities.consultant import Consultant, ConsultantCreate, ConsultantUpdate
+from app.adapters.repositories.consultant_repository import (
+    SKILL_PAIRS_VERSION_QUERY, SQLAlchemyConsultantRepository, skill_pairs_version_from_row
+)
+from app.adapters.repositories.pagination import apply_keyset, split_page
+from app.adapters.services.skill_index import SkillPairsVersion
+from app.infrastructure.database.models import Consultant as ConsultantModel
+from app.infrastructure.database.models import ConsultantSkill as ConsultantSkillModel
+from app.infrastructure.database.models import User as UserModel
+from app.infrastructure.database.models import Skill as SkillModel
+
+class AsyncSQLAlchemyConsultantRepository(SQLAlchemyConsultantRepository):
+    """
+    Implémentation SQLAlchemy asynchrone (AsyncSession) du repository pour les consultants
+
+    Mêmes requêtes, filtres et mapping que SQLAlchemyConsultantRepository,
+    mais chaque accès à la base est réellement attendu sans bloquer la boucle d'événements.
+    """
+
+    def _select(self):
+        """Requête de base avec chargement anticipé de l'utilisateur et des compétences"""
+        return select(ConsultantModel).options(
+            joinedload(ConsultantModel.user),
+            selectinload(ConsultantModel.consultant_skills).joinedload(ConsultantSkillModel.skill)
+        )
+
+    async def _fetch_all(self, statement) -> List[ConsultantModel]:
+        result = await self.db.execute(statement)
+        return list(result.scalars().unique().all())
+
+    async def _fetch_one(self, statement) -> Optional[ConsultantModel]:
+        result = await self.db.execute(statement)
+        return result.scalars().unique().first()
+
+    async def get_all(self) -> List[Consultant]:
+        """Récupère tous les consultants"""
+        consultants = await self._fetch_all(self._select())
+        return [self._map_to_entity(consultant) for consultant in consultants]
+
+    async def get_page(self, company_id: Optional[int] = None, skill_id: Optional[int] = None,
+                       availability: Optional[bool] = None, cursor: Optional[str] = None,
+                       skip: int = 0, limit: int = 100) -> Tuple[List[Consultant], Optional[str]]:
+        """Récupère une page de consultants filtrée en SQL, triée par (created_at, id)"""
+        statement = self._select().where(*self._page_filters(company_id, skill_id, availability))
+        rows = await self._fetch_all(
+            apply_keyset(statement, ConsultantModel, cursor=cursor, limit=limit, skip=skip)
+        )
+        consultants, next_cursor = split_page(rows, limit)
+        return [self._map_to_entity(consultant) for consultant in consultants], next_cursor
+
+    async def get_by_id(self, consultant_id: int) -> Optional[Consultant]:
+        """Récupère un consultant par son ID"""
+        consultant = await self._fetch_one(self._select().where(ConsultantModel.id == consultant_id))
+        if not consultant:
+            return None
+        return self._map_to_entity(consultant)
+
+    async def get_by_ids(self, consultant_ids: List[int]) -> List[Consultant]:
+        """Récupère plusieurs consultants par leurs IDs (triés par ID)"""
+        if not consultant_ids:
+            return []
+        consultants = await self._fetch_all(
+            self._select().where(ConsultantModel.id.in_(consultant_ids)).order_by(ConsultantModel.id)
+        )
+        return [self._map_to_entity(consultant) for consultant in consultants]
+
+    async def get_skill_pairs(self) -> List[Tuple[int, int]]:
+        """Récupère tous les couples (skill_id, consultant_id) de consultant_skills"""
+        result = await self.db.execute(
+            select(ConsultantSkillModel.skill_id, ConsultantSkillModel.consultant_id)
+        )
+        return [(skill_id, consultant_id) for skill_id, consultant_id in result.all()]
+
+    async def get_skill_pairs_version(self) -> SkillPairsVersion:
+        """Empreinte additive de consultant_skills, modifiée par tout ajout ou suppression de couple"""
+        result = await self.db.execute(SKILL_PAIRS_VERSION_QUERY)
+        return skill_pairs_version_from_row(result.one())
+
+    async def get_by_user_id(self, user_id: int) -> Optional[Consultant]:
+        """Récupère un consultant par l'ID de son utilisateur"""
+        consultant = await self._fetch_one(self._select().where(ConsultantModel.user_id == user_id))
+        if not consultant:
+            return None
+        return self._map_to_entity(consultant)
+
+    async def get_by_company_id(self, company_id: int) -> List[Consultant]:
+        """Récupère tous les consultants d'une entreprise"""
+        consultants = await self._fetch_all(self._select().where(ConsultantModel.company_id == company_id))
+        return [self._map_to_entity(consultant) for consultant in consultants]
+
+    async def create(self, consultant: ConsultantCreate) -> Consultant:
+        """Crée un nouveau consultant"""
+        try:
+            # Vérifier que l'utilisateur existe seulement si un user_id est fourni
+            if consultant.user_id is not None:
+                user = await self.db.get(UserModel, consultant.user_id)
+                if not user:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="L'utilisateur n'existe pas"
+                    )
+
+            db_consultant = ConsultantModel(
+                user_id=consultant.user_id,
+                company_id=consultant.company_id,
+                title=consultant.title,
+                years_experience=consultant.experience_years,
+                status=consultant.availability_status,
+                availability_date=consultant.availability_date,
+                hourly_rate=consultant.hourly_rate,
+                daily_rate=consultant.daily_rate,
+                bio=consultant.bio,
+                photo_url=consultant.photo_url,
+                first_name=consultant.first_name,
+                last_name=consultant.last_name
+            )
+
+            self.db.add(db_consultant)
+            await self.db.commit()
+
+            return await self.get_by_id(db_consultant.id)
+        except IntegrityError:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Erreur lors de la création du consultant"
+            )
+
+    async def update(self, consultant_id: int, consultant: ConsultantUpdate) -> Optional[Consultant]:
+        """Met à jour un consultant existant"""
+        db_consultant = await self.db.get(ConsultantModel, consultant_id)
+        if not db_consultant:
+            return None
+
+        update_data = consultant.dict(exclude_unset=True)
+
+        for key, value in update_data.items():
+            setattr(db_consultant, key, value)
+
+        try:
+            await self.db.commit()
+            # Recharger avec les relations pour le mapping sans I/O
+            self.db.expunge(db_consultant)
+            return await self.get_by_id(consultant_id)
+        except IntegrityError:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Erreur lors de la mise à jour du consultant"
+            )
+
+    async def delete(self, consultant_id: int) -> bool:
+        """Supprime un consultant"""
+        db_consultant = await self.db.get(ConsultantModel, consultant_id)
+        if not db_consultant:
+            return False
+
+        # Les lignes d'association ne sont pas en cascade côté ORM (même ordre que la version synchrone)
+        await self.db.execute(
+            sql_delete(ConsultantSkillModel).where(ConsultantSkillModel.consultant_id == consultant_id)
+        )
+        await self.db.delete(db_consultant)
+        await self.db.commit()
+        return True
+
+    async def get_skills(self, consultant_id: int) -> List[Dict[str, Any]]:
+        """Récupère les compétences d'un consultant"""
+        result = await self.db.execute(
+            select(ConsultantSkillModel, SkillModel).join(
+                SkillModel, ConsultantSkillModel.skill_id == SkillModel.id
+            ).where(
+                ConsultantSkillModel.consultant_id == consultant_id
+            )
+        )
+
+        return [
+            {
+                "id": skill.id,
+                "name": skill.name,
+                "category": skill.category,
+                "description": skill.description,
+                "proficiency_level": consultant_skill.proficiency_level.value if consultant_skill.proficiency_level else None,
+                "years_experience": consultant_skill.years_experience,
+                "details": consultant_skill.details
+            }
+            for consultant_skill, skill in result.all()
+        ]
+
+    async def add_skill(self, consultant_id: int, skill_id: int, proficiency_level: str,
+                       years_experience: Optional[int] = None, details: Optional[str] = None) -> bool:
+        """Ajoute une compétence à un consultant"""
+        try:
+            if not await self.db.get(ConsultantModel, consultant_id):
+                return False
+
+            if not await self.db.get(SkillModel, skill_id):
+                return False
+
+            existing = await self.db.get(ConsultantSkillModel, (consultant_id, skill_id))
+
+            if existing:
+                existing.proficiency_level = proficiency_level
+                existing.years_experience = years_experience
+                existing.details = details
+            else:
+                self.db.add(ConsultantSkillModel(
+                    consultant_id=consultant_id,
+                    skill_id=skill_id,
+                    proficiency_level=proficiency_level,
+                    years_experience=years_experience,
+                    details=details
+                ))
+
+            await self.db.commit()
+            return True
+        except Exception:
+            await self.db.rollback()
+            return False
+
+    async def remove_skill(self, consultant_id: int, skill_id: int) -> bool:
+        """Supprime une compétence d'un consultant"""
+        result = await self.db.execute(
+            sql_delete(ConsultantSkillModel).where(
+                ConsultantSkillModel.consultant_id == consultant_id,
+                ConsultantSkillModel.skill_id == skill_id
+            )
+        )
+        if not result.rowcount:
+            return False
+
+        await self.db.commit()
+        return True
+
+    async def get_available_consultants(self) -> List[Consultant]:
+        """Récupère les consultants qualifiés et disponibles"""
+        consultants = await self._fetch_all(
+            self._select().where(*self._page_filters(None, None, True)).order_by(ConsultantModel.id)
+        )
+        return [self._map_to_entity(consultant) for consultant in consultants]
+
+    async def search_consultants(self, query: str, skills: Optional[List[int]] = None,
+                               company_id: Optional[int] = None,
+                               availability_status: Optional[str] = None) -> List[Consultant]:
+        """Recherche des consultants par critères"""
+        search = f"%{query}%"
+
+        statement = self._select().join(
+            UserModel, ConsultantModel.user_id == UserModel.id
+        ).where(
+            (UserModel.full_name.ilike(search)) |
+            (ConsultantModel.title.ilike(search)) |
+            (ConsultantModel.bio.ilike(search))
+        )
+
+        if company_id:
+            statement = statement.where(ConsultantModel.company_id == company_id)
+
+        if availability_status:
+            statement = statement.where(ConsultantModel.status == availability_status)
+
+        # Le consultant doit posséder chacune des compétences demandées
+        for skill_id in skills or []:
+            statement = statement.where(
+                ConsultantModel.consultant_skills.any(ConsultantSkillModel.skill_id == skill_id)
+            )
+
+        consultants = await self._fetch_all(statement)
+        return [self._map_to_entity(consultant) for consultant in consultants]
@@ -1,15 +1,35 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import and_, or_, not_, func, select, cast, BigInteger
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
-from datetime import datetime
+from datetime import date
 
 from app.core.interfaces.consultant_repository import ConsultantRepository
 from app.core.entities.consultant import Consultant, ConsultantCreate, ConsultantUpdate, AvailabilityStatus
 from app.infrastructure.database.models import Consultant as ConsultantModel
+from app.infrastructure.database.models import ConsultantStatus
 from app.infrastructure.database.models import ConsultantSkill as ConsultantSkillModel
 from app.infrastructure.database.models import User as UserModel
 from app.infrastructure.database.models import Skill as SkillModel
+from app.adapters.repositories.pagination import paginate
+from app.adapters.services.skill_index import PAIR_HASH_MULTIPLIER, PAIR_HASH_MODULUS, SkillPairsVersion
+
+# Empreinte additive de consultant_skills (voir SkillInvertedIndex) : nombre de couples,
+# sommes des identifiants et somme des hachages des couples
+SKILL_PAIRS_VERSION_QUERY = select(
+    func.count(),
+    func.coalesce(func.sum(ConsultantSkillModel.consultant_id), 0),
+    func.coalesce(func.sum(ConsultantSkillModel.skill_id), 0),
+    func.coalesce(func.sum(
+        (cast(ConsultantSkillModel.consultant_id, BigInteger) * PAIR_HASH_MULTIPLIER
+         + ConsultantSkillModel.skill_id) % PAIR_HASH_MODULUS
+    ), 0)
+)
+
+def skill_pairs_version_from_row(row: Tuple[Any, ...]) -> SkillPairsVersion:
+    """Empreinte de consultant_skills à partir du résultat de SKILL_PAIRS_VERSION_QUERY"""
+    return tuple(int(value) for value in row)
 
 class SQLAlchemyConsultantRepository(ConsultantRepository):
     """
@@ -19,29 +39,94 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
     def __init__(self, db: Session):
         self.db = db
     
+    def _query(self):
+        """
+        Requête de base avec chargement anticipé de l'utilisateur (jointure) et des compétences
+        (une requête consultant_skills + skills), soit un nombre constant de requêtes par liste
+        """
+        return self.db.query(ConsultantModel).options(
+            joinedload(ConsultantModel.user),
+            selectinload(ConsultantModel.consultant_skills).joinedload(ConsultantSkillModel.skill)
+        )
+    
     async def get_all(self) -> List[Consultant]:
         """Récupère tous les consultants"""
-        consultants = self.db.query(ConsultantModel).all()
-        return [await self._map_to_entity(consultant) for consultant in consultants]
+        consultants = self._query().all()
+        return [self._map_to_entity(consultant) for consultant in consultants]
+    
+    async def get_page(self, company_id: Optional[int] = None, skill_id: Optional[int] = None,
+                       availability: Optional[bool] = None, cursor: Optional[str] = None,
+                       skip: int = 0, limit: int = 100) -> Tuple[List[Consultant], Optional[str]]:
+        """
+        Récupère une page de consultants filtrée en SQL, triée par (created_at, id)
+        
+        Returns:
+            Tuple (consultants, curseur de la page suivante ou None)
+        """
+        query = self._query().filter(*self._page_filters(company_id, skill_id, availability))
+        consultants, next_cursor = paginate(query, ConsultantModel, cursor=cursor, limit=limit, skip=skip)
+        return [self._map_to_entity(consultant) for consultant in consultants], next_cursor
+    
+    @staticmethod
+    def _page_filters(company_id: Optional[int], skill_id: Optional[int],
+                      availability: Optional[bool]) -> List[Any]:
+        """Conditions SQL des filtres de liste (partagées avec le repository asynchrone)"""
+        conditions = []
+        
+        if company_id is not None:
+            conditions.append(ConsultantModel.company_id == company_id)
+        
+        if skill_id is not None:
+            conditions.append(ConsultantModel.consultant_skills.any(ConsultantSkillModel.skill_id == skill_id))
+        
+        if availability is not None:
+            # Même règle que get_available_consultants : qualifié et date de disponibilité passée ou non définie
+            available = and_(
+                ConsultantModel.status == ConsultantStatus.QUALIFIED,
+                or_(ConsultantModel.availability_date.is_(None), ConsultantModel.availability_date <= date.today())
+            )
+            conditions.append(available if availability else not_(available))
+        
+        return conditions
     
     async def get_by_id(self, consultant_id: int) -> Optional[Consultant]:
         """Récupère un consultant par son ID"""
-        consultant = self.db.query(ConsultantModel).filter(ConsultantModel.id == consultant_id).first()
+        consultant = self._query().filter(ConsultantModel.id == consultant_id).first()
         if not consultant:
             return None
-        return await self._map_to_entity(consultant)
+        return self._map_to_entity(consultant)
+    
+    async def get_by_ids(self, consultant_ids: List[int]) -> List[Consultant]:
+        """Récupère plusieurs consultants par leurs IDs (triés par ID)"""
+        if not consultant_ids:
+            return []
+        consultants = self._query().filter(
+            ConsultantModel.id.in_(consultant_ids)
+        ).order_by(ConsultantModel.id).all()
+        return [self._map_to_entity(consultant) for consultant in consultants]
+    
+    async def get_skill_pairs(self) -> List[Tuple[int, int]]:
+        """Récupère tous les couples (skill_id, consultant_id) de consultant_skills"""
+        rows = self.db.query(
+            ConsultantSkillModel.skill_id, ConsultantSkillModel.consultant_id
+        ).all()
+        return [(skill_id, consultant_id) for skill_id, consultant_id in rows]
+    
+    async def get_skill_pairs_version(self) -> SkillPairsVersion:
+        """Empreinte additive de consultant_skills, modifiée par tout ajout ou suppression de couple"""
+        return skill_pairs_version_from_row(self.db.execute(SKILL_PAIRS_VERSION_QUERY).one())
     
     async def get_by_user_id(self, user_id: int) -> Optional[Consultant]:
         """Récupère un consultant par l'ID de son utilisateur"""
-        consultant = self.db.query(ConsultantModel).filter(ConsultantModel.user_id == user_id).first()
+        consultant = self._query().filter(ConsultantModel.user_id == user_id).first()
         if not consultant:
             return None
-        return await self._map_to_entity(consultant)
+        return self._map_to_entity(consultant)
     
     async def get_by_company_id(self, company_id: int) -> List[Consultant]:
         """Récupère tous les consultants d'une entreprise"""
-        consultants = self.db.query(ConsultantModel).filter(ConsultantModel.company_id == company_id).all()
-        return [await self._map_to_entity(consultant) for consultant in consultants]
+        consultants = self._query().filter(ConsultantModel.company_id == company_id).all()
+        return [self._map_to_entity(consultant) for consultant in consultants]
     
     async def create(self, consultant: ConsultantCreate) -> Consultant:
         """Crée un nouveau consultant"""
@@ -80,7 +165,7 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
             self.db.commit()
             self.db.refresh(db_consultant)
             
-            return await self._map_to_entity(db_consultant)
+            return self._map_to_entity(db_consultant)
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(
@@ -103,7 +188,7 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
         try:
             self.db.commit()
             self.db.refresh(db_consultant)
-            return await self._map_to_entity(db_consultant)
+            return self._map_to_entity(db_consultant)
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(
@@ -117,6 +202,10 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
         if not db_consultant:
             return False
         
+        # Les lignes d'association ne sont pas en cascade côté ORM
+        self.db.query(ConsultantSkillModel).filter(
+            ConsultantSkillModel.consultant_id == consultant_id
+        ).delete(synchronize_session=False)
         self.db.delete(db_consultant)
         self.db.commit()
         return True
@@ -204,7 +293,7 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
     async def get_available_consultants(self) -> List[Consultant]:
         """Récupère les consultants qualifiés et disponibles"""
         # Récupère les consultants avec statut QUALIFIED
-        consultants = self.db.query(ConsultantModel).filter(
+        consultants = self._query().filter(
             ConsultantModel.status == "QUALIFIED"
         ).all()
         
@@ -212,9 +301,9 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
         # basé sur leur date de disponibilité
         available_consultants = []
         for consultant in consultants:
-            entity = await self._map_to_entity(consultant)
+            entity = self._map_to_entity(consultant)
             # Un consultant est disponible si sa date de disponibilité est passée ou non définie
-            if not entity.availability_date or entity.availability_date <= datetime.now().date():
+            if not entity.availability_date or entity.availability_date <= date.today():
                 available_consultants.append(entity)
                 
         return available_consultants
@@ -226,7 +315,7 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
         search = f"%{query}%"
         
         # Requête de base
-        consultants_query = self.db.query(ConsultantModel).join(
+        consultants_query = self._query().join(
             UserModel, ConsultantModel.user_id == UserModel.id
         ).filter(
             (UserModel.full_name.ilike(search)) |
@@ -253,12 +342,16 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
                 )
         
         consultants = consultants_query.all()
-        return [await self._map_to_entity(consultant) for consultant in consultants]
+        return [self._map_to_entity(consultant) for consultant in consultants]
     
-    async def _map_to_entity(self, db_consultant: ConsultantModel) -> Consultant:
-        """Convertit un modèle SQLAlchemy en entité"""
-        # Récupérer les informations de l'utilisateur
-        user = self.db.query(UserModel).filter(UserModel.id == db_consultant.user_id).first()
+    def _map_to_entity(self, db_consultant: ConsultantModel) -> Consultant:
+        """
+        Convertit un modèle SQLAlchemy en entité
+        
+        Fonction pure : l'utilisateur et les compétences doivent avoir été chargés
+        par la requête (voir _query), aucune requête n'est émise ici.
+        """
+        user = db_consultant.user
         
         user_data = {
             "id": user.id,
@@ -267,18 +360,17 @@ class SQLAlchemyConsultantRepository(ConsultantRepository):
             "role": user.role.value
         } if user else {}
         
-        # Récupération des compétences du consultant de manière simplifiée
-        # Nous allons récupérer les compétences directement depuis la relation skills
+        # Compétences avec le niveau et l'expérience réellement enregistrés
         skills_data = []
-        if hasattr(db_consultant, 'skills') and db_consultant.skills:
-            for skill in db_consultant.skills:
-                skill_data = {
-                    "id": skill.id,
-                    "name": skill.name,
-                    "level": "intermediate",  # Valeur par défaut
-                    "years": 0  # Valeur par défaut
-                }
-                skills_data.append(skill_data)
+        for consultant_skill in db_consultant.consultant_skills or []:
+            skill = consultant_skill.skill
+            skills_data.append({
+                "id": consultant_skill.skill_id,
+                "skill_id": consultant_skill.skill_id,
+                "name": skill.name if skill else None,
+                "level": consultant_skill.proficiency_level.value if consultant_skill.proficiency_level else "intermediate",
+                "years": consultant_skill.years_experience or 0
+            })
         
         # Conversion directe de l'enum status vers availability_status
         # Les valeurs d'enum sont maintenant identiques entre le modèle et l'entité
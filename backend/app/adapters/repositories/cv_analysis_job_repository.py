@@ -0,0 +1,276 @@
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+import uuid
+from sqlalchemy.orm import Session
+
+from app.core.entities.cv_analysis_job import CVAnalysisJob, CVAnalysisJobStatus, CVAnalyzer
+from app.core.interfaces.cv_analysis_job_repository import CVAnalysisJobRepository
+from app.infrastructure.database.models import WorkflowExecution as WorkflowExecutionModel
+from app.infrastructure.database.models import WorkflowStatus
+
+# Identifiant des exécutions d'analyse de CV dans workflow_executions
+CV_ANALYSIS_WORKFLOW_ID = "cv-analysis"
+
+# Avancement affiché à la prise en charge par un worker
+CLAIMED_PROGRESS = 10
+
+# Correspondance entre le statut d'exécution et le statut exposé aux clients
+JOB_STATUSES = {
+    WorkflowStatus.PENDING: CVAnalysisJobStatus.UPLOADED,
+    WorkflowStatus.QUEUED: CVAnalysisJobStatus.QUEUED,
+    WorkflowStatus.RUNNING: CVAnalysisJobStatus.ANALYZING,
+    WorkflowStatus.SUCCESS: CVAnalysisJobStatus.ANALYZED,
+    WorkflowStatus.ERROR: CVAnalysisJobStatus.ERROR,
+    WorkflowStatus.CANCELLED: CVAnalysisJobStatus.ERROR,
+}
+
+class SQLAlchemyCVAnalysisJobRepository(CVAnalysisJobRepository):
+    """
+    Implémentation SQLAlchemy de la file d'attente des analyses de CV
+
+    La table workflow_executions sert de file durable : les workers de plusieurs processus
+    réservent les jobs avec SELECT ... FOR UPDATE SKIP LOCKED, sans se bloquer entre eux.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _query(self):
+        return self.db.query(WorkflowExecutionModel).filter(
+            WorkflowExecutionModel.workflow_id == CV_ANALYSIS_WORKFLOW_ID
+        )
+
+    def _get_model(self, job_id: int) -> Optional[WorkflowExecutionModel]:
+        return self._query().filter(WorkflowExecutionModel.id == job_id).first()
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    async def create(self, file_name: str, file_type: str, file_size: int, object_name: str,
+                     queued: bool = False, analyzer: CVAnalyzer = CVAnalyzer.ENHANCED) -> CVAnalysisJob:
+        """Crée un job pour un fichier déposé, éventuellement directement mis en file"""
+        try:
+            db_job = WorkflowExecutionModel(
+                workflow_id=CV_ANALYSIS_WORKFLOW_ID,
+                execution_id=uuid.uuid4().hex,
+                status=WorkflowStatus.QUEUED if queued else WorkflowStatus.PENDING,
+                data={
+                    "file_name": file_name,
+                    "file_type": file_type,
+                    "file_size": file_size,
+                    "object_name": object_name,
+                    "analyzer": analyzer.value
+                },
+                progress=0,
+                attempts=0
+            )
+            self.db.add(db_job)
+            self.db.commit()
+            self.db.refresh(db_job)
+            return self._map_to_entity(db_job)
+        except Exception:
+            self.db.rollback()
+            raise
+
+    async def get(self, job_id: int) -> Optional[CVAnalysisJob]:
+        db_job = self._get_model(job_id)
+        return self._map_to_entity(db_job) if db_job else None
+
+    async def get_many(self, job_ids: List[int]) -> List[CVAnalysisJob]:
+        """Récupère plusieurs jobs en une requête (suivi d'un lot)"""
+        if not job_ids:
+            return []
+        db_jobs = self._query().filter(WorkflowExecutionModel.id.in_(job_ids)).all()
+        return [self._map_to_entity(db_job) for db_job in db_jobs]
+
+    async def list(self, skip: int = 0, limit: int = 100) -> List[CVAnalysisJob]:
+        db_jobs = self._query().order_by(
+            WorkflowExecutionModel.created_at, WorkflowExecutionModel.id
+        ).offset(skip).limit(limit).all()
+        return [self._map_to_entity(db_job) for db_job in db_jobs]
+
+    async def enqueue(self, job_id: int) -> Optional[CVAnalysisJob]:
+        """Met en file un job déposé ou en erreur ; sans effet sur un job en file, en cours ou terminé"""
+        db_job = self._get_model(job_id)
+        if not db_job:
+            return None
+
+        if db_job.status in (WorkflowStatus.PENDING, WorkflowStatus.ERROR, WorkflowStatus.CANCELLED):
+            db_job.status = WorkflowStatus.QUEUED
+            db_job.progress = 0
+            db_job.attempts = 0
+            db_job.error_message = None
+            db_job.finished_at = None
+            self.db.commit()
+            self.db.refresh(db_job)
+
+        return self._map_to_entity(db_job)
+
+    async def count_in_flight(self) -> int:
+        """Nombre de jobs en file ou en cours (mesure de la pression sur les workers)"""
+        return self._query().filter(
+            WorkflowExecutionModel.status.in_([WorkflowStatus.QUEUED, WorkflowStatus.RUNNING])
+        ).count()
+
+    async def claim_next(self, worker_id: str) -> Optional[CVAnalysisJob]:
+        """Réserve le plus ancien job en file pour un worker"""
+        try:
+            db_job = self._query().filter(
+                WorkflowExecutionModel.status == WorkflowStatus.QUEUED
+            ).order_by(
+                WorkflowExecutionModel.created_at, WorkflowExecutionModel.id
+            ).with_for_update(skip_locked=True).first()
+
+            if not db_job:
+                self.db.commit()
+                return None
+
+            now = self._now()
+            db_job.status = WorkflowStatus.RUNNING
+            db_job.worker_id = worker_id
+            db_job.heartbeat_at = now
+            db_job.started_at = now
+            db_job.attempts = (db_job.attempts or 0) + 1
+            db_job.progress = CLAIMED_PROGRESS
+            self.db.commit()
+            self.db.refresh(db_job)
+            return self._map_to_entity(db_job)
+        except Exception:
+            self.db.rollback()
+            raise
+
+    async def update_progress(self, job_id: int, progress: int) -> None:
+        """Met à jour l'avancement et le signe de vie du worker"""
+        self._query().filter(WorkflowExecutionModel.id == job_id).update(
+            {"progress": progress, "heartbeat_at": self._now()}, synchronize_session=False
+        )
+        self.db.commit()
+
+    async def heartbeat(self, job_id: int) -> None:
+        """Signale que le worker traite toujours le job (évite sa reprise par requeue_stale)"""
+        self._query().filter(
+            WorkflowExecutionModel.id == job_id,
+            WorkflowExecutionModel.status == WorkflowStatus.RUNNING
+        ).update({"heartbeat_at": self._now()}, synchronize_session=False)
+        self.db.commit()
+
+    def _owned(self, job_id: int, worker_id: Optional[str]):
+        """
+        Job encore détenu par worker_id (en cours chez lui) ; sans worker_id, job non démarré.
+        Un worker dont le bail a expiré (job repris par requeue_stale) ne le détient plus.
+        """
+        query = self._query().filter(WorkflowExecutionModel.id == job_id)
+        if worker_id is None:
+            return query.filter(WorkflowExecutionModel.status.in_([WorkflowStatus.PENDING, WorkflowStatus.QUEUED]))
+        return query.filter(
+            WorkflowExecutionModel.status == WorkflowStatus.RUNNING,
+            WorkflowExecutionModel.worker_id == worker_id
+        )
+
+    async def complete(self, job_id: int, result: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """
+        Enregistre le résultat d'un job détenu par worker_id (sans worker_id : job non démarré,
+        résultat en cache)
+
+        Returns:
+            False si le job n'est plus détenu (bail perdu) : rien n'est modifié
+        """
+        db_job = self._get_model(job_id)
+        if not db_job:
+            return False
+        updated = self._owned(job_id, worker_id).update(
+            {
+                "status": WorkflowStatus.SUCCESS,
+                "progress": 100,
+                "data": {**(db_job.data or {}), "result": result},
+                "error_message": None,
+                "worker_id": None,
+                "finished_at": self._now()
+            },
+            synchronize_session=False
+        )
+        self.db.commit()
+        return updated > 0
+
+    async def fail(self, job_id: int, error_message: str, max_attempts: int, worker_id: str) -> bool:
+        """
+        Remet le job en file tant que max_attempts n'est pas atteint, sinon le passe en erreur,
+        s'il est toujours détenu par worker_id
+
+        Returns:
+            False si le job n'est plus détenu (bail perdu) : rien n'est modifié
+        """
+        db_job = self._get_model(job_id)
+        if not db_job:
+            return False
+        if (db_job.attempts or 0) < max_attempts:
+            values = {"status": WorkflowStatus.QUEUED}
+        else:
+            values = {"status": WorkflowStatus.ERROR, "finished_at": self._now()}
+        updated = self._owned(job_id, worker_id).filter(
+            WorkflowExecutionModel.attempts == db_job.attempts
+        ).update(
+            {**values, "error_message": error_message, "worker_id": None, "progress": 0},
+            synchronize_session=False
+        )
+        self.db.commit()
+        return updated > 0
+
+    async def requeue_stale(self, lease_timeout: int, max_attempts: int) -> int:
+        """
+        Reprend les jobs dont le worker ne donne plus signe de vie (worker arrêté ou planté)
+
+        Un job abandonné max_attempts fois (par exemple un CV qui fait planter le worker)
+        passe en erreur au lieu d'être remis en file indéfiniment.
+        """
+        cutoff = self._now() - timedelta(seconds=lease_timeout)
+        stale = self._query().filter(
+            WorkflowExecutionModel.status == WorkflowStatus.RUNNING,
+            WorkflowExecutionModel.heartbeat_at < cutoff
+        )
+        failed = stale.filter(WorkflowExecutionModel.attempts >= max_attempts).update(
+            {
+                "status": WorkflowStatus.ERROR,
+                "worker_id": None,
+                "progress": 0,
+                "error_message": f"Analyse abandonnée après {max_attempts} tentative(s)",
+                "finished_at": self._now()
+            },
+            synchronize_session=False
+        )
+        requeued = stale.filter(WorkflowExecutionModel.attempts < max_attempts).update(
+            {"status": WorkflowStatus.QUEUED, "worker_id": None, "progress": 0},
+            synchronize_session=False
+        )
+        self.db.commit()
+        return failed + requeued
+
+    async def delete(self, job_id: int) -> Optional[CVAnalysisJob]:
+        db_job = self._get_model(job_id)
+        if not db_job:
+            return None
+        job = self._map_to_entity(db_job)
+        self.db.delete(db_job)
+        self.db.commit()
+        return job
+
+    def _map_to_entity(self, db_job: WorkflowExecutionModel) -> CVAnalysisJob:
+        """Convertit une exécution en job d'analyse"""
+        data = db_job.data or {}
+        return CVAnalysisJob(
+            id=db_job.id,
+            job_key=db_job.execution_id,
+            file_name=data.get("file_name", ""),
+            file_type=data.get("file_type", ""),
+            file_size=data.get("file_size", 0),
+            object_name=data.get("object_name", ""),
+            analyzer=data.get("analyzer", CVAnalyzer.ENHANCED),
+            status=JOB_STATUSES[db_job.status],
+            progress=db_job.progress or 0,
+            attempts=db_job.attempts or 0,
+            result=data.get("result"),
+            error_message=db_job.error_message,
+            created_at=db_job.created_at,
+            finished_at=db_job.finished_at
+        )
@@ -1,13 +1,16 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
+from fastapi import status as http_status
 
 from app.core.interfaces.match_repository import MatchRepository
 from app.core.entities.match import Match, MatchCreate, MatchUpdate
 from app.infrastructure.database.models import Match as MatchModel
+from app.infrastructure.database.models import MatchStatus
 from app.infrastructure.database.models import Consultant as ConsultantModel
 from app.infrastructure.database.models import Tender as TenderModel
+from app.adapters.repositories.pagination import paginate
 
 class SQLAlchemyMatchRepository(MatchRepository):
     """
@@ -22,6 +25,35 @@ class SQLAlchemyMatchRepository(MatchRepository):
         matches = self.db.query(MatchModel).all()
         return [self._map_to_entity(match) for match in matches]
     
+    async def get_page(self, consultant_id: Optional[int] = None, tender_id: Optional[int] = None,
+                       status: Optional[str] = None, cursor: Optional[str] = None,
+                       skip: int = 0, limit: int = 100) -> Tuple[List[Match], Optional[str]]:
+        """
+        Récupère une page de matchs filtrée en SQL, triée par (created_at, id)
+        
+        Returns:
+            Tuple (matchs, curseur de la page suivante ou None)
+        """
+        query = self.db.query(MatchModel)
+        
+        if consultant_id is not None:
+            query = query.filter(MatchModel.consultant_id == consultant_id)
+        
+        if tender_id is not None:
+            query = query.filter(MatchModel.tender_id == tender_id)
+        
+        if status:
+            try:
+                query = query.filter(MatchModel.status == MatchStatus(status))
+            except ValueError:
+                raise HTTPException(
+                    status_code=http_status.HTTP_400_BAD_REQUEST,
+                    detail="Statut de match invalide"
+                )
+        
+        matches, next_cursor = paginate(query, MatchModel, cursor=cursor, limit=limit, skip=skip)
+        return [self._map_to_entity(match) for match in matches], next_cursor
+    
     async def get_by_id(self, match_id: int) -> Optional[Match]:
         """Récupère un match par son ID"""
         match = self.db.query(MatchModel).filter(MatchModel.id == match_id).first()
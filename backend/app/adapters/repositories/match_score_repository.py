@@ -0,0 +1,149 @@
+from typing import Any, List, Dict, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core.interfaces.match_score_repository import MatchScoreRepository
+from app.infrastructure.database.models import MatchScore as MatchScoreModel
+from app.infrastructure.database.models import MatchScoreConsultantVersion as ConsultantVersionModel
+from app.infrastructure.database.models import MatchScoreTenderVersion as TenderVersionModel
+from app.infrastructure.database.models import Consultant as ConsultantModel
+from app.infrastructure.database.models import Tender as TenderModel
+
+class SQLAlchemyMatchScoreRepository(MatchScoreRepository):
+    """
+    Implémentation SQLAlchemy de la matrice matérialisée des scores consultant x appel d'offres
+
+    Les paires de score nul ne sont pas stockées : une paire absente vaut 0.
+    Chaque ligne (consultant) et colonne (appel d'offres) garde la version des champs avec
+    laquelle elle a été calculée, comparée par refresh_stale_scores du matchmaking.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    async def replace_consultant_scores(self, consultant_id: int, scores: Dict[int, float],
+                                        version: Optional[str] = None) -> None:
+        """
+        Remplace la ligne d'un consultant (scores indexés par tender_id)
+        
+        version (empreinte des champs du consultant utilisés par le calcul) est enregistrée
+        avec la ligne pour détecter les modifications faites depuis.
+        """
+        try:
+            self.db.query(MatchScoreModel).filter(
+                MatchScoreModel.consultant_id == consultant_id
+            ).delete(synchronize_session=False)
+            self.db.bulk_insert_mappings(MatchScoreModel, [
+                {"consultant_id": consultant_id, "tender_id": tender_id, "score": score}
+                for tender_id, score in scores.items() if score > 0
+            ])
+            self._replace_versions(ConsultantVersionModel, ConsultantVersionModel.consultant_id,
+                                   {consultant_id: version} if version is not None else {}, [consultant_id])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    async def replace_tender_scores(self, tender_id: int, scores: Dict[int, float],
+                                    version: Optional[str] = None) -> None:
+        """
+        Remplace la colonne d'un appel d'offres (scores indexés par consultant_id)
+        
+        version (empreinte des champs de l'appel d'offres utilisés par le calcul) est enregistrée
+        avec la colonne pour détecter les modifications faites depuis.
+        """
+        try:
+            self.db.query(MatchScoreModel).filter(
+                MatchScoreModel.tender_id == tender_id
+            ).delete(synchronize_session=False)
+            self.db.bulk_insert_mappings(MatchScoreModel, [
+                {"consultant_id": consultant_id, "tender_id": tender_id, "score": score}
+                for consultant_id, score in scores.items() if score > 0
+            ])
+            self._replace_versions(TenderVersionModel, TenderVersionModel.tender_id,
+                                   {tender_id: version} if version is not None else {}, [tender_id])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    async def set_consultant_versions(self, versions: Dict[int, str]) -> None:
+        """Enregistre la version de lignes couvertes par un recalcul de toutes les colonnes"""
+        try:
+            self._replace_versions(ConsultantVersionModel, ConsultantVersionModel.consultant_id,
+                                   versions, list(versions))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def _replace_versions(self, model: Any, key: Any, versions: Dict[int, str], ids: List[int]) -> None:
+        """Remplace les versions des lignes ou colonnes `ids` (sans commit)"""
+        self.db.query(model).filter(key.in_(ids)).delete(synchronize_session=False)
+        self.db.bulk_insert_mappings(model, [
+            {key.key: entity_id, "version": version} for entity_id, version in versions.items()
+        ])
+    
+    async def delete_consultant_scores(self, consultant_id: int) -> None:
+        """Supprime la ligne d'un consultant"""
+        self.db.query(MatchScoreModel).filter(
+            MatchScoreModel.consultant_id == consultant_id
+        ).delete(synchronize_session=False)
+        self.db.query(ConsultantVersionModel).filter(
+            ConsultantVersionModel.consultant_id == consultant_id
+        ).delete(synchronize_session=False)
+        self.db.commit()
+    
+    async def delete_tender_scores(self, tender_id: int) -> None:
+        """Supprime la colonne d'un appel d'offres"""
+        self.db.query(MatchScoreModel).filter(
+            MatchScoreModel.tender_id == tender_id
+        ).delete(synchronize_session=False)
+        self.db.query(TenderVersionModel).filter(
+            TenderVersionModel.tender_id == tender_id
+        ).delete(synchronize_session=False)
+        self.db.commit()
+    
+    async def get_consultant_versions(self) -> Dict[int, str]:
+        """Version de chaque ligne calculée (lignes jamais calculées absentes)"""
+        rows = self.db.query(ConsultantVersionModel.consultant_id, ConsultantVersionModel.version).all()
+        return {consultant_id: version for consultant_id, version in rows}
+    
+    async def get_tender_versions(self) -> Dict[int, str]:
+        """Version de chaque colonne calculée (colonnes jamais calculées absentes)"""
+        rows = self.db.query(TenderVersionModel.tender_id, TenderVersionModel.version).all()
+        return {tender_id: version for tender_id, version in rows}
+    
+    async def get_top_for_tender(self, tender_id: int, min_score: float = 0.0,
+                                 skip: int = 0, limit: int = 100) -> List[Tuple[int, float]]:
+        """Lecture indexée (tender_id, score) des meilleurs consultants d'un appel d'offres"""
+        rows = self.db.query(
+            MatchScoreModel.consultant_id, MatchScoreModel.score
+        ).filter(
+            MatchScoreModel.tender_id == tender_id,
+            MatchScoreModel.score >= min_score
+        ).order_by(
+            MatchScoreModel.score.desc(), MatchScoreModel.consultant_id
+        ).offset(skip).limit(limit).all()
+        
+        return [(consultant_id, score) for consultant_id, score in rows]
+    
+    async def get_top_for_company(self, company_id: int, min_score: float = 0.0,
+                                  limit: int = 10) -> List[Tuple[int, int, float]]:
+        """
+        Meilleures paires dont le consultant ou l'appel d'offres appartient à l'entreprise
+        """
+        rows = self.db.query(
+            MatchScoreModel.consultant_id, MatchScoreModel.tender_id, MatchScoreModel.score
+        ).join(
+            ConsultantModel, MatchScoreModel.consultant_id == ConsultantModel.id
+        ).join(
+            TenderModel, MatchScoreModel.tender_id == TenderModel.id
+        ).filter(
+            MatchScoreModel.score >= min_score,
+            or_(ConsultantModel.company_id == company_id, TenderModel.company_id == company_id)
+        ).order_by(
+            MatchScoreModel.score.desc(), MatchScoreModel.consultant_id, MatchScoreModel.tender_id
+        ).limit(limit).all()
+        
+        return [(consultant_id, tender_id, score) for consultant_id, tender_id, score in rows]
@@ -0,0 +1,84 @@
+from typing import Any, List, Optional, Tuple
+from datetime import datetime
+import base64
+import json
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+from fastapi import HTTPException, status
+
+# Taille de page maximale acceptée par les repositories
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode la position (created_at, id) d'une ligne en curseur opaque"""
+    payload = {"c": created_at.isoformat(), "i": row_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Décode un curseur opaque
+
+    Raises:
+        HTTPException 400 si le curseur est invalide
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Curseur de pagination invalide"
+        )
+
+
+def apply_keyset(statement: Any, model: Any, cursor: Optional[str] = None,
+                 limit: int = 100, skip: int = 0) -> Any:
+    """
+    Ajoute tri, condition de curseur et limite à une requête (Query synchrone ou select())
+
+    Avec un curseur, la page suivante est obtenue par la comparaison de ligne
+    (created_at, id) > (curseur), parcours direct de l'index composite : la latence ne
+    dépend pas de la profondeur de la page. created_at est obligatoire (migration 012).
+    Sans curseur, skip est appliqué en OFFSET pour la compatibilité des anciens clients.
+    Une ligne de plus que la limite est demandée pour détecter la page suivante.
+    """
+    statement = statement.order_by(model.created_at, model.id)
+
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        statement = statement.filter(tuple_(model.created_at, model.id) > tuple_(created_at, last_id))
+    elif skip:
+        statement = statement.offset(skip)
+
+    return statement.limit(page_size(limit) + 1)
+
+
+def page_size(limit: int) -> int:
+    """Borne la taille de page demandée"""
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def split_page(rows: List[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """Sépare la ligne sentinelle et calcule le curseur de la page suivante"""
+    limit = page_size(limit)
+    if len(rows) <= limit:
+        return list(rows), None
+
+    rows = list(rows[:limit])
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+
+def paginate(query: Query, model: Any, cursor: Optional[str] = None,
+             limit: int = 100, skip: int = 0) -> Tuple[List[Any], Optional[str]]:
+    """
+    Applique une pagination par clé (keyset) sur (created_at, id) à une requête synchrone
+
+    Returns:
+        Tuple (lignes de la page, curseur de la page suivante ou None)
+    """
+    rows = apply_keyset(query, model, cursor=cursor, limit=limit, skip=skip).all()
+    return split_page(rows, limit)
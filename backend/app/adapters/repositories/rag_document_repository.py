@@ -0,0 +1,235 @@
+from typing import List, Optional, Dict, Any, Callable, Awaitable, Iterator, Tuple
+import numpy as np
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.interfaces.rag_document_repository import RAGDocumentRepository
+from app.infrastructure.database.models import (
+    DocumentType,
+    RAGChunk as RAGChunkModel,
+    RAGDocument as RAGDocumentModel,
+)
+
+# Types de document du service RAG sans équivalent direct dans l'énumération DocumentType
+_DOCUMENT_TYPE_ALIASES = {"skills": DocumentType.SKILL}
+
+
+def to_document_type(document_type: str) -> Optional[DocumentType]:
+    """Type de document en base correspondant à un type du service RAG (None si aucun)"""
+    if document_type in _DOCUMENT_TYPE_ALIASES:
+        return _DOCUMENT_TYPE_ALIASES[document_type]
+    try:
+        return DocumentType(document_type)
+    except ValueError:
+        return None
+
+
+def from_document_type(document_type: DocumentType) -> str:
+    """Type du service RAG correspondant à un type de document en base"""
+    for alias, db_type in _DOCUMENT_TYPE_ALIASES.items():
+        if db_type == document_type:
+            return alias
+    return document_type.value
+
+
+def normalize_document_type(document_type: str) -> str:
+    """Type du service RAG canonique pour un type reçu, qu'il soit donné sous sa forme en base ou non"""
+    db_type = to_document_type(document_type)
+    return from_document_type(db_type) if db_type is not None else document_type
+
+
+def encode_embedding(vector: Any, dtype: Optional[str] = None) -> Tuple[bytes, str]:
+    """Octets bruts d'un vecteur et type de ses composantes (RAG_EMBEDDING_STORAGE_DTYPE par défaut)"""
+    dtype = dtype or settings.RAG_EMBEDDING_STORAGE_DTYPE
+    return np.ascontiguousarray(vector, dtype=dtype).tobytes(), dtype
+
+
+def decode_embedding(data: bytes, dtype: Optional[str] = None) -> np.ndarray:
+    """Vecteur lu sans copie sur les octets stockés (tableau en lecture seule)"""
+    return np.frombuffer(data, dtype=dtype or "float32")
+
+
+class SQLAlchemyRAGDocumentRepository(RAGDocumentRepository):
+    """
+    Implémentation de RAGDocumentRepository avec SQLAlchemy (tables rag_documents et rag_chunks)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def get_chunk_count(self, document_id: str) -> Optional[int]:
+        return self.db.query(RAGDocumentModel.chunk_count).filter(
+            RAGDocumentModel.document_id == document_id
+        ).scalar()
+
+    async def replace_document(self, document_id: str, document_type: str, title: str, content: str,
+                               metadata: Dict[str, Any], chunks: List[Dict[str, Any]],
+                               file_path: Optional[str] = None,
+                               before_commit: Optional[Callable[[], Awaitable[None]]] = None) -> int:
+        """
+        Enregistre un document et remplace ses chunks dans une seule transaction
+
+        Les chunks sont insérés en une requête ; before_commit (écriture des vecteurs) est
+        exécuté avant la validation, et son échec annule la transaction. Réindexer un document
+        remplace ses lignes au lieu de les dupliquer.
+
+        Args:
+            chunks: Dictionnaires {chunk_id, content, chunk_index, token_count}, avec
+                éventuellement embedding (vecteur NumPy, stocké en binaire)
+
+        Returns:
+            Identifiant (clé primaire) du document
+        """
+        db_type = to_document_type(document_type)
+        if db_type is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Type de document non supporté: {document_type}"
+            )
+        try:
+            db_document = self.db.query(RAGDocumentModel).filter(
+                RAGDocumentModel.document_id == document_id
+            ).with_for_update().first()
+            if db_document is None:
+                db_document = RAGDocumentModel(document_id=document_id)
+                self.db.add(db_document)
+            db_document.document_type = db_type
+            db_document.title = title[:255]
+            db_document.content = content
+            db_document.document_metadata = metadata
+            db_document.file_path = file_path
+            db_document.chunk_count = len(chunks)
+            self.db.flush()
+
+            self.db.query(RAGChunkModel).filter(
+                RAGChunkModel.document_id == db_document.id
+            ).delete(synchronize_session=False)
+            if chunks:
+                self.db.execute(
+                    insert(RAGChunkModel),
+                    [self._chunk_row(chunk, db_document.id) for chunk in chunks]
+                )
+
+            if before_commit is not None:
+                await before_commit()
+            self.db.commit()
+            return db_document.id
+        except IntegrityError as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Erreur lors de l'enregistrement du document: {str(e)}"
+            )
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _chunk_row(self, chunk: Dict[str, Any], document_pk: int) -> Dict[str, Any]:
+        row = {**chunk, "document_id": document_pk}
+        if chunk.get("embedding") is not None:
+            row["embedding"], row["embedding_dtype"] = encode_embedding(chunk["embedding"])
+        return row
+
+    async def get_chunk_embeddings(self, chunk_ids: List[str]) -> Dict[str, np.ndarray]:
+        rows = self.db.query(
+            RAGChunkModel.chunk_id, RAGChunkModel.embedding, RAGChunkModel.embedding_dtype
+        ).filter(
+            RAGChunkModel.chunk_id.in_(chunk_ids),
+            RAGChunkModel.embedding.isnot(None)
+        ).all()
+        return {chunk_id: decode_embedding(data, dtype) for chunk_id, data, dtype in rows}
+
+    def iter_embedding_batches(self, document_type: Optional[str] = None,
+                               batch_size: int = 1000) -> Iterator[List[Tuple[str, bytes, str]]]:
+        """
+        Parcourt les vecteurs des chunks par lots, en flux (curseur côté serveur)
+
+        Seules les colonnes chunk_id, embedding et embedding_dtype sont lues.
+
+        Yields:
+            Lots de tuples (chunk_id, octets du vecteur, type des composantes)
+        """
+        query = self._embedding_query(RAGChunkModel.chunk_id, RAGChunkModel.embedding,
+                                      RAGChunkModel.embedding_dtype, document_type=document_type)
+        result = self.db.execute(query.order_by(RAGChunkModel.id).execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+    async def load_embeddings(self, document_type: Optional[str] = None,
+                              batch_size: int = 1000) -> Tuple[List[str], np.ndarray]:
+        """
+        Charge les vecteurs des chunks dans une matrice float32 (construction d'un index)
+
+        La matrice est allouée une fois d'après le nombre de chunks, puis remplie lot par lot
+        directement depuis les octets stockés, sans liste intermédiaire de vecteurs.
+
+        Returns:
+            Identifiants des chunks et matrice (nombre de chunks, dimension) dans le même ordre
+        """
+        count = self.db.execute(
+            self._embedding_query(func.count(RAGChunkModel.id), document_type=document_type)
+        ).scalar() or 0
+        chunk_ids: List[str] = []
+        matrix: Optional[np.ndarray] = None
+        for batch in self.iter_embedding_batches(document_type, batch_size):
+            # Chunks ajoutés pendant la lecture : ils seront pris au prochain chargement
+            batch = batch[:count - len(chunk_ids)]
+            for chunk_id, data, dtype in batch:
+                vector = decode_embedding(data, dtype)
+                if matrix is None:
+                    matrix = np.empty((count, len(vector)), dtype=np.float32)
+                matrix[len(chunk_ids)] = vector
+                chunk_ids.append(chunk_id)
+            if len(chunk_ids) == count:
+                break
+        if matrix is None:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        return chunk_ids, matrix[:len(chunk_ids)]
+
+    def _embedding_query(self, *columns: Any, document_type: Optional[str] = None) -> Any:
+        query = select(*columns).where(RAGChunkModel.embedding.isnot(None))
+        if document_type is not None:
+            query = query.join(RAGDocumentModel, RAGChunkModel.document_id == RAGDocumentModel.id).where(
+                RAGDocumentModel.document_type == to_document_type(document_type)
+            )
+        return query
+
+    async def get_document_types(self, document_ids: List[str]) -> Dict[str, str]:
+        """
+        Annuaire des documents : type (au sens du service RAG) de chaque document connu
+
+        Une seule requête, quel que soit le nombre d'identifiants ; les documents inconnus
+        sont absents du résultat.
+        """
+        if not document_ids:
+            return {}
+        rows = self.db.query(RAGDocumentModel.document_id, RAGDocumentModel.document_type).filter(
+            RAGDocumentModel.document_id.in_(document_ids)
+        ).all()
+        return {document_id: from_document_type(document_type) for document_id, document_type in rows}
+
+    async def delete_document(self, document_id: str) -> bool:
+        return await self.delete_documents([document_id]) > 0
+
+    async def delete_documents(self, document_ids: List[str]) -> int:
+        """Supprime des documents et leurs chunks ; renvoie le nombre de documents supprimés"""
+        if not document_ids:
+            return 0
+        try:
+            primary_keys = self.db.query(RAGDocumentModel.id).filter(
+                RAGDocumentModel.document_id.in_(document_ids)
+            ).scalar_subquery()
+            self.db.query(RAGChunkModel).filter(
+                RAGChunkModel.document_id.in_(primary_keys)
+            ).delete(synchronize_session=False)
+            deleted = self.db.query(RAGDocumentModel).filter(
+                RAGDocumentModel.document_id.in_(document_ids)
+            ).delete(synchronize_session=False)
+            self.db.commit()
+            return deleted
+        except Exception:
+            self.db.rollback()
+            raise
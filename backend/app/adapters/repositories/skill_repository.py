@@ -11,6 +11,8 @@ from app.core.entities.skill import (
     ProficiencyLevel
 )
 from app.infrastructure.database.models import Skill as SkillModel
+from app.infrastructure.database.models import SkillAlias as SkillAliasModel
+from app.adapters.services.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy, skill_key
 
 
 class SQLAlchemySkillRepository(SkillRepository):
@@ -18,8 +20,10 @@ class SQLAlchemySkillRepository(SkillRepository):
     Implémentation de SkillRepository avec SQLAlchemy
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, skill_taxonomy: Optional[SkillTaxonomy] = None):
         self.db = db
+        # Taxonomie utilisée par l'analyse des CV, à recompiler quand les compétences changent
+        self.skill_taxonomy = skill_taxonomy if skill_taxonomy is not None else get_skill_taxonomy()
 
     async def get_all(self) -> List[SkillEntity]:
         db_skills = self.db.query(SkillModel).all()
@@ -52,6 +56,7 @@ class SQLAlchemySkillRepository(SkillRepository):
             self.db.add(db_skill)
             self.db.commit()
             self.db.refresh(db_skill)
+            self.skill_taxonomy.invalidate()
             return self._map_to_entity(db_skill)
         except IntegrityError:
             self.db.rollback()
@@ -78,6 +83,7 @@ class SQLAlchemySkillRepository(SkillRepository):
         try:
             self.db.commit()
             self.db.refresh(db_skill)
+            self.skill_taxonomy.invalidate()
             return self._map_to_entity(db_skill)
         except IntegrityError as e:
             self.db.rollback()
@@ -93,6 +99,7 @@ class SQLAlchemySkillRepository(SkillRepository):
         try:
             self.db.delete(db_skill)
             self.db.commit()
+            self.skill_taxonomy.invalidate()
             return True
         except IntegrityError as e:
             self.db.rollback()
@@ -101,6 +108,38 @@ class SQLAlchemySkillRepository(SkillRepository):
                 detail=f"Erreur lors de la suppression de la skill: {str(e)}"
             )
 
+    async def get_aliases(self, skill_id: int) -> List[str]:
+        db_aliases = self.db.query(SkillAliasModel).filter(
+            SkillAliasModel.skill_id == skill_id
+        ).order_by(SkillAliasModel.alias).all()
+        return [db_alias.alias for db_alias in db_aliases]
+
+    async def add_alias(self, skill_id: int, alias: str) -> bool:
+        db_skill = self.db.query(SkillModel).filter(SkillModel.id == skill_id).first()
+        if not db_skill:
+            return False
+        try:
+            self.db.add(SkillAliasModel(skill_id=skill_id, alias=skill_key(alias)))
+            self.db.commit()
+            self.skill_taxonomy.invalidate()
+            return True
+        except IntegrityError:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Alias '{alias}' already exists."
+            )
+
+    async def remove_alias(self, skill_id: int, alias: str) -> bool:
+        deleted = self.db.query(SkillAliasModel).filter(
+            SkillAliasModel.skill_id == skill_id,
+            SkillAliasModel.alias == skill_key(alias)
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        if deleted:
+            self.skill_taxonomy.invalidate()
+        return bool(deleted)
+
     async def search_skills(self, query: str) -> List[SkillEntity]:
         # On cherche par name ou description
         search_pattern = f"%{query}%"
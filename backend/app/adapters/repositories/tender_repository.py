@@ -1,13 +1,16 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
+from fastapi import status as http_status
 
 from app.core.interfaces.tender_repository import TenderRepository
 from app.core.entities.tender import Tender, TenderCreate, TenderUpdate
 from app.infrastructure.database.models import Tender as TenderModel
+from app.infrastructure.database.models import TenderStatus
 from app.infrastructure.database.models import TenderSkill as TenderSkillModel
 from app.infrastructure.database.models import Skill as SkillModel
+from app.adapters.repositories.pagination import paginate
 
 class SQLAlchemyTenderRepository(TenderRepository):
     """
@@ -22,6 +25,35 @@ class SQLAlchemyTenderRepository(TenderRepository):
         tenders = self.db.query(TenderModel).all()
         return [self._map_to_entity(tender) for tender in tenders]
     
+    async def get_page(self, company_id: Optional[int] = None, skill_id: Optional[int] = None,
+                       status: Optional[str] = None, cursor: Optional[str] = None,
+                       skip: int = 0, limit: int = 100) -> Tuple[List[Tender], Optional[str]]:
+        """
+        Récupère une page d'appels d'offres filtrée en SQL, triée par (created_at, id)
+        
+        Returns:
+            Tuple (appels d'offres, curseur de la page suivante ou None)
+        """
+        query = self.db.query(TenderModel)
+        
+        if company_id is not None:
+            query = query.filter(TenderModel.company_id == company_id)
+        
+        if skill_id is not None:
+            query = query.filter(TenderModel.tender_skills.any(TenderSkillModel.skill_id == skill_id))
+        
+        if status:
+            try:
+                query = query.filter(TenderModel.status == TenderStatus(status))
+            except ValueError:
+                raise HTTPException(
+                    status_code=http_status.HTTP_400_BAD_REQUEST,
+                    detail="Statut d'appel d'offres invalide"
+                )
+        
+        tenders, next_cursor = paginate(query, TenderModel, cursor=cursor, limit=limit, skip=skip)
+        return [self._map_to_entity(tender) for tender in tenders], next_cursor
+    
     async def get_by_id(self, tender_id: int) -> Optional[Tender]:
         """Récupère un appel d'offres par son ID"""
         tender = self.db.query(TenderModel).filter(TenderModel.id == tender_id).first()
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 import os
 import json
 import logging
@@ -8,63 +8,38 @@ import tempfile
 from pathlib import Path
 
 from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.document_loaders import PyPDFLoader, Docx2txtLoader, TextLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
-from langchain_community.llms import LlamaCpp
 
 from app.core.interfaces.rag_service import RAGService
 from app.core.interfaces.n8n_integration_service import N8nIntegrationService
 from app.core.config import settings
+from app.adapters.services.cv_result_cache import CVResultCache, get_cv_result_cache
+from app.adapters.services.rag_service import collect_generation
 
 class AgentIAMaisonService:
     """
     Service pour les agents IA maison intégrés avec n8n et RAG
     """
     
-    def __init__(self, n8n_service: N8nIntegrationService, rag_service: Optional[RAGService] = None):
+    def __init__(self, n8n_service: N8nIntegrationService, rag_service: Optional[RAGService] = None,
+                 result_cache: Optional[CVResultCache] = None):
         """
         Initialisation du service d'agents IA maison
         
         Args:
             n8n_service: Service d'intégration avec n8n
             rag_service: Service RAG pour l'enrichissement des analyses (optionnel)
+            result_cache: Cache des extractions de CV par empreinte du fichier (partagé par défaut)
         """
         self.n8n_service = n8n_service
         self.rag_service = rag_service
+        self.result_cache = result_cache if result_cache is not None else get_cv_result_cache()
         self.logger = logging.getLogger(__name__)
         
-        # Initialiser le modèle d'embeddings si RAG n'est pas fourni
-        if not self.rag_service:
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-MiniLM-L6-v2",
-                model_kwargs={"device": "cpu"}
-            )
-            
-            # Initialiser le text splitter
-            self.text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000,
-                chunk_overlap=200
-            )
-            
-            # Initialiser le modèle de langage
-            model_path = os.getenv("LLM_MODEL_PATH", "/opt/models/llama-3-8b-instruct.Q4_K_M.gguf")
-            if os.path.exists(model_path):
-                self.llm = LlamaCpp(
-                    model_path=model_path,
-                    temperature=0.1,
-                    max_tokens=2048,
-                    n_ctx=4096,
-                    verbose=False
-                )
-            else:
-                self.llm = None
-                self.logger.warning(f"Modèle LLM non trouvé à {model_path}. La génération de réponses ne sera pas disponible.")
-        
         # Initialiser les workflows n8n
         self.workflow_ids = {
             "cv_extraction": settings.N8N_CV_EXTRACTION_WORKFLOW_ID,
@@ -112,6 +87,9 @@ class AgentIAMaisonService:
         """
         Extrait les données d'un CV en utilisant l'agent IA maison
         
+        Les résultats du workflow sont mis en cache selon l'empreinte du fichier : un CV
+        déjà traité par le même workflow n'est pas renvoyé à n8n.
+        
         Args:
             file_content: Contenu du fichier CV
             file_name: Nom du fichier
@@ -121,10 +99,26 @@ class AgentIAMaisonService:
         """
         self.logger.info(f"Extraction des données du CV: {file_name}")
         
+        # Déterminer le type de fichier
+        file_type = Path(file_name).suffix.lower().replace(".", "")
+        
+        if not self.workflow_ids.get("cv_extraction"):
+            self.logger.warning("Workflow d'extraction de CV non configuré")
+            return self._fallback_cv_extraction(file_type)
+        
+        try:
+            namespace = f"agent-{file_type}-rag" if self.rag_service else f"agent-{file_type}"
+            cache_key = self.result_cache.key(namespace, self.workflow_ids["cv_extraction"], file_content)
+            return await self.result_cache.get_or_compute(
+                cache_key, lambda: self._run_cv_extraction(file_content, file_name, file_type)
+            )
+        except Exception as e:
+            self.logger.error(f"Erreur lors de l'extraction des données du CV: {str(e)}")
+            return self._fallback_cv_extraction(file_type)
+    
+    async def _run_cv_extraction(self, file_content: bytes, file_name: str, file_type: str) -> Dict[str, Any]:
+        """Exécute le workflow d'extraction de CV sur une copie temporaire du fichier"""
         try:
-            # Déterminer le type de fichier
-            file_type = Path(file_name).suffix.lower().replace(".", "")
-            
             # Créer un fichier temporaire
             with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_type}") as temp_file:
                 temp_file.write(file_content)
@@ -143,28 +137,20 @@ class AgentIAMaisonService:
             }
             
             # Exécuter le workflow d'extraction de CV
-            if self.workflow_ids.get("cv_extraction"):
-                result = await self.n8n_service.execute_workflow(
-                    self.workflow_ids["cv_extraction"],
-                    workflow_data
+            result = await self.n8n_service.execute_workflow(
+                self.workflow_ids["cv_extraction"],
+                workflow_data
+            )
+            
+            # Enrichir avec RAG si disponible
+            if self.rag_service and "extracted_text" in result:
+                rag_enrichment = await self._enrich_with_rag(
+                    result["extracted_text"],
+                    "Extraire les compétences, l'expérience et la formation de ce CV."
                 )
-                
-                # Enrichir avec RAG si disponible
-                if self.rag_service and "extracted_text" in result:
-                    rag_enrichment = await self._enrich_with_rag(
-                        result["extracted_text"],
-                        "Extraire les compétences, l'expérience et la formation de ce CV."
-                    )
-                    result["rag_enrichment"] = rag_enrichment
-                
-                return result
-            else:
-                self.logger.warning("Workflow d'extraction de CV non configuré")
-                return self._fallback_cv_extraction(file_type)
-        
-        except Exception as e:
-            self.logger.error(f"Erreur lors de l'extraction des données du CV: {str(e)}")
-            return self._fallback_cv_extraction(file_type)
+                result["rag_enrichment"] = rag_enrichment
+            
+            return result
         
         finally:
             # Supprimer le fichier temporaire
@@ -318,25 +304,13 @@ class AgentIAMaisonService:
         self.logger.info(f"Requête RAG: {query}")
         
         try:
-            # Utiliser le service RAG si disponible
+            # Utiliser le service RAG si disponible (même chemin que la génération en flux)
             if self.rag_service:
-                # Exécuter la requête RAG
-                query_results = await self.rag_service.query(
-                    text=query,
-                    filters=filters,
-                    top_k=5
-                )
-                
-                # Générer une réponse
-                generation_result = await self.rag_service.generate(
-                    text=query,
-                    filters=filters,
-                    generation_params={"temperature": 0.2, "top_k": 5}
-                )
+                generation = await collect_generation(self.stream_knowledge_base(query, filters))
                 
                 return {
-                    "query_results": query_results,
-                    "generation": generation_result
+                    "query_results": generation.pop("context_documents"),
+                    "generation": generation
                 }
             
             # Sinon, utiliser le workflow n8n
@@ -366,6 +340,26 @@ class AgentIAMaisonService:
             self.logger.error(f"Erreur lors de la requête RAG: {str(e)}")
             return {"error": str(e)}
     
+    def stream_knowledge_base(self, query: str, filters: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Interroge la base de connaissances avec RAG, en flux : documents de contexte puis tokens
+        
+        Une seule recherche alimente à la fois les résultats et le contexte de la génération.
+        
+        Args:
+            query: Requête à exécuter
+            filters: Filtres à appliquer
+            
+        Returns:
+            Itérateur asynchrone d'événements {"event", "data"} (voir RAGService.generate_stream)
+        """
+        return self.rag_service.generate_stream(
+            text=query,
+            filters=filters,
+            generation_params={"temperature": 0.2},
+            top_k=5
+        )
+    
     async def _enrich_with_rag(self, context: str, query: str) -> Dict[str, Any]:
         """
         Enrichit les données avec le service RAG
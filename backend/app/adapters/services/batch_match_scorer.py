@@ -0,0 +1,287 @@
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+import hashlib
+import numpy as np
+
+# Poids selon l'importance des compétences dans l'appel d'offres
+IMPORTANCE_WEIGHTS = {
+    "required": 1.0,
+    "preferred": 0.7,
+    "nice_to_have": 0.3
+}
+
+# Équivalent numérique des niveaux de maîtrise (même échelle que l'analyse de CV)
+PROFICIENCY_LEVEL_VALUES = {
+    "beginner": 1,
+    "intermediate": 2,
+    "advanced": 3,
+    "expert": 4
+}
+
+
+def skill_id_of(skill: Dict[str, Any]) -> Any:
+    """Retourne l'identifiant de compétence d'une entrée (clé skill_id, sinon id)"""
+    return skill["skill_id"] if "skill_id" in skill else skill.get("id")
+
+
+def skill_level_factor(level: Any) -> float:
+    """Normalise un niveau de compétence (supposé entre 1 et 5) en facteur entre 0 et 1"""
+    if isinstance(level, str):
+        level = PROFICIENCY_LEVEL_VALUES.get(level.lower(), 1)
+    return min(level / 5.0, 1.0)
+
+
+def consultant_scoring_version(consultant: Any) -> str:
+    """
+    Empreinte des champs d'un consultant utilisés par le score : elle change dès que
+    sa ligne de la matrice des scores doit être recalculée
+    """
+    skills = sorted(repr((skill_id_of(skill), skill.get("level", 1))) for skill in consultant.skills or [])
+    fields = (
+        skills, consultant.experience_years, consultant.location, consultant.remote_work,
+        consultant.max_travel_distance, getattr(consultant.availability_status, "value", consultant.availability_status),
+        consultant.availability_date
+    )
+    return hashlib.sha1(repr(fields).encode("utf-8")).hexdigest()
+
+
+def tender_scoring_version(tender: Any) -> str:
+    """
+    Empreinte des champs d'un appel d'offres utilisés par le score : elle change dès que
+    sa colonne de la matrice des scores doit être recalculée
+    """
+    # L'ordre des compétences est conservé : il fixe l'ordre des additions du score
+    skills = [(skill_id_of(skill), skill.get("importance", "required")) for skill in tender.skills or []]
+    fields = (skills, tender.location, tender.remote_work, tender.start_date)
+    return hashlib.sha1(repr(fields).encode("utf-8")).hexdigest()
+
+
+class BatchMatchScorer:
+    """
+    Calcule en une passe vectorisée (NumPy) les scores de correspondance entre un appel
+    d'offres et une liste de consultants.
+
+    Reproduit exactement la formule pondérée de DefaultMatchmakingService.calculate_match_score :
+    les sous-scores sont calculés colonne par colonne dans le même ordre d'opérations que
+    le calcul unitaire, et l'arrondi final utilise round() de Python.
+    """
+
+    def __init__(self, weights: Dict[str, float]):
+        self.weights = weights
+
+    def score(self, tender: Any, consultants: Sequence[Any]) -> np.ndarray:
+        """
+        Calcule les scores non arrondis de tous les consultants pour un appel d'offres
+
+        Returns:
+            Tableau float64 de taille len(consultants)
+        """
+        if not consultants:
+            return np.zeros(0)
+
+        return (
+            self._skills_scores(tender, consultants) * self.weights["skills"] +
+            self._experience_scores(consultants) * self.weights["experience"] +
+            self._location_scores(tender, consultants) * self.weights["location"] +
+            self._availability_scores(tender, consultants) * self.weights["availability"]
+        )
+
+    def score_tenders(self, consultant: Any, tenders: Sequence[Any]) -> np.ndarray:
+        """
+        Calcule les scores non arrondis d'un consultant pour tous les appels d'offres
+        (ligne de la matrice), avec les mêmes opérations que score() pour chaque paire
+
+        Returns:
+            Tableau float64 de taille len(tenders)
+        """
+        if not tenders:
+            return np.zeros(0)
+
+        return (
+            self._tender_skills_scores(consultant, tenders) * self.weights["skills"] +
+            self._experience_scores([consultant])[0] * self.weights["experience"] +
+            self._tender_location_scores(consultant, tenders) * self.weights["location"] +
+            self._tender_availability_scores(consultant, tenders) * self.weights["availability"]
+        )
+
+    def required_skill_score(self, min_score: float) -> float:
+        """
+        Score de compétences minimum (entre 0 et 1) qu'un consultant doit pouvoir atteindre
+        pour que son score final arrondi puisse valoir min_score, les autres critères
+        étant supposés parfaits. Une valeur <= 0 signifie qu'aucun élagage n'est possible.
+        """
+        other_weights = sum(weight for criterion, weight in self.weights.items() if criterion != "skills")
+        # Marge couvrant l'arrondi à 2 décimales et les erreurs d'arrondi flottant
+        return (min_score - 0.01 - other_weights) / self.weights["skills"]
+
+    def top_matches(self, tender: Any, consultants: Sequence[Any], min_score: float = 0.0,
+                    limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Sélectionne les consultants dont le score arrondi atteint min_score, triés par score décroissant
+
+        Args:
+            tender: Appel d'offres
+            consultants: Consultants candidats
+            min_score: Score minimum (appliqué au score arrondi à 2 décimales)
+            limit: Nombre maximum de résultats (top-k), None pour tous
+
+        Returns:
+            Liste de tuples (index du consultant dans la séquence, score arrondi)
+        """
+        raw_scores = self.score(tender, consultants)
+
+        # L'arrondi peut remonter un score d'au plus 0.005 : on élimine les candidats
+        # hors d'atteinte avant d'appliquer round() aux seuls survivants
+        candidates = np.flatnonzero(raw_scores >= min_score - 0.01)
+        rounded = np.array([round(float(raw_scores[i]), 2) for i in candidates], dtype=float)
+        kept = rounded >= min_score
+        candidates, rounded = candidates[kept], rounded[kept]
+
+        if limit is not None:
+            if limit <= 0:
+                return []
+            if limit < len(rounded):
+                # Seuil du k-ième meilleur score ; les ex-aequo sont conservés pour le tri stable
+                threshold = np.partition(rounded, len(rounded) - limit)[len(rounded) - limit]
+                selected = np.flatnonzero(rounded >= threshold)
+                candidates, rounded = candidates[selected], rounded[selected]
+
+        # Tri stable décroissant : même ordre que list.sort(reverse=True) sur les scores
+        order = np.argsort(-rounded, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+
+        return [(int(candidates[i]), float(rounded[i])) for i in order]
+
+    def _skills_scores(self, tender: Any, consultants: Sequence[Any]) -> np.ndarray:
+        """Score de correspondance des compétences pour chaque consultant"""
+        n = len(consultants)
+        if not tender.skills:
+            return np.zeros(n)
+
+        tender_skills = {skill_id_of(skill): skill for skill in tender.skills}
+        columns = {skill_id: j for j, skill_id in enumerate(tender_skills)}
+        skill_weights = [
+            IMPORTANCE_WEIGHTS.get(skill.get("importance", "required"), 1.0)
+            for skill in tender_skills.values()
+        ]
+
+        # Matrice consultant x compétence de l'appel d'offres contenant le facteur de niveau
+        level_factors = np.zeros((n, len(columns)))
+        for i, consultant in enumerate(consultants):
+            if not consultant.skills:
+                continue
+            consultant_skills = {skill_id_of(skill): skill for skill in consultant.skills}
+            for skill_id, skill in consultant_skills.items():
+                j = columns.get(skill_id)
+                if j is not None:
+                    level_factors[i, j] = skill_level_factor(skill.get("level", 1))
+
+        total_weight = 0
+        for weight in skill_weights:
+            total_weight += weight
+
+        # Accumulation colonne par colonne pour conserver l'ordre des additions du calcul unitaire
+        matched_weight = np.zeros(n)
+        for j, weight in enumerate(skill_weights):
+            matched_weight += weight * level_factors[:, j]
+
+        return matched_weight / total_weight
+
+    def _experience_scores(self, consultants: Sequence[Any]) -> np.ndarray:
+        """Score de correspondance de l'expérience pour chaque consultant"""
+        experience = np.array([c.experience_years or 0 for c in consultants], dtype=float)
+
+        required_exp = 3
+        ideal_exp = 5
+
+        between = 0.7 + 0.3 * ((experience - required_exp) / (ideal_exp - required_exp))
+        below = np.maximum(0.3, 0.7 * (experience / required_exp))
+        scores = np.where(experience >= ideal_exp, 1.0, np.where(experience >= required_exp, between, below))
+
+        # Expérience non spécifiée : match moyen
+        return np.where(experience != 0, scores, 0.5)
+
+    def _location_scores(self, tender: Any, consultants: Sequence[Any]) -> np.ndarray:
+        """Score de correspondance de la localisation pour chaque consultant"""
+        if tender.remote_work:
+            remote = np.array([bool(c.remote_work) for c in consultants])
+            return np.where(remote, 1.0, 0.3)
+
+        tender_location = tender.location.lower() if tender.location else None
+        same_location = np.array([
+            bool(tender_location and c.location and c.location.lower() == tender_location)
+            for c in consultants
+        ])
+        can_travel = np.array([bool(c.max_travel_distance) for c in consultants])
+
+        return np.where(same_location, 1.0, np.where(can_travel, 0.5, 0.3))
+
+    def _availability_scores(self, tender: Any, consultants: Sequence[Any]) -> np.ndarray:
+        """Score de correspondance de la disponibilité pour chaque consultant"""
+        statuses = np.array([getattr(c.availability_status, "value", c.availability_status) or ""
+                             for c in consultants], dtype=object)
+        available_after_start = np.array([
+            bool(c.availability_date and tender.start_date and c.availability_date > tender.start_date)
+            for c in consultants
+        ])
+
+        unavailable = (statuses == "unavailable") | (statuses == "on_mission")
+        late = (statuses == "partially_available") & available_after_start
+
+        scores = np.where(statuses == "available", 1.0, 0.7)
+        scores = np.where(late, 0.3, scores)
+        return np.where(unavailable, 0.0, scores)
+
+    def _tender_skills_scores(self, consultant: Any, tenders: Sequence[Any]) -> np.ndarray:
+        """Score de correspondance des compétences d'un consultant pour chaque appel d'offres"""
+        n = len(tenders)
+        consultant_skills = {skill_id_of(skill): skill for skill in consultant.skills or []}
+
+        # Matrices appel d'offres x compétence (complétées par des zéros) des poids d'importance
+        # et des facteurs de niveau du consultant, dans l'ordre des compétences de chaque appel d'offres
+        tender_skills = [{skill_id_of(skill): skill for skill in tender.skills or []} for tender in tenders]
+        width = max((len(skills) for skills in tender_skills), default=0)
+        weights = np.zeros((n, width))
+        level_factors = np.zeros((n, width))
+        for i, skills in enumerate(tender_skills):
+            for j, (skill_id, skill) in enumerate(skills.items()):
+                weights[i, j] = IMPORTANCE_WEIGHTS.get(skill.get("importance", "required"), 1.0)
+                if skill_id in consultant_skills:
+                    level_factors[i, j] = skill_level_factor(consultant_skills[skill_id].get("level", 1))
+
+        # Accumulation colonne par colonne : même ordre des additions que le calcul unitaire
+        total_weight = np.zeros(n)
+        matched_weight = np.zeros(n)
+        for j in range(width):
+            total_weight += weights[:, j]
+            matched_weight += weights[:, j] * level_factors[:, j]
+
+        return np.divide(matched_weight, total_weight, out=np.zeros(n), where=total_weight != 0)
+
+    def _tender_location_scores(self, consultant: Any, tenders: Sequence[Any]) -> np.ndarray:
+        """Score de correspondance de la localisation d'un consultant pour chaque appel d'offres"""
+        location = consultant.location.lower() if consultant.location else None
+        remote = np.array([bool(tender.remote_work) for tender in tenders])
+        same_location = np.array([
+            bool(location and tender.location and tender.location.lower() == location)
+            for tender in tenders
+        ])
+
+        remote_score = 1.0 if consultant.remote_work else 0.3
+        on_site_score = 0.5 if consultant.max_travel_distance else 0.3
+        return np.where(remote, remote_score, np.where(same_location, 1.0, on_site_score))
+
+    def _tender_availability_scores(self, consultant: Any, tenders: Sequence[Any]) -> np.ndarray:
+        """Score de correspondance de la disponibilité d'un consultant pour chaque appel d'offres"""
+        status = getattr(consultant.availability_status, "value", consultant.availability_status) or ""
+        if status in ("unavailable", "on_mission"):
+            return np.zeros(len(tenders))
+        if status == "available":
+            return np.ones(len(tenders))
+
+        late = np.array([
+            bool(status == "partially_available" and consultant.availability_date and tender.start_date
+                 and consultant.availability_date > tender.start_date)
+            for tender in tenders
+        ])
+        return np.where(late, 0.3, 0.7)
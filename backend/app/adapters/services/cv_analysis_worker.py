@@ -0,0 +1,249 @@
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.entities.cv_analysis_job import CVAnalysisJob, CVAnalysisJobStatus, CVAnalyzer
+from app.core.interfaces.cv_analysis_service import CVAnalysisService
+from app.adapters.repositories.cv_analysis_job_repository import SQLAlchemyCVAnalysisJobRepository
+from app.adapters.services.cv_parsing_executor import CVDocumentRejected, shutdown_cv_parsing_executor
+
+logger = logging.getLogger(__name__)
+
+# Avancement affiché une fois le fichier récupéré depuis le stockage objet
+DOWNLOADED_PROGRESS = 40
+
+
+async def analyze_cv_content(analysis_service: CVAnalysisService, content: bytes, file_type: str) -> Dict[str, Any]:
+    """
+    Analyse le contenu d'un CV selon son format
+
+    Raises:
+        ValueError si le format n'est pas supporté
+    """
+    if file_type == "pdf":
+        return await analysis_service.analyze_pdf(content)
+    if file_type in ("docx", "doc"):
+        return await analysis_service.analyze_docx(content)
+    raise ValueError(f"Format de fichier non supporté: {file_type}")
+
+
+def format_candidate(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Met en forme le résultat d'analyse pour le frontend"""
+    personal_info = result.get("personal_info") or {}
+    return {
+        "name": result.get("name") or personal_info.get("name", ""),
+        "email": result.get("email") or personal_info.get("email", ""),
+        "phone": result.get("phone") or personal_info.get("phone", ""),
+        "skills": result.get("skills", []),
+        "experience": result.get("experience", []),
+        "education": result.get("education", [])
+    }
+
+
+async def wait_for_job(repository: SQLAlchemyCVAnalysisJobRepository, job: CVAnalysisJob,
+                       timeout: float) -> CVAnalysisJob:
+    """
+    Attend la fin du traitement d'un job par un worker, dans la limite de timeout secondes
+
+    Returns:
+        Le job dans son dernier état (encore en file ou en cours si le délai est dépassé)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while job.status in (CVAnalysisJobStatus.QUEUED, CVAnalysisJobStatus.ANALYZING) and loop.time() < deadline:
+        await asyncio.sleep(settings.CV_JOB_POLL_INTERVAL)
+        # Relire l'état validé par le worker
+        repository.db.expire_all()
+        job = await repository.get(job.id)
+    return job
+
+
+class CVAnalysisWorkerPool:
+    """
+    Pool de workers asynchrones consommant la file des analyses de CV
+
+    Chaque processus exécute `concurrency` boucles qui réservent un job, téléchargent le
+    fichier depuis le stockage objet, l'analysent et persistent le résultat. Plusieurs
+    processus (ou conteneurs) peuvent consommer la même file : la réservation s'appuie
+    sur SKIP LOCKED. Les jobs d'un worker disparu sont remis en file après lease_timeout.
+
+    Les jobs déposés via /api/v1/n8n/cv-analysis sont analysés par l'agent IA maison
+    (CVAnalyzer.AGENT), les autres par le service d'analyse de CV.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None, storage: Any = None,
+                 analysis_service: Optional[CVAnalysisService] = None, agent_service: Any = None,
+                 concurrency: Optional[int] = None,
+                 poll_interval: Optional[float] = None, max_attempts: Optional[int] = None,
+                 lease_timeout: Optional[int] = None, worker_id: Optional[str] = None):
+        if session_factory is None:
+            from app.infrastructure.database.session import SessionLocal
+            session_factory = SessionLocal
+        if analysis_service is None:
+            from app.adapters.services.enhanced_cv_analysis_service import get_cv_analysis_service
+            analysis_service = get_cv_analysis_service()
+
+        self.session_factory = session_factory
+        self._storage = storage
+        self.analysis_service = analysis_service
+        self._agent_service = agent_service
+        self.concurrency = concurrency or settings.CV_JOB_WORKER_CONCURRENCY
+        self.poll_interval = poll_interval if poll_interval is not None else settings.CV_JOB_POLL_INTERVAL
+        self.max_attempts = max_attempts or settings.CV_JOB_MAX_ATTEMPTS
+        self.lease_timeout = lease_timeout or settings.CV_JOB_LEASE_TIMEOUT
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def storage(self) -> Any:
+        """Stockage objet des CV (MinIO par défaut), créé à la première utilisation"""
+        if self._storage is None:
+            from app.infrastructure.storage.minio_client import get_minio_client
+            self._storage = get_minio_client()
+        return self._storage
+
+    @property
+    def agent_service(self) -> Any:
+        """Agent IA maison (jobs CVAnalyzer.AGENT), créé à la première utilisation"""
+        if self._agent_service is None:
+            from app.adapters.n8n.workflow_service import N8nWorkflowService
+            from app.adapters.services.agent_ia_maison_service import AgentIAMaisonService
+            from app.adapters.services.service_container import get_shared_rag_service
+            self._agent_service = AgentIAMaisonService(N8nWorkflowService(), get_shared_rag_service())
+        return self._agent_service
+
+    async def analyze(self, job: CVAnalysisJob, content: bytes) -> Dict[str, Any]:
+        """Analyse le contenu d'un CV avec l'analyseur choisi au dépôt du job"""
+        if job.analyzer == CVAnalyzer.AGENT:
+            cv_data = await self.agent_service.extract_cv_data(content, job.file_name)
+            skills_analysis = await self.agent_service.analyze_skills(cv_data)
+            return {**format_candidate(cv_data), "skills_analysis": skills_analysis}
+        return format_candidate(await analyze_cv_content(self.analysis_service, content, job.file_type))
+
+    async def _heartbeat_loop(self, repository: SQLAlchemyCVAnalysisJobRepository, job_id: int) -> None:
+        """Rafraîchit le signe de vie du job pendant son traitement"""
+        while True:
+            await asyncio.sleep(self.lease_timeout / 3)
+            try:
+                await repository.heartbeat(job_id)
+            except Exception as e:
+                logger.error(f"Impossible de rafraîchir le signe de vie du CV {job_id}: {str(e)}")
+
+    async def process_next(self, worker_name: Optional[str] = None) -> bool:
+        """
+        Réserve et traite un job
+
+        Returns:
+            True si un job a été traité (avec succès ou non), False si la file est vide
+        """
+        db = self.session_factory()
+        try:
+            repository = SQLAlchemyCVAnalysisJobRepository(db)
+            worker_id = worker_name or self.worker_id
+            job = await repository.claim_next(worker_id)
+            if not job:
+                return False
+
+            heartbeat = asyncio.create_task(self._heartbeat_loop(repository, job.id))
+            try:
+                content = await self.storage.download_file(job.object_name)
+                await repository.update_progress(job.id, DOWNLOADED_PROGRESS)
+
+                result = await self.analyze(job, content)
+                owned = await repository.complete(job.id, result, worker_id=worker_id)
+                logger.info(f"Analyse du CV {job.id} ({job.file_name}) terminée")
+            except CVDocumentRejected as e:
+                # Document hors limites : inutile de réessayer
+                logger.warning(f"CV {job.id} ({job.file_name}) refusé: {str(e)}")
+                owned = await repository.fail(job.id, str(e), max_attempts=1, worker_id=worker_id)
+            except Exception as e:
+                logger.error(f"Erreur lors de l'analyse du CV {job.id} ({job.file_name}): {str(e)}")
+                owned = await repository.fail(job.id, str(e), self.max_attempts, worker_id=worker_id)
+            finally:
+                heartbeat.cancel()
+            if not owned:
+                # Bail expiré : le job a été repris, son état actuel est conservé
+                logger.warning(f"CV {job.id} ({job.file_name}) repris par un autre worker, résultat ignoré")
+            return True
+        finally:
+            db.close()
+
+    async def requeue_stale(self) -> int:
+        """Reprend les jobs réservés par des workers disparus (remis en file ou en erreur)"""
+        db = self.session_factory()
+        try:
+            count = await SQLAlchemyCVAnalysisJobRepository(db).requeue_stale(self.lease_timeout, self.max_attempts)
+            if count:
+                logger.warning(f"{count} analyse(s) de CV abandonnée(s) reprise(s)")
+            return count
+        finally:
+            db.close()
+
+    async def run_until_empty(self) -> int:
+        """Traite les jobs en file jusqu'à épuisement (tests, traitement ponctuel)"""
+        processed = 0
+        while await self.process_next():
+            processed += 1
+        return processed
+
+    async def _wait(self, delay: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _worker_loop(self, index: int) -> None:
+        worker_name = f"{self.worker_id}/{index}"
+        while not self._stopping.is_set():
+            try:
+                processed = await self.process_next(worker_name)
+            except Exception as e:
+                # Base indisponible : on attend avant de réessayer
+                logger.error(f"Worker {worker_name} : erreur lors de la réservation d'un job: {str(e)}")
+                processed = False
+            if not processed:
+                await self._wait(self.poll_interval)
+
+    async def _reaper_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.requeue_stale()
+            except Exception as e:
+                logger.error(f"Erreur lors de la reprise des analyses abandonnées: {str(e)}")
+            await self._wait(self.lease_timeout / 2)
+
+    async def start(self) -> None:
+        """Démarre les boucles de traitement et la reprise des jobs abandonnés"""
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._worker_loop(index)) for index in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._reaper_loop()))
+        logger.info(f"Worker {self.worker_id} démarré ({self.concurrency} analyses simultanées)")
+
+    async def stop(self) -> None:
+        """Arrête le pool après la fin des analyses en cours"""
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_forever(self) -> None:
+        """Exécute le pool jusqu'à SIGINT / SIGTERM"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopping.set)
+        await self.start()
+        await self._stopping.wait()
+        await self.stop()
+        shutdown_cv_parsing_executor()
+
+
+if __name__ == "__main__":
+    # Processus worker dédié : python -m app.adapters.services.cv_analysis_worker
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(CVAnalysisWorkerPool().run_forever())
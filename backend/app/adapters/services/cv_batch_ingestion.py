@@ -0,0 +1,241 @@
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+import asyncio
+import logging
+import os
+import time
+import uuid
+import zipfile
+
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.core.entities.cv_analysis_job import CVAnalysisJob, CVAnalysisJobStatus
+from app.adapters.repositories.cv_analysis_job_repository import SQLAlchemyCVAnalysisJobRepository
+from app.adapters.services.cv_parsing_executor import CVDocumentRejected
+
+logger = logging.getLogger(__name__)
+
+# Extensions de CV acceptées, seules ou dans une archive
+CV_EXTENSIONS = ("pdf", "docx", "doc")
+
+
+@dataclass
+class CVBatchItem:
+    """CV d'un lot, lu seulement au moment de son traitement"""
+    name: str
+    content_type: str
+    size: Optional[int]
+    read: Callable[[], bytes]
+
+
+def _zip_items(archive: zipfile.ZipFile) -> List[CVBatchItem]:
+    items = []
+    for info in archive.infolist():
+        name = os.path.basename(info.filename)
+        # Répertoires et métadonnées macOS
+        if info.is_dir() or not name or info.filename.startswith("__MACOSX/"):
+            continue
+        items.append(CVBatchItem(
+            name=name,
+            content_type="application/octet-stream",
+            size=info.file_size,
+            read=lambda info=info: archive.read(info)
+        ))
+    return items
+
+
+def _upload_size(file: UploadFile) -> int:
+    """Taille d'un fichier envoyé : annoncée par l'envoi, sinon mesurée sur le fichier temporaire"""
+    size = getattr(file, "size", None)
+    if size is None:
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+    return size
+
+
+def expand_batch(files: List[UploadFile]) -> List[CVBatchItem]:
+    """
+    Liste les CV d'un envoi multipart : fichiers isolés et membres des archives zip
+
+    Les archives sont lues membre par membre depuis le fichier temporaire de l'envoi,
+    sans être chargées en mémoire.
+
+    Raises:
+        ValueError si une archive est illisible
+    """
+    items = []
+    for file in files:
+        if file.filename.lower().endswith(".zip"):
+            try:
+                items.extend(_zip_items(zipfile.ZipFile(file.file)))
+            except zipfile.BadZipFile:
+                raise ValueError(f"Archive zip invalide: {file.filename}")
+        else:
+            items.append(CVBatchItem(
+                name=file.filename,
+                content_type=file.content_type or "application/octet-stream",
+                size=_upload_size(file),
+                read=lambda file=file: (file.file.seek(0), file.file.read())[1]
+            ))
+    return items
+
+
+class CVBatchIngestionService:
+    """
+    Ingestion d'un lot de CV : stockage, mise en file et suivi fichier par fichier
+
+    Chaque CV devient un job de la file d'analyse, traité par les workers comme les envois
+    isolés. Au plus `concurrency` CV du lot sont lus et stockés à la fois ; une fois en file,
+    un CV ne retient plus de place et tous les jobs du lot sont suivis ensemble, par une
+    requête à chaque intervalle. Un événement est produit à la fin de chaque CV, dans
+    l'ordre d'achèvement, puis un bilan avec le débit global.
+    """
+
+    def __init__(self, repository: SQLAlchemyCVAnalysisJobRepository, storage: Any,
+                 concurrency: Optional[int] = None, max_bytes: Optional[int] = None,
+                 wait_timeout: Optional[float] = None):
+        self.repository = repository
+        self.storage = storage
+        self.concurrency = (concurrency or settings.CV_BATCH_CONCURRENCY
+                            or settings.CV_PARSER_WORKERS or os.cpu_count() or 1)
+        self.max_bytes = max_bytes or settings.CV_MAX_BYTES
+        self.wait_timeout = wait_timeout if wait_timeout is not None else settings.CV_JOB_WAIT_TIMEOUT
+
+    async def _read(self, item: CVBatchItem) -> bytes:
+        if item.size is not None and item.size > self.max_bytes:
+            raise CVDocumentRejected(f"Le CV fait {item.size} octets (maximum {self.max_bytes})")
+        # Lecture du fichier temporaire ou décompression hors de la boucle d'événements
+        content = await asyncio.to_thread(item.read)
+        if len(content) == 0:
+            raise ValueError("Le fichier est vide ou corrompu.")
+        return content
+
+    async def _enqueue(self, index: int, item: CVBatchItem) -> Tuple[Dict[str, Any], Optional[CVAnalysisJob]]:
+        """Stocke un CV et le met en file ; les erreurs sont rapportées dans l'événement (sans job)"""
+        event: Dict[str, Any] = {"event": "file", "index": index, "name": item.name}
+        try:
+            file_type = item.name.rsplit(".", 1)[-1].lower() if "." in item.name else ""
+            if file_type not in CV_EXTENSIONS:
+                raise ValueError("Format de fichier non supporté. Seuls les formats PDF, DOCX et DOC sont acceptés.")
+            content = await self._read(item)
+
+            object_name = f"cv/{uuid.uuid4().hex}.{file_type}"
+            await self.storage.upload_file(object_name, content, item.content_type)
+            job = await self.repository.create(
+                file_name=item.name,
+                file_type=file_type,
+                file_size=len(content),
+                object_name=object_name,
+                queued=True
+            )
+            event["fileId"] = job.id
+            return event, job
+        except Exception as e:
+            logger.error(f"Erreur lors de l'ingestion du CV {item.name}: {str(e)}")
+            event.update(status="error", error=str(e))
+            return event, None
+
+    @staticmethod
+    def _finish(event: Dict[str, Any], job: Optional[CVAnalysisJob]) -> Dict[str, Any]:
+        """Complète l'événement d'un CV mis en file avec le dernier état de son job"""
+        if job is not None and job.status == CVAnalysisJobStatus.ANALYZED:
+            event.update(status="analyzed", candidate=job.result)
+        elif job is None or job.status == CVAnalysisJobStatus.ERROR:
+            event.update(status="error", error=(job.error_message if job else None) or "Analyse interrompue")
+        else:
+            # Toujours en file : le client suit le CV via /status/{fileId}
+            event.update(status="analyzing")
+        return event
+
+    async def _wait(self, waiting: Dict[int, Tuple[Dict[str, Any], float]],
+                    events: asyncio.Queue, enqueued: asyncio.Event) -> None:
+        """
+        Suit les jobs du lot jusqu'à leur fin ou leur échéance, tous relus en une requête
+        à chaque intervalle, jusqu'à ce que le lot soit entièrement mis en file et terminé
+
+        Args:
+            waiting: Jobs suivis (id -> (événement, échéance)), alimenté pendant la mise en file
+            events: File des événements produits
+            enqueued: Signalé quand tous les CV du lot ont été mis en file (ou rejetés)
+        """
+        loop = asyncio.get_running_loop()
+        while waiting or not enqueued.is_set():
+            await asyncio.sleep(settings.CV_JOB_POLL_INTERVAL)
+            if not waiting:
+                continue
+            # Relire l'état validé par les workers
+            self.repository.db.expire_all()
+            jobs = {job.id: job for job in await self.repository.get_many(list(waiting))}
+            now = loop.time()
+            for job_id, (event, deadline) in list(waiting.items()):
+                job = jobs.get(job_id)
+                if (job is not None and now < deadline
+                        and job.status in (CVAnalysisJobStatus.QUEUED, CVAnalysisJobStatus.ANALYZING)):
+                    continue
+                del waiting[job_id]
+                await events.put(self._finish(event, job))
+
+    async def ingest(self, items: Iterable[CVBatchItem]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Traite un lot de CV et produit un événement par CV puis un bilan
+
+        Si le client se déconnecte, les CV encore en cours sont abandonnés.
+        """
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        events: asyncio.Queue = asyncio.Queue()
+        waiting: Dict[int, Tuple[Dict[str, Any], float]] = {}
+        enqueued = asyncio.Event()
+
+        async def enqueue(index: int, item: CVBatchItem) -> None:
+            try:
+                event, job = await self._enqueue(index, item)
+            finally:
+                # Le contenu est stocké : l'attente du worker ne retient pas de place
+                semaphore.release()
+            if job is None:
+                await events.put(event)
+            else:
+                waiting[job.id] = (event, loop.time() + self.wait_timeout)
+
+        async def produce() -> None:
+            tasks = []
+            waiter = asyncio.create_task(self._wait(waiting, events, enqueued))
+            try:
+                for index, item in enumerate(items):
+                    # Le CV suivant n'est lu qu'une fois une place de lecture libérée
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(enqueue(index, item)))
+                await asyncio.gather(*tasks)
+                enqueued.set()
+                await waiter
+            finally:
+                for task in tasks:
+                    task.cancel()
+                waiter.cancel()
+                await events.put(None)
+
+        producer = asyncio.create_task(produce())
+        total = analyzed = pending = 0
+        try:
+            while (event := await events.get()) is not None:
+                total += 1
+                analyzed += event["status"] == "analyzed"
+                pending += event["status"] == "analyzing"
+                yield event
+            await producer
+        finally:
+            producer.cancel()
+
+        elapsed = time.monotonic() - started
+        yield {
+            "event": "summary",
+            "total": total,
+            "analyzed": analyzed,
+            "analyzing": pending,
+            "errors": total - analyzed - pending,
+            "elapsed_seconds": round(elapsed, 3),
+            "cvs_per_second": round(total / elapsed, 2) if elapsed > 0 else 0.0
+        }
@@ -0,0 +1,182 @@
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import logging
+import os
+import pickle
+import threading
+
+from app.core.config import settings
+from app.adapters.services.document_text import CVDocumentRejected, iter_text_blocks
+from app.adapters.services.cv_segmenter import segment_blocks
+from app.adapters.services.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy, load_skill_matcher
+
+logger = logging.getLogger(__name__)
+
+# Version de l'extraction et de l'analyse : à incrémenter quand leur résultat change
+CV_PARSER_VERSION = "3"
+
+
+# Analyseur du processus courant (un par processus du pool)
+_parser = None
+
+
+def _get_parser():
+    global _parser
+    if _parser is None:
+        from app.adapters.services.enhanced_cv_analysis_service import EnhancedCVAnalysisService
+        _parser = EnhancedCVAnalysisService()
+    return _parser
+
+
+def parse_cv_document(content: bytes, file_type: str, max_pages: int,
+                      matcher_path: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    Extrait le texte d'un CV puis ses informations structurées (exécuté dans un processus du pool)
+
+    Args:
+        matcher_path: Automate compilé de la taxonomie des compétences (vocabulaire intégré sinon)
+
+    Returns:
+        Tuple (texte brut, données structurées du CV)
+    """
+    parser = _get_parser()
+    if matcher_path:
+        try:
+            parser.skill_matcher = load_skill_matcher(matcher_path)
+        except (OSError, pickle.UnpicklingError) as e:
+            logger.warning(f"Automate des compétences illisible ({matcher_path}), automate précédent conservé: {str(e)}")
+    if file_type not in ("pdf", "docx", "doc"):
+        raise CVDocumentRejected(f"Format de fichier non supporté: {file_type}")
+
+    # Le découpage en sections avance au rythme de l'extraction des pages
+    blocks = []
+
+    def collect() -> Iterator[str]:
+        for block in iter_text_blocks(content, file_type, max_pages, strict=True):
+            blocks.append(block)
+            yield block
+
+    segmentation = segment_blocks(collect())
+    text = "\n".join(blocks)
+    return text, parser._parse_cv_text(text, segmentation)
+
+
+class CVParsingExecutor:
+    """
+    Exécuteur CPU pour l'extraction et l'analyse des CV
+
+    Le travail est délégué à un pool de processus dimensionné sur le nombre de cœurs :
+    un PDF volumineux n'occupe qu'un processus et ne bloque jamais la boucle d'événements.
+    Chaque document est borné en taille, en nombre de pages et en durée ; un document qui
+    dépasse son délai est interrompu en recyclant le pool. Avec une taxonomie, chaque document
+    transmet le chemin de l'automate des compétences courant, rechargé par les processus du pool.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None,
+                 max_pages: Optional[int] = None, max_bytes: Optional[int] = None,
+                 taxonomy: Optional[SkillTaxonomy] = None):
+        self.max_workers = max_workers or settings.CV_PARSER_WORKERS or os.cpu_count() or 1
+        self.timeout = timeout or settings.CV_PARSE_TIMEOUT
+        self.max_pages = max_pages or settings.CV_MAX_PAGES
+        self.max_bytes = max_bytes or settings.CV_MAX_BYTES
+        self.taxonomy = taxonomy
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Arrête les processus du pool (seul moyen d'interrompre une extraction en cours)"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Exécute une fonction dans le pool de processus
+
+        Raises:
+            asyncio.TimeoutError si la fonction dépasse son délai (le processus est arrêté)
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self._get_pool()
+            future = loop.run_in_executor(pool, fn, *args)
+            try:
+                return await asyncio.wait_for(future, timeout=timeout or self.timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Extraction interrompue après {timeout or self.timeout}s, recyclage du pool")
+                self._recycle_pool(pool)
+                raise
+            except asyncio.CancelledError:
+                # Requête annulée : la tâche en file est abandonnée, celle en cours se termine seule
+                future.cancel()
+                raise
+            except BrokenProcessPool:
+                # Pool recyclé par le délai d'un autre document : une seule nouvelle tentative
+                self._recycle_pool(pool)
+                if attempt:
+                    raise
+
+    async def parse(self, content: bytes, file_type: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extrait et analyse un CV hors de la boucle d'événements
+
+        Returns:
+            Tuple (texte brut, données structurées du CV)
+
+        Raises:
+            CVDocumentRejected si le document dépasse max_bytes / max_pages ou n'est pas supporté
+            asyncio.TimeoutError si l'analyse dépasse le délai
+        """
+        if len(content) > self.max_bytes:
+            raise CVDocumentRejected(
+                f"Le CV fait {len(content)} octets (maximum {self.max_bytes})"
+            )
+        matcher_path = await self.taxonomy.matcher_path() if self.taxonomy else None
+        return await self.run(parse_cv_document, content, file_type, self.max_pages, matcher_path)
+
+    async def parser_version(self) -> str:
+        """Version des résultats produits : analyseur et taxonomie des compétences courante"""
+        if self.taxonomy is None:
+            return CV_PARSER_VERSION
+        await self.taxonomy.matcher_path()
+        return f"{CV_PARSER_VERSION}-{self.taxonomy.version or 'builtin'}"
+
+    def shutdown(self) -> None:
+        """Arrête le pool de processus"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Exécuteur partagé par le processus
+_cv_parsing_executor: Optional[CVParsingExecutor] = None
+
+
+def get_cv_parsing_executor() -> CVParsingExecutor:
+    """
+    Factory pour l'injection de dépendance de l'exécuteur d'analyse des CV
+    """
+    global _cv_parsing_executor
+    if _cv_parsing_executor is None:
+        _cv_parsing_executor = CVParsingExecutor(taxonomy=get_skill_taxonomy())
+    return _cv_parsing_executor
+
+
+def shutdown_cv_parsing_executor() -> None:
+    """Arrête l'exécuteur partagé (arrêt de l'application ou du worker)"""
+    global _cv_parsing_executor
+    if _cv_parsing_executor is not None:
+        _cv_parsing_executor.shutdown()
+    _cv_parsing_executor = None
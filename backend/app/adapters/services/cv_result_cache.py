@@ -0,0 +1,163 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+from collections import OrderedDict
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Préfixe des clés dans Redis
+CACHE_KEY_PREFIX = "talentmatch:cv-result"
+
+
+def content_hash(content: bytes) -> str:
+    """Empreinte SHA-256 du contenu d'un fichier"""
+    return hashlib.sha256(content).hexdigest()
+
+
+class CVResultCache:
+    """
+    Cache des résultats d'analyse de CV indexé par le contenu du fichier
+
+    Deux niveaux : un LRU en mémoire du processus, puis Redis partagé entre l'API et les
+    workers. La clé contient la version de l'analyseur (et de la taxonomie des compétences) :
+    une nouvelle version invalide les entrées sans purge. Si Redis est indisponible, seul
+    le niveau local est utilisé jusqu'à la prochaine tentative de connexion.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[int] = None,
+                 redis_client: Any = None, redis_enabled: Optional[bool] = None,
+                 redis_retry_interval: float = 30.0):
+        self.max_entries = max_entries or settings.CV_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.CV_CACHE_TTL
+        self._redis = redis_client
+        self._redis_enabled = redis_enabled if redis_enabled is not None else (
+            redis_client is not None or settings.CV_CACHE_REDIS_ENABLED
+        )
+        self.redis_retry_interval = redis_retry_interval
+        self._redis_down_until = 0.0
+        # Valeurs sérialisées en JSON : chaque lecture renvoie une copie indépendante
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def key(namespace: str, version: str, content: bytes) -> str:
+        """Clé d'un résultat : type d'analyse, version de l'analyseur et empreinte du contenu"""
+        return f"{CACHE_KEY_PREFIX}:{namespace}:{version}:{content_hash(content)}"
+
+    @property
+    def redis(self) -> Any:
+        """Client Redis (tier partagé), ou None s'il est désactivé ou indisponible"""
+        if not self._redis_enabled or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.Redis.from_url(
+                settings.REDIS_URL, socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        return self._redis
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.warning(f"Cache Redis indisponible, cache local seul pendant {self.redis_retry_interval}s: {str(error)}")
+        self._redis_down_until = time.monotonic() + self.redis_retry_interval
+
+    def _get_local(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._local.get(key)
+            if value is not None:
+                self._local.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: str) -> None:
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Renvoie le résultat en cache (copie), ou None"""
+        value = self._get_local(key)
+        if value is None and self.redis is not None:
+            try:
+                raw = await self.redis.get(key)
+            except Exception as e:
+                self._redis_failed(e)
+                raw = None
+            if raw is not None:
+                value = raw.decode() if isinstance(raw, bytes) else raw
+                self._set_local(key, value)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        await self._store(key, json.dumps(result, ensure_ascii=False, default=str))
+
+    async def _store(self, key: str, value: str) -> None:
+        self._set_local(key, value)
+        if self.redis is not None:
+            try:
+                await self.redis.set(key, value, ex=self.ttl)
+            except Exception as e:
+                self._redis_failed(e)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Renvoie le résultat en cache ou le calcule
+
+        Les demandes simultanées pour un même contenu attendent le premier calcul au lieu
+        de le relancer ; si celui-ci échoue, chacune calcule de son côté.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            await asyncio.wait([inflight])
+            if not inflight.cancelled() and inflight.exception() is None:
+                return json.loads(inflight.result())
+            return await compute()
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+            value = json.dumps(result, ensure_ascii=False, default=str)
+            await self._store(key, value)
+            future.set_result(value)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Exception consultée ici : pas d'avertissement si aucune demande n'attendait
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Vide le niveau local"""
+        with self._lock:
+            self._local.clear()
+
+
+# Cache partagé par le processus
+_cv_result_cache: Optional[CVResultCache] = None
+
+
+def get_cv_result_cache() -> CVResultCache:
+    """
+    Factory pour l'injection de dépendance du cache des résultats d'analyse de CV
+    """
+    global _cv_result_cache
+    if _cv_result_cache is None:
+        _cv_result_cache = CVResultCache()
+    return _cv_result_cache
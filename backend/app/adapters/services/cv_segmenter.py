@@ -0,0 +1,117 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+import re
+
+from app.adapters.services.document_text import iter_section_lines
+
+# Types d'entité d'une ligne
+BLANK, TEXT, DATES, YEAR, CONTACT = "blank", "text", "dates", "year", "contact"
+
+_MONTHS = (
+    "Janvier|Février|Mars|Avril|Mai|Juin|Juillet|Août|Septembre|Octobre|Novembre|Décembre"
+    "|Jan|Fév|Mar|Avr|Mai|Jun|Jul|Aoû|Sep|Oct|Nov|Déc"
+)
+DATE_RANGE_PATTERN = re.compile(
+    rf"({_MONTHS})\s+(\d{{4}})\s*-\s*({_MONTHS}|Présent)\s*(\d{{4}})?", flags=re.IGNORECASE
+)
+YEAR_PATTERN = re.compile(r"(\d{4})\s*-\s*(\d{4})|(\d{4})")
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+PHONE_PATTERN = re.compile(
+    r"\+\d{1,4}[\s\d-]{7,12}|\d{2}[\s\.-]?\d{2}[\s\.-]?\d{2}[\s\.-]?\d{2}[\s\.-]?\d{2}"
+)
+# Localisation, par ordre de priorité : libellé explicite, en-tête "Ville, Pays | ...", ligne "Ville, Pays"
+LOCATION_PATTERNS = (
+    ("location_labelled", re.compile(r"(?:Adresse|Location|Localisation|Ville)\s*:\s*([^,\n]+(?:,\s*[^,\n]+)*)"), False),
+    ("location_header", re.compile(r"([^,|\n]+,\s*[^,|\n]+)\s*\|\s*"), False),
+    ("location_country", re.compile(r"([A-Z][a-zé]+(?: [A-Z][a-zé]+)*,\s*(?:France|Belgique|Suisse|Canada))"), True),
+)
+
+
+@dataclass
+class CVLine:
+    """Ligne d'un CV étiquetée par sa section et son type d'entité"""
+    text: str
+    section: Optional[str]
+    kind: str
+    value: Any = None
+
+
+@dataclass
+class CVSegmentation:
+    """
+    Découpage d'un CV en lignes étiquetées, produit en un seul passage
+
+    Les extracteurs (expériences, formation, informations personnelles) lisent ce
+    découpage au lieu de rechercher à nouveau les titres et motifs dans le texte.
+    """
+    lines: List[CVLine] = field(default_factory=list)
+    # Première valeur rencontrée par entité (email, phone, location_*)
+    entities: Dict[str, str] = field(default_factory=dict)
+
+    def first_line(self) -> Optional[CVLine]:
+        """Première ligne non vide du CV"""
+        return next((line for line in self.lines if line.kind != BLANK), None)
+
+    def blocks(self, section: str) -> Iterator[List[CVLine]]:
+        """Blocs de lignes consécutives non vides d'une section (une expérience, une formation...)"""
+        block: List[CVLine] = []
+        for line in self.lines:
+            if line.section == section and line.kind != BLANK:
+                block.append(line)
+                continue
+            if block:
+                yield block
+                block = []
+        if block:
+            yield block
+
+
+def _label(text: str, section: Optional[str], entities: Dict[str, str], first: bool) -> CVLine:
+    stripped = text.strip()
+    if not stripped:
+        return CVLine(text, section, BLANK)
+
+    # Coordonnées : recherchées partout, seule la première occurrence est retenue
+    kind = TEXT
+    for name, pattern in (("email", EMAIL_PATTERN), ("phone", PHONE_PATTERN)):
+        if name not in entities:
+            match = pattern.search(text)
+            if match:
+                entities[name] = match.group(0)
+                kind = CONTACT
+    for name, pattern, line_start in LOCATION_PATTERNS:
+        if name not in entities and not (line_start and first):
+            match = pattern.match(text) if line_start else pattern.search(text)
+            if match:
+                entities[name] = match.group(1).strip()
+
+    # Entités propres à la section
+    if section == "experience":
+        match = DATE_RANGE_PATTERN.search(text)
+        if match:
+            return CVLine(text, section, DATES, match.groups())
+    elif section == "education":
+        match = YEAR_PATTERN.search(text)
+        if match:
+            return CVLine(text, section, YEAR, int(match.group(3) or match.group(2)))
+    return CVLine(text, section, kind)
+
+
+def segment_lines(lines: Iterable[Tuple[Optional[str], str]]) -> CVSegmentation:
+    """Étiquette des lignes déjà rattachées à leur section (voir iter_section_lines)"""
+    segmentation = CVSegmentation()
+    for section, text in lines:
+        segmentation.lines.append(
+            _label(text, section, segmentation.entities, first=not segmentation.lines)
+        )
+    return segmentation
+
+
+def segment_blocks(blocks: Iterable[str]) -> CVSegmentation:
+    """Découpe des blocs de texte (pages, paragraphes) au fil de leur extraction"""
+    return segment_lines(iter_section_lines(blocks))
+
+
+def segment_cv(text: str) -> CVSegmentation:
+    """Découpe le texte complet d'un CV"""
+    return segment_blocks([text])
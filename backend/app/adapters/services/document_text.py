@@ -0,0 +1,161 @@
+from typing import Iterable, Iterator, Optional, Tuple
+import codecs
+import io
+import re
+import xml.etree.ElementTree as ElementTree
+import zipfile
+
+
+class CVDocumentRejected(ValueError):
+    """Document refusé avant ou pendant l'extraction (taille, nombre de pages, format)"""
+
+
+# Espace de noms WordprocessingML du corps d'un fichier DOCX
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Taille des blocs produits pour un document texte brut
+TEXT_BLOCK_SIZE = 64 * 1024
+
+# Titres de section reconnus : une ligne courte ne contenant que le titre
+SECTION_HEADERS = (
+    ("experience", r"exp[ée]riences?(?:\s+professionnelles?)?|professional\s+experience|work\s+experience|emplois|parcours\s+professionnel"),
+    ("education", r"formations?|[ée]ducation|dipl[ôo]mes?|[ée]tudes"),
+    ("skills", r"comp[ée]tences(?:\s+techniques)?|skills|technical\s+skills"),
+    ("languages", r"langues|languages"),
+    ("certifications", r"certifications?"),
+    ("projects", r"projets|projects"),
+    ("interests", r"centres?\s+d'int[ée]r[êe]ts?|loisirs|interests|hobbies"),
+)
+_SECTION_PATTERN = re.compile(
+    r"^\s*(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in SECTION_HEADERS) + r")\s*:?\s*$",
+    flags=re.IGNORECASE
+)
+
+
+def iter_pdf_pages(content: bytes, max_pages: Optional[int] = None, strict: bool = False) -> Iterator[str]:
+    """
+    Produit le texte d'un PDF page par page, depuis la mémoire et sans fichier temporaire
+
+    Une page n'est décodée que lorsqu'elle est demandée : l'appelant peut s'arrêter à tout
+    moment et seul le texte de la page courante est construit.
+
+    Args:
+        max_pages: Nombre maximum de pages lues (toutes par défaut)
+        strict: Refuser le document s'il dépasse max_pages au lieu de le tronquer
+
+    Raises:
+        CVDocumentRejected si strict et que le document dépasse max_pages
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    page_count = len(reader.pages)
+    if max_pages is not None and page_count > max_pages:
+        if strict:
+            raise CVDocumentRejected(f"Le CV compte {page_count} pages (maximum {max_pages})")
+        page_count = max_pages
+    for index in range(page_count):
+        yield reader.pages[index].extract_text() or ""
+
+
+def _paragraph_text(paragraph: ElementTree.Element) -> str:
+    parts = []
+    for element in paragraph.iter():
+        if element.tag == f"{_W}t":
+            parts.append(element.text or "")
+        elif element.tag == f"{_W}tab":
+            parts.append("\t")
+        elif element.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def iter_docx_paragraphs(content: bytes) -> Iterator[str]:
+    """
+    Produit le texte d'un DOCX paragraphe par paragraphe
+
+    Le corps du document est lu en flux : chaque paragraphe est libéré après avoir été produit.
+
+    Raises:
+        CVDocumentRejected si le fichier n'est pas un DOCX lisible
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(content))
+        body = archive.open("word/document.xml")
+    except (zipfile.BadZipFile, KeyError):
+        raise CVDocumentRejected("Le fichier n'est pas un document DOCX lisible")
+    with archive, body:
+        for _, element in ElementTree.iterparse(body, events=("end",)):
+            if element.tag == f"{_W}p":
+                yield _paragraph_text(element)
+                element.clear()
+
+
+def iter_plain_text(content: bytes, block_size: int = TEXT_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Produit le texte d'un document brut par blocs, coupés en fin de ligne
+
+    Le décodeur incrémental conserve un caractère multi-octets coupé en fin de bloc.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    pending = ""
+    for start in range(0, len(content), block_size):
+        block = pending + decoder.decode(content[start:start + block_size])
+        cut = block.rfind("\n")
+        if cut < 0:
+            pending = block
+            continue
+        pending = block[cut + 1:]
+        yield block[:cut]
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def iter_text_blocks(content: bytes, file_type: str, max_pages: Optional[int] = None,
+                     strict: bool = False) -> Iterator[str]:
+    """
+    Produit le texte d'un document par blocs (pages d'un PDF, paragraphes d'un DOCX)
+
+    Args:
+        file_type: Extension du fichier, sans le point
+        max_pages: Nombre maximum de pages lues pour un PDF
+        strict: Refuser un PDF de plus de max_pages pages au lieu de le tronquer
+
+    Raises:
+        CVDocumentRejected si le format n'est pas supporté ou le document refusé
+    """
+    file_type = file_type.lower().lstrip(".")
+    if file_type == "pdf":
+        return iter_pdf_pages(content, max_pages, strict)
+    if file_type in ("docx", "doc"):
+        return iter_docx_paragraphs(content)
+    if file_type in ("txt", "md", ""):
+        return iter_plain_text(content)
+    raise CVDocumentRejected(f"Format de fichier non supporté: {file_type}")
+
+
+def detect_section(line: str) -> Optional[str]:
+    """Renvoie la section dont la ligne est le titre (experience, education, skills...), ou None"""
+    if len(line) > 60:
+        return None
+    match = _SECTION_PATTERN.match(line)
+    return match.lastgroup if match else None
+
+
+def iter_section_lines(blocks: Iterable[str]) -> Iterator[Tuple[Optional[str], str]]:
+    """
+    Découpe des blocs de texte en lignes étiquetées par leur section, au fil de l'extraction
+
+    Les lignes précédant le premier titre sont étiquetées None (en-tête du CV) ; les titres
+    eux-mêmes ne sont pas produits. L'appelant peut s'arrêter dès qu'il a les sections voulues,
+    sans que les pages suivantes soient extraites.
+    """
+    section = None
+    for block in blocks:
+        for line in block.split("\n"):
+            header = detect_section(line)
+            if header is not None:
+                section = header
+                continue
+            yield section, line
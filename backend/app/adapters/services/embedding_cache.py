@@ -0,0 +1,231 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.interfaces.embedding_service import EmbeddingService
+from app.adapters.services.embedding_service import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Enregistrement du fichier persistant : empreinte (32 octets), type (1 octet), dimension (uint32), vecteur
+_RECORD_HEADER = struct.Struct("<32sBI")
+_DTYPES = {0: np.dtype("float32"), 1: np.dtype("float16")}
+_DTYPE_CODES = {dtype: code for code, dtype in _DTYPES.items()}
+
+# Coût mémoire approximatif d'une entrée du LRU en plus des octets du vecteur
+_ENTRY_OVERHEAD = 200
+
+
+def embedding_key(model_id: str, text: str) -> bytes:
+    """Clé d'un embedding : empreinte SHA-256 du modèle et du texte normalisé"""
+    return hashlib.sha256(f"{model_id}\0{normalize_text(text)}".encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """
+    Cache des embeddings à deux niveaux
+
+    Un LRU en mémoire du processus, borné en octets, puis (si un répertoire est configuré)
+    un fichier ajout seul projeté en mémoire, partagé entre les processus et conservé entre
+    les redémarrages. Les vecteurs lus dans le fichier ne sont pas copiés. Les compteurs
+    de hits / misses servent à dimensionner le cache.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, directory: Optional[str] = None):
+        self.max_bytes = max_bytes if max_bytes is not None else settings.EMBEDDING_CACHE_MAX_BYTES
+        directory = directory if directory is not None else settings.EMBEDDING_CACHE_DIR
+        self.path = Path(directory) / "embeddings.bin" if directory else None
+        self._local: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._local_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Niveau persistant : position de chaque vecteur dans le fichier, et fichier projeté
+        self._offsets: Dict[bytes, Tuple[int, int, int]] = {}
+        self._scanned = 0
+        self._map: Optional[mmap.mmap] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.touch(exist_ok=True)
+
+    # -- Niveau local ----------------------------------------------------
+
+    def _get_local(self, key: bytes) -> Optional[np.ndarray]:
+        vector = self._local.get(key)
+        if vector is not None:
+            self._local.move_to_end(key)
+        return vector
+
+    def _set_local(self, key: bytes, vector: np.ndarray) -> None:
+        size = vector.nbytes + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        previous = self._local.pop(key, None)
+        if previous is not None:
+            self._local_bytes -= previous.nbytes + _ENTRY_OVERHEAD
+        self._local[key] = vector
+        self._local_bytes += size
+        while self._local_bytes > self.max_bytes:
+            _, evicted = self._local.popitem(last=False)
+            self._local_bytes -= evicted.nbytes + _ENTRY_OVERHEAD
+            self.evictions += 1
+
+    # -- Niveau persistant -----------------------------------------------
+
+    def _scan(self) -> None:
+        """Indexe les enregistrements ajoutés au fichier depuis le dernier parcours (par tout processus)"""
+        size = self.path.stat().st_size
+        if size <= self._scanned:
+            return
+        # L'ancienne projection reste valide pour les vecteurs encore référencés (fermée par le GC)
+        with open(self.path, "rb") as cache_file:
+            self._map = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = self._scanned
+        while offset + _RECORD_HEADER.size <= size:
+            key, code, dim = _RECORD_HEADER.unpack_from(self._map, offset)
+            dtype = _DTYPES.get(code)
+            end = offset + _RECORD_HEADER.size + dim * (dtype.itemsize if dtype is not None else 0)
+            if dtype is None or end > size:
+                # Fin de fichier incomplète (écriture en cours) : reprise au prochain parcours
+                break
+            self._offsets[key] = (offset + _RECORD_HEADER.size, code, dim)
+            offset = end
+        self._scanned = offset
+
+    def _get_persistent(self, key: bytes) -> Optional[np.ndarray]:
+        if self.path is None:
+            return None
+        if key not in self._offsets:
+            self._scan()
+        position = self._offsets.get(key)
+        if position is None:
+            return None
+        offset, code, dim = position
+        return np.frombuffer(self._map, dtype=_DTYPES[code], count=dim, offset=offset)
+
+    def _append_persistent(self, entries: List[Tuple[bytes, np.ndarray]]) -> None:
+        records = []
+        for key, vector in entries:
+            code = _DTYPE_CODES.get(vector.dtype)
+            if code is None:
+                vector, code = vector.astype(np.float32), 0
+            records.append(_RECORD_HEADER.pack(key, code, len(vector)) + vector.tobytes())
+        # Une seule écriture en mode ajout : les enregistrements des processus ne s'entremêlent pas
+        descriptor = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(descriptor, b"".join(records))
+        finally:
+            os.close(descriptor)
+
+    # -- API ---------------------------------------------------------------
+
+    def get_many(self, keys: Sequence[bytes]) -> List[Optional[np.ndarray]]:
+        """Vecteurs en cache (lecture seule), None pour les clés absentes"""
+        vectors: List[Optional[np.ndarray]] = []
+        with self._lock:
+            for key in keys:
+                vector = self._get_local(key)
+                if vector is not None:
+                    self.hits += 1
+                else:
+                    vector = self._get_persistent(key)
+                    if vector is not None:
+                        self.persistent_hits += 1
+                        self._set_local(key, vector)
+                    else:
+                        self.misses += 1
+                vectors.append(vector)
+        return vectors
+
+    def set_many(self, entries: Sequence[Tuple[bytes, np.ndarray]]) -> None:
+        """Enregistre des vecteurs dans les deux niveaux"""
+        entries = [(key, np.array(vector, copy=True)) for key, vector in entries]
+        for _, vector in entries:
+            vector.flags.writeable = False
+        with self._lock:
+            for key, vector in entries:
+                self._set_local(key, vector)
+            if self.path is not None and entries:
+                self._append_persistent(entries)
+
+    def stats(self) -> Dict[str, float]:
+        """Compteurs du cache"""
+        with self._lock:
+            lookups = self.hits + self.persistent_hits + self.misses
+            return {
+                "hits": self.hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.persistent_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._local),
+                "bytes": self._local_bytes,
+                "max_bytes": self.max_bytes,
+                "persistent_entries": len(self._offsets),
+            }
+
+    def clear(self) -> None:
+        """Vide le niveau local et remet les compteurs à zéro"""
+        with self._lock:
+            self._local.clear()
+            self._local_bytes = 0
+            self.hits = self.persistent_hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        with self._lock:
+            # Les vecteurs déjà lus gardent la projection ouverte tant qu'ils sont référencés
+            self._map = None
+            self._offsets.clear()
+            self._scanned = 0
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """
+    Service d'embedding servant les textes déjà encodés depuis un EmbeddingCache
+
+    Seuls les textes absents du cache (dédupliqués dans le lot) sont transmis au service encapsulé.
+    """
+
+    def __init__(self, service: EmbeddingService, cache: Optional[EmbeddingCache] = None):
+        self.service = service
+        self.cache = cache or EmbeddingCache()
+
+    @property
+    def model_id(self) -> str:
+        return self.service.model_id
+
+    @property
+    def dimension(self) -> int:
+        return self.service.dimension
+
+    async def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return await self.service.embed_many(texts)
+        keys = [embedding_key(self.model_id, text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        missing: Dict[bytes, str] = {}
+        for key, text, vector in zip(keys, texts, cached):
+            if vector is None:
+                missing.setdefault(key, text)
+        computed: Dict[bytes, np.ndarray] = {}
+        if missing:
+            vectors = await self.service.embed_many(list(missing.values()))
+            computed = dict(zip(missing, vectors))
+            self.cache.set_many(list(computed.items()))
+
+        return np.stack([
+            vector if vector is not None else computed[key] for key, vector in zip(keys, cached)
+        ])
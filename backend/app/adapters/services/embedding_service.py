@@ -0,0 +1,244 @@
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from abc import abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import logging
+import os
+import re
+import threading
+import unicodedata
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.interfaces.embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+# Version du hachage des n-grammes : à incrémenter quand les vecteurs produits changent
+HASHED_NGRAM_VERSION = "1"
+
+# Tailles des n-grammes de caractères (les mots courts sont couverts grâce aux espaces de bordure)
+NGRAM_SIZES = (3, 4, 5)
+
+_WHITESPACE = re.compile(r"\s+")
+_BASE = np.uint64(0x100000001B3)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def normalize_text(text: str) -> str:
+    """Forme canonique d'un texte : Unicode NFKC, minuscules, espaces fusionnés"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text).lower()).strip()
+
+
+def _ngram_hashes(data: np.ndarray, size: int) -> np.ndarray:
+    """Empreintes 64 bits de tous les n-grammes d'octets de taille `size` (calcul vectorisé)"""
+    count = len(data) - size + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.uint64)
+    hashes = np.full(count, np.uint64(size), dtype=np.uint64)
+    for offset in range(size):
+        hashes = hashes * _BASE + data[offset:offset + count]
+    # Mélange des bits (splitmix64) : les bits de poids fort dépendent de tout le n-gramme
+    hashes ^= hashes >> np.uint64(31)
+    hashes *= _MIX_1
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= _MIX_2
+    hashes ^= hashes >> np.uint64(33)
+    return hashes
+
+
+def hashed_ngram_vectors(texts: Sequence[str], dimension: int, dtype: str = "float32") -> np.ndarray:
+    """
+    Projection de textes par hachage signé de leurs n-grammes de caractères
+
+    Chaque n-gramme est envoyé sur une coordonnée (avec un signe) ; les comptes sont
+    amortis en log(1 + tf) puis la ligne est normalisée. Le résultat est déterministe
+    et ne dépend d'aucun modèle : deux textes partageant des termes ont un cosinus élevé.
+    """
+    vectors = np.zeros((len(texts), dimension), dtype=np.float32)
+    for row, text in enumerate(texts):
+        data = np.frombuffer(f" {normalize_text(text)} ".encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+        hashes = np.concatenate([_ngram_hashes(data, size) for size in NGRAM_SIZES])
+        if len(hashes) == 0:
+            continue
+        signs = np.where(hashes >> np.uint64(63), -1.0, 1.0)
+        counts = np.bincount((hashes % np.uint64(dimension)).astype(np.int64), weights=signs, minlength=dimension)
+        vectors[row] = np.sign(counts) * np.log1p(np.abs(counts))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(dtype, copy=False)
+
+
+class PooledEmbeddingService(EmbeddingService):
+    """
+    Base des services d'embedding : découpage en lots répartis sur un pool de threads ou de processus
+
+    Tous les lots, même un seul, sont calculés dans le pool : la boucle d'événements n'exécute
+    jamais le calcul des vecteurs ni le chargement d'un modèle.
+    """
+
+    def __init__(self, dimension: int, dtype: Optional[str] = None, batch_size: Optional[int] = None,
+                 workers: Optional[int] = None, pool: str = "thread"):
+        self._dimension = dimension
+        self.dtype = dtype or settings.EMBEDDING_DTYPE
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self.workers = workers or settings.EMBEDDING_WORKERS or os.cpu_count() or 1
+        self.pool = pool
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                executor_class = ProcessPoolExecutor if self.pool == "process" else ThreadPoolExecutor
+                self._executor = executor_class(max_workers=self.workers)
+            return self._executor
+
+    @abstractmethod
+    def _batch_call(self) -> Tuple[Callable[..., np.ndarray], Tuple[Any, ...]]:
+        """Fonction (et arguments après le lot de textes) calculant les vecteurs d'un lot"""
+        pass
+
+    async def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        if not texts:
+            # Dimension d'un modèle pas encore chargé : chargement dans le pool
+            dimension = self._dimension or await loop.run_in_executor(executor, lambda: self.dimension)
+            return np.zeros((0, dimension), dtype=self.dtype)
+        fn, args = self._batch_call()
+        batches = [list(texts[start:start + self.batch_size]) for start in range(0, len(texts), self.batch_size)]
+        results = await asyncio.gather(*(loop.run_in_executor(executor, fn, batch, *args) for batch in batches))
+        return np.concatenate(results)
+
+    def shutdown(self) -> None:
+        """Arrête le pool"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class HashedNgramEmbeddingService(PooledEmbeddingService):
+    """
+    Embeddings hors ligne par hachage des n-grammes de caractères
+
+    Aucun modèle à télécharger ni à charger : utilisable partout, y compris dans les tests.
+    Les lots sont répartis sur un pool de processus pour occuper tous les cœurs.
+    """
+
+    def __init__(self, dimension: Optional[int] = None, dtype: Optional[str] = None,
+                 batch_size: Optional[int] = None, workers: Optional[int] = None, pool: str = "process"):
+        super().__init__(dimension or settings.EMBEDDING_DIM, dtype, batch_size, workers, pool)
+
+    @property
+    def model_id(self) -> str:
+        return f"hashed-ngram-v{HASHED_NGRAM_VERSION}-{self.dimension}-{self.dtype}"
+
+    def _batch_call(self) -> Tuple[Callable[..., np.ndarray], Tuple[Any, ...]]:
+        return hashed_ngram_vectors, (self.dimension, self.dtype)
+
+
+class SentenceTransformerEmbeddingService(PooledEmbeddingService):
+    """
+    Embeddings calculés par un modèle sentence-transformers local (chargé depuis un chemin)
+
+    Le modèle est chargé une fois, à la première utilisation ; les lots sont encodés dans
+    un pool de threads (le calcul libère le GIL).
+    """
+
+    def __init__(self, model_path: Optional[str] = None, dtype: Optional[str] = None,
+                 batch_size: Optional[int] = None, workers: Optional[int] = None, device: Optional[str] = None):
+        super().__init__(0, dtype, batch_size, workers, pool="thread")
+        self.model_path = model_path or settings.EMBEDDING_MODEL_PATH
+        self.device = device
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self) -> Any:
+        with self._model_lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                logger.info(f"Chargement du modèle d'embedding {self.model_path}")
+                self._model = SentenceTransformer(self.model_path, device=self.device)
+                self._dimension = self._model.get_sentence_embedding_dimension()
+            return self._model
+
+    @property
+    def dimension(self) -> int:
+        if not self._dimension:
+            self.model
+        return self._dimension
+
+    @property
+    def model_id(self) -> str:
+        return f"sentence-transformers:{os.path.basename(os.path.normpath(self.model_path))}:{self.dtype}"
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(texts, batch_size=self.batch_size, normalize_embeddings=True,
+                                    convert_to_numpy=True, show_progress_bar=False)
+        return vectors.astype(self.dtype, copy=False)
+
+    def _batch_call(self) -> Tuple[Callable[..., np.ndarray], Tuple[Any, ...]]:
+        return self._encode, ()
+
+
+def create_embedding_service(backend: Optional[str] = None) -> EmbeddingService:
+    """
+    Crée le service d'embedding configuré (EMBEDDING_BACKEND)
+
+    Raises:
+        ValueError si le backend est inconnu ou si le modèle local n'est pas configuré
+    """
+    backend = backend or settings.EMBEDDING_BACKEND
+    if backend == "hashed":
+        return HashedNgramEmbeddingService()
+    if backend == "sentence-transformers":
+        if not settings.EMBEDDING_MODEL_PATH:
+            raise ValueError("EMBEDDING_MODEL_PATH doit indiquer le répertoire du modèle sentence-transformers")
+        return SentenceTransformerEmbeddingService()
+    raise ValueError(f"Backend d'embedding inconnu: {backend}")
+
+
+# Service d'embedding partagé par le processus
+_embedding_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """
+    Factory pour l'injection de dépendance du service d'embedding
+    """
+    global _embedding_service
+    if _embedding_service is None:
+        _embedding_service = create_embedding_service()
+        if settings.EMBEDDING_CACHE_ENABLED:
+            from app.adapters.services.embedding_cache import CachedEmbeddingService
+
+            _embedding_service = CachedEmbeddingService(_embedding_service)
+    return _embedding_service
+
+
+def close_embedding_service(service: EmbeddingService) -> None:
+    """Arrête le pool d'un service d'embedding et ferme son cache s'il en a un"""
+    pooled = getattr(service, "service", service)
+    if isinstance(pooled, PooledEmbeddingService):
+        pooled.shutdown()
+    cache = getattr(service, "cache", None)
+    if cache is not None:
+        cache.close()
+
+
+def shutdown_embedding_service() -> None:
+    """Arrête le pool du service partagé (arrêt de l'application)"""
+    global _embedding_service
+    if _embedding_service is not None:
+        close_embedding_service(_embedding_service)
+    _embedding_service = None
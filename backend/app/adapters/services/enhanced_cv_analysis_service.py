@@ -1,4 +1,5 @@
 from typing import Dict, Any, List, Optional
+import asyncio
 import os
 import json
 import logging
@@ -9,250 +10,61 @@ from datetime import datetime, date
 
 from app.core.interfaces.cv_analysis_service import CVAnalysisService
 from app.core.interfaces.rag_service import RAGService
+from app.adapters.services.skill_matcher import SkillMatcher
+from app.adapters.services.cv_segmenter import (
+    DATES, LOCATION_PATTERNS, YEAR, CVSegmentation, segment_cv
+)
+from app.adapters.services.cv_result_cache import CVResultCache, get_cv_result_cache
+from app.adapters.services.skill_taxonomy import SKILL_LEVELS, SKILLS_CATEGORIES
+from app.adapters.services.cv_parsing_executor import (
+    CVDocumentRejected,
+    CVParsingExecutor,
+    get_cv_parsing_executor,
+)
 
 class EnhancedCVAnalysisService(CVAnalysisService):
     """
     Implémentation améliorée du service d'analyse de CV avec NLP et IA
     """
     
-    def __init__(self, rag_service: Optional[RAGService] = None):
+    def __init__(self, rag_service: Optional[RAGService] = None,
+                 parsing_executor: Optional[CVParsingExecutor] = None,
+                 result_cache: Optional[CVResultCache] = None):
         """
         Initialisation du service d'analyse de CV avancé
         
         Args:
             rag_service: Service RAG pour l'extraction de contexte (optionnel)
+            parsing_executor: Exécuteur CPU de l'extraction (partagé par défaut)
+            result_cache: Cache des résultats par empreinte du fichier (partagé par défaut)
         """
         self.rag_service = rag_service
+        self._parsing_executor = parsing_executor
+        self._result_cache = result_cache
         self.logger = logging.getLogger(__name__)
         
-        # Dictionnaire des compétences courantes avec leur catégorie
-        self.skills_categories = {
-            # Langages de programmation
-            "python": "programming_language",
-            "javascript": "programming_language",
-            "typescript": "programming_language",
-            "java": "programming_language",
-            "c#": "programming_language",
-            "c++": "programming_language",
-            "php": "programming_language",
-            "ruby": "programming_language",
-            "go": "programming_language",
-            "rust": "programming_language",
-            "swift": "programming_language",
-            "kotlin": "programming_language",
-            
-            # Frameworks frontend
-            "react": "frontend_framework",
-            "angular": "frontend_framework",
-            "vue": "frontend_framework",
-            "svelte": "frontend_framework",
-            "jquery": "frontend_framework",
-            
-            # Frameworks backend
-            "django": "backend_framework",
-            "flask": "backend_framework",
-            "fastapi": "backend_framework",
-            "express": "backend_framework",
-            "spring": "backend_framework",
-            "laravel": "backend_framework",
-            "ruby on rails": "backend_framework",
-            "asp.net": "backend_framework",
-            
-            # Bases de données
-            "sql": "database",
-            "mysql": "database",
-            "postgresql": "database",
-            "mongodb": "database",
-            "redis": "database",
-            "elasticsearch": "database",
-            "sqlite": "database",
-            "oracle": "database",
-            "cassandra": "database",
-            
-            # DevOps
-            "docker": "devops",
-            "kubernetes": "devops",
-            "jenkins": "devops",
-            "github actions": "devops",
-            "gitlab ci": "devops",
-            "aws": "cloud",
-            "azure": "cloud",
-            "gcp": "cloud",
-            "terraform": "devops",
-            "ansible": "devops",
-            
-            # UI/UX
-            "figma": "design",
-            "sketch": "design",
-            "adobe xd": "design",
-            "photoshop": "design",
-            "illustrator": "design",
-            
-            # Soft skills
-            "communication": "soft_skill",
-            "leadership": "soft_skill",
-            "teamwork": "soft_skill",
-            "problem solving": "soft_skill",
-            "time management": "soft_skill",
-            "critical thinking": "soft_skill",
-            "project management": "soft_skill",
-            "agile": "methodology",
-            "scrum": "methodology",
-            "kanban": "methodology",
-            
-            # Data science
-            "machine learning": "data_science",
-            "deep learning": "data_science",
-            "tensorflow": "data_science",
-            "pytorch": "data_science",
-            "pandas": "data_science",
-            "numpy": "data_science",
-            "scikit-learn": "data_science",
-            "data analysis": "data_science",
-            "statistics": "data_science",
-            "big data": "data_science",
-            "hadoop": "data_science",
-            "spark": "data_science",
-            
-            # Mobile
-            "ios": "mobile",
-            "android": "mobile",
-            "react native": "mobile",
-            "flutter": "mobile",
-            "xamarin": "mobile",
-            
-            # Testing
-            "testing": "testing",
-            "unit testing": "testing",
-            "integration testing": "testing",
-            "e2e testing": "testing",
-            "jest": "testing",
-            "pytest": "testing",
-            "selenium": "testing",
-            "cypress": "testing",
-            "mocha": "testing",
-            "chai": "testing",
-        }
+        # Vocabulaire intégré, complété par la table skills via la taxonomie compilée
+        self.skills_categories = dict(SKILLS_CATEGORIES)
+        self.skill_levels = dict(SKILL_LEVELS)
         
-        # Niveaux de compétence avec leur équivalent numérique
-        self.skill_levels = {
-            "beginner": 1,
-            "basic": 1,
-            "elementary": 1,
-            "novice": 1,
-            
-            "intermediate": 2,
-            "moderate": 2,
-            "average": 2,
-            
-            "advanced": 3,
-            "proficient": 3,
-            "skilled": 3,
-            "competent": 3,
-            
-            "expert": 4,
-            "master": 4,
-            "experienced": 4,
-            "senior": 4,
-            
-            "specialist": 5,
-            "guru": 5,
-            "authority": 5,
-        }
+        # Automate de recherche des compétences, niveaux et durées, compilé une seule fois
+        self.skill_matcher = SkillMatcher(self.skills_categories, self.skill_levels)
     
-    async def _extract_text_from_pdf(self, content: bytes) -> str:
-        """
-        Extrait le texte d'un fichier PDF
-        
-        Dans une implémentation réelle, nous utiliserions PyPDF2, pdfplumber ou pdfminer
-        """
-        # Simuler l'extraction de texte pour le MVP
-        # Dans une version réelle, le code ressemblerait à ceci:
-        '''
-        import io
-        import PyPDF2
-        
-        pdf_file = io.BytesIO(content)
-        reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in range(len(reader.pages)):
-            text += reader.pages[page].extract_text()
-        return text
-        '''
-        
-        # Pour le MVP, on utilise un texte exemple
-        return """
-        JOHN DOE
-        Développeur Full Stack
-        Paris, France | +33123456789 | john.doe@example.com
-        
-        RÉSUMÉ
-        Développeur Full Stack avec 5 ans d'expérience en développement web et mobile.
-        Compétences avancées en JavaScript, React, Node.js et bases de données SQL/NoSQL.
-        
-        COMPÉTENCES
-        • Langages: JavaScript (5 ans), Python (3 ans), TypeScript (2 ans)
-        • Frontend: React (4 ans), Angular (2 ans), HTML5, CSS3, SASS
-        • Backend: Node.js (4 ans), Express.js, Django, Flask
-        • Bases de données: MongoDB, PostgreSQL, MySQL
-        • DevOps: Docker, Kubernetes, AWS, CI/CD, Git
-        • Méthodologies: Agile, Scrum, TDD
-        
-        EXPÉRIENCE PROFESSIONNELLE
-        Développeur Full Stack
-        Tech Solutions, Paris
-        Janvier 2020 - Présent
-        • Développement d'applications web avec React et Node.js
-        • Mise en place d'une architecture microservices
-        • Implémentation de tests automatisés et CI/CD
-        • Collaboration avec les équipes produit et design
-        
-        Développeur Frontend
-        Digital Agency, Lyon
-        Juin 2018 - Décembre 2019
-        • Création d'interfaces utilisateur responsive
-        • Développement de composants React réutilisables
-        • Optimisation de performances frontend
-        
-        FORMATION
-        Master en Informatique
-        Université de Paris
-        2016 - 2018
-        
-        Licence en Génie Logiciel
-        INSA Lyon
-        2013 - 2016
-        
-        LANGUES
-        • Français (natif)
-        • Anglais (courant)
-        • Espagnol (notions)
-        """
+    @property
+    def result_cache(self) -> CVResultCache:
+        """Cache des résultats d'analyse, résolu à la première utilisation"""
+        if self._result_cache is None:
+            self._result_cache = get_cv_result_cache()
+        return self._result_cache
     
-    async def _extract_text_from_docx(self, content: bytes) -> str:
-        """
-        Extrait le texte d'un fichier DOCX
-        
-        Dans une implémentation réelle, nous utiliserions python-docx
-        """
-        # Simuler l'extraction de texte pour le MVP
-        # Dans une version réelle, le code ressemblerait à ceci:
-        '''
-        import io
-        from docx import Document
-        
-        docx_file = io.BytesIO(content)
-        document = Document(docx_file)
-        text = ""
-        for paragraph in document.paragraphs:
-            text += paragraph.text + "\n"
-        return text
-        '''
-        
-        # Pour le MVP, on utilise le même texte exemple que pour le PDF
-        return await self._extract_text_from_pdf(content)
+    @property
+    def parsing_executor(self) -> CVParsingExecutor:
+        """Exécuteur CPU de l'extraction, résolu à la première utilisation"""
+        if self._parsing_executor is None:
+            self._parsing_executor = get_cv_parsing_executor()
+        return self._parsing_executor
     
-    async def _extract_skills_from_text(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_skills_from_text(self, text: str) -> List[Dict[str, Any]]:
         """
         Extrait les compétences à partir du texte du CV
         
@@ -262,245 +74,187 @@ class EnhancedCVAnalysisService(CVAnalysisService):
         Returns:
             Liste des compétences avec leur niveau et catégorie
         """
-        skills = []
-        text_lower = text.lower()
-        
-        # Rechercher les compétences connues dans le texte
-        for skill_name, category in self.skills_categories.items():
-            if skill_name in text_lower:
-                # Chercher le niveau de compétence à proximité de la mention de la compétence
-                level = "intermediate"  # Niveau par défaut
-                years_experience = None
-                
-                # Recherche du niveau
-                for level_name, level_value in self.skill_levels.items():
-                    if level_name in text_lower and abs(text_lower.find(skill_name) - text_lower.find(level_name)) < 100:
-                        level = level_name
-                        break
-                
-                # Recherche des années d'expérience
-                # Chercher un pattern comme "Python (3 ans)" ou "JavaScript - 5 ans"
-                patterns = [
-                    rf"{skill_name}\s*\((\d+)\s*an",
-                    rf"{skill_name}\s*[:-]\s*(\d+)\s*an",
-                    rf"{skill_name}\s+(\d+)\s+an"
-                ]
-                
-                for pattern in patterns:
-                    matches = re.findall(pattern, text_lower)
-                    if matches:
-                        years_experience = int(matches[0])
-                        break
-                
-                skills.append({
-                    "name": skill_name.title(),  # Mettre en majuscule la première lettre
-                    "level": level,
-                    "level_value": self.skill_levels.get(level, 2),  # Valeur numérique du niveau
-                    "category": category,
-                    "years_experience": years_experience
-                })
-        
-        return skills
+        return self.skill_matcher.extract(text)
     
-    async def _extract_experience_from_text(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_experience_from_text(self, text: str,
+                                      segmentation: Optional[CVSegmentation] = None) -> List[Dict[str, Any]]:
         """
         Extrait les expériences professionnelles à partir du texte du CV
         
         Args:
             text: Texte du CV
+            segmentation: Découpage du CV (calculé à partir du texte sinon)
             
         Returns:
             Liste des expériences professionnelles
         """
+        segmentation = segmentation or segment_cv(text)
         experiences = []
         
-        # Dans une implémentation réelle, nous utiliserions des techniques NLP plus avancées
-        # Pour le MVP, on utilise un parsing simple basé sur des patterns
-        
-        # Rechercher des sections d'expérience
-        experience_sections = re.split(r"EXPÉRIENCE PROFESSIONNELLE|EXPERIENCE|EMPLOIS", text, flags=re.IGNORECASE)
-        
-        if len(experience_sections) > 1:
-            # Prendre la section après le titre "EXPÉRIENCE PROFESSIONNELLE"
-            experience_text = experience_sections[1]
+        # Chaque bloc de la section suit le pattern "Titre\nEntreprise, Lieu\nPériode\nDescription"
+        for lines in segmentation.blocks("experience"):
+            if len(lines) < 3:
+                continue
             
-            # La section suivante est généralement la formation
-            education_idx = re.search(r"FORMATION|ÉDUCATION|EDUCATION", experience_text, flags=re.IGNORECASE)
-            if education_idx:
-                experience_text = experience_text[:education_idx.start()]
+            title = lines[0].text.strip()
             
-            # Diviser en expériences individuelles
-            # On recherche des patterns comme "Titre\nEntreprise, Lieu\nPériode"
-            experiences_raw = re.split(r"\n\s*\n", experience_text)
+            # Analyser la deuxième ligne (entreprise, lieu)
+            company_parts = lines[1].text.split(',')
+            company = company_parts[0].strip()
+            location = company_parts[1].strip() if len(company_parts) > 1 else None
             
-            for exp in experiences_raw:
-                if not exp.strip():
-                    continue
+            # Analyser la troisième ligne (période), étiquetée lors du découpage
+            start_date = None
+            end_date = None
+            if lines[2].kind == DATES:
+                start_month, start_year, end_month, end_year = lines[2].value
+                start_date = f"{start_month} {start_year}"
                 
-                lines = exp.strip().split('\n')
-                if len(lines) >= 3:
-                    title = lines[0].strip()
-                    
-                    # Analyser la deuxième ligne (entreprise, lieu)
-                    company_line = lines[1]
-                    company_parts = company_line.split(',')
-                    company = company_parts[0].strip()
-                    location = company_parts[1].strip() if len(company_parts) > 1 else None
-                    
-                    # Analyser la troisième ligne (période)
-                    date_line = lines[2]
-                    dates = re.findall(r"(Janvier|Février|Mars|Avril|Mai|Juin|Juillet|Août|Septembre|Octobre|Novembre|Décembre|Jan|Fév|Mar|Avr|Mai|Jun|Jul|Aoû|Sep|Oct|Nov|Déc)\s+(\d{4})\s*-\s*(Janvier|Février|Mars|Avril|Mai|Juin|Juillet|Août|Septembre|Octobre|Novembre|Décembre|Jan|Fév|Mar|Avr|Mai|Jun|Jul|Aoû|Sep|Oct|Nov|Déc|Présent)\s*(\d{4})?", date_line, flags=re.IGNORECASE)
-                    
-                    start_date = None
-                    end_date = None
-                    if dates:
-                        start_month, start_year, end_month, end_year = dates[0]
-                        start_date = f"{start_month} {start_year}"
-                        
-                        if end_month.lower() == "présent":
-                            end_date = "Présent"
-                        else:
-                            end_date = f"{end_month} {end_year if end_year else ''}"
-                    
-                    # Description de l'expérience (les lignes restantes)
-                    description = "\n".join(lines[3:]) if len(lines) > 3 else ""
-                    
-                    experiences.append({
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "description": description
-                    })
+                if end_month.lower() == "présent":
+                    end_date = "Présent"
+                else:
+                    end_date = f"{end_month} {end_year if end_year else ''}"
+            
+            # Description de l'expérience (les lignes restantes)
+            description = "\n".join(line.text for line in lines[3:])
+            
+            experiences.append({
+                "title": title,
+                "company": company,
+                "location": location,
+                "start_date": start_date,
+                "end_date": end_date,
+                "description": description
+            })
         
         return experiences
     
-    async def _extract_education_from_text(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_education_from_text(self, text: str,
+                                     segmentation: Optional[CVSegmentation] = None) -> List[Dict[str, Any]]:
         """
         Extrait la formation à partir du texte du CV
         
         Args:
             text: Texte du CV
+            segmentation: Découpage du CV (calculé à partir du texte sinon)
             
         Returns:
             Liste des formations
         """
+        segmentation = segmentation or segment_cv(text)
         education = []
         
-        # Rechercher des sections de formation
-        education_sections = re.split(r"FORMATION|ÉDUCATION|EDUCATION", text, flags=re.IGNORECASE)
-        
-        if len(education_sections) > 1:
-            # Prendre la section après le titre "FORMATION"
-            education_text = education_sections[1]
+        # Chaque bloc de la section suit le pattern "Diplôme\nÉtablissement\nAnnées"
+        for lines in segmentation.blocks("education"):
+            if len(lines) < 2:
+                continue
             
-            # La section suivante est généralement les langues ou certifications
-            next_section_idx = re.search(r"LANGUES|CERTIFICATIONS|COMPÉTENCES", education_text, flags=re.IGNORECASE)
-            if next_section_idx:
-                education_text = education_text[:next_section_idx.start()]
+            # Année de fin (ou année simple) de la première ligne datée
+            year = next((line.value for line in lines if line.kind == YEAR), None)
             
-            # Diviser en formations individuelles
-            education_raw = re.split(r"\n\s*\n", education_text)
-            
-            for edu in education_raw:
-                if not edu.strip():
-                    continue
-                
-                lines = edu.strip().split('\n')
-                if len(lines) >= 2:
-                    degree = lines[0].strip()
-                    
-                    # Analyser la deuxième ligne (institution)
-                    institution = lines[1].strip()
-                    
-                    # Analyser les années
-                    year = None
-                    years_match = re.search(r"(\d{4})\s*-\s*(\d{4})|(\d{4})", edu)
-                    if years_match:
-                        if years_match.group(3):  # Format simple année
-                            year = int(years_match.group(3))
-                        else:  # Format début - fin
-                            year = int(years_match.group(2))  # Année de fin
-                    
-                    education.append({
-                        "degree": degree,
-                        "institution": institution,
-                        "year": year
-                    })
+            education.append({
+                "degree": lines[0].text.strip(),
+                "institution": lines[1].text.strip(),
+                "year": year
+            })
         
         return education
     
-    async def _extract_personal_info(self, text: str) -> Dict[str, Any]:
+    def _extract_personal_info(self, text: str,
+                               segmentation: Optional[CVSegmentation] = None) -> Dict[str, Any]:
         """
         Extrait les informations personnelles à partir du texte du CV
         
         Args:
             text: Texte du CV
+            segmentation: Découpage du CV (calculé à partir du texte sinon)
             
         Returns:
             Informations personnelles
         """
+        segmentation = segmentation or segment_cv(text)
         personal_info = {}
         
         # Extraire le nom (en supposant qu'il soit en haut du CV)
-        first_lines = text.strip().split('\n')[:3]
-        if first_lines:
-            name_line = first_lines[0].strip()
+        first_line = segmentation.first_line()
+        if first_line is not None and first_line.section is None:
+            name_line = first_line.text.strip()
             if len(name_line.split()) <= 4:  # C'est probablement un nom
                 personal_info["name"] = name_line
         
-        # Extraire l'email
-        email_match = re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", text)
-        if email_match:
-            personal_info["email"] = email_match.group(0)
-        
-        # Extraire le numéro de téléphone
-        phone_match = re.search(r"\+\d{1,4}[\s\d-]{7,12}|\d{2}[\s\.-]?\d{2}[\s\.-]?\d{2}[\s\.-]?\d{2}[\s\.-]?\d{2}", text)
-        if phone_match:
-            personal_info["phone"] = phone_match.group(0)
-        
-        # Extraire la localisation
-        location_patterns = [
-            r"(?:Adresse|Location|Localisation|Ville)\s*:\s*([^,\n]+(?:,\s*[^,\n]+)*)",
-            r"([^,|\n]+,\s*[^,|\n]+)\s*\|\s*",
-            r"\n([A-Z][a-zé]+(?: [A-Z][a-zé]+)*,\s*(?:France|Belgique|Suisse|Canada))"
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.search(pattern, text)
-            if location_match:
-                personal_info["location"] = location_match.group(1).strip()
+        # Coordonnées relevées lors du découpage
+        for key in ("email", "phone"):
+            if key in segmentation.entities:
+                personal_info[key] = segmentation.entities[key]
+        
+        # Localisation, par ordre de priorité des patterns
+        for name, _, _ in LOCATION_PATTERNS:
+            if name in segmentation.entities:
+                personal_info["location"] = segmentation.entities[name]
                 break
         
         return personal_info
     
-    async def _parse_cv_text(self, text: str) -> Dict[str, Any]:
+    def _parse_cv_text(self, text: str, segmentation: Optional[CVSegmentation] = None) -> Dict[str, Any]:
         """
         Analyse le texte brut d'un CV et extrait les informations structurées
         
+        Le texte est découpé une seule fois ; tous les extracteurs lisent ce découpage.
+        
         Args:
             text: Texte du CV
+            segmentation: Découpage déjà produit pendant l'extraction (calculé sinon)
             
         Returns:
             Données structurées du CV
         """
+        segmentation = segmentation or segment_cv(text)
         cv_data = {}
         
         # Extraire les compétences
-        cv_data["skills"] = await self._extract_skills_from_text(text)
+        cv_data["skills"] = self._extract_skills_from_text(text)
         
         # Extraire les expériences professionnelles
-        cv_data["experience"] = await self._extract_experience_from_text(text)
+        cv_data["experience"] = self._extract_experience_from_text(text, segmentation)
         
         # Extraire la formation
-        cv_data["education"] = await self._extract_education_from_text(text)
+        cv_data["education"] = self._extract_education_from_text(text, segmentation)
         
         # Extraire les informations personnelles
-        cv_data["personal_info"] = await self._extract_personal_info(text)
+        cv_data["personal_info"] = self._extract_personal_info(text, segmentation)
         
         return cv_data
     
+    async def _cache_key(self, content: bytes, file_type: str) -> str:
+        namespace = f"enhanced-{file_type}-rag" if self.rag_service else f"enhanced-{file_type}"
+        return self.result_cache.key(namespace, await self.parsing_executor.parser_version(), content)
+    
+    async def _analyze(self, content: bytes, file_type: str) -> Dict[str, Any]:
+        """
+        Extrait, analyse et enrichit un CV ; le résultat est mis en cache selon l'empreinte du contenu
+        """
+        async def compute() -> Dict[str, Any]:
+            # Extraire et analyser le texte hors de la boucle d'événements
+            text, cv_data = await self.parsing_executor.parse(content, file_type)
+            
+            # Enrichir avec RAG si disponible
+            if self.rag_service:
+                cv_data = await self._enrich_with_rag(cv_data, text)
+            
+            return cv_data
+        
+        return await self.result_cache.get_or_compute(await self._cache_key(content, file_type), compute)
+    
+    async def get_cached_analysis(self, content: bytes, file_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Renvoie le résultat déjà calculé pour ce contenu, sans lancer d'analyse
+        
+        Args:
+            content: Contenu du fichier
+            file_type: Format du fichier (pdf, docx, doc)
+        """
+        return await self.result_cache.get(await self._cache_key(content, "pdf" if file_type == "pdf" else "docx"))
+    
     async def analyze_pdf(self, content: bytes) -> Dict[str, Any]:
         """
         Analyse un CV au format PDF
@@ -512,18 +266,11 @@ class EnhancedCVAnalysisService(CVAnalysisService):
             Résultat de l'analyse
         """
         try:
-            # Extraire le texte du PDF
-            text = await self._extract_text_from_pdf(content)
-            
-            # Analyser le texte
-            cv_data = await self._parse_cv_text(text)
-            
-            # Enrichir avec RAG si disponible
-            if self.rag_service:
-                cv_data = await self._enrich_with_rag(cv_data, text)
-            
-            return cv_data
+            return await self._analyze(content, "pdf")
             
+        except (CVDocumentRejected, asyncio.TimeoutError):
+            # Document refusé ou trop long à analyser : pas de résultat de substitution
+            raise
         except Exception as e:
             self.logger.error(f"Erreur lors de l'analyse du PDF: {str(e)}")
             # Fallback sur le service basique
@@ -568,18 +315,11 @@ class EnhancedCVAnalysisService(CVAnalysisService):
             Résultat de l'analyse
         """
         try:
-            # Extraire le texte du DOCX
-            text = await self._extract_text_from_docx(content)
-            
-            # Analyser le texte
-            cv_data = await self._parse_cv_text(text)
-            
-            # Enrichir avec RAG si disponible
-            if self.rag_service:
-                cv_data = await self._enrich_with_rag(cv_data, text)
-            
-            return cv_data
+            return await self._analyze(content, "docx")
             
+        except (CVDocumentRejected, asyncio.TimeoutError):
+            # Document refusé ou trop long à analyser : pas de résultat de substitution
+            raise
         except Exception as e:
             self.logger.error(f"Erreur lors de l'analyse du DOCX: {str(e)}")
             # Fallback sur le service basique (même que pour PDF)
@@ -956,4 +696,18 @@ où il a développé des compétences directement applicables à ce projet.
                 "version": "2.0",
                 "analyzer": "EnhancedCVAnalyzer"
             }
-        }
\ No newline at end of file
+        }
+
+
+# Service partagé par le processus
+_cv_analysis_service: Optional[EnhancedCVAnalysisService] = None
+
+
+def get_cv_analysis_service() -> EnhancedCVAnalysisService:
+    """
+    Factory pour l'injection de dépendance du service d'analyse de CV
+    """
+    global _cv_analysis_service
+    if _cv_analysis_service is None:
+        _cv_analysis_service = EnhancedCVAnalysisService()
+    return _cv_analysis_service
@@ -0,0 +1,128 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from array import array
+from collections import Counter
+import math
+import re
+
+import numpy as np
+
+from app.adapters.services.embedding_service import normalize_text
+
+# Termes : mots, en gardant les technologies du type c++, c#, node.js ou asp.net
+_TERM = re.compile(r"\w[\w+#.]*[\w+#]|\w")
+
+# Fréquence d'un terme dans un chunk stockée sur 16 bits
+_MAX_TF = 65535
+
+
+def tokenize(text: str) -> List[str]:
+    """Termes d'un texte, après normalisation (minuscules, Unicode NFKC)"""
+    return _TERM.findall(normalize_text(text))
+
+
+class LexicalIndex:
+    """
+    Index inversé BM25 sur le texte des lignes d'une collection
+
+    Chaque terme a deux tableaux compacts (array) : les lignes qui le contiennent (uint32)
+    et sa fréquence dans chacune (uint16), lus sans copie par NumPy au moment du calcul.
+    L'index ne connaît que des numéros de ligne : les suppressions sont appliquées par le
+    masque des lignes vivantes passé à search, et df / longueur moyenne sont calculés sur
+    ces seules lignes.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._terms: Dict[str, int] = {}
+        self._rows: List[array] = []
+        self._frequencies: List[array] = []
+        self._lengths = np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, row: int, text: str) -> None:
+        """Indexe le texte d'une ligne (les lignes sont ajoutées dans l'ordre croissant)"""
+        terms = tokenize(text)
+        if row >= len(self._lengths):
+            lengths = np.zeros(max(row + 1, 2 * len(self._lengths), 1024), dtype=np.int32)
+            lengths[:len(self._lengths)] = self._lengths
+            self._lengths = lengths
+        self._lengths[row] = len(terms)
+        for term, frequency in Counter(terms).items():
+            term_id = self._terms.get(term)
+            if term_id is None:
+                term_id = self._terms[term] = len(self._rows)
+                self._rows.append(array("I"))
+                self._frequencies.append(array("H"))
+            self._rows[term_id].append(row)
+            self._frequencies[term_id].append(min(frequency, _MAX_TF))
+
+    def search(self, query: str, alive: np.ndarray, limit: int,
+               candidates: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lignes les mieux classées par BM25 pour une requête
+
+        Args:
+            query: Texte de la requête
+            alive: Masque des lignes vivantes (une case par ligne de la collection)
+            limit: Nombre maximum de lignes
+            candidates: Lignes admises (filtres de métadonnées), None = toutes
+
+        Returns:
+            Lignes et scores, par score décroissant
+        """
+        mask = alive.copy()
+        if candidates is not None:
+            mask[:] = False
+            mask[candidates] = alive[candidates]
+        document_count = int(mask.sum())
+        terms = [self._terms[term] for term in set(tokenize(query)) if term in self._terms]
+        if document_count == 0 or not terms or limit <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+
+        lengths = self._lengths[:len(mask)]
+        average_length = max(float(lengths[mask].mean()), 1.0)
+        matched_rows, contributions = [], []
+        for term_id in terms:
+            rows = np.frombuffer(self._rows[term_id], dtype=np.uint32).astype(np.int64)
+            frequencies = np.frombuffer(self._frequencies[term_id], dtype=np.uint16).astype(np.float64)
+            kept = mask[rows]
+            rows, frequencies = rows[kept], frequencies[kept]
+            if len(rows) == 0:
+                continue
+            idf = math.log(1.0 + (document_count - len(rows) + 0.5) / (len(rows) + 0.5))
+            norms = self.k1 * (1.0 - self.b + self.b * lengths[rows] / average_length)
+            matched_rows.append(rows)
+            contributions.append(idf * frequencies * (self.k1 + 1.0) / (frequencies + norms))
+        if not matched_rows:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+
+        rows, inverse = np.unique(np.concatenate(matched_rows), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(contributions))
+        top = min(limit, len(rows))
+        best = np.argpartition(-scores, top - 1)[:top]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return rows[best], scores[best]
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[Dict[str, Any]]], k: int = 60,
+                           limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Fusionne des classements par rang réciproque : score = somme des 1 / (k + rang)
+
+    Les résultats sont identifiés par leur clé "id" ; chaque résultat fusionné garde la
+    première version rencontrée, avec le score fusionné dans "score" et le rang obtenu
+    dans chaque classement dans "ranks" (None s'il en est absent).
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for leg, ranking in enumerate(rankings):
+        for rank, result in enumerate(ranking, start=1):
+            entry = fused.get(result["id"])
+            if entry is None:
+                entry = fused[result["id"]] = {**result, "score": 0.0, "ranks": [None] * len(rankings)}
+            entry["score"] += 1.0 / (k + rank)
+            entry["ranks"][leg] = rank
+    results = sorted(fused.values(), key=lambda entry: entry["score"], reverse=True)
+    return results[:limit] if limit is not None else results
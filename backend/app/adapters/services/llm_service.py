@@ -0,0 +1,119 @@
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+import asyncio
+import logging
+import os
+import threading
+
+from app.core.config import settings
+from app.core.interfaces.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+# Paramètres de génération transmis au modèle llama.cpp (les autres sont ignorés)
+_LLAMA_PARAMS = ("temperature", "max_tokens", "top_p")
+
+# Fin du flux de tokens produit par le thread d'inférence
+_END = object()
+
+
+class LlamaCppLLMService(LLMService):
+    """
+    Modèle de langage local (fichier GGUF) exécuté par llama.cpp
+
+    Le modèle est chargé une fois, à la première utilisation (ou au warm-up), et les
+    inférences sont sérialisées dans un thread : llama.cpp n'accepte pas d'appels concurrents
+    sur un même contexte.
+    """
+
+    def __init__(self, model_path: Optional[str] = None, n_ctx: Optional[int] = None):
+        self.model_path = model_path or settings.LLM_MODEL_PATH
+        self.n_ctx = n_ctx or settings.LLM_N_CTX
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Vrai si le fichier du modèle existe"""
+        return os.path.exists(self.model_path)
+
+    def _load(self) -> Any:
+        if self._model is None:
+            from langchain_community.llms import LlamaCpp
+
+            logger.info(f"Chargement du modèle LLM {self.model_path}")
+            self._model = LlamaCpp(model_path=self.model_path, n_ctx=self.n_ctx, verbose=False)
+        return self._model
+
+    def _generate(self, prompt: str, params: Dict[str, Any]) -> str:
+        with self._lock:
+            return self._load().invoke(prompt, **params)
+
+    async def generate(self, prompt: str, **params: Any) -> Dict[str, Any]:
+        params = {key: value for key, value in params.items() if key in _LLAMA_PARAMS}
+        text = await asyncio.to_thread(self._generate, prompt, params)
+        return {"text": text}
+
+    def _stream(self, prompt: str, params: Dict[str, Any], emit: Callable[[Any], None],
+                cancelled: threading.Event) -> None:
+        with self._lock:
+            for token in self._load().stream(prompt, **params):
+                if cancelled.is_set():
+                    break
+                emit(token)
+
+    async def stream(self, prompt: str, **params: Any) -> AsyncIterator[str]:
+        """
+        Tokens transmis dès leur production par llama.cpp
+
+        L'inférence tourne dans un thread qui pousse les tokens dans une file ; fermer
+        l'itérateur (client déconnecté) arrête la génération au token suivant.
+        """
+        params = {key: value for key, value in params.items() if key in _LLAMA_PARAMS}
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+
+        def emit(item: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # Boucle d'événements fermée : plus personne n'attend les tokens
+                cancelled.set()
+
+        def produce() -> None:
+            try:
+                self._stream(prompt, params, emit, cancelled)
+            except Exception as e:
+                emit(e)
+            finally:
+                emit(_END)
+
+        loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+
+    async def warm_up(self) -> None:
+        await self.generate("Bonjour", max_tokens=1)
+
+    def close(self) -> None:
+        with self._lock:
+            self._model = None
+
+
+def create_llm_service() -> Optional[LLMService]:
+    """
+    Crée le service LLM configuré (LLM_MODEL_PATH), ou None si le modèle est absent
+    """
+    service = LlamaCppLLMService()
+    if not service.available:
+        logger.warning(f"Modèle LLM non trouvé à {service.model_path}. La génération de réponses ne sera pas disponible.")
+        return None
+    return service
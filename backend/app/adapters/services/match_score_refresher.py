@@ -0,0 +1,104 @@
+from typing import Callable, Optional
+import asyncio
+import logging
+import signal
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.adapters.services.matchmaking_service import get_matchmaking_service
+
+logger = logging.getLogger(__name__)
+
+
+class MatchScoreRefresher:
+    """
+    Rattrapage périodique de la matrice des scores, hors du chemin de lecture
+
+    Les écritures faites via l'API recalculent déjà la ligne ou la colonne concernée ; cette
+    boucle recalcule le reste toutes les `interval` secondes (matrice vide après déploiement,
+    écritures hors API, recalculs en échec). Elle tourne dans l'API (lifespan) ou dans un
+    processus dédié, auquel cas MATCH_SCORES_REFRESH_INTERVAL=0 la désactive dans l'API.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None,
+                 interval: Optional[float] = None):
+        if session_factory is None:
+            from app.infrastructure.database.session import SessionLocal
+            session_factory = SessionLocal
+
+        self.session_factory = session_factory
+        self.interval = interval if interval is not None else settings.MATCH_SCORES_REFRESH_INTERVAL
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh_once(self) -> int:
+        """Recalcule les lignes et colonnes périmées"""
+        db = self.session_factory()
+        try:
+            return await get_matchmaking_service(db).refresh_stale_scores()
+        finally:
+            db.close()
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                logger.error(f"Erreur lors du rattrapage de la matrice des scores: {str(e)}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Lance la boucle de rattrapage en tâche de fond"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Arrête la boucle après le recalcul en cours"""
+        self._stopping.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_forever(self) -> None:
+        """Exécute la boucle jusqu'à SIGINT / SIGTERM"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopping.set)
+        self.start()
+        await self._stopping.wait()
+        await self.stop()
+
+
+# Boucle de rattrapage de l'API
+_match_score_refresher: Optional[MatchScoreRefresher] = None
+
+
+async def start_match_score_refresher() -> Optional[MatchScoreRefresher]:
+    """Lance la boucle de rattrapage (démarrage de l'application), sauf si elle est désactivée"""
+    global _match_score_refresher
+    if settings.MATCH_SCORES_REFRESH_INTERVAL <= 0:
+        return None
+    if _match_score_refresher is None:
+        _match_score_refresher = MatchScoreRefresher()
+        _match_score_refresher.start()
+    return _match_score_refresher
+
+
+async def stop_match_score_refresher() -> None:
+    """Arrête la boucle de rattrapage (arrêt de l'application)"""
+    global _match_score_refresher
+    refresher, _match_score_refresher = _match_score_refresher, None
+    if refresher is not None:
+        await refresher.stop()
+
+
+if __name__ == "__main__":
+    # Processus dédié : python -m app.adapters.services.match_score_refresher
+    logging.basicConfig(level=logging.INFO)
+    interval = settings.MATCH_SCORES_REFRESH_INTERVAL or 300
+    asyncio.run(MatchScoreRefresher(interval=interval).run_forever())
@@ -1,27 +1,49 @@
 from typing import List, Optional, Dict, Any
 import logging
 from datetime import date
+from sqlalchemy.orm import Session
 
 from app.core.interfaces.matchmaking_service import MatchmakingService
 from app.core.interfaces.consultant_repository import ConsultantRepository
 from app.core.interfaces.tender_repository import TenderRepository
 from app.core.interfaces.match_repository import MatchRepository
+from app.core.interfaces.match_score_repository import MatchScoreRepository
 from app.core.entities.match import MatchCreate, MatchStatus
+from app.adapters.services.batch_match_scorer import (
+    BatchMatchScorer, IMPORTANCE_WEIGHTS, consultant_scoring_version, skill_id_of, skill_level_factor,
+    tender_scoring_version
+)
+from app.adapters.services.skill_index import SkillInvertedIndex, get_skill_index
 
 class DefaultMatchmakingService:
     """
     Implémentation par défaut du service de matchmaking entre consultants et appels d'offres
     """
     
+    # Facteurs de pondération pour chaque critère
+    weights = {
+        "skills": 0.5,          # 50% pour les compétences
+        "experience": 0.2,       # 20% pour l'expérience
+        "location": 0.15,        # 15% pour la localisation
+        "availability": 0.15     # 15% pour la disponibilité
+    }
+    
     def __init__(
         self,
         consultant_repository: ConsultantRepository,
         tender_repository: TenderRepository,
-        match_repository: MatchRepository
+        match_repository: MatchRepository,
+        skill_index: Optional[SkillInvertedIndex] = None,
+        match_score_repository: Optional[MatchScoreRepository] = None
     ):
         self.consultant_repository = consultant_repository
         self.tender_repository = tender_repository
         self.match_repository = match_repository
+        # Index inversé optionnel servant à présélectionner les consultants candidats
+        self.skill_index = skill_index
+        # Matrice matérialisée optionnelle des scores consultant x appel d'offres
+        self.match_score_repository = match_score_repository
+        self.batch_scorer = BatchMatchScorer(self.weights)
         self.logger = logging.getLogger(__name__)
     
     async def calculate_match_score(self, consultant_id: int, tender_id: int) -> float:
@@ -35,13 +57,7 @@ class DefaultMatchmakingService:
         if not consultant or not tender:
             return 0.0
         
-        # Facteurs de pondération pour chaque critère
-        weights = {
-            "skills": 0.5,          # 50% pour les compétences
-            "experience": 0.2,       # 20% pour l'expérience
-            "location": 0.15,        # 15% pour la localisation
-            "availability": 0.15     # 15% pour la disponibilité
-        }
+        weights = self.weights
         
         # Score basé sur les compétences
         skills_score = self._calculate_skills_match(consultant, tender)
@@ -71,29 +87,22 @@ class DefaultMatchmakingService:
         if not tender.skills or not consultant.skills:
             return 0.0
         
-        tender_skills = {skill["skill_id"]: skill for skill in tender.skills}
-        consultant_skills = {skill["skill_id"]: skill for skill in consultant.skills}
-        
-        # Poids selon l'importance des compétences dans l'appel d'offres
-        importance_weights = {
-            "required": 1.0,
-            "preferred": 0.7,
-            "nice_to_have": 0.3
-        }
+        tender_skills = {skill_id_of(skill): skill for skill in tender.skills}
+        consultant_skills = {skill_id_of(skill): skill for skill in consultant.skills}
         
         total_weight = 0
         matched_weight = 0
         
         for skill_id, tender_skill in tender_skills.items():
             importance = tender_skill.get("importance", "required")
-            weight = importance_weights.get(importance, 1.0)
+            weight = IMPORTANCE_WEIGHTS.get(importance, 1.0)
             total_weight += weight
             
             if skill_id in consultant_skills:
                 # Vérifier le niveau de compétence du consultant
                 consultant_level = consultant_skills[skill_id].get("level", 1)
                 # Normaliser le niveau (supposons entre 1 et 5)
-                level_factor = min(consultant_level / 5.0, 1.0)
+                level_factor = skill_level_factor(consultant_level)
                 
                 matched_weight += weight * level_factor
         
@@ -166,38 +175,96 @@ class DefaultMatchmakingService:
     
     async def find_matches_for_tender(self, tender_id: int, 
                                      min_score: float = 0.6,
-                                     include_partner_consultants: bool = True) -> List[Dict[str, Any]]:
+                                     include_partner_consultants: bool = True,
+                                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Trouve les consultants qui correspondent à un appel d'offres
         Inclut les consultants des ESN partenaires si include_partner_consultants est True
+        
+        L'appel d'offres est chargé une seule fois et tous les consultants sont évalués
+        en une passe vectorisée ; le filtrage par min_score et la sélection des
+        `limit` meilleurs résultats sont faits dans cette même passe.
         """
         tender = await self.tender_repository.get_by_id(tender_id)
         if not tender:
             return []
             
-        # Récupérer tous les consultants (avec filtre selon les partenaires)
-        if include_partner_consultants:
-            consultants = await self.consultant_repository.get_all()
-        else:
-            # Seulement les consultants de la même entreprise
-            consultants = await self.consultant_repository.get_by_company_id(tender.company_id)
-            
-        matches = []
-        for consultant in consultants:
-            # Calculer le score de match
-            score = await self.calculate_match_score(consultant.id, tender_id)
+        consultants = await self._get_candidate_consultants(tender, min_score, include_partner_consultants)
             
-            # Filtrer selon le score minimum
-            if score >= min_score:
-                matches.append({
-                    "consultant": consultant,
-                    "tender": tender,
-                    "score": score
-                })
-                
-        # Trier par score décroissant
-        matches.sort(key=lambda x: x["score"], reverse=True)
-        return matches
+        ranked = self.batch_scorer.top_matches(tender, consultants, min_score=min_score, limit=limit)
+        
+        return [
+            {
+                "consultant": consultants[index],
+                "tender": tender,
+                "score": score
+            }
+            for index, score in ranked
+        ]
+    
+    async def _refresh_skill_index(self) -> bool:
+        """
+        Recharge l'index inversé si consultant_skills a été modifiée par un autre processus
+        
+        Les écritures de ce processus sont déjà appliquées à l'index (refresh_consultant_scores) ;
+        l'empreinte de la table n'est comparée à celle de l'index qu'au plus toutes les
+        refresh_interval secondes, pour voir celles des autres processus.
+        
+        Returns:
+            True si l'index est à jour, False si sa fraîcheur ne peut être vérifiée (pas d'élagage)
+        """
+        if not self.skill_index.check_due():
+            return True
+        try:
+            version = await self.consultant_repository.get_skill_pairs_version()
+            if not self.skill_index.is_loaded or version != self.skill_index.version:
+                self.skill_index.load(await self.consultant_repository.get_skill_pairs(), version=version)
+            return True
+        except Exception as e:
+            self.skill_index.clear()
+            self.logger.error(f"Erreur lors du rechargement de l'index des compétences: {str(e)}")
+            return False
+    
+    async def _get_candidate_consultants(self, tender: Any, min_score: float,
+                                         include_partner_consultants: bool) -> List[Any]:
+        """
+        Récupère les consultants à évaluer pour un appel d'offres
+        
+        Avec l'index inversé, seuls les consultants partageant des compétences avec
+        l'appel d'offres sont chargés, et ceux dont le score maximal atteignable
+        (niveau de compétence et autres critères parfaits) reste sous min_score sont écartés.
+        Sans index, ou si min_score est trop bas pour élaguer, tous les consultants sont évalués.
+        """
+        required_skill_score = self.batch_scorer.required_skill_score(min_score)
+        
+        if (self.skill_index is None or required_skill_score <= 0 or not tender.skills
+                or not await self._refresh_skill_index()):
+            # Récupérer tous les consultants (avec filtre selon les partenaires)
+            if include_partner_consultants:
+                return await self.consultant_repository.get_all()
+            # Seulement les consultants de la même entreprise
+            return await self.consultant_repository.get_by_company_id(tender.company_id)
+        
+        tender_skills = {skill_id_of(skill): skill for skill in tender.skills}
+        skill_weights = {
+            skill_id: IMPORTANCE_WEIGHTS.get(skill.get("importance", "required"), 1.0)
+            for skill_id, skill in tender_skills.items()
+        }
+        total_weight = sum(skill_weights.values())
+        
+        candidate_ids, matched_weights = self.skill_index.weighted_candidates(skill_weights)
+        candidate_ids = candidate_ids[matched_weights / total_weight >= required_skill_score]
+        
+        self.logger.debug(
+            f"Appel d'offres {tender.id}: {len(candidate_ids)} consultants candidats après élagage"
+        )
+        
+        if include_partner_consultants:
+            return await self.consultant_repository.get_by_ids(candidate_ids.tolist())
+        
+        consultants = await self.consultant_repository.get_by_company_id(tender.company_id)
+        candidate_set = set(candidate_ids.tolist())
+        return [consultant for consultant in consultants if consultant.id in candidate_set]
     
     async def find_matches_for_consultant(self, consultant_id: int,
                                          min_score: float = 0.6,
@@ -237,18 +304,28 @@ class DefaultMatchmakingService:
     async def suggest_top_matches(self, company_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Suggère les meilleures correspondances pour une ESN
+        
+        Avec la matrice des scores, il s'agit d'une simple lecture indexée triée en base ; sinon
+        les scores sont recalculés pour chaque consultant et appel d'offres de l'entreprise.
         """
+        if self.match_score_repository is not None:
+            rows = await self.match_score_repository.get_top_for_company(company_id, min_score=0.7, limit=limit)
+            return await self._hydrate_matches(rows)
+        
         # Récupérer les consultants et appels d'offres de l'entreprise
         consultants = await self.consultant_repository.get_by_company_id(company_id)
         tenders = await self.tender_repository.get_by_company_id(company_id)
         
         all_matches = []
+        seen_pairs = set()
         
         # Pour chaque consultant, trouver les meilleurs appels d'offres
         for consultant in consultants:
             matches = await self.find_matches_for_consultant(
                 consultant.id, min_score=0.7, include_partner_tenders=True
             )
+            for match in matches:
+                seen_pairs.add((match["consultant"].id, match["tender"].id))
             all_matches.extend(matches)
             
         # Pour chaque appel d'offres, trouver les meilleurs consultants
@@ -258,19 +335,164 @@ class DefaultMatchmakingService:
             )
             # On vérifie qu'on n'ajoute pas de doublons
             for match in matches:
-                # Vérifier si cette paire consultant/tender existe déjà
-                exists = any(
-                    m["consultant"].id == match["consultant"].id and 
-                    m["tender"].id == match["tender"].id 
-                    for m in all_matches
-                )
-                if not exists:
+                pair = (match["consultant"].id, match["tender"].id)
+                if pair not in seen_pairs:
+                    seen_pairs.add(pair)
                     all_matches.append(match)
                     
         # Trier par score décroissant et limiter le nombre de résultats
         all_matches.sort(key=lambda x: x["score"], reverse=True)
         return all_matches[:limit]
     
+    async def get_stored_matches_for_tender(self, tender_id: int, min_score: float = 0.0,
+                                            skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Lit les correspondances d'un appel d'offres depuis la matrice des scores
+        (calcul à la volée si la matrice n'est pas configurée)
+        
+        La matrice est tenue à jour à l'écriture (refresh_tender_scores, refresh_consultant_scores)
+        et par refresh_stale_scores : la lecture ne recalcule rien.
+        """
+        if self.match_score_repository is None:
+            matches = await self.find_matches_for_tender(tender_id, min_score=min_score, limit=skip + limit)
+            return matches[skip:]
+        
+        rows = await self.match_score_repository.get_top_for_tender(
+            tender_id, min_score=min_score, skip=skip, limit=limit
+        )
+        return await self._hydrate_matches([(consultant_id, tender_id, score) for consultant_id, score in rows])
+    
+    async def refresh_tender_scores(self, tender_id: int) -> int:
+        """
+        Recalcule la colonne d'un appel d'offres dans la matrice des scores
+        (création, modification ou changement de compétences requises)
+        
+        Returns:
+            Nombre de scores enregistrés
+        """
+        if self.match_score_repository is None:
+            return 0
+        
+        tender = await self.tender_repository.get_by_id(tender_id)
+        if not tender:
+            await self.match_score_repository.delete_tender_scores(tender_id)
+            return 0
+        
+        consultants = await self.consultant_repository.get_all()
+        return await self._refresh_tender_column(tender, consultants)
+    
+    async def _refresh_tender_column(self, tender: Any, consultants: List[Any]) -> int:
+        """Calcule et enregistre la colonne d'un appel d'offres (paires de score nul exclues)"""
+        ranked = self.batch_scorer.top_matches(tender, consultants, min_score=0.01)
+        scores = {consultants[index].id: score for index, score in ranked}
+        
+        await self.match_score_repository.replace_tender_scores(
+            tender.id, scores, version=tender_scoring_version(tender)
+        )
+        return len(scores)
+    
+    async def refresh_consultant_scores(self, consultant_id: int) -> int:
+        """
+        Recalcule la ligne d'un consultant dans la matrice des scores et met à jour ses listes
+        dans l'index inversé des compétences (création, modification, suppression ou
+        changement de compétences)
+        
+        Returns:
+            Nombre de scores enregistrés
+        """
+        consultant = await self.consultant_repository.get_by_id(consultant_id)
+        if self.skill_index is not None:
+            skill_ids = [skill_id_of(skill) for skill in consultant.skills or []] if consultant else []
+            self.skill_index.set_consultant_skills(consultant_id, skill_ids)
+        
+        if self.match_score_repository is None:
+            return 0
+        
+        if not consultant:
+            await self.match_score_repository.delete_consultant_scores(consultant_id)
+            return 0
+        
+        tenders = await self.tender_repository.get_all()
+        return await self._refresh_consultant_row(consultant, tenders)
+    
+    async def _refresh_consultant_row(self, consultant: Any, tenders: List[Any]) -> int:
+        """Calcule en une passe et enregistre la ligne d'un consultant (paires de score nul exclues)"""
+        raw_scores = self.batch_scorer.score_tenders(consultant, tenders)
+        scores = {}
+        for tender, raw_score in zip(tenders, raw_scores):
+            score = round(float(raw_score), 2)
+            if score > 0:
+                scores[tender.id] = score
+        
+        await self.match_score_repository.replace_consultant_scores(
+            consultant.id, scores, version=consultant_scoring_version(consultant)
+        )
+        return len(scores)
+    
+    async def refresh_stale_scores(self) -> int:
+        """
+        Recalcule les lignes et colonnes périmées de la matrice des scores, hors du chemin de lecture
+        
+        Une ligne (consultant) ou une colonne (appel d'offres) est périmée si elle n'a jamais été
+        calculée (matrice vide après déploiement) ou si les champs utilisés par le score ont changé
+        depuis (écriture hors API, recalcul en échec). Seules celles-ci sont recalculées ; si toutes
+        les lignes ou toutes les colonnes le sont, la matrice est reconstruite colonne par colonne
+        et les lignes, ainsi couvertes, ne sont pas recalculées une seconde fois.
+        
+        Returns:
+            Nombre de lignes et colonnes recalculées
+        """
+        if self.match_score_repository is None:
+            return 0
+        
+        consultants = await self.consultant_repository.get_all()
+        tenders = await self.tender_repository.get_all()
+        consultant_versions = {c.id: consultant_scoring_version(c) for c in consultants}
+        stored_consultants = await self.match_score_repository.get_consultant_versions()
+        stored_tenders = await self.match_score_repository.get_tender_versions()
+        
+        stale_consultants = [c for c in consultants if stored_consultants.get(c.id) != consultant_versions[c.id]]
+        stale_tenders = [t for t in tenders if stored_tenders.get(t.id) != tender_scoring_version(t)]
+        if not stale_consultants and not stale_tenders:
+            return 0
+        
+        if len(stale_consultants) == len(consultants) or len(stale_tenders) == len(tenders):
+            for tender in tenders:
+                await self._refresh_tender_column(tender, consultants)
+            await self.match_score_repository.set_consultant_versions(consultant_versions)
+        else:
+            for tender in stale_tenders:
+                await self._refresh_tender_column(tender, consultants)
+            for consultant in stale_consultants:
+                await self._refresh_consultant_row(consultant, tenders)
+        
+        self.logger.info(
+            f"Matrice des scores : {len(stale_consultants)} lignes et {len(stale_tenders)} colonnes recalculées"
+        )
+        return len(stale_consultants) + len(stale_tenders)
+    
+    async def _hydrate_matches(self, rows: List[Any]) -> List[Dict[str, Any]]:
+        """Convertit des triplets (consultant_id, tender_id, score) en correspondances complètes"""
+        if not rows:
+            return []
+        
+        consultant_ids = sorted({consultant_id for consultant_id, _, _ in rows})
+        consultants = {c.id: c for c in await self.consultant_repository.get_by_ids(consultant_ids)}
+        tenders = {}
+        for _, tender_id, _ in rows:
+            if tender_id not in tenders:
+                tenders[tender_id] = await self.tender_repository.get_by_id(tender_id)
+        
+        return [
+            {
+                "consultant": consultants[consultant_id],
+                "tender": tenders[tender_id],
+                "score": score
+            }
+            for consultant_id, tender_id, score in rows
+            if consultant_id in consultants and tenders.get(tender_id)
+        ]
+    
     async def update_match_status(self, match_id: int, new_status: str) -> bool:
         """
         Met à jour le statut d'une correspondance
@@ -290,4 +512,23 @@ class DefaultMatchmakingService:
             match_id, {"status": valid_status}
         )
         
-        return updated is not None
\ No newline at end of file
+        return updated is not None
+
+
+def get_matchmaking_service(db: Session) -> DefaultMatchmakingService:
+    """
+    Factory du service de matchmaking adossé aux repositories SQLAlchemy,
+    à l'index inversé des compétences et à la matrice des scores
+    """
+    from app.adapters.repositories.consultant_repository import SQLAlchemyConsultantRepository
+    from app.adapters.repositories.tender_repository import SQLAlchemyTenderRepository
+    from app.adapters.repositories.match_repository import SQLAlchemyMatchRepository
+    from app.adapters.repositories.match_score_repository import SQLAlchemyMatchScoreRepository
+    
+    return DefaultMatchmakingService(
+        consultant_repository=SQLAlchemyConsultantRepository(db),
+        tender_repository=SQLAlchemyTenderRepository(db),
+        match_repository=SQLAlchemyMatchRepository(db),
+        skill_index=get_skill_index(),
+        match_score_repository=SQLAlchemyMatchScoreRepository(db)
+    )
@@ -1,12 +1,47 @@
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
+import asyncio
+import hashlib
 import logging
 import os
-import tempfile
 import uuid
 from datetime import datetime
 
+import numpy as np
+
 from app.core.interfaces.rag_service import RAGService
+from app.core.interfaces.embedding_service import EmbeddingService
+from app.core.interfaces.rag_document_repository import RAGDocumentRepository
 from app.core.config import settings
+from app.adapters.services.document_text import CVDocumentRejected, iter_text_blocks
+from app.adapters.repositories.rag_document_repository import normalize_document_type, to_document_type
+from app.adapters.services.embedding_service import get_embedding_service
+from app.adapters.services.lexical_index import reciprocal_rank_fusion
+from app.adapters.services.text_chunker import chunk_text
+from app.adapters.services.vector_store import get_vector_store
+
+# Métadonnées propres à chaque chunk, retirées des métadonnées d'un document
+_CHUNK_METADATA = ("chunk_index", "token_count")
+
+async def collect_generation(events: AsyncIterator[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Rassemble les événements d'une génération en flux (generate_stream) en une seule réponse
+    
+    Returns:
+        {"context_documents", "generated_text", "generation_config"}, ou {"error"} en cas d'échec
+    """
+    generation: Dict[str, Any] = {"context_documents": [], "generated_text": "", "generation_config": {}}
+    tokens = []
+    async for event in events:
+        if event["event"] == "context":
+            generation["context_documents"] = event["data"]["context_documents"]
+        elif event["event"] == "token":
+            tokens.append(event["data"]["text"])
+        elif event["event"] == "done":
+            generation["generation_config"] = event["data"]["generation_config"]
+        elif event["event"] == "error":
+            return {"error": event["data"]["error"], "context_documents": generation["context_documents"]}
+    generation["generated_text"] = "".join(tokens)
+    return generation
 
 class VectorRAGService(RAGService):
     """
@@ -14,21 +49,33 @@ class VectorRAGService(RAGService):
     et les matchings avec une recherche vectorielle
     """
     
-    def __init__(self, vector_db_client=None, llm_service=None):
+    def __init__(self, vector_db_client=None, llm_service=None,
+                 embedding_service: Optional[EmbeddingService] = None,
+                 document_repository: Optional[RAGDocumentRepository] = None):
         """
         Initialise le service RAG avec un client de base de données vectorielle et un service LLM
         
         Args:
-            vector_db_client: Client pour la base de données vectorielle
+            vector_db_client: Client pour la base de données vectorielle (base locale partagée par défaut)
             llm_service: Service pour l'inférence du modèle de langage
+            embedding_service: Service d'embedding (service partagé configuré par défaut)
+            document_repository: Repository des tables rag_documents / rag_chunks (optionnel)
         """
         self.logger = logging.getLogger(__name__)
-        self.vector_db_client = vector_db_client
+        self.vector_db_client = vector_db_client if vector_db_client is not None else get_vector_store()
         self.llm_service = llm_service
+        self.embedding_service = embedding_service or get_embedding_service()
+        self.document_repository = document_repository
         
         # Configuration par défaut
-        self.embedding_dim = 768  # Dimension des embeddings (dépend du modèle utilisé)
         self.default_top_k = 5    # Nombre de résultats par défaut
+        self.chunk_tokens = settings.RAG_CHUNK_TOKENS
+        self.chunk_overlap = settings.RAG_CHUNK_OVERLAP
+        self.chunks_per_document = settings.RAG_CHUNKS_PER_DOCUMENT  # Chunks retenus par document dans une réponse
+        self.hybrid_search = settings.RAG_HYBRID_SEARCH
+        self.vector_k = settings.RAG_VECTOR_K
+        self.lexical_k = settings.RAG_LEXICAL_K
+        self.rrf_k = settings.RAG_RRF_K
         self.collection_names = {
             "cv": "cv_embeddings",
             "skills": "skill_embeddings",
@@ -37,6 +84,11 @@ class VectorRAGService(RAGService):
         }
         
         self.logger.info("Service RAG initialisé")
+
+    @property
+    def embedding_dim(self) -> int:
+        """Dimension des embeddings (charge le modèle au premier accès)"""
+        return self.embedding_service.dimension
     
     async def query(self, text: str, filters: Optional[Dict[str, Any]] = None, 
                    top_k: int = None) -> List[Dict[str, Any]]:
@@ -61,32 +113,14 @@ class VectorRAGService(RAGService):
             # Déterminer la collection à utiliser
             collection_name = self._get_collection_name(filters)
             
-            # Obtenir l'embedding pour le texte de la requête
-            embedding = await self._get_embedding(text)
-            
             # Définir le nombre de résultats à retourner
             top_k = top_k or self.default_top_k
             
-            # Effectuer la recherche vectorielle
-            results = await self.vector_db_client.search(
-                collection_name=collection_name,
-                embedding=embedding,
-                filters=filters,
-                limit=top_k
-            )
+            # Rechercher les chunks (vectoriel, ou hybride vectoriel + BM25)
+            results = await self._search_chunks(collection_name, text, filters, top_k * self.chunks_per_document)
             
-            # Traiter et formater les résultats
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    "document_id": result.get("id"),
-                    "score": result.get("score"),
-                    "metadata": result.get("metadata", {}),
-                    "content": result.get("content", ""),
-                    "source": result.get("source", "unknown")
-                })
-            
-            return formatted_results
+            # Regrouper les chunks par document
+            return self._group_chunks(results, top_k)
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la requête RAG: {str(e)}")
@@ -105,15 +139,60 @@ class VectorRAGService(RAGService):
         Returns:
             Réponse générée et informations contextuelles
         """
-        self.logger.info(f"Génération RAG pour: '{text[:50]}...'")
+        generation = await collect_generation(self.generate_stream(text, filters, generation_params))
+        if "error" in generation:
+            return {"error": generation["error"]}
+        
+        # Formater la réponse finale
+        return {
+            "generated_text": generation["generated_text"],
+            "context_documents": [{"id": doc["id"], "score": doc["score"]} for doc in generation["context_documents"]],
+            "generation_config": generation["generation_config"]
+        }
+    
+    async def generate_stream(self, text: str, filters: Optional[Dict[str, Any]] = None,
+                              generation_params: Optional[Dict[str, Any]] = None,
+                              top_k: int = 3) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Génère une réponse en la transmettant au fil de la production des tokens
+        
+        Les documents de contexte sont envoyés avant le premier token. Fermer le générateur
+        (client déconnecté) interrompt la génération du LLM.
+        
+        Args:
+            text: Texte de la requête
+            filters: Filtres optionnels à appliquer à la recherche
+            generation_params: Paramètres pour la génération
+            top_k: Nombre de documents de contexte
         
-        if not self.llm_service:
-            self.logger.warning("Service LLM non configuré")
-            return {"error": "Service LLM non disponible"}
+        Yields:
+            Événements {"event": "context" | "token" | "done" | "error", "data": {...}}
+        """
+        self.logger.info(f"Génération RAG pour: '{text[:50]}...'")
         
         try:
             # Récupérer le contexte pertinent
-            context_docs = await self.query(text, filters, top_k=3)
+            context_docs = await self.query(text, filters, top_k=top_k)
+            yield {
+                "event": "context",
+                "data": {
+                    "context_documents": [
+                        {
+                            "id": doc["document_id"],
+                            "score": doc["score"],
+                            "metadata": doc["metadata"],
+                            "content": doc["content"]
+                        }
+                        for doc in context_docs
+                    ]
+                }
+            }
+            
+            # Sans LLM, seuls les documents de contexte sont transmis
+            if not self.llm_service:
+                self.logger.warning("Service LLM non configuré")
+                yield {"event": "error", "data": {"error": "Service LLM non disponible"}}
+                return
             
             # Préparer le contexte pour l'envoi au LLM
             context_text = "\n\n".join([doc["content"] for doc in context_docs])
@@ -145,22 +224,27 @@ Réponds de manière précise et basée uniquement sur le contexte fourni.
 Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
 """
             
-            # Générer la réponse avec le LLM
-            llm_response = await self.llm_service.generate(
-                prompt=prompt,
-                **generation_config
-            )
+            # Transmettre les tokens du LLM (réponse complète en un bloc s'il ne sait pas streamer)
+            stream = getattr(self.llm_service, "stream", None)
+            if stream is not None:
+                tokens = stream(prompt=prompt, **generation_config)
+                try:
+                    async for token in tokens:
+                        yield {"event": "token", "data": {"text": token}}
+                finally:
+                    await tokens.aclose()
+            else:
+                llm_response = await self.llm_service.generate(
+                    prompt=prompt,
+                    **generation_config
+                )
+                yield {"event": "token", "data": {"text": llm_response.get("text", "")}}
             
-            # Formater la réponse finale
-            return {
-                "generated_text": llm_response.get("text", ""),
-                "context_documents": [{"id": doc["document_id"], "score": doc["score"]} for doc in context_docs],
-                "generation_config": generation_config
-            }
+            yield {"event": "done", "data": {"generation_config": generation_config}}
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la génération RAG: {str(e)}")
-            return {"error": str(e)}
+            yield {"event": "error", "data": {"error": str(e)}}
     
     async def index_document(self, content: bytes, filename: str, document_type: str, metadata: Dict[str, Any]) -> str:
         """
@@ -183,16 +267,17 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
         
         try:
             # Déterminer la collection
-            collection_name = self.collection_names.get(document_type, "general")
+            collection_name = self._collection_for(document_type)
             
             # Extraire le texte du contenu du document
             document_text = self._extract_text_from_content(content, filename)
             
-            # Obtenir l'embedding
-            embedding = await self._get_embedding(document_text)
+            # Identifiant stable : réindexer le même contenu remplace le document
+            document_id = str(metadata.get("document_id") or self._content_id(document_type, content))
             
-            # Générer un ID de document
-            document_id = self._generate_id()
+            # Découper en chunks et obtenir leurs embeddings par lots
+            chunks = chunk_text(document_text, self.chunk_tokens, self.chunk_overlap)
+            embeddings = await self._get_embeddings([chunk.content for chunk in chunks])
             
             # Enrichir les métadonnées
             enhanced_metadata = {
@@ -200,19 +285,60 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
                 "filename": filename,
                 "file_extension": os.path.splitext(filename)[1].lower(),
                 "indexed_at": self._get_current_timestamp(),
-                **metadata
+                **metadata,
+                "document_id": document_id,
+                "chunk_count": len(chunks)
             }
             
-            # Indexer le document
-            result = await self.vector_db_client.insert(
-                collection_name=collection_name,
-                documents=[{
-                    "id": document_id,
+            vector_documents = [
+                {
+                    "id": self._chunk_id(document_id, chunk.index),
                     "embedding": embedding,
-                    "metadata": enhanced_metadata,
-                    "content": document_text
-                }]
-            )
+                    "metadata": {**enhanced_metadata, "chunk_index": chunk.index, "token_count": chunk.token_count},
+                    "content": chunk.content
+                }
+                for chunk, embedding in zip(chunks, embeddings)
+            ]
+            
+            async def write_vectors() -> None:
+                # Chunks d'une indexation précédente au-delà du nouveau découpage
+                stale_ids = set(await self._chunk_ids(collection_name, document_id)) - {
+                    document["id"] for document in vector_documents
+                }
+                if vector_documents:
+                    await self.vector_db_client.insert(
+                        collection_name=collection_name,
+                        documents=vector_documents
+                    )
+                for chunk_id in stale_ids:
+                    await self.vector_db_client.delete_document(
+                        collection_name=collection_name,
+                        document_id=chunk_id
+                    )
+            
+            # Lignes rag_documents / rag_chunks et vecteurs validés ensemble
+            if self.document_repository is not None and to_document_type(document_type) is not None:
+                await self.document_repository.replace_document(
+                    document_id=document_id,
+                    document_type=document_type,
+                    title=filename,
+                    content=document_text,
+                    metadata=enhanced_metadata,
+                    chunks=[
+                        {
+                            "chunk_id": document["id"],
+                            "content": document["content"],
+                            "chunk_index": document["metadata"]["chunk_index"],
+                            "token_count": document["metadata"]["token_count"],
+                            "embedding": document["embedding"]
+                        }
+                        for document in vector_documents
+                    ],
+                    file_path=filename,
+                    before_commit=write_vectors
+                )
+            else:
+                await write_vectors()
             
             return document_id
             
@@ -220,7 +346,107 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
             self.logger.error(f"Erreur lors de l'indexation du document: {str(e)}")
             return {"error": str(e)}
     
-    async def _get_embedding(self, text: str) -> List[float]:
+    async def _search_chunks(self, collection_name: str, text: str, filters: Optional[Dict[str, Any]],
+                             limit: int) -> List[Dict[str, Any]]:
+        """
+        Recherche des chunks pertinents pour une requête
+        
+        En mode hybride, la recherche vectorielle et la recherche BM25 (termes exacts : technologies,
+        certifications) sont lancées en parallèle, chacune avec son propre nombre de résultats,
+        puis fusionnées par rang réciproque.
+        
+        Returns:
+            Chunks triés par pertinence décroissante
+        """
+        hybrid = self.hybrid_search and hasattr(self.vector_db_client, "search_text")
+        
+        async def vector_leg() -> List[Dict[str, Any]]:
+            embedding = await self._get_embedding(text)
+            return await self.vector_db_client.search(
+                collection_name=collection_name,
+                embedding=embedding,
+                filters=filters,
+                limit=max(self.vector_k, limit) if hybrid else limit
+            )
+        
+        if not hybrid:
+            return await vector_leg()
+        
+        vector_results, lexical_results = await asyncio.gather(
+            vector_leg(),
+            self.vector_db_client.search_text(
+                collection_name=collection_name,
+                query=text,
+                filters=filters,
+                limit=max(self.lexical_k, limit)
+            )
+        )
+        return reciprocal_rank_fusion([vector_results, lexical_results], k=self.rrf_k)
+    
+    def _content_id(self, document_type: str, content: bytes) -> str:
+        """
+        Identifiant déterministe d'un document, dérivé de son type et de son contenu
+        
+        Returns:
+            UUID (version 5) du document
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"talentmatch:rag:{document_type}:{digest}"))
+    
+    def _chunk_id(self, document_id: str, chunk_index: int) -> str:
+        """Identifiant d'un chunk dans la base vectorielle"""
+        return f"{document_id}:{chunk_index}"
+    
+    async def _chunk_ids(self, collection_name: str, document_id: str) -> List[str]:
+        """Identifiants des chunks d'un document présents dans une collection"""
+        chunks = await self.vector_db_client.list_documents(
+            collection_name=collection_name,
+            filters={"document_id": document_id}
+        )
+        return [chunk.get("id") for chunk in chunks]
+    
+    def _group_chunks(self, results: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Regroupe des chunks par document, dans l'ordre du meilleur score de chaque document
+        
+        Le contenu d'un document est la concaténation de ses chunks retenus, dans l'ordre du texte.
+        
+        Args:
+            results: Chunks renvoyés par la base vectorielle (triés par score décroissant s'il y en a un)
+            top_k: Nombre maximum de documents
+            
+        Returns:
+            Documents avec leur score, leurs métadonnées et leurs chunks
+        """
+        documents: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            metadata = result.get("metadata", {})
+            document_id = metadata.get("document_id", result.get("id"))
+            document = documents.get(document_id)
+            if document is None:
+                if top_k is not None and len(documents) >= top_k:
+                    continue
+                document = documents[document_id] = {
+                    "document_id": document_id,
+                    "score": result.get("score"),
+                    "metadata": {key: value for key, value in metadata.items() if key not in _CHUNK_METADATA},
+                    "source": result.get("source", "unknown"),
+                    "chunks": []
+                }
+            if len(document["chunks"]) < self.chunks_per_document or top_k is None:
+                document["chunks"].append({
+                    "chunk_id": result.get("id"),
+                    "chunk_index": metadata.get("chunk_index", 0),
+                    "score": result.get("score"),
+                    "content": result.get("content", "")
+                })
+        
+        for document in documents.values():
+            document["chunks"].sort(key=lambda chunk: chunk["chunk_index"])
+            document["content"] = "\n".join(chunk["content"] for chunk in document["chunks"])
+        return list(documents.values())
+    
+    async def _get_embedding(self, text: str) -> np.ndarray:
         """
         Obtient l'embedding pour un texte donné
         
@@ -230,15 +456,20 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
         Returns:
             Vecteur d'embedding
         """
-        # Dans une implémentation réelle, nous utiliserions un service d'embedding
-        # comme sentence-transformers, HuggingFace ou OpenAI
-        # Pour le MVP, nous retournons un vecteur factice
+        return await self.embedding_service.embed(text)
+    
+    async def _get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Obtient les embeddings d'un lot de textes en un seul appel
         
-        # Simuler un embedding de la dimension configurée
-        import numpy as np
-        embedding = np.random.normal(0, 1, self.embedding_dim).tolist()
+        Args:
+            texts: Textes à encoder
         
-        return embedding
+        Returns:
+            Matrice des embeddings, une ligne par texte
+        """
+        return await self.embedding_service.embed_many(texts)
+    
     def _extract_text_from_content(self, content: bytes, filename: str) -> str:
         """
         Extrait le texte du contenu brut d'un document
@@ -252,44 +483,17 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
         """
         file_ext = os.path.splitext(filename)[1].lower()
         
-        # Créer un fichier temporaire pour le contenu
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            temp_file.write(content)
-            temp_path = temp_file.name
-        
         try:
-            extracted_text = ""
-            
-            # Extraire le texte selon le type de fichier
-            if file_ext == '.pdf':
-                from langchain_community.document_loaders import PyPDFLoader
-                loader = PyPDFLoader(temp_path)
-                documents = loader.load()
-                extracted_text = "\n".join([doc.page_content for doc in documents])
-            elif file_ext in ['.docx', '.doc']:
-                from langchain_community.document_loaders import Docx2txtLoader
-                loader = Docx2txtLoader(temp_path)
-                documents = loader.load()
-                extracted_text = "\n".join([doc.page_content for doc in documents])
-            elif file_ext == '.txt':
-                from langchain_community.document_loaders import TextLoader
-                loader = TextLoader(temp_path)
-                documents = loader.load()
-                extracted_text = "\n".join([doc.page_content for doc in documents])
-            else:
-                # Pour les autres types de fichiers, tenter une extraction basique
-                extracted_text = content.decode('utf-8', errors='ignore')
-            
-            return extracted_text
+            # Extraction en mémoire, page par page pour les PDF
+            return "\n".join(iter_text_blocks(content, file_ext))
+        
+        except CVDocumentRejected:
+            # Pour les autres types de fichiers, tenter une extraction basique
+            return content.decode('utf-8', errors='ignore')
         
         except Exception as e:
             self.logger.error(f"Erreur lors de l'extraction du texte: {str(e)}")
             return ""
-        
-        finally:
-            # Supprimer le fichier temporaire
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
     
     def _extract_text_from_document(self, document: Dict[str, Any]) -> str:
         """
@@ -385,11 +589,20 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
             return self.collection_names.get("cv", "general")
         
         doc_type = filters.get("document_type")
-        if doc_type and doc_type in self.collection_names:
-            return self.collection_names[doc_type]
+        if doc_type and normalize_document_type(doc_type) in self.collection_names:
+            return self._collection_for(doc_type)
         
         return self.collection_names.get("cv", "general")  # Collection par défaut
     
+    def _collection_for(self, document_type: str) -> str:
+        """
+        Collection d'un type de document, quelle que soit sa forme ("skill" ou "skills")
+        
+        Utilisée à l'indexation comme à la résolution par l'annuaire rag_documents, pour
+        qu'un document soit toujours cherché dans la collection où il a été écrit.
+        """
+        return self.collection_names.get(normalize_document_type(document_type), "general")
+    
     def _get_current_timestamp(self) -> str:
         """
         Retourne le timestamp actuel au format ISO
@@ -410,12 +623,17 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
         import uuid
         return str(uuid.uuid4())
     
-    async def get_documents(self, document_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def get_documents(self, document_type: Optional[str] = None,
+                            document_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Récupère la liste des documents indexés
         
+        Avec des identifiants, les documents sont regroupés par collection (résolue par
+        l'annuaire rag_documents) et chaque collection est lue en un seul appel.
+        
         Args:
             document_type: Type de document à filtrer (optionnel)
+            document_ids: Identifiants des documents à récupérer (optionnel)
             
         Returns:
             Liste des documents
@@ -427,6 +645,31 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
             return []
         
         try:
+            if document_ids is not None:
+                documents = []
+                for collection_name, ids in (await self._resolve_collections(document_ids)).items():
+                    chunks = await self.vector_db_client.list_documents(
+                        collection_name=collection_name,
+                        filters={"document_id": ids}
+                    )
+                    documents.extend(
+                        {**document, "collection": collection_name} for document in self._group_chunks(chunks)
+                        if document_type is None or document["metadata"].get("document_type") == document_type
+                    )
+                # Ordre des identifiants demandés
+                order = {document_id: position for position, document_id in enumerate(document_ids)}
+                documents.sort(key=lambda document: order.get(document["document_id"], len(order)))
+                return [
+                    {
+                        "id": doc["document_id"],
+                        "metadata": doc["metadata"],
+                        "content": doc["content"],
+                        "chunk_count": len(doc["chunks"]),
+                        "collection": doc["collection"]
+                    }
+                    for doc in documents
+                ]
+            
             # Déterminer la collection
             collection_name = self.collection_names.get(document_type, "general") if document_type else "general"
             
@@ -439,14 +682,14 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
                 filters=filters
             )
             
-            # Formater les résultats
+            # Formater les résultats (un élément par document, et non par chunk)
             return [
                 {
-                    "id": doc.get("id", ""),
-                    "metadata": doc.get("metadata", {}),
-                    "content_preview": doc.get("content", "")[:200] + "..." if len(doc.get("content", "")) > 200 else doc.get("content", "")
+                    "id": doc["document_id"],
+                    "metadata": doc["metadata"],
+                    "content_preview": doc["content"][:200] + "..." if len(doc["content"]) > 200 else doc["content"]
                 }
-                for doc in documents
+                for doc in self._group_chunks(documents)
             ]
             
         except Exception as e:
@@ -465,33 +708,8 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
         """
         self.logger.info(f"Récupération du document avec l'ID: {document_id}")
         
-        if not self.vector_db_client:
-            self.logger.warning("Client de base de données vectorielle non configuré")
-            return None
-        
-        try:
-            # Rechercher dans toutes les collections
-            for collection_name in self.collection_names.values():
-                # Récupérer le document
-                document = await self.vector_db_client.get_document(
-                    collection_name=collection_name,
-                    document_id=document_id
-                )
-                
-                if document:
-                    return {
-                        "id": document.get("id", ""),
-                        "metadata": document.get("metadata", {}),
-                        "content": document.get("content", ""),
-                        "collection": collection_name
-                    }
-            
-            # Document non trouvé
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la récupération du document: {str(e)}")
-            return None
+        documents = await self.get_documents(document_ids=[document_id])
+        return documents[0] if documents else None
     
     async def delete_document(self, document_id: str) -> bool:
         """
@@ -505,25 +723,67 @@ Si le contexte ne contient pas l'information nécessaire, indique-le clairement.
         """
         self.logger.info(f"Suppression du document avec l'ID: {document_id}")
         
+        return document_id in await self.delete_documents([document_id])
+    
+    async def delete_documents(self, document_ids: List[str]) -> List[str]:
+        """
+        Supprime des documents indexés (vecteurs de leurs chunks et lignes rag_documents / rag_chunks)
+        
+        Un seul appel de suppression par collection concernée.
+        
+        Args:
+            document_ids: Identifiants des documents
+            
+        Returns:
+            Identifiants des documents supprimés
+        """
         if not self.vector_db_client:
             self.logger.warning("Client de base de données vectorielle non configuré")
-            return False
+            return []
         
         try:
-            # Rechercher dans toutes les collections
-            for collection_name in self.collection_names.values():
-                # Tenter de supprimer le document
-                success = await self.vector_db_client.delete_document(
+            deleted: List[str] = []
+            for collection_name, ids in (await self._resolve_collections(document_ids)).items():
+                chunk_ids = await self.vector_db_client.delete_documents(
                     collection_name=collection_name,
-                    document_id=document_id
+                    filters={"document_id": ids}
                 )
-                
-                if success:
-                    return True
-            
-            # Document non trouvé ou non supprimé
-            return False
+                found = {chunk_id.rsplit(":", 1)[0] for chunk_id in chunk_ids}
+                deleted.extend(document_id for document_id in ids if document_id in found)
+            # Les lignes des documents dont les vecteurs n'ont pas été supprimés restent en place
+            if self.document_repository is not None:
+                await self.document_repository.delete_documents(deleted)
+            return deleted
             
         except Exception as e:
-            self.logger.error(f"Erreur lors de la suppression du document: {str(e)}")
-            return False
+            self.logger.error(f"Erreur lors de la suppression des documents: {str(e)}")
+            return []
+    
+    async def _resolve_collections(self, document_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Regroupe des identifiants de documents par collection
+        
+        La collection est déduite du type enregistré dans rag_documents (une seule requête).
+        Les documents absents de l'annuaire (indexés sans repository, ou d'un type sans
+        équivalent en base) sont cherchés dans toutes les collections.
+        
+        Returns:
+            Identifiants des documents par nom de collection
+        """
+        document_types = {}
+        if self.document_repository is not None:
+            document_types = await self.document_repository.get_document_types(list(document_ids))
+        
+        groups: Dict[str, List[str]] = {}
+        unresolved = []
+        for document_id in dict.fromkeys(document_ids):
+            if document_id in document_types:
+                collection_name = self._collection_for(document_types[document_id])
+                groups.setdefault(collection_name, []).append(document_id)
+            else:
+                unresolved.append(document_id)
+        
+        if unresolved:
+            for collection_name in dict.fromkeys([*self.collection_names.values(), "general"]):
+                groups.setdefault(collection_name, []).extend(unresolved)
+        return groups
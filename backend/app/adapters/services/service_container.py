@@ -0,0 +1,153 @@
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+import time
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.interfaces.embedding_service import EmbeddingService
+from app.core.interfaces.llm_service import LLMService
+from app.adapters.repositories.rag_document_repository import SQLAlchemyRAGDocumentRepository
+from app.adapters.services.embedding_service import (
+    close_embedding_service, get_embedding_service, shutdown_embedding_service
+)
+from app.adapters.services.llm_service import create_llm_service
+from app.adapters.services.rag_service import VectorRAGService
+from app.adapters.services.vector_store import LocalVectorStore, get_vector_store
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """
+    Services partagés par toute l'application : embeddings, base vectorielle, LLM et RAG
+
+    Créé une fois au démarrage (lifespan FastAPI). Le warm-up charge les modèles et
+    exécute une première inférence de chacun, pour que la première requête ne paie pas
+    le chargement ; `ready` indique qu'il est terminé.
+    """
+
+    def __init__(self, embedding_service: Optional[EmbeddingService] = None,
+                 vector_store: Optional[LocalVectorStore] = None,
+                 llm_service: Optional[LLMService] = None, load_llm: bool = True):
+        # Service partagé du processus, ou service injecté fermé avec le conteneur
+        self._shared_embedding_service = embedding_service is None
+        self.embedding_service = embedding_service or get_embedding_service()
+        self.vector_store = vector_store or get_vector_store()
+        if llm_service is None and load_llm:
+            llm_service = create_llm_service()
+        self.llm_service = llm_service
+        self.rag_service = VectorRAGService(
+            vector_db_client=self.vector_store,
+            llm_service=self.llm_service,
+            embedding_service=self.embedding_service
+        )
+        self.ready = False
+        self.warm_up_error: Optional[str] = None
+        self.warm_up_seconds: Dict[str, float] = {}
+        self._warm_up_task: Optional[asyncio.Task] = None
+
+    def rag_service_for(self, db: Session) -> VectorRAGService:
+        """
+        Service RAG d'une requête : composants partagés, documents enregistrés dans la session `db`
+        """
+        return VectorRAGService(
+            vector_db_client=self.vector_store,
+            llm_service=self.llm_service,
+            embedding_service=self.embedding_service,
+            document_repository=SQLAlchemyRAGDocumentRepository(db)
+        )
+
+    async def warm_up(self) -> None:
+        """Charge les index et les modèles puis exécute une inférence de chacun"""
+        try:
+            await self._timed("embeddings", self.embedding_service.embed_many(["warm-up"]))
+            await self._timed("vector_store", asyncio.to_thread(self._load_collections))
+            if self.llm_service is not None:
+                await self._timed("llm", self.llm_service.warm_up())
+            self.ready = True
+            logger.info(f"Services prêts: {self.warm_up_seconds}")
+        except Exception as e:
+            self.warm_up_error = str(e)
+            logger.error(f"Erreur lors du warm-up des services: {str(e)}")
+
+    async def _timed(self, name: str, awaitable: Any) -> None:
+        start = time.perf_counter()
+        await awaitable
+        self.warm_up_seconds[name] = round(time.perf_counter() - start, 3)
+
+    def _load_collections(self) -> None:
+        # Collections chargées depuis le disque et index lexical construit
+        for collection_name in dict.fromkeys([*self.rag_service.collection_names.values(), "general"]):
+            self.vector_store.collection(collection_name).search_text("warm-up", limit=1)
+
+    def start(self) -> None:
+        """Lance le warm-up en tâche de fond (l'application accepte les requêtes pendant ce temps)"""
+        if self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(self.warm_up())
+
+    def status(self) -> Dict[str, Any]:
+        """État de préparation des services (sonde de readiness)"""
+        return {
+            "ready": self.ready,
+            "error": self.warm_up_error,
+            "llm": self.llm_service is not None,
+            "warm_up_seconds": self.warm_up_seconds,
+        }
+
+    async def close(self) -> None:
+        """Arrête le warm-up en cours et libère les modèles, l'index et les pools"""
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+            try:
+                await self._warm_up_task
+            except asyncio.CancelledError:
+                pass
+        if self.llm_service is not None:
+            self.llm_service.close()
+        self.vector_store.close()
+        if self._shared_embedding_service:
+            shutdown_embedding_service()
+        else:
+            close_embedding_service(self.embedding_service)
+        self.ready = False
+
+
+# Conteneur partagé par le processus
+_service_container: Optional[ServiceContainer] = None
+
+
+def get_service_container() -> ServiceContainer:
+    """
+    Factory pour l'injection de dépendance du conteneur de services
+    """
+    global _service_container
+    if _service_container is None:
+        _service_container = ServiceContainer()
+    return _service_container
+
+
+def get_shared_rag_service() -> VectorRAGService:
+    """
+    Factory pour l'injection de dépendance du service RAG partagé (sans enregistrement en base)
+    """
+    return get_service_container().rag_service
+
+
+async def start_services() -> ServiceContainer:
+    """Crée le conteneur et lance son warm-up (démarrage de l'application)"""
+    container = get_service_container()
+    if settings.SERVICES_WARMUP:
+        container.start()
+    else:
+        container.ready = True
+    return container
+
+
+async def close_services() -> None:
+    """Libère le conteneur partagé (arrêt de l'application)"""
+    global _service_container
+    container, _service_container = _service_container, None
+    if container is not None:
+        await container.close()
@@ -0,0 +1,189 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import threading
+import time
+import numpy as np
+
+from app.core.config import settings
+
+# Hachage d'un couple (skill_id, consultant_id), calculé à l'identique en SQL par le repository
+PAIR_HASH_MULTIPLIER = 1000003
+PAIR_HASH_MODULUS = 2147483647
+
+# Empreinte additive de consultant_skills :
+# (nombre de couples, somme des consultant_id, somme des skill_id, somme des hachages des couples)
+SkillPairsVersion = Tuple[int, int, int, int]
+
+
+def pair_hash(skill_id: int, consultant_id: int) -> int:
+    """Hachage d'un couple (skill_id, consultant_id)"""
+    return (consultant_id * PAIR_HASH_MULTIPLIER + skill_id) % PAIR_HASH_MODULUS
+
+
+def skill_pairs_version(pairs: Iterable[Tuple[int, int]]) -> SkillPairsVersion:
+    """Empreinte additive d'un ensemble de couples (skill_id, consultant_id)"""
+    count = consultant_sum = skill_sum = hash_sum = 0
+    for skill_id, consultant_id in pairs:
+        count += 1
+        consultant_sum += consultant_id
+        skill_sum += skill_id
+        hash_sum += pair_hash(skill_id, consultant_id)
+    return count, consultant_sum, skill_sum, hash_sum
+
+
+class SkillInvertedIndex:
+    """
+    Index inversé en mémoire : compétence -> tableau trié des identifiants de consultants.
+
+    Construit à partir de la table consultant_skills et associé à l'empreinte de la table
+    au moment du chargement (version). Les écritures de ce processus sont appliquées
+    incrémentalement (set_consultant_skills), empreinte comprise, sans relire la table.
+    Les compétences sont aussi modifiées par d'autres processus (autres workers uvicorn,
+    scripts) : le matchmaking compare l'empreinte en base à version au plus toutes les
+    refresh_interval secondes et recharge l'index si elle diffère.
+    Permet au matchmaking de ne charger que les consultants partageant au moins une
+    compétence avec un appel d'offres.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = None):
+        self._postings: Dict[int, np.ndarray] = {}
+        self._skills_by_consultant: Dict[int, Set[int]] = {}
+        self._lock = threading.Lock()
+        self.refresh_interval = (refresh_interval if refresh_interval is not None
+                                 else settings.SKILL_INDEX_REFRESH_INTERVAL)
+        self._checked_at = float("-inf")
+        self.is_loaded = False
+        self.version: Optional[SkillPairsVersion] = None
+
+    def load(self, pairs: Iterable[Tuple[int, int]], version: Optional[SkillPairsVersion] = None) -> None:
+        """
+        Reconstruit l'index complet
+
+        Args:
+            pairs: Couples (skill_id, consultant_id) issus de consultant_skills
+            version: Empreinte de consultant_skills correspondant à ces couples
+        """
+        grouped: Dict[int, List[int]] = {}
+        skills_by_consultant: Dict[int, Set[int]] = {}
+        for skill_id, consultant_id in pairs:
+            grouped.setdefault(skill_id, []).append(consultant_id)
+            skills_by_consultant.setdefault(consultant_id, set()).add(skill_id)
+
+        postings = {
+            skill_id: np.unique(np.asarray(consultant_ids, dtype=np.int64))
+            for skill_id, consultant_ids in grouped.items()
+        }
+
+        with self._lock:
+            self._postings = postings
+            self._skills_by_consultant = skills_by_consultant
+            self.version = version
+            self.is_loaded = True
+
+    def set_consultant_skills(self, consultant_id: int, skill_ids: Iterable[int]) -> None:
+        """
+        Remplace les compétences d'un consultant (écriture faite par ce processus)
+
+        Seules les listes des compétences ajoutées ou retirées sont modifiées, et l'empreinte
+        est mise à jour du même écart : si d'autres écritures n'ont pas encore été vues,
+        elle reste différente de celle de la base et l'index sera rechargé.
+        Sans effet tant que l'index n'est pas chargé.
+
+        Args:
+            consultant_id: Identifiant du consultant
+            skill_ids: Compétences actuelles du consultant (vide s'il a été supprimé)
+        """
+        new_skills = set(skill_ids)
+        with self._lock:
+            if not self.is_loaded:
+                return
+
+            old_skills = self._skills_by_consultant.get(consultant_id, set())
+            added, removed = new_skills - old_skills, old_skills - new_skills
+
+            for skill_id in added:
+                posting = self._postings.get(skill_id, np.empty(0, dtype=np.int64))
+                position = np.searchsorted(posting, consultant_id)
+                self._postings[skill_id] = np.insert(posting, position, consultant_id)
+
+            for skill_id in removed:
+                posting = self._postings[skill_id]
+                posting = np.delete(posting, np.searchsorted(posting, consultant_id))
+                if len(posting):
+                    self._postings[skill_id] = posting
+                else:
+                    del self._postings[skill_id]
+
+            if new_skills:
+                self._skills_by_consultant[consultant_id] = new_skills
+            else:
+                self._skills_by_consultant.pop(consultant_id, None)
+
+            if self.version is not None:
+                plus = skill_pairs_version((skill_id, consultant_id) for skill_id in added)
+                minus = skill_pairs_version((skill_id, consultant_id) for skill_id in removed)
+                self.version = tuple(v + p - m for v, p, m in zip(self.version, plus, minus))
+
+    def check_due(self) -> bool:
+        """
+        Indique si l'empreinte en base doit être vérifiée (index non chargé ou dernière
+        vérification plus ancienne que refresh_interval) et, si oui, note la vérification
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.is_loaded and now - self._checked_at < self.refresh_interval:
+                return False
+            self._checked_at = now
+            return True
+
+    def clear(self) -> None:
+        """Vide l'index ; il sera rechargé au prochain usage"""
+        with self._lock:
+            self._postings = {}
+            self._skills_by_consultant = {}
+            self._checked_at = float("-inf")
+            self.version = None
+            self.is_loaded = False
+
+    def postings(self, skill_id: int) -> np.ndarray:
+        """Retourne le tableau trié des consultants possédant une compétence"""
+        with self._lock:
+            return self._postings.get(skill_id, np.empty(0, dtype=np.int64))
+
+    def candidates(self, skill_ids: Iterable[int]) -> np.ndarray:
+        """Union triée des listes des compétences demandées"""
+        ids, _ = self.weighted_candidates({skill_id: 1.0 for skill_id in skill_ids})
+        return ids
+
+    def weighted_candidates(self, skill_weights: Dict[int, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Union des listes des compétences demandées avec, pour chaque consultant,
+        la somme des poids des compétences qu'il possède
+
+        Args:
+            skill_weights: Poids par compétence (ex. importance dans l'appel d'offres)
+
+        Returns:
+            Tuple (identifiants de consultants triés, somme des poids correspondante)
+        """
+        with self._lock:
+            lists = [(self._postings[skill_id], weight)
+                     for skill_id, weight in skill_weights.items() if skill_id in self._postings]
+
+        if not lists:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        all_ids = np.concatenate([posting for posting, _ in lists])
+        all_weights = np.concatenate([np.full(len(posting), weight) for posting, weight in lists])
+        ids, inverse = np.unique(all_ids, return_inverse=True)
+        return ids, np.bincount(inverse, weights=all_weights, minlength=len(ids))
+
+
+# Index partagé par le processus
+skill_index = SkillInvertedIndex()
+
+
+def get_skill_index() -> SkillInvertedIndex:
+    """
+    Factory pour l'injection de dépendance de l'index des compétences
+    """
+    return skill_index
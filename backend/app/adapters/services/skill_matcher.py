@@ -0,0 +1,205 @@
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from collections import deque
+
+T = TypeVar("T")
+
+# Distance maximale (en caractères) entre une compétence et le niveau qui la qualifie
+LEVEL_WINDOW = 100
+
+# Unités d'une durée d'expérience ("Python (3 ans)", "Java - 5 years")
+YEAR_UNITS = ("an", "ans", "année", "années", "year", "years")
+
+# Séparateurs admis entre une compétence et sa durée
+YEAR_SEPARATORS = "(:-"
+
+# Catégories de mots-clés reconnus par l'automate
+SKILL, LEVEL, YEARS = "skill", "level", "years"
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class AhoCorasick(Generic[T]):
+    """
+    Automate d'Aho-Corasick : recherche simultanée de tous les motifs en un seul passage
+
+    Le temps de recherche est linéaire en la taille du texte (plus le nombre de
+    correspondances), quelle que soit la taille du vocabulaire. Seules les occurrences
+    délimitées par des frontières de mot sont renvoyées ("go" ne correspond pas à "google").
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, T]]):
+        # Nœud 0 = racine ; chaque nœud a ses transitions, son lien d'échec et ses sorties
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, T]]] = [[]]
+
+        for pattern, payload in patterns:
+            if pattern:
+                self._add(pattern, payload)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, payload: T) -> None:
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = next_node
+        self._outputs[node].append((len(pattern), payload))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                # Un motif suffixe d'un autre est aussi reconnu à cette position
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, T]]:
+        """
+        Parcourt le texte et renvoie les occurrences (début, fin, valeur) délimitées par des frontières de mot
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        length = len(text)
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not outputs[node]:
+                continue
+            end = index + 1
+            # Le mot continue après la fin du motif
+            if end < length and _is_word_char(char) and _is_word_char(text[end]):
+                continue
+            for pattern_length, payload in outputs[node]:
+                start = end - pattern_length
+                # Le mot commence avant le début du motif
+                if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+                    continue
+                yield start, end, payload
+
+
+class SkillMatcher:
+    """
+    Extraction des compétences d'un CV avec un automate compilé une seule fois
+
+    Compétences, niveaux et durées ("3 ans") sont repérés en un seul passage sur le texte,
+    puis associés par position : niveau le plus proche dans une fenêtre de LEVEL_WINDOW
+    caractères, durée placée immédiatement après la compétence.
+    """
+
+    def __init__(self, skills_categories: Dict[str, str], skill_levels: Dict[str, int],
+                 aliases: Optional[Dict[str, str]] = None, display_names: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            skills_categories: Compétence (en minuscules) -> catégorie
+            skill_levels: Mot-clé de niveau -> valeur numérique
+            aliases: Synonyme -> compétence de référence ("k8s" -> "kubernetes")
+            display_names: Compétence -> nom affiché (par défaut, nom en majuscules initiales)
+        """
+        self.skills_categories = skills_categories
+        self.skill_levels = skill_levels
+        self.display_names = display_names or {}
+        patterns: List[Tuple[str, Tuple[str, str]]] = [(name.lower(), (SKILL, name)) for name in skills_categories]
+        patterns += [
+            (alias.lower(), (SKILL, name)) for alias, name in (aliases or {}).items()
+            if name in skills_categories and alias.lower() not in skills_categories
+        ]
+        patterns += [(name.lower(), (LEVEL, name)) for name in skill_levels]
+        patterns += [(unit, (YEARS, unit)) for unit in YEAR_UNITS]
+        self.automaton = AhoCorasick(patterns)
+
+    @staticmethod
+    def _years_anchor(text: str, unit_start: int) -> Optional[Tuple[int, int]]:
+        """
+        Pour une unité de durée, renvoie (position de la compétence attendue, nombre d'années)
+
+        Accepte "Python (3 ans", "Python: 3 ans", "Python - 3 ans" et "Python 3 ans".
+        """
+        position = unit_start
+        while position > 0 and text[position - 1].isspace():
+            position -= 1
+        digits_end = position
+        while position > 0 and text[position - 1].isdigit():
+            position -= 1
+        if position == digits_end:
+            return None
+        years = int(text[position:digits_end])
+        while position > 0 and text[position - 1].isspace():
+            position -= 1
+        if position > 0 and text[position - 1] in YEAR_SEPARATORS:
+            position -= 1
+            while position > 0 and text[position - 1].isspace():
+                position -= 1
+        return position, years
+
+    def extract(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Extrait les compétences d'un texte, dans l'ordre de leur première mention
+
+        Returns:
+            Liste des compétences avec leur niveau, leur catégorie et leurs années d'expérience
+        """
+        text_lower = text.lower()
+        first_mentions: Dict[str, int] = {}
+        skill_ends: Dict[int, List[str]] = {}
+        levels: List[Tuple[int, str]] = []
+        years_by_anchor: Dict[int, int] = {}
+
+        for start, end, (kind, name) in self.automaton.iter_matches(text_lower):
+            if kind == SKILL:
+                first_mentions.setdefault(name, start)
+                skill_ends.setdefault(end, []).append(name)
+            elif kind == LEVEL:
+                levels.append((start, name))
+            else:
+                anchor = self._years_anchor(text_lower, start)
+                if anchor:
+                    years_by_anchor.setdefault(*anchor)
+
+        levels.sort()
+
+        # Première durée écrite juste après une mention de chaque compétence
+        skill_years: Dict[str, int] = {}
+        for end in sorted(skill_ends):
+            if end in years_by_anchor:
+                for name in skill_ends[end]:
+                    skill_years.setdefault(name, years_by_anchor[end])
+
+        skills = []
+        level_index = 0
+        for name, position in sorted(first_mentions.items(), key=lambda item: item[1]):
+            # Niveau le plus proche de la première mention (les niveaux sont triés par position)
+            while level_index + 1 < len(levels) and levels[level_index + 1][0] <= position:
+                level_index += 1
+            level = "intermediate"  # Niveau par défaut
+            candidates = levels[level_index:level_index + 2]
+            nearby = [(abs(start - position), level_name) for start, level_name in candidates
+                      if abs(start - position) < LEVEL_WINDOW]
+            if nearby:
+                level = min(nearby)[1]
+
+            skills.append({
+                "name": self.display_names.get(name) or name.title(),
+                "level": level,
+                "level_value": self.skill_levels.get(level, 2),  # Valeur numérique du niveau
+                "category": self.skills_categories[name],
+                "years_experience": skill_years.get(name)
+            })
+
+        return skills
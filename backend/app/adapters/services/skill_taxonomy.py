@@ -0,0 +1,347 @@
+from typing import Callable, Dict, Optional, Tuple
+import asyncio
+import glob
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.adapters.services.skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+# Dictionnaire des compétences courantes avec leur catégorie
+SKILLS_CATEGORIES = {
+    # Langages de programmation
+    "python": "programming_language",
+    "javascript": "programming_language",
+    "typescript": "programming_language",
+    "java": "programming_language",
+    "c#": "programming_language",
+    "c++": "programming_language",
+    "php": "programming_language",
+    "ruby": "programming_language",
+    "go": "programming_language",
+    "rust": "programming_language",
+    "swift": "programming_language",
+    "kotlin": "programming_language",
+
+    # Frameworks frontend
+    "react": "frontend_framework",
+    "angular": "frontend_framework",
+    "vue": "frontend_framework",
+    "svelte": "frontend_framework",
+    "jquery": "frontend_framework",
+
+    # Frameworks backend
+    "django": "backend_framework",
+    "flask": "backend_framework",
+    "fastapi": "backend_framework",
+    "express": "backend_framework",
+    "spring": "backend_framework",
+    "laravel": "backend_framework",
+    "ruby on rails": "backend_framework",
+    "asp.net": "backend_framework",
+
+    # Bases de données
+    "sql": "database",
+    "mysql": "database",
+    "postgresql": "database",
+    "mongodb": "database",
+    "redis": "database",
+    "elasticsearch": "database",
+    "sqlite": "database",
+    "oracle": "database",
+    "cassandra": "database",
+
+    # DevOps
+    "docker": "devops",
+    "kubernetes": "devops",
+    "jenkins": "devops",
+    "github actions": "devops",
+    "gitlab ci": "devops",
+    "aws": "cloud",
+    "azure": "cloud",
+    "gcp": "cloud",
+    "terraform": "devops",
+    "ansible": "devops",
+
+    # UI/UX
+    "figma": "design",
+    "sketch": "design",
+    "adobe xd": "design",
+    "photoshop": "design",
+    "illustrator": "design",
+
+    # Soft skills
+    "communication": "soft_skill",
+    "leadership": "soft_skill",
+    "teamwork": "soft_skill",
+    "problem solving": "soft_skill",
+    "time management": "soft_skill",
+    "critical thinking": "soft_skill",
+    "project management": "soft_skill",
+    "agile": "methodology",
+    "scrum": "methodology",
+    "kanban": "methodology",
+
+    # Data science
+    "machine learning": "data_science",
+    "deep learning": "data_science",
+    "tensorflow": "data_science",
+    "pytorch": "data_science",
+    "pandas": "data_science",
+    "numpy": "data_science",
+    "scikit-learn": "data_science",
+    "data analysis": "data_science",
+    "statistics": "data_science",
+    "big data": "data_science",
+    "hadoop": "data_science",
+    "spark": "data_science",
+
+    # Mobile
+    "ios": "mobile",
+    "android": "mobile",
+    "react native": "mobile",
+    "flutter": "mobile",
+    "xamarin": "mobile",
+
+    # Testing
+    "testing": "testing",
+    "unit testing": "testing",
+    "integration testing": "testing",
+    "e2e testing": "testing",
+    "jest": "testing",
+    "pytest": "testing",
+    "selenium": "testing",
+    "cypress": "testing",
+    "mocha": "testing",
+    "chai": "testing",
+}
+
+# Niveaux de compétence avec leur équivalent numérique
+SKILL_LEVELS = {
+    "beginner": 1,
+    "basic": 1,
+    "elementary": 1,
+    "novice": 1,
+
+    "intermediate": 2,
+    "moderate": 2,
+    "average": 2,
+
+    "advanced": 3,
+    "proficient": 3,
+    "skilled": 3,
+    "competent": 3,
+
+    "expert": 4,
+    "master": 4,
+    "experienced": 4,
+    "senior": 4,
+
+    "specialist": 5,
+    "guru": 5,
+    "authority": 5,
+}
+
+# Synonymes usuels, appliqués lorsque la compétence de référence fait partie de la taxonomie
+DEFAULT_SKILL_ALIASES = {
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "k8s": "kubernetes",
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "nodejs": "node.js",
+    "mongo": "mongodb",
+    "sklearn": "scikit-learn",
+    "ml": "machine learning",
+}
+
+# Empreinte du vocabulaire intégré : une modification du code invalide les automates sur disque
+BUILTIN_FINGERPRINT = hashlib.sha256(
+    json.dumps([SKILLS_CATEGORIES, SKILL_LEVELS, DEFAULT_SKILL_ALIASES], sort_keys=True).encode()
+).hexdigest()
+
+# Nombre d'automates conservés sur disque (les processus d'analyse peuvent encore lire les précédents)
+KEPT_ARTIFACTS = 3
+
+
+def skill_key(name: str) -> str:
+    """Clé de recherche d'une compétence ou d'un synonyme"""
+    return " ".join(name.lower().split())
+
+
+class SkillTaxonomy:
+    """
+    Taxonomie des compétences (vocabulaire intégré, table skills et skill_aliases) compilée en automate
+
+    L'automate compilé est écrit sur disque sous un nom dérivé de l'empreinte de la taxonomie :
+    un redémarrage ou un autre processus le réutilise sans recompilation. L'empreinte est vérifiée
+    au plus toutes les refresh_interval secondes (ou dès invalidate()) ; en cas de changement, un
+    nouvel automate est compilé hors de la boucle d'événements puis publié d'un bloc.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None,
+                 cache_dir: Optional[str] = None, refresh_interval: Optional[float] = None):
+        if session_factory is None:
+            from app.infrastructure.database.session import SessionLocal
+            session_factory = SessionLocal
+
+        self.session_factory = session_factory
+        self.cache_dir = cache_dir or settings.SKILL_TAXONOMY_CACHE_DIR or os.path.join(
+            tempfile.gettempdir(), "talentmatch-skill-taxonomy"
+        )
+        self.refresh_interval = (refresh_interval if refresh_interval is not None
+                                 else settings.SKILL_TAXONOMY_REFRESH_INTERVAL)
+        self._path: Optional[str] = None
+        self._fingerprint: Optional[str] = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:
+        """Empreinte de l'automate courant (None tant qu'aucun n'a été compilé)"""
+        return self._fingerprint
+
+    def invalidate(self) -> None:
+        """Force la vérification de la taxonomie à la prochaine analyse (compétences modifiées)"""
+        self._checked_at = float("-inf")
+
+    def fingerprint(self, db: Session) -> str:
+        """
+        Empreinte de la taxonomie en base
+
+        Les compétences sont résumées par leur nombre, leur dernier identifiant et leur dernière
+        modification ; les alias, sans date de modification, par leurs couples (alias, skill_id).
+        """
+        from app.infrastructure.database.models import Skill as SkillModel, SkillAlias as SkillAliasModel
+
+        skills = db.query(
+            func.count(SkillModel.id), func.max(SkillModel.id),
+            func.max(func.coalesce(SkillModel.updated_at, SkillModel.created_at))
+        ).one()
+        digest = hashlib.sha256(f"{BUILTIN_FINGERPRINT}:{tuple(skills)}".encode())
+        for alias, skill_id in db.query(SkillAliasModel.alias, SkillAliasModel.skill_id).order_by(SkillAliasModel.id):
+            digest.update(f":{alias}={skill_id}".encode())
+        return digest.hexdigest()[:16]
+
+    def compile(self, db: Session) -> SkillMatcher:
+        """Compile l'automate à partir du vocabulaire intégré et des tables skills / skill_aliases"""
+        from app.infrastructure.database.models import Skill as SkillModel, SkillAlias as SkillAliasModel
+
+        skills_categories = dict(SKILLS_CATEGORIES)
+        display_names: Dict[str, str] = {}
+        for name, category in db.query(SkillModel.name, SkillModel.category):
+            key = skill_key(name)
+            skills_categories[key] = category or skills_categories.get(key) or "other"
+            display_names[key] = name
+
+        aliases = dict(DEFAULT_SKILL_ALIASES)
+        for alias, name in db.query(SkillAliasModel.alias, SkillModel.name).join(
+            SkillModel, SkillAliasModel.skill_id == SkillModel.id
+        ):
+            aliases[skill_key(alias)] = skill_key(name)
+
+        return SkillMatcher(skills_categories, SKILL_LEVELS, aliases, display_names)
+
+    def _write(self, matcher: SkillMatcher, path: str) -> None:
+        """Écrit l'automate puis le publie par renommage atomique"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                pickle.dump(matcher, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+        artifacts = sorted(glob.glob(os.path.join(self.cache_dir, "skill_matcher-*.pkl")), key=os.path.getmtime)
+        for stale in artifacts[:-KEPT_ARTIFACTS]:
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
+
+    def refresh(self) -> Optional[str]:
+        """
+        Vérifie l'empreinte et recompile l'automate si nécessaire (appel bloquant)
+
+        Returns:
+            Chemin de l'automate courant
+        """
+        with self._lock:
+            db = self.session_factory()
+            try:
+                fingerprint = self.fingerprint(db)
+                if fingerprint != self._fingerprint:
+                    path = os.path.join(self.cache_dir, f"skill_matcher-{fingerprint}.pkl")
+                    if not os.path.exists(path):
+                        started = time.monotonic()
+                        matcher = self.compile(db)
+                        self._write(matcher, path)
+                        logger.info(
+                            f"Taxonomie des compétences compilée ({len(matcher.skills_categories)} compétences) "
+                            f"en {time.monotonic() - started:.2f}s"
+                        )
+                    self._fingerprint, self._path = fingerprint, path
+            finally:
+                db.close()
+            return self._path
+
+    async def matcher_path(self) -> Optional[str]:
+        """
+        Chemin de l'automate courant, vérifié au plus toutes les refresh_interval secondes
+
+        Si la base est indisponible, l'automate précédent (ou le vocabulaire intégré) reste utilisé.
+        """
+        if time.monotonic() - self._checked_at >= self.refresh_interval:
+            self._checked_at = time.monotonic()
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.error(f"Erreur lors du rechargement de la taxonomie des compétences: {str(e)}")
+        return self._path
+
+
+# Automate chargé dans le processus courant : (chemin, automate), remplacé d'un bloc
+_loaded_matcher: Tuple[Optional[str], Optional[SkillMatcher]] = (None, None)
+
+
+def load_skill_matcher(path: str) -> SkillMatcher:
+    """Charge un automate compilé, en le gardant en mémoire tant que le chemin ne change pas"""
+    global _loaded_matcher
+    loaded_path, matcher = _loaded_matcher
+    if loaded_path != path:
+        with open(path, "rb") as artifact:
+            matcher = pickle.load(artifact)
+        _loaded_matcher = (path, matcher)
+    return matcher
+
+
+# Taxonomie partagée par le processus
+_skill_taxonomy: Optional[SkillTaxonomy] = None
+
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """
+    Factory pour l'injection de dépendance de la taxonomie des compétences
+    """
+    global _skill_taxonomy
+    if _skill_taxonomy is None:
+        _skill_taxonomy = SkillTaxonomy()
+    return _skill_taxonomy
@@ -0,0 +1,59 @@
+from typing import List, Optional
+from dataclasses import dataclass
+import re
+
+from app.core.config import settings
+
+# Jetons : mots (lettres, chiffres) ou signes de ponctuation isolés
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+# Ponctuation de fin de phrase où couper un chunk de préférence (avec les fins de ligne)
+_SENTENCE_END = frozenset(".!?;")
+
+
+@dataclass
+class TextChunk:
+    """Fragment d'un document, borné en nombre de jetons"""
+    index: int
+    content: str
+    token_count: int
+    start: int
+    end: int
+
+
+def count_tokens(text: str) -> int:
+    """Nombre de jetons d'un texte (même découpage que chunk_text)"""
+    return sum(1 for _ in _TOKEN.finditer(text))
+
+
+def chunk_text(text: str, max_tokens: Optional[int] = None, overlap: Optional[int] = None) -> List[TextChunk]:
+    """
+    Découpe un texte en chunks d'au plus max_tokens jetons qui se chevauchent de overlap jetons
+
+    Un chunk s'arrête de préférence sur une fin de phrase ou de ligne située dans sa seconde
+    moitié, pour ne pas couper une expérience ou une compétence au milieu.
+    """
+    max_tokens = max_tokens or settings.RAG_CHUNK_TOKENS
+    overlap = min(overlap if overlap is not None else settings.RAG_CHUNK_OVERLAP, max_tokens // 2)
+    tokens = [(match.start(), match.end()) for match in _TOKEN.finditer(text)]
+    chunks: List[TextChunk] = []
+    start = 0
+    while start < len(tokens):
+        end = min(start + max_tokens, len(tokens))
+        if end < len(tokens):
+            for cut in range(end, start + max_tokens // 2, -1):
+                last_start, last_end = tokens[cut - 1]
+                if text[last_start:last_end] in _SENTENCE_END or "\n" in text[last_end:tokens[cut][0]]:
+                    end = cut
+                    break
+        chunks.append(TextChunk(
+            index=len(chunks),
+            content=text[tokens[start][0]:tokens[end - 1][1]],
+            token_count=end - start,
+            start=tokens[start][0],
+            end=tokens[end - 1][1],
+        ))
+        if end == len(tokens):
+            break
+        start = max(end - overlap, start + 1)
+    return chunks
@@ -0,0 +1,685 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from pathlib import Path
+import asyncio
+import fcntl
+import json
+import logging
+import mmap
+import os
+import pickle
+import re
+import shutil
+import threading
+
+import numpy as np
+
+from app.core.config import settings
+from app.adapters.services.lexical_index import LexicalIndex
+
+logger = logging.getLogger(__name__)
+
+# Noms de collection admis (ils deviennent des noms de répertoire)
+_COLLECTION_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# Types de valeurs de métadonnées indexées pour les filtres
+_INDEXABLE = (str, int, float, bool, type(None))
+
+# Taille des lots de vecteurs pour l'affectation aux listes IVF
+_ASSIGN_BATCH = 65536
+
+
+def _grow(array: np.ndarray, size: int, fill: Any) -> np.ndarray:
+    """Agrandit un tableau 1D (capacité doublée) ; les nouvelles cases valent `fill`"""
+    if size <= len(array):
+        return array
+    grown = np.full(max(size, 2 * len(array), 1024), fill, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Normalise les lignes (similarité cosinus = produit scalaire)"""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Centroïde le plus proche de chaque vecteur, par lots"""
+    assign = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _ASSIGN_BATCH):
+        batch = np.asarray(vectors[start:start + _ASSIGN_BATCH], dtype=np.float32)
+        assign[start:start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return assign
+
+
+def spherical_kmeans(sample: np.ndarray, k: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """K-moyennes sphériques (centroïdes normalisés) sur un échantillon de vecteurs normalisés"""
+    rng = np.random.default_rng(seed)
+    centroids = sample[rng.choice(len(sample), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assign = _nearest_centroids(sample, centroids)
+        order = np.argsort(assign, kind="stable")
+        clusters, starts, counts = np.unique(assign[order], return_index=True, return_counts=True)
+        sums = np.add.reduceat(sample[order], starts, axis=0)
+        # Les clusters vides gardent leur centroïde
+        centroids[clusters] = _normalize(sums / counts[:, None])
+    return centroids
+
+
+def _values(value: Any) -> List[Any]:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def matches_filters(metadata: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    """
+    Vrai si les métadonnées satisfont tous les filtres
+
+    Une liste de valeurs dans un filtre signifie "l'une de" ; une métadonnée de type liste
+    correspond si l'un de ses éléments correspond.
+    """
+    for key, expected in (filters or {}).items():
+        if key not in metadata:
+            return False
+        if not any(item == value for item in _values(metadata[key]) for value in _values(expected)):
+            return False
+    return True
+
+
+class VectorCollection:
+    """
+    Collection de vecteurs en mémoire (ou projetée depuis le disque) avec index IVF
+
+    Les vecteurs sont normalisés et stockés dans une matrice float32 ; la recherche est exacte
+    tant que la collection compte moins de `ivf_threshold` vecteurs, puis passe par un index
+    IVF (k-moyennes sphériques) dont seules les `nprobe` listes les plus proches sont parcourues.
+    Les filtres de métadonnées sont résolus avant le calcul des scores via un index inversé ;
+    un filtre sélectif bascule en recherche exacte sur les seules lignes retenues.
+
+    Un index inversé BM25 sur les contenus (construit à la première recherche textuelle,
+    puis tenu à jour à chaque ajout) partage les lignes, suppressions et filtres des vecteurs.
+
+    Avec un répertoire, la collection est persistée en fichiers ajout seul : vecteurs bruts
+    (projetés en mémoire au chargement), contenus textuels (lus à la demande), journal des
+    enregistrements et index IVF entraîné. Un redémarrage ne recalcule rien.
+
+    Les positions d'écriture sont déduites de l'état en mémoire : un seul processus écrit dans
+    une collection persistée (verrou <collection>.lock pris à la première écriture), les autres
+    peuvent la lire mais ne voient pas les ajouts faits après leur chargement.
+    """
+
+    def __init__(self, name: str, path: Optional[Path] = None, ivf_threshold: Optional[int] = None,
+                 nprobe: Optional[int] = None):
+        self.name = name
+        self.path = path
+        self.ivf_threshold = ivf_threshold or settings.VECTOR_STORE_IVF_THRESHOLD
+        self.nprobe = nprobe or settings.VECTOR_STORE_NPROBE
+        self.dim: Optional[int] = None
+        self._lock = threading.RLock()
+        # Verrou inter-processus d'écriture (fichier ouvert tant que la collection est réservée)
+        self._writer: Optional[Any] = None
+
+        self._reset()
+
+        if path is not None:
+            self._load()
+
+    def _reset(self) -> None:
+        self._count = 0
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._metadata: List[Dict[str, Any]] = []
+        self._metadata_index: Dict[str, Dict[Any, List[int]]] = {}
+        # Contenus : en mémoire, ou (position, longueur) dans contents.bin
+        self._contents: List[Any] = []
+        self._contents_map: Optional[mmap.mmap] = None
+
+        # Index IVF : centroïdes, liste de chaque ligne, listes triées et lignes pas encore rangées
+        self._centroids: Optional[np.ndarray] = None
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._list_rows = np.zeros(0, dtype=np.int64)
+        self._list_bounds = np.zeros(1, dtype=np.int64)
+        self._pending: List[int] = []
+        self._trained_rows = 0
+
+        # Index lexical BM25 (None tant qu'aucune recherche textuelle n'a été faite)
+        self._lexical: Optional[LexicalIndex] = None
+
+    # -- Propriétés -------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def indexed(self) -> bool:
+        """Vrai si la recherche passe par l'index IVF"""
+        return self._centroids is not None
+
+    # -- Persistance -----------------------------------------------------
+
+    def _file(self, name: str) -> Path:
+        return self.path / name
+
+    def _sibling(self, suffix: str) -> Path:
+        """Fichier ou répertoire voisin de la collection (verrou, compaction)"""
+        return self.path.with_name(f"{self.path.name}.{suffix}")
+
+    def _try_lock(self) -> Optional[Any]:
+        """Verrou exclusif d'écriture de la collection, ou None s'il est tenu par un autre processus"""
+        lock_file = open(self._sibling("lock"), "ab")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def _acquire_writer(self) -> None:
+        """
+        Réserve la collection en écriture pour ce processus, jusqu'à close()
+
+        Raises:
+            RuntimeError si un autre processus écrit déjà dans la collection
+        """
+        if self.path is None or self._writer is not None:
+            return
+        self._writer = self._try_lock()
+        if self._writer is None:
+            raise RuntimeError(f"La collection {self.name} est déjà ouverte en écriture par un autre processus")
+
+    def _recover(self) -> None:
+        """Termine ou annule une compaction interrompue (arrêt du processus qui écrivait)"""
+        compacted_path, old_path = self._sibling("compact"), self._sibling("old")
+        if not (compacted_path.exists() or old_path.exists()):
+            return
+        lock_file = self._try_lock()
+        if lock_file is None:
+            # Compaction en cours dans le processus qui écrit
+            return
+        try:
+            if compacted_path.exists() and old_path.exists():
+                # Arrêt entre les deux renommages : la copie compactée est complète
+                shutil.rmtree(self.path, ignore_errors=True)
+                os.replace(compacted_path, self.path)
+            shutil.rmtree(compacted_path, ignore_errors=True)
+            shutil.rmtree(old_path, ignore_errors=True)
+        finally:
+            lock_file.close()
+
+    def _load(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._recover()
+        self.path.mkdir(exist_ok=True)
+        meta_file = self._file("meta.json")
+        if not meta_file.exists():
+            return
+        self.dim = json.loads(meta_file.read_text())["dim"]
+
+        events: List[Tuple[str, Any]] = []
+        log_file = self._file("records.log")
+        if log_file.exists():
+            with open(log_file, "rb") as log:
+                while True:
+                    try:
+                        events.append(pickle.load(log))
+                    except EOFError:
+                        break
+                    except pickle.UnpicklingError:
+                        # Dernier enregistrement tronqué (arrêt pendant une écriture)
+                        logger.warning(f"Journal de la collection {self.name} tronqué, fin ignorée")
+                        break
+
+        # Des vecteurs écrits sans leur enregistrement sont ignorés
+        count = sum(len(payload) for kind, payload in events if kind == "add")
+        vector_file = self._file("vectors.f32")
+        if vector_file.exists() and vector_file.stat().st_size > count * self.dim * 4:
+            with open(vector_file, "r+b") as vectors:
+                vectors.truncate(count * self.dim * 4)
+        self._remap(count)
+        self._open_contents()
+
+        # Rejeu dans l'ordre : un remplacement est journalisé comme suppression puis ajout
+        self._alive = np.ones(count, dtype=bool)
+        for kind, payload in events:
+            if kind == "add":
+                for document_id, metadata, offset, length in payload:
+                    self._register(len(self._ids), document_id, metadata, (offset, length))
+            else:
+                for document_id in payload:
+                    self._forget(document_id)
+
+        ivf_file = self._file("ivf.npz")
+        if ivf_file.exists():
+            ivf = np.load(ivf_file)
+            assign = ivf["assign"]
+            if len(assign) <= count:
+                self._centroids = ivf["centroids"]
+                self._trained_rows = int(ivf["trained_rows"])
+                self._assign = np.concatenate([assign, np.full(count - len(assign), -1, dtype=np.int32)])
+                self._pending = list(range(len(assign), count))
+                self._rebuild_lists()
+
+    def _remap(self, count: int) -> None:
+        self._count = count
+        if count == 0:
+            self._vectors = np.empty((0, self.dim or 0), dtype=np.float32)
+        else:
+            self._vectors = np.memmap(self._file("vectors.f32"), dtype=np.float32, mode="r", shape=(count, self.dim))
+
+    def _open_contents(self) -> None:
+        if self._contents_map is not None:
+            self._contents_map.close()
+            self._contents_map = None
+        contents_file = self._file("contents.bin")
+        if contents_file.exists() and contents_file.stat().st_size > 0:
+            with open(contents_file, "rb") as contents:
+                self._contents_map = mmap.mmap(contents.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _append_log(self, kind: str, payload: Any) -> None:
+        with open(self._file("records.log"), "ab") as log:
+            pickle.dump((kind, payload), log, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _save_ivf(self) -> None:
+        if self.path is None or self._centroids is None:
+            return
+        tmp_file = self._file("ivf.tmp.npz")
+        np.savez(tmp_file, centroids=self._centroids, assign=self._assign[:self._count],
+                 trained_rows=np.array(self._trained_rows))
+        os.replace(tmp_file, self._file("ivf.npz"))
+
+    # -- Enregistrements -------------------------------------------------
+
+    def _register(self, row: int, document_id: str, metadata: Dict[str, Any], content: Any) -> None:
+        self._ids.append(document_id)
+        self._metadata.append(metadata)
+        self._contents.append(content)
+        self._rows[document_id] = row
+        for key, value in metadata.items():
+            for item in _values(value):
+                if isinstance(item, _INDEXABLE):
+                    self._metadata_index.setdefault(key, {}).setdefault(item, []).append(row)
+        if self._lexical is not None:
+            self._lexical.add(row, self._content(row))
+
+    def _forget(self, document_id: str) -> bool:
+        row = self._rows.pop(document_id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        return True
+
+    def _content(self, row: int) -> str:
+        content = self._contents[row]
+        if isinstance(content, tuple):
+            offset, length = content
+            return self._contents_map[offset:offset + length].decode("utf-8")
+        return content
+
+    def _document(self, row: int, score: Optional[float] = None) -> Dict[str, Any]:
+        document = {"id": self._ids[row], "metadata": self._metadata[row], "content": self._content(row)}
+        if score is not None:
+            document.update(score=score, source=self.name)
+        return document
+
+    # -- Écriture --------------------------------------------------------
+
+    def add(self, documents: Sequence[Dict[str, Any]]) -> List[str]:
+        """
+        Ajoute (ou remplace, à identifiant égal) des documents {id, embedding, metadata, content}
+
+        Raises:
+            ValueError si la dimension des vecteurs diffère de celle de la collection
+        """
+        if not documents:
+            return []
+        vectors = _normalize(np.asarray([document["embedding"] for document in documents], dtype=np.float32))
+        with self._lock:
+            self._acquire_writer()
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                if self.path is not None:
+                    self._file("meta.json").write_text(json.dumps({"dim": self.dim}))
+            if vectors.shape[1] != self.dim:
+                raise ValueError(
+                    f"Dimension {vectors.shape[1]} incompatible avec la collection {self.name} ({self.dim})"
+                )
+
+            ids = [str(document.get("id")) for document in documents]
+            replaced = [document_id for document_id in ids if document_id in self._rows]
+            for document_id in replaced:
+                self._forget(document_id)
+            if replaced and self.path is not None:
+                self._append_log("del", replaced)
+
+            start = self._count
+            records = self._write_rows(vectors, documents, ids)
+            self._alive = _grow(self._alive, self._count, False)
+            self._alive[start:self._count] = True
+            for offset, (document_id, metadata, content) in enumerate(records):
+                self._register(start + offset, document_id, metadata, content)
+
+            if self._centroids is not None:
+                self._assign = _grow(self._assign, self._count, -1)
+                self._assign[start:self._count] = -1
+                self._pending.extend(range(start, self._count))
+            self._maintain_index()
+            return ids
+
+    def _write_rows(self, vectors: np.ndarray, documents: Sequence[Dict[str, Any]],
+                    ids: List[str]) -> List[Tuple[str, Dict[str, Any], Any]]:
+        """Écrit les vecteurs et contenus (fichiers ajout seul, ou matrice en mémoire)"""
+        start = self._count
+        metadata = [dict(document.get("metadata") or {}) for document in documents]
+        contents = [document.get("content") or "" for document in documents]
+        if self.path is None:
+            if start + len(vectors) > len(self._vectors):
+                capacity = max(start + len(vectors), 2 * len(self._vectors), 1024)
+                grown = np.empty((capacity, self.dim), dtype=np.float32)
+                if start:
+                    grown[:start] = self._vectors[:start]
+                self._vectors = grown
+            self._vectors[start:start + len(vectors)] = vectors
+            self._count = start + len(vectors)
+            return list(zip(ids, metadata, contents))
+
+        encoded = [content.encode("utf-8") for content in contents]
+        with open(self._file("contents.bin"), "ab") as contents_file:
+            # Position fiable : ce processus est le seul à écrire dans la collection (_acquire_writer)
+            offset = contents_file.tell()
+            contents_file.write(b"".join(encoded))
+        positions = []
+        for data in encoded:
+            positions.append((offset, len(data)))
+            offset += len(data)
+        with open(self._file("vectors.f32"), "ab") as vector_file:
+            vector_file.write(vectors.tobytes())
+        records = [(document_id, meta, position) for document_id, meta, position in zip(ids, metadata, positions)]
+        self._append_log("add", [(document_id, meta, *position) for document_id, meta, position in records])
+        self._remap(start + len(vectors))
+        self._open_contents()
+        return records
+
+    def delete(self, document_ids: Iterable[str]) -> List[str]:
+        """Supprime des documents ; renvoie les identifiants effectivement supprimés"""
+        with self._lock:
+            self._acquire_writer()
+            deleted = [document_id for document_id in document_ids if self._forget(document_id)]
+            if deleted and self.path is not None:
+                self._append_log("del", deleted)
+            # Réécriture quand plus de la moitié des lignes sont supprimées
+            if self._count >= 1024 and len(self._rows) < self._count // 2:
+                self.compact()
+            return deleted
+
+    def delete_where(self, filters: Dict[str, Any]) -> List[str]:
+        """Supprime les documents satisfaisant les filtres (non vides)"""
+        if not filters:
+            raise ValueError("Filtres requis pour une suppression en masse")
+        with self._lock:
+            return self.delete([self._ids[row] for row in self._filter_rows(filters)])
+
+    def compact(self) -> None:
+        """
+        Réécrit la collection sans les lignes supprimées ; l'index est réentraîné si nécessaire
+
+        Sur disque, la collection compactée est écrite dans un répertoire voisin puis substituée
+        à l'ancienne par renommage : un arrêt pendant la réécriture laisse l'une ou l'autre intacte.
+        """
+        with self._lock:
+            rows = np.flatnonzero(self._alive[:self._count])
+            if self.path is None:
+                documents = [self._export(row) for row in rows]
+                self._reset()
+                self._remap(0)
+                for start in range(0, len(documents), _ASSIGN_BATCH):
+                    self.add(documents[start:start + _ASSIGN_BATCH])
+                return
+
+            self._acquire_writer()
+            compacted_path, old_path = self._sibling("compact"), self._sibling("old")
+            shutil.rmtree(compacted_path, ignore_errors=True)
+            compacted = VectorCollection(self.name, compacted_path, self.ivf_threshold, self.nprobe)
+            # La copie est écrite sous le verrou de la collection
+            compacted._writer = self._writer
+            for start in range(0, len(rows), _ASSIGN_BATCH):
+                compacted.add([self._export(row) for row in rows[start:start + _ASSIGN_BATCH]])
+            compacted._writer = None
+            compacted.close()
+
+            if self._contents_map is not None:
+                self._contents_map.close()
+            shutil.rmtree(old_path, ignore_errors=True)
+            os.replace(self.path, old_path)
+            os.replace(compacted_path, self.path)
+            shutil.rmtree(old_path, ignore_errors=True)
+            self._reset()
+            self._load()
+
+    def _export(self, row: int) -> Dict[str, Any]:
+        """Document d'une ligne, au format accepté par add()"""
+        return {"id": self._ids[row], "embedding": np.array(self._vectors[row]),
+                "metadata": self._metadata[row], "content": self._content(row)}
+
+    # -- Index IVF -------------------------------------------------------
+
+    def _maintain_index(self) -> None:
+        """Entraîne l'index au seuil, le réentraîne quand la collection a doublé, range les lignes en attente"""
+        alive = len(self._rows)
+        if alive >= self.ivf_threshold and (self._centroids is None or alive >= 2 * self._trained_rows):
+            self.train()
+        elif self._centroids is not None and len(self._pending) > max(4096, self._count // 100):
+            pending = np.asarray(self._pending, dtype=np.int64)
+            self._assign[pending] = _nearest_centroids(self._vectors[pending], self._centroids)
+            self._pending = []
+            self._rebuild_lists()
+            self._save_ivf()
+
+    def train(self, seed: int = 0) -> None:
+        """Entraîne l'index IVF sur un échantillon des vecteurs de la collection"""
+        with self._lock:
+            rows = np.flatnonzero(self._alive[:self._count])
+            if len(rows) == 0:
+                return
+            nlist = max(1, min(len(rows), int(np.sqrt(len(rows)))))
+            rng = np.random.default_rng(seed)
+            sample_rows = np.sort(rng.choice(rows, size=min(len(rows), nlist * 32), replace=False))
+            self._centroids = spherical_kmeans(np.asarray(self._vectors[sample_rows]), nlist, seed=seed)
+            self._assign = _nearest_centroids(self._vectors[:self._count], self._centroids)
+            self._pending = []
+            self._trained_rows = len(rows)
+            self._rebuild_lists()
+            self._save_ivf()
+            logger.info(f"Index IVF de la collection {self.name} entraîné: {len(rows)} vecteurs, {nlist} listes")
+
+    def _rebuild_lists(self) -> None:
+        assigned = np.flatnonzero(self._assign[:self._count] >= 0)
+        order = assigned[np.argsort(self._assign[assigned], kind="stable")]
+        self._list_rows = order
+        self._list_bounds = np.searchsorted(self._assign[order], np.arange(len(self._centroids) + 1))
+
+    # -- Lecture ---------------------------------------------------------
+
+    def _filter_rows(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Lignes vivantes satisfaisant les filtres (None = toutes)"""
+        if not filters:
+            return None
+        rows: Optional[np.ndarray] = None
+        for key, expected in filters.items():
+            values = _values(expected)
+            if all(isinstance(value, _INDEXABLE) for value in values):
+                index = self._metadata_index.get(key, {})
+                matched = np.unique(np.fromiter(
+                    (row for value in values for row in index.get(value, ())), dtype=np.int64
+                ))
+            else:
+                matched = np.asarray([
+                    row for row in range(self._count) if matches_filters(self._metadata[row], {key: expected})
+                ], dtype=np.int64)
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        return rows[self._alive[rows]]
+
+    def search(self, embedding: Sequence[float], filters: Optional[Dict[str, Any]] = None,
+               limit: int = 5) -> List[Dict[str, Any]]:
+        """Les `limit` documents les plus similaires (cosinus) satisfaisant les filtres"""
+        with self._lock:
+            if self._count == 0 or limit <= 0:
+                return []
+            query = _normalize(np.asarray(embedding, dtype=np.float32))
+            if query.shape[0] != self.dim:
+                raise ValueError(f"Dimension {query.shape[0]} incompatible avec la collection {self.name} ({self.dim})")
+
+            candidates = self._filter_rows(filters)
+            if self._centroids is None:
+                rows = candidates
+            else:
+                # Recherche exacte si le filtre retient moins de lignes que les listes parcourues
+                probed_rows = self.nprobe * self._count / len(self._centroids)
+                rows = candidates if candidates is not None and len(candidates) <= probed_rows else None
+                if rows is None:
+                    rows = self._probe(query, candidates)
+
+            if rows is None:
+                scores = np.asarray(self._vectors[:self._count] @ query)
+                scores[~self._alive[:self._count]] = -np.inf
+                rows = np.arange(self._count)
+            else:
+                if len(rows) == 0:
+                    return []
+                scores = np.asarray(self._vectors[rows] @ query)
+
+            top = min(limit, int(np.isfinite(scores).sum()))
+            if top == 0:
+                return []
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            return [self._document(int(rows[i]), float(scores[i])) for i in best]
+
+    def _probe(self, query: np.ndarray, candidates: Optional[np.ndarray]) -> np.ndarray:
+        """Lignes des nprobe listes les plus proches de la requête, et lignes pas encore rangées"""
+        nprobe = min(self.nprobe, len(self._centroids))
+        lists = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        parts = [self._list_rows[self._list_bounds[i]:self._list_bounds[i + 1]] for i in lists]
+        parts.append(np.asarray(self._pending, dtype=np.int64))
+        rows = np.concatenate(parts)
+        rows = rows[self._alive[rows]]
+        if candidates is not None:
+            rows = rows[np.isin(rows, candidates, assume_unique=True)]
+        return rows
+
+    def search_text(self, query: str, filters: Optional[Dict[str, Any]] = None,
+                    limit: int = 5) -> List[Dict[str, Any]]:
+        """Les `limit` documents les mieux classés par BM25 sur leur contenu, satisfaisant les filtres"""
+        with self._lock:
+            if self._count == 0 or limit <= 0:
+                return []
+            if self._lexical is None:
+                self._lexical = LexicalIndex()
+                for row in range(self._count):
+                    self._lexical.add(row, self._content(row) if self._alive[row] else "")
+            rows, scores = self._lexical.search(query, self._alive[:self._count], limit, self._filter_rows(filters))
+            return [self._document(int(row), float(score)) for row, score in zip(rows, scores)]
+
+    def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._rows.get(document_id)
+            return self._document(row) if row is not None else None
+
+    def list(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            candidates = self._filter_rows(filters)
+            rows = np.flatnonzero(self._alive[:self._count]) if candidates is None else candidates
+            return [self._document(int(row)) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._contents_map is not None:
+                self._contents_map.close()
+                self._contents_map = None
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+class LocalVectorStore:
+    """
+    Base vectorielle locale, hors ligne, respectant le contrat vector_db_client de VectorRAGService
+
+    Une VectorCollection par collection, chargée à la première utilisation. Les calculs
+    sont exécutés hors de la boucle d'événements. Un seul processus peut écrire dans une
+    collection persistée (voir VectorCollection).
+    """
+
+    def __init__(self, data_dir: Optional[str] = None, ivf_threshold: Optional[int] = None,
+                 nprobe: Optional[int] = None, persistent: bool = True):
+        self.data_dir = Path(data_dir or settings.VECTOR_STORE_DIR) if persistent else None
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self._collections: Dict[str, VectorCollection] = {}
+        self._lock = threading.Lock()
+
+    def collection(self, collection_name: str) -> VectorCollection:
+        """Collection (créée ou chargée depuis le disque au premier accès)"""
+        if not _COLLECTION_NAME.match(collection_name or ""):
+            raise ValueError(f"Nom de collection invalide: {collection_name}")
+        with self._lock:
+            collection = self._collections.get(collection_name)
+            if collection is None:
+                path = self.data_dir / collection_name if self.data_dir is not None else None
+                collection = VectorCollection(collection_name, path, self.ivf_threshold, self.nprobe)
+                self._collections[collection_name] = collection
+            return collection
+
+    async def search(self, collection_name: str, embedding: Sequence[float],
+                     filters: Optional[Dict[str, Any]] = None, limit: int = 5) -> List[Dict[str, Any]]:
+        collection = await asyncio.to_thread(self.collection, collection_name)
+        return await asyncio.to_thread(collection.search, embedding, filters, limit)
+
+    async def search_text(self, collection_name: str, query: str,
+                          filters: Optional[Dict[str, Any]] = None, limit: int = 5) -> List[Dict[str, Any]]:
+        collection = await asyncio.to_thread(self.collection, collection_name)
+        return await asyncio.to_thread(collection.search_text, query, filters, limit)
+
+    async def insert(self, collection_name: str, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        collection = await asyncio.to_thread(self.collection, collection_name)
+        ids = await asyncio.to_thread(collection.add, documents)
+        return {"inserted": len(ids), "ids": ids}
+
+    async def list_documents(self, collection_name: str,
+                             filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        collection = await asyncio.to_thread(self.collection, collection_name)
+        return await asyncio.to_thread(collection.list, filters)
+
+    async def get_document(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
+        collection = await asyncio.to_thread(self.collection, collection_name)
+        return collection.get(document_id)
+
+    async def delete_document(self, collection_name: str, document_id: str) -> bool:
+        collection = await asyncio.to_thread(self.collection, collection_name)
+        return bool(await asyncio.to_thread(collection.delete, [document_id]))
+
+    async def delete_documents(self, collection_name: str, filters: Dict[str, Any]) -> List[str]:
+        """Supprime en une fois tous les documents satisfaisant les filtres ; renvoie leurs identifiants"""
+        collection = await asyncio.to_thread(self.collection, collection_name)
+        return await asyncio.to_thread(collection.delete_where, filters)
+
+    def close(self) -> None:
+        with self._lock:
+            for collection in self._collections.values():
+                collection.close()
+            self._collections.clear()
+
+
+# Base vectorielle partagée par le processus
+_vector_store: Optional[LocalVectorStore] = None
+
+
+def get_vector_store() -> LocalVectorStore:
+    """
+    Factory pour l'injection de dépendance de la base vectorielle locale
+    """
+    global _vector_store
+    if _vector_store is None:
+        _vector_store = LocalVectorStore()
+    return _vector_store
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.entities.consultant import ConsultantCreate, ConsultantUpdate, ConsultantResponse
 from app.core.use_cases.consultant_use_case import ConsultantUseCase
 from app.infrastructure.database.session import get_db
+from app.infrastructure.database.async_session import get_async_db
+from app.adapters.repositories.async_consultant_repository import AsyncSQLAlchemyConsultantRepository
 from app.adapters.repositories.consultant_repository import SQLAlchemyConsultantRepository
 from app.adapters.repositories.skill_repository import SQLAlchemySkillRepository
 from app.adapters.repositories.user_repository import SQLAlchemyUserRepository
 from app.adapters.repositories.company_repository import SQLAlchemyCompanyRepository
+from app.adapters.services.matchmaking_service import get_matchmaking_service
 
 router = APIRouter(
     prefix="/consultants",
@@ -26,7 +30,23 @@ def get_consultant_use_case(db: Session = Depends(get_db)):
         consultant_repository=consultant_repo,
         skill_repository=skill_repo,
         user_repository=user_repo,
-        company_repository=company_repo
+        company_repository=company_repo,
+        matchmaking_service=get_matchmaking_service(db)
+    )
+
+def get_consultant_read_use_case(
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Cas d'utilisation des lectures de consultants : le repository des consultants utilise la
+    session asynchrone et n'occupe pas la boucle d'événements pendant les requêtes
+    """
+    return ConsultantUseCase(
+        consultant_repository=AsyncSQLAlchemyConsultantRepository(async_db),
+        skill_repository=SQLAlchemySkillRepository(db),
+        user_repository=SQLAlchemyUserRepository(db),
+        company_repository=SQLAlchemyCompanyRepository(db)
     )
 
 @router.post("/", response_model=ConsultantResponse, status_code=status.HTTP_201_CREATED)
@@ -41,28 +61,37 @@ async def create_consultant(
 
 @router.get("/", response_model=List[ConsultantResponse])
 async def get_all_consultants(
+    response: Response,
     company_id: Optional[int] = None,
     skill_id: Optional[int] = None,
     availability: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
-    use_case: ConsultantUseCase = Depends(get_consultant_use_case)
+    cursor: Optional[str] = None,
+    use_case: ConsultantUseCase = Depends(get_consultant_read_use_case)
 ):
     """
     Récupère la liste des consultants avec filtres optionnels.
+    
+    Le curseur de la page suivante est renvoyé dans l'en-tête X-Next-Cursor ;
+    il se passe tel quel dans le paramètre cursor (skip est alors ignoré).
     """
-    return await use_case.get_all_consultants(
+    consultants, next_cursor = await use_case.get_consultants_page(
         company_id=company_id,
         skill_id=skill_id,
         availability=availability,
+        cursor=cursor,
         skip=skip,
         limit=limit
     )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return consultants
 
 @router.get("/{consultant_id}", response_model=ConsultantResponse)
 async def get_consultant(
     consultant_id: int,
-    use_case: ConsultantUseCase = Depends(get_consultant_use_case)
+    use_case: ConsultantUseCase = Depends(get_consultant_read_use_case)
 ):
     """
     Récupère un consultant par son ID.
@@ -111,7 +140,7 @@ async def delete_consultant(
 @router.get("/{consultant_id}/skills", response_model=List[dict])
 async def get_consultant_skills(
     consultant_id: int,
-    use_case: ConsultantUseCase = Depends(get_consultant_use_case)
+    use_case: ConsultantUseCase = Depends(get_consultant_read_use_case)
 ):
     """
     Récupère les compétences d'un consultant.
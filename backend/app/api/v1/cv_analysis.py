@@ -1,11 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import json
 import uuid
 from enum import Enum
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import datetime
 from pydantic import BaseModel
 
 from app.core.use_cases.cv_analysis_use_case import CVAnalysisUseCase
@@ -15,7 +15,13 @@ from app.core.use_cases.consultant_use_case import ConsultantUseCase
 from app.adapters.repositories.consultant_repository import ConsultantRepository
 from app.adapters.repositories.skill_repository import SkillRepository
 from app.infrastructure.database.session import get_db
-from app.infrastructure.storage.minio_client import MinioClient
+from app.infrastructure.storage.minio_client import MinioClient, get_minio_client
+from app.adapters.repositories.cv_analysis_job_repository import SQLAlchemyCVAnalysisJobRepository
+from app.adapters.services.cv_batch_ingestion import CVBatchIngestionService, expand_batch
+from app.adapters.services.cv_analysis_worker import analyze_cv_content, format_candidate, wait_for_job
+from app.adapters.services.enhanced_cv_analysis_service import EnhancedCVAnalysisService, get_cv_analysis_service
+from app.core.entities.cv_analysis_job import CVAnalysisJob, CVAnalysisJobStatus, CVAnalyzer
+from app.core.config import settings
 
 # Models for API
 class CvFileStatus(str, Enum):
@@ -38,58 +44,140 @@ router = APIRouter(
     tags=["CV Analysis"]
 )
 
-# In-memory storage for development (would be DB in production)
-cv_files = {}
-cv_results = {}
+# Délai suggéré aux clients quand la file est saturée (secondes)
+CV_JOB_RETRY_AFTER = 30
+
+# Formats lus par le service d'analyse de CV ; l'agent IA maison lit aussi le texte brut
+CV_EXTENSIONS = ('.pdf', '.docx', '.doc')
+AGENT_CV_EXTENSIONS = CV_EXTENSIONS + ('.txt',)
+
+# Statut exposé au frontend : un job en file est présenté comme en cours d'analyse
+FILE_STATUSES = {
+    CVAnalysisJobStatus.UPLOADED: CvFileStatus.UPLOADED,
+    CVAnalysisJobStatus.QUEUED: CvFileStatus.ANALYZING,
+    CVAnalysisJobStatus.ANALYZING: CvFileStatus.ANALYZING,
+    CVAnalysisJobStatus.ANALYZED: CvFileStatus.ANALYZED,
+    CVAnalysisJobStatus.ERROR: CvFileStatus.ERROR,
+}
+
+def get_cv_analysis_job_repository(db: Session = Depends(get_db)) -> SQLAlchemyCVAnalysisJobRepository:
+    """
+    Factory pour l'injection de dépendance du repository des analyses de CV
+    """
+    return SQLAlchemyCVAnalysisJobRepository(db)
+
+def _file_info(job: CVAnalysisJob) -> Dict[str, Any]:
+    """Informations d'un fichier déposé, avec le résultat d'analyse s'il existe"""
+    file_info = {
+        "id": job.id,
+        "name": job.file_name,
+        "size": f"{job.file_size / 1024:.2f} KB",
+        "type": job.file_type,
+        "status": FILE_STATUSES[job.status],
+        "progress": job.progress,
+        "upload_time": job.created_at.isoformat() if job.created_at else None
+    }
+    if job.status == CVAnalysisJobStatus.ERROR and job.error_message:
+        file_info["error"] = job.error_message
+    if job.result is not None:
+        file_info["candidate"] = job.result
+    return file_info
+
+async def _get_job_or_404(repository: SQLAlchemyCVAnalysisJobRepository, file_id: int) -> CVAnalysisJob:
+    job = await repository.get(file_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"CV avec ID {file_id} non trouvé"
+        )
+    return job
+
+async def _ensure_queue_capacity(repository: SQLAlchemyCVAnalysisJobRepository, count: int = 1) -> None:
+    """Refuse les count nouvelles analyses quand les workers ne suivent plus (backpressure)"""
+    if await repository.count_in_flight() + count > settings.CV_JOB_MAX_QUEUED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Trop d'analyses de CV en attente, veuillez réessayer plus tard",
+            headers={"Retry-After": str(CV_JOB_RETRY_AFTER)}
+        )
+
+async def store_cv_file(
+    file: UploadFile,
+    repository: SQLAlchemyCVAnalysisJobRepository,
+    storage: MinioClient,
+    queued: bool,
+    analysis_service: Optional[EnhancedCVAnalysisService] = None,
+    analyzer: CVAnalyzer = CVAnalyzer.ENHANCED,
+    extensions: Tuple[str, ...] = CV_EXTENSIONS
+) -> CVAnalysisJob:
+    """
+    Valide un CV déposé, l'enregistre dans le stockage objet et crée son job d'analyse
+
+    Avec analysis_service, un CV dont l'analyse est déjà en cache est directement marqué analysé.
+    analyzer désigne le service qui analysera le CV dans le worker, extensions les formats qu'il lit.
+    """
+    if not file.filename.lower().endswith(extensions):
+        formats = [extension.lstrip(".").upper() for extension in extensions]
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Format de fichier non supporté. Seuls les formats {', '.join(formats[:-1])} "
+                   f"et {formats[-1]} sont acceptés."
+        )
+    
+    content = await file.read()
+    if len(content) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Le fichier est vide ou corrompu."
+        )
+    
+    file_type = file.filename.split('.')[-1].lower()
+    
+    # CV déjà analysé (même contenu) : le résultat en cache évite de passer par la file
+    cached = None
+    if queued and analysis_service is not None:
+        cached = await analysis_service.get_cached_analysis(content, file_type)
+    
+    if queued and cached is None:
+        await _ensure_queue_capacity(repository)
+    
+    object_name = f"cv/{uuid.uuid4().hex}.{file_type}"
+    await storage.upload_file(object_name, content, file.content_type or "application/octet-stream")
+    
+    job = await repository.create(
+        file_name=file.filename,
+        file_type=file_type,
+        file_size=len(content),
+        object_name=object_name,
+        queued=queued and cached is None,
+        analyzer=analyzer
+    )
+    
+    if cached is not None:
+        await repository.complete(job.id, format_candidate(cached))
+        job = await repository.get(job.id)
+    
+    return job
 
 @router.post("/upload", response_model=CvUploadResponse)
 async def upload_cv(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository),
+    storage: MinioClient = Depends(get_minio_client)
 ):
     """
     Upload a CV file
     """
-    # Validate file type
-    if not file.filename.lower().endswith(('.pdf', '.docx', '.doc')):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Format de fichier non supporté. Seuls les formats PDF, DOCX et DOC sont acceptés."
-        )
-    
     try:
-        content = await file.read()
-        if len(content) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Le fichier est vide ou corrompu."
-            )
-            
-        # Generate a unique file ID
-        file_id = len(cv_files) + 1
-        
-        # Store file metadata
-        file_type = file.filename.split('.')[-1].lower()
-        file_size = len(content) / 1024  # Size in KB
-        
-        cv_files[file_id] = {
-            "id": file_id,
-            "name": file.filename,
-            "size": f"{file_size:.2f} KB",
-            "type": file_type,
-            "status": CvFileStatus.UPLOADED,
-            "progress": 0,
-            "content": content,  # Store content in memory (would use object storage in production)
-            "upload_time": datetime.now().isoformat()
-        }
+        job = await store_cv_file(file, repository, storage, queued=False)
         
         return CvUploadResponse(
-            fileId=file_id,
+            fileId=job.id,
             status=CvFileStatus.UPLOADED,
             message="CV téléchargé avec succès"
         )
-        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -97,236 +185,184 @@ async def upload_cv(
         )
 
 @router.get("/files")
-async def get_cv_files(db: Session = Depends(get_db)):
+async def get_cv_files(
+    skip: int = 0,
+    limit: int = 100,
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository)
+):
     """
     Get list of uploaded CV files
     """
-    # Convert cv_files dict to a list of files with relevant fields only (omit content)
-    files = []
-    for file_id, file_data in cv_files.items():
-        file_info = {k: v for k, v in file_data.items() if k != 'content'}
-        
-        # Check if there are analysis results for this file
-        if file_id in cv_results:
-            file_info['candidate'] = cv_results[file_id]['candidate']
-            
-        files.append(file_info)
-    
-    return files
+    return [_file_info(job) for job in await repository.list(skip=skip, limit=limit)]
 
 @router.get("/files/{file_id}")
-async def get_cv_file(file_id: int, db: Session = Depends(get_db)):
+async def get_cv_file(
+    file_id: int,
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository)
+):
     """
     Get a specific CV file
     """
-    if file_id not in cv_files:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"CV avec ID {file_id} non trouvé"
-        )
-    
-    # Return file info without content
-    file_info = {k: v for k, v in cv_files[file_id].items() if k != 'content'}
-    
-    # Check if there are analysis results for this file
-    if file_id in cv_results:
-        file_info['candidate'] = cv_results[file_id]['candidate']
-        
-    return file_info
+    return _file_info(await _get_job_or_404(repository, file_id))
 
 @router.post("/analyze/{file_id}")
-async def analyze_cv_by_id(file_id: int, db: Session = Depends(get_db)):
+async def analyze_cv_by_id(
+    file_id: int,
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository)
+):
     """
-    Analyze a previously uploaded CV
+    Queue the analysis of a previously uploaded CV
+
+    L'analyse est effectuée par les workers ; le client suit l'avancement via /status/{file_id}.
     """
-    if file_id not in cv_files:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"CV avec ID {file_id} non trouvé"
-        )
-    
-    file_data = cv_files[file_id]
-    content = file_data['content']
-    file_type = file_data['type']
+    job = await _get_job_or_404(repository, file_id)
     
-    # Update status to analyzing
-    cv_files[file_id]['status'] = CvFileStatus.ANALYZING
-    cv_files[file_id]['progress'] = 25
+    if job.status in (CVAnalysisJobStatus.UPLOADED, CVAnalysisJobStatus.ERROR):
+        await _ensure_queue_capacity(repository)
+        job = await repository.enqueue(file_id)
     
-    # Initialiser le service d'analyse de CV
-    cv_analysis_service = BasicCVAnalysisService()
-    
-    # Initialiser le cas d'utilisation
-    cv_analysis_use_case = CVAnalysisUseCase(cv_analysis_service)
-    
-    try:
-        # Analyser le CV
-        if file_type in ['pdf']:
-            result = await cv_analysis_use_case.analyze_pdf(content)
-        elif file_type in ['docx', 'doc']:
-            result = await cv_analysis_use_case.analyze_docx(content)
-        else:
-            raise ValueError(f"Format de fichier non supporté: {file_type}")
-        
-        # Update status to analyzed
-        cv_files[file_id]['status'] = CvFileStatus.ANALYZED
-        cv_files[file_id]['progress'] = 100
-        
-        # Store analysis results
-        cv_results[file_id] = {
-            'fileId': file_id,
-            'candidate': result
-        }
-        
-        # Return updated file info
-        return {
-            **{k: v for k, v in cv_files[file_id].items() if k != 'content'},
-            'candidate': result
-        }
-    except Exception as e:
-        # Update status to error
-        cv_files[file_id]['status'] = CvFileStatus.ERROR
-        cv_files[file_id]['progress'] = 0
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erreur lors de l'analyse du CV: {str(e)}"
-        )
+    return _file_info(job)
 
 @router.get("/results/{file_id}", response_model=CvAnalysisResult)
-async def get_cv_analysis_result(file_id: int, db: Session = Depends(get_db)):
+async def get_cv_analysis_result(
+    file_id: int,
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository)
+):
     """
     Get analysis results for a CV
     """
-    if file_id not in cv_results:
+    job = await repository.get(file_id)
+    if not job or job.result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Résultats d'analyse pour le CV ID {file_id} non trouvés"
         )
     
-    return cv_results[file_id]
+    return CvAnalysisResult(fileId=job.id, candidate=job.result)
 
 @router.get("/status/{file_id}")
-async def check_cv_status(file_id: int, db: Session = Depends(get_db)):
+async def check_cv_status(
+    file_id: int,
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository)
+):
     """
     Check the status of a CV analysis
     """
-    if file_id not in cv_files:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"CV avec ID {file_id} non trouvé"
-        )
-    
-    return {"status": cv_files[file_id]['status']}
+    job = await _get_job_or_404(repository, file_id)
+    return {"status": FILE_STATUSES[job.status], "progress": job.progress}
 
 @router.delete("/files/{file_id}")
-async def delete_cv_file(file_id: int, db: Session = Depends(get_db)):
+async def delete_cv_file(
+    file_id: int,
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository),
+    storage: MinioClient = Depends(get_minio_client)
+):
     """
     Delete a CV file
     """
-    if file_id not in cv_files:
+    job = await repository.delete(file_id)
+    if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"CV avec ID {file_id} non trouvé"
         )
     
-    # Remove the file and its analysis results
-    del cv_files[file_id]
-    if file_id in cv_results:
-        del cv_results[file_id]
+    # Supprimer le fichier et ses résultats d'analyse
+    await storage.delete_file(job.object_name)
     
     return {"message": f"CV avec ID {file_id} supprimé avec succès"}
 
 @router.post("/upload-analyze", response_model=CvAnalysisResult)
 async def upload_and_analyze_cv(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository),
+    storage: MinioClient = Depends(get_minio_client),
+    analysis_service: EnhancedCVAnalysisService = Depends(get_cv_analysis_service)
 ):
     """
     Upload and analyze a CV in one operation
+
+    Le CV passe par la file d'attente comme les autres ; la requête attend la fin
+    de l'analyse par un worker, dans la limite de CV_JOB_WAIT_TIMEOUT.
     """
-    # Validate file type
-    if not file.filename.lower().endswith(('.pdf', '.docx', '.doc')):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Format de fichier non supporté. Seuls les formats PDF, DOCX et DOC sont acceptés."
-        )
-    
     try:
-        content = await file.read()
-        if len(content) == 0:
+        job = await store_cv_file(file, repository, storage, queued=True, analysis_service=analysis_service)
+        
+        job = await wait_for_job(repository, job, settings.CV_JOB_WAIT_TIMEOUT)
+        if job.status in (CVAnalysisJobStatus.QUEUED, CVAnalysisJobStatus.ANALYZING):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Le fichier est vide ou corrompu."
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"L'analyse du CV {job.id} est toujours en cours, suivez-la via /status/{job.id}"
             )
-            
-        # Generate a unique file ID
-        file_id = len(cv_files) + 1
-        
-        # Store file metadata
-        file_type = file.filename.split('.')[-1].lower()
-        file_size = len(content) / 1024  # Size in KB
-        
-        cv_files[file_id] = {
-            "id": file_id,
-            "name": file.filename,
-            "size": f"{file_size:.2f} KB",
-            "type": file_type,
-            "status": CvFileStatus.ANALYZING,
-            "progress": 50,
-            "content": content,  # Store content in memory (would use object storage in production)
-            "upload_time": datetime.now().isoformat()
-        }
         
-        # Initialiser le service d'analyse de CV
-        cv_analysis_service = BasicCVAnalysisService()
-        
-        # Initialiser le cas d'utilisation
-        cv_analysis_use_case = CVAnalysisUseCase(cv_analysis_service)
-        
-        # Analyser le CV
-        if file_type in ['pdf']:
-            result = await cv_analysis_use_case.analyze_pdf(content)
-        elif file_type in ['docx', 'doc']:
-            result = await cv_analysis_use_case.analyze_docx(content)
-        else:
-            raise ValueError(f"Format de fichier non supporté: {file_type}")
-        
-        # Update status to analyzed
-        cv_files[file_id]['status'] = CvFileStatus.ANALYZED
-        cv_files[file_id]['progress'] = 100
-        
-        # Format candidate data for frontend
-        candidate_data = {
-            "name": result.get("name", ""),
-            "email": result.get("email", ""),
-            "phone": result.get("phone", ""),
-            "skills": result.get("skills", []),
-            "experience": result.get("experience", []),
-            "education": result.get("education", [])
-        }
-        
-        # Store analysis results
-        cv_results[file_id] = {
-            'fileId': file_id,
-            'candidate': candidate_data
-        }
+        if job.status != CVAnalysisJobStatus.ANALYZED:
+            raise ValueError(job.error_message or "Analyse interrompue")
         
         return CvAnalysisResult(
-            fileId=file_id,
-            candidate=candidate_data
+            fileId=job.id,
+            candidate=job.result
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erreur lors du téléchargement et de l'analyse du CV: {str(e)}"
         )
 
+def _format_batch_event(event: Dict[str, Any], stream_format: str) -> str:
+    """Sérialise un événement d'ingestion en ligne NDJSON ou en message SSE"""
+    data = json.dumps(event, ensure_ascii=False, default=str)
+    if stream_format == "sse":
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+@router.post("/batch")
+async def ingest_cv_batch(
+    files: List[UploadFile] = File(...),
+    stream_format: str = Query("ndjson", alias="format", regex="^(ndjson|sse)$"),
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository),
+    storage: MinioClient = Depends(get_minio_client)
+):
+    """
+    Upload and analyze a batch of CVs (several files and/or zip archives)
+
+    Les CV sont mis en file pour les workers ; la progression est renvoyée au fil de l'eau
+    (NDJSON ou SSE) : un événement par CV, dans l'ordre d'achèvement, puis un bilan avec
+    le débit (CV/seconde).
+    """
+    try:
+        items = expand_batch(files)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Aucun CV dans l'envoi"
+        )
+    if len(items) > settings.CV_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Trop de CV dans l'envoi ({len(items)}, maximum {settings.CV_BATCH_MAX_FILES})"
+        )
+    await _ensure_queue_capacity(repository, len(items))
+    
+    service = CVBatchIngestionService(repository, storage)
+    
+    async def stream():
+        async for event in service.ingest(items):
+            yield _format_batch_event(event, stream_format)
+    
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(stream(), media_type=media_type)
+
 @router.post("/create-consultant")
 async def create_consultant_from_cv(
     data: dict,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository)
 ):
     """
     Create a consultant from an analyzed CV
@@ -340,7 +376,8 @@ async def create_consultant_from_cv(
             detail="Les paramètres file_id et company_id sont requis"
         )
     
-    if file_id not in cv_results:
+    job = await repository.get(file_id)
+    if not job or job.result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Résultats d'analyse pour le CV ID {file_id} non trouvés"
@@ -348,8 +385,7 @@ async def create_consultant_from_cv(
     
     try:
         # Get analysis results
-        analysis_result = cv_results[file_id]
-        candidate_data = analysis_result['candidate']
+        candidate_data = job.result
         
         # Create a consultant from the candidate data
         consultant_repo = ConsultantRepository(db)
@@ -381,11 +417,12 @@ async def create_consultant_from_cv(
             detail=f"Erreur lors de la création du consultant: {str(e)}"
         )
 
+# Keep existing endpoints
 # Keep existing endpoints
 @router.post("/analyze")
 async def analyze_cv(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    analysis_service: EnhancedCVAnalysisService = Depends(get_cv_analysis_service)
 ):
     """
     Analyse un CV et extrait les informations pertinentes
@@ -397,23 +434,13 @@ async def analyze_cv(
             detail="Format de fichier non supporté. Seuls les formats PDF et DOCX sont acceptés."
         )
     
-    # Initialiser le service d'analyse de CV
-    cv_analysis_service = BasicCVAnalysisService()
-    
-    # Initialiser le cas d'utilisation
-    cv_analysis_use_case = CVAnalysisUseCase(cv_analysis_service)
-    
     try:
         # Lire le contenu du fichier
         content = await file.read()
         
-        # Analyser le CV
-        if file.filename.lower().endswith('.pdf'):
-            result = await cv_analysis_use_case.analyze_pdf(content)
-        else:  # .docx
-            result = await cv_analysis_use_case.analyze_docx(content)
-        
-        return result
+        # Analyser le CV (résultat en cache si ce contenu a déjà été analysé)
+        file_type = file.filename.split('.')[-1].lower()
+        return await analyze_cv_content(analysis_service, content, file_type)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
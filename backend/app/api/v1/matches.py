@@ -1,6 +1,6 @@
 from typing import Dict, Any, List, Optional
 import os
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.use_cases.match_use_case import MatchUseCase
@@ -134,42 +134,38 @@ async def find_matches_for_tender(
 
 @router.get("/")
 async def get_matches(
+    response: Response,
     consultant_id: Optional[int] = None,
     tender_id: Optional[int] = None,
     status_filter: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
     Récupère les matchs, avec filtrage optionnel par consultant, appel d'offres et statut
+    
+    Le curseur de la page suivante est renvoyé dans l'en-tête X-Next-Cursor.
     """
-    # Initialiser les repositories
-    consultant_repository = SQLAlchemyConsultantRepository(db)
-    tender_repository = SQLAlchemyTenderRepository(db)
     match_repository = SQLAlchemyMatchRepository(db)
     
-    # Initialiser le service n8n
-    n8n_service = N8nWorkflowService()
-    
-    # Initialiser le cas d'utilisation
-    match_use_case = MatchUseCase(
-        match_repository=match_repository,
-        consultant_repository=consultant_repository,
-        tender_repository=tender_repository,
-        n8n_service=n8n_service
-    )
-    
     try:
-        # Récupérer les matchs selon les filtres
-        if consultant_id:
-            matches = await match_repository.get_by_consultant_id(consultant_id)
-        elif tender_id:
-            matches = await match_repository.get_by_tender_id(tender_id)
-        elif status_filter:
-            matches = await match_repository.get_by_status(status_filter)
-        else:
-            matches = await match_repository.get_all()
+        # Récupérer les matchs selon les filtres (appliqués en base)
+        matches, next_cursor = await match_repository.get_page(
+            consultant_id=consultant_id,
+            tender_id=tender_id,
+            status=status_filter,
+            cursor=cursor,
+            skip=skip,
+            limit=limit
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         
         return matches
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,5 +1,5 @@
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, BackgroundTasks
 from sqlalchemy.orm import Session
 import uuid
 from datetime import datetime
@@ -9,6 +9,11 @@ from app.adapters.services.agent_ia_maison_service import AgentIAMaisonService
 from app.infrastructure.database.session import get_db
 from app.infrastructure.database.models import WorkflowExecution, WorkflowStatus
 from app.core.interfaces.rag_service import RAGService
+from app.adapters.services.service_container import get_shared_rag_service
+from app.adapters.repositories.cv_analysis_job_repository import SQLAlchemyCVAnalysisJobRepository
+from app.api.v1.cv_analysis import AGENT_CV_EXTENSIONS, get_cv_analysis_job_repository, store_cv_file
+from app.core.entities.cv_analysis_job import CVAnalyzer
+from app.infrastructure.storage.minio_client import MinioClient, get_minio_client
 
 router = APIRouter(
     prefix="/api/v1/n8n",
@@ -25,7 +30,7 @@ async def get_n8n_service():
 # Dépendance pour obtenir le service d'agent IA maison
 async def get_agent_ia_service(
     n8n_service: N8nIntegrationService = Depends(get_n8n_service),
-    rag_service: RAGService = Depends(lambda: RAGService())
+    rag_service: RAGService = Depends(get_shared_rag_service)
 ):
     return AgentIAMaisonService(n8n_service, rag_service)
 
@@ -274,39 +279,19 @@ async def get_workflow_execution(
 @router.post("/cv-analysis")
 async def analyze_cv(
     file: UploadFile = File(...),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    agent_service: AgentIAMaisonService = Depends(get_agent_ia_service),
-    db: Session = Depends(get_db)
+    repository: SQLAlchemyCVAnalysisJobRepository = Depends(get_cv_analysis_job_repository),
+    storage: MinioClient = Depends(get_minio_client)
 ):
     """
-    Analyse un CV avec l'agent IA maison
+    Analyse un CV avec l'agent IA maison : le fichier est déposé dans le stockage objet et
+    l'analyse mise en file pour les workers (suivi via /api/v1/cv-analysis/status/{analysis_id})
     """
     try:
-        # Vérifier le type de fichier
-        if not file.filename.lower().endswith(('.pdf', '.docx', '.doc', '.txt')):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Format de fichier non supporté. Seuls les formats PDF, DOCX, DOC et TXT sont acceptés."
-            )
-        
-        # Lire le contenu du fichier
-        content = await file.read()
-        
-        # Créer un ID unique pour cette analyse
-        analysis_id = str(uuid.uuid4())
-        
-        # Lancer l'analyse en arrière-plan
-        background_tasks.add_task(
-            analyze_cv_background,
-            content,
-            file.filename,
-            analysis_id,
-            agent_service,
-            db
-        )
+        job = await store_cv_file(file, repository, storage, queued=True, analyzer=CVAnalyzer.AGENT,
+                                  extensions=AGENT_CV_EXTENSIONS)
         
         return {
-            "analysis_id": analysis_id,
+            "analysis_id": job.id,
             "status": "processing",
             "message": "Analyse du CV démarrée"
         }
@@ -318,31 +303,6 @@ async def analyze_cv(
             detail=f"Erreur lors de l'analyse du CV: {str(e)}"
         )
 
-async def analyze_cv_background(
-    file_content: bytes,
-    file_name: str,
-    analysis_id: str,
-    agent_service: AgentIAMaisonService,
-    db: Session
-):
-    """
-    Analyse un CV en arrière-plan
-    """
-    try:
-        # Extraire les données du CV
-        cv_data = await agent_service.extract_cv_data(file_content, file_name)
-        
-        # Analyser les compétences
-        skills_analysis = await agent_service.analyze_skills(cv_data)
-        
-        # TODO: Sauvegarder les résultats dans la base de données
-        
-        # Pour l'instant, nous ne faisons rien avec les résultats
-        pass
-    except Exception as e:
-        # Gérer les erreurs
-        print(f"Erreur lors de l'analyse du CV: {str(e)}")
-
 @router.post("/match")
 async def match_consultant_tender(
     match_request: Dict[str, Any],
@@ -2,9 +2,12 @@ from typing import Dict, Any, List, Optional
 import os
 import json
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.interfaces.rag_service import RAGService
+from app.adapters.services.embedding_service import get_embedding_service
+from app.adapters.services.service_container import get_service_container
 from app.infrastructure.database.session import get_db
 
 router = APIRouter(
@@ -12,12 +15,16 @@ router = APIRouter(
     tags=["RAG Agents"]
 )
 
+# Dépendance pour obtenir le service RAG (modèles et index partagés, documents enregistrés en base)
+def get_rag_service(db: Session = Depends(get_db)) -> RAGService:
+    return get_service_container().rag_service_for(db)
+
 @router.post("/index-document")
 async def index_document(
     file: UploadFile = File(...),
     document_type: str = Form(...),
     metadata: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    rag_service: RAGService = Depends(get_rag_service)
 ):
     """
     Indexe un document dans la base de connaissances pour l'approche RAG
@@ -34,9 +41,6 @@ async def index_document(
             detail="Format de fichier non supporté. Seuls les formats PDF, DOCX et TXT sont acceptés."
         )
     
-    # Initialiser le service RAG
-    rag_service = RAGService()
-    
     try:
         # Lire le contenu du fichier
         content = await file.read()
@@ -68,7 +72,7 @@ async def index_document(
 @router.post("/query")
 async def query_rag(
     query: Dict[str, Any],
-    db: Session = Depends(get_db)
+    rag_service: RAGService = Depends(get_rag_service)
 ):
     """
     Interroge la base de connaissances avec l'approche RAG
@@ -76,9 +80,6 @@ async def query_rag(
     Args:
         query: Requête contenant le texte de la question et les filtres optionnels
     """
-    # Initialiser le service RAG
-    rag_service = RAGService()
-    
     try:
         # Vérifier que la requête contient le texte de la question
         if "text" not in query or not query["text"]:
@@ -107,7 +108,7 @@ async def query_rag(
 @router.post("/generate")
 async def generate_with_rag(
     request: Dict[str, Any],
-    db: Session = Depends(get_db)
+    rag_service: RAGService = Depends(get_rag_service)
 ):
     """
     Génère une réponse avec l'approche RAG
@@ -115,9 +116,6 @@ async def generate_with_rag(
     Args:
         request: Requête contenant le texte de la question, les filtres optionnels et les paramètres de génération
     """
-    # Initialiser le service RAG
-    rag_service = RAGService()
-    
     try:
         # Vérifier que la requête contient le texte de la question
         if "text" not in request or not request["text"]:
@@ -143,10 +141,55 @@ async def generate_with_rag(
             detail=f"Erreur lors de la génération de la réponse: {str(e)}"
         )
 
+def format_sse(event: Dict[str, Any]) -> str:
+    """Événement Server-Sent Events (une ligne event, une ligne data en JSON)"""
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'], ensure_ascii=False, default=str)}\n\n"
+
+@router.post("/generate/stream")
+async def generate_with_rag_stream(
+    request: Dict[str, Any],
+    rag_service: RAGService = Depends(get_rag_service)
+):
+    """
+    Génère une réponse avec l'approche RAG, transmise en Server-Sent Events
+    
+    Les documents de contexte (événement "context") précèdent les tokens ("token"), puis
+    "done" ou "error". Si le client se déconnecte, la génération est interrompue.
+    
+    Args:
+        request: Requête contenant le texte de la question, les filtres optionnels et les paramètres de génération
+    """
+    # Vérifier que la requête contient le texte de la question
+    if "text" not in request or not request["text"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="La requête doit contenir le texte de la question."
+        )
+    
+    events = rag_service.generate_stream(
+        request["text"],
+        request.get("filters", {}),
+        request.get("generation_params", {})
+    )
+    
+    async def event_stream():
+        # La déconnexion du client annule cette tâche : fermer le flux arrête le LLM
+        try:
+            async for event in events:
+                yield format_sse(event)
+        finally:
+            await events.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/documents")
 async def get_documents(
     document_type: Optional[str] = None,
-    db: Session = Depends(get_db)
+    rag_service: RAGService = Depends(get_rag_service)
 ):
     """
     Récupère la liste des documents indexés dans la base de connaissances
@@ -154,9 +197,6 @@ async def get_documents(
     Args:
         document_type: Type de document à filtrer (optionnel)
     """
-    # Initialiser le service RAG
-    rag_service = RAGService()
-    
     try:
         # Récupérer les documents
         documents = await rag_service.get_documents(document_type)
@@ -171,7 +211,7 @@ async def get_documents(
 @router.get("/documents/{document_id}")
 async def get_document(
     document_id: str,
-    db: Session = Depends(get_db)
+    rag_service: RAGService = Depends(get_rag_service)
 ):
     """
     Récupère un document indexé dans la base de connaissances
@@ -179,9 +219,6 @@ async def get_document(
     Args:
         document_id: Identifiant du document
     """
-    # Initialiser le service RAG
-    rag_service = RAGService()
-    
     try:
         # Récupérer le document
         document = await rag_service.get_document(document_id)
@@ -204,7 +241,7 @@ async def get_document(
 @router.delete("/documents/{document_id}")
 async def delete_document(
     document_id: str,
-    db: Session = Depends(get_db)
+    rag_service: RAGService = Depends(get_rag_service)
 ):
     """
     Supprime un document indexé dans la base de connaissances
@@ -212,9 +249,6 @@ async def delete_document(
     Args:
         document_id: Identifiant du document
     """
-    # Initialiser le service RAG
-    rag_service = RAGService()
-    
     try:
         # Supprimer le document
         success = await rag_service.delete_document(document_id)
@@ -233,3 +267,13 @@ async def delete_document(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erreur lors de la suppression du document: {str(e)}"
         )
+
+@router.get("/embedding-cache/stats")
+async def get_embedding_cache_stats():
+    """
+    Compteurs du cache des embeddings (hits, misses, occupation) pour son dimensionnement
+    """
+    cache = getattr(get_embedding_service(), "cache", None)
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
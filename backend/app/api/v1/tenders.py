@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.entities.tender import TenderCreate, TenderUpdate, TenderResponse
 from app.core.use_cases.tender_use_case import TenderUseCase
 from app.infrastructure.database.session import get_db
-from app.adapters.repositories.tender_repository import TenderRepository
+from app.adapters.repositories.tender_repository import SQLAlchemyTenderRepository
+from app.adapters.repositories.skill_repository import SQLAlchemySkillRepository
+from app.adapters.repositories.company_repository import SQLAlchemyCompanyRepository
+from app.adapters.repositories.collaboration_repository import SQLAlchemyCollaborationRepository
+from app.adapters.services.matchmaking_service import get_matchmaking_service
 
 router = APIRouter(
     prefix="/api/tenders",
@@ -14,8 +18,13 @@ router = APIRouter(
 )
 
 def get_tender_use_case(db: Session = Depends(get_db)):
-    repository = TenderRepository(db)
-    return TenderUseCase(repository)
+    return TenderUseCase(
+        tender_repository=SQLAlchemyTenderRepository(db),
+        skill_repository=SQLAlchemySkillRepository(db),
+        company_repository=SQLAlchemyCompanyRepository(db),
+        collaboration_repository=SQLAlchemyCollaborationRepository(db),
+        matchmaking_service=get_matchmaking_service(db)
+    )
 
 @router.post("/", response_model=TenderResponse, status_code=status.HTTP_201_CREATED)
 async def create_tender(
@@ -29,23 +38,31 @@ async def create_tender(
 
 @router.get("/", response_model=List[TenderResponse])
 async def get_tenders(
+    response: Response,
     company_id: Optional[int] = None,
     skill_id: Optional[int] = None,
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     use_case: TenderUseCase = Depends(get_tender_use_case)
 ):
     """
     Récupère la liste des appels d'offres avec filtres optionnels.
+    
+    Le curseur de la page suivante est renvoyé dans l'en-tête X-Next-Cursor.
     """
-    return await use_case.get_tenders(
+    tenders, next_cursor = await use_case.get_tenders(
         company_id=company_id,
         skill_id=skill_id,
         status=status,
+        cursor=cursor,
         skip=skip,
         limit=limit
     )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return tenders
 
 @router.get("/{tender_id}", response_model=TenderResponse)
 async def get_tender(
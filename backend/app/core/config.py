@@ -24,6 +24,23 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         # Force the port to be 5432 (internal Docker container port)
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:5432/{self.POSTGRES_DB}"
+    
+    # URL de connexion asynchrone (driver asyncpg), surchargeable pour les tests (ex: sqlite+aiosqlite://)
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return os.getenv(
+            "ASYNC_DATABASE_URL",
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:5432/{self.POSTGRES_DB}"
+        )
+    
+    # Configuration du pool de connexions
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # secondes
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # secondes
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))  # requêtes préparées asyncpg
+    
     # Configuration de MinIO (stockage compatible S3)
     MINIO_HOST: str = os.getenv("MINIO_HOST", "minio" if os.getenv("ENVIRONMENT") == "development" else "localhost")
     MINIO_PORT: str = os.getenv("MINIO_PORT", "9000")
@@ -68,12 +85,96 @@ class Settings(BaseSettings):
     N8N_PORT: str = os.getenv("N8N_PORT", "5678")  # Port interne dans le conteneur
     N8N_API_KEY: str = os.getenv("N8N_API_KEY", "talentmatch_apikey")
     N8N_ENCRYPTION_KEY: str = os.getenv("N8N_ENCRYPTION_KEY", "supersecretkey")
+
+    # Identifiants des workflows n8n utilisés par l'agent IA maison
+    N8N_CV_EXTRACTION_WORKFLOW_ID: str = os.getenv("N8N_CV_EXTRACTION_WORKFLOW_ID", "")
+    N8N_SKILL_ANALYSIS_WORKFLOW_ID: str = os.getenv("N8N_SKILL_ANALYSIS_WORKFLOW_ID", "")
+    N8N_CONSULTANT_MATCHING_WORKFLOW_ID: str = os.getenv("N8N_CONSULTANT_MATCHING_WORKFLOW_ID", "")
+    N8N_PORTFOLIO_GENERATION_WORKFLOW_ID: str = os.getenv("N8N_PORTFOLIO_GENERATION_WORKFLOW_ID", "")
+    N8N_RAG_QUERY_WORKFLOW_ID: str = os.getenv("N8N_RAG_QUERY_WORKFLOW_ID", "")
+
+    # Client HTTP n8n partagé (pool keep-alive, délais, concurrence, reprises)
+    N8N_CONNECT_TIMEOUT: float = float(os.getenv("N8N_CONNECT_TIMEOUT", "5"))
+    N8N_READ_TIMEOUT: float = float(os.getenv("N8N_READ_TIMEOUT", "30"))
+    N8N_EXECUTE_TIMEOUT: float = float(os.getenv("N8N_EXECUTE_TIMEOUT", "300"))  # Exécution synchrone d'un workflow
+    N8N_MAX_CONNECTIONS: int = int(os.getenv("N8N_MAX_CONNECTIONS", "20"))
+    N8N_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("N8N_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    N8N_MAX_CONCURRENCY: int = int(os.getenv("N8N_MAX_CONCURRENCY", "10"))
+    N8N_MAX_RETRIES: int = int(os.getenv("N8N_MAX_RETRIES", "3"))
+    N8N_RETRY_BACKOFF: float = float(os.getenv("N8N_RETRY_BACKOFF", "0.5"))
+    N8N_RETRY_MAX_BACKOFF: float = float(os.getenv("N8N_RETRY_MAX_BACKOFF", "8"))
     
     # Construction de l'URL d'accès à n8n
     @property
     def N8N_URL(self) -> str:
         return f"http://{self.N8N_HOST}:{self.N8N_PORT}"
     
+    # File d'attente des analyses de CV (table workflow_executions)
+    CV_JOB_WORKER_CONCURRENCY: int = int(os.getenv("CV_JOB_WORKER_CONCURRENCY", "4"))  # Analyses simultanées par processus worker
+    CV_JOB_MAX_QUEUED: int = int(os.getenv("CV_JOB_MAX_QUEUED", "500"))  # Au-delà, les nouveaux envois sont refusés (503)
+    CV_JOB_POLL_INTERVAL: float = float(os.getenv("CV_JOB_POLL_INTERVAL", "1.0"))
+    CV_JOB_MAX_ATTEMPTS: int = int(os.getenv("CV_JOB_MAX_ATTEMPTS", "3"))
+    CV_JOB_LEASE_TIMEOUT: int = int(os.getenv("CV_JOB_LEASE_TIMEOUT", "300"))  # Secondes sans signe de vie avant reprise
+    CV_JOB_WAIT_TIMEOUT: float = float(os.getenv("CV_JOB_WAIT_TIMEOUT", "120"))  # Attente maximale de /upload-analyze
+
+    # Extraction et analyse des CV dans un pool de processus
+    CV_PARSER_WORKERS: int = int(os.getenv("CV_PARSER_WORKERS", "0"))  # 0 = nombre de cœurs
+    CV_PARSE_TIMEOUT: float = float(os.getenv("CV_PARSE_TIMEOUT", "30"))  # Secondes par document
+    CV_MAX_PAGES: int = int(os.getenv("CV_MAX_PAGES", "50"))
+    CV_MAX_BYTES: int = int(os.getenv("CV_MAX_BYTES", str(10 * 1024 * 1024)))
+
+    # Ingestion de CV par lots
+    CV_BATCH_CONCURRENCY: int = int(os.getenv("CV_BATCH_CONCURRENCY", "0"))  # 0 = taille du pool d'analyse
+    CV_BATCH_MAX_FILES: int = int(os.getenv("CV_BATCH_MAX_FILES", "1000"))
+
+    # Taxonomie des compétences compilée pour l'analyse des CV
+    SKILL_TAXONOMY_CACHE_DIR: str = os.getenv("SKILL_TAXONOMY_CACHE_DIR", "")  # Vide = répertoire temporaire
+    SKILL_TAXONOMY_REFRESH_INTERVAL: float = float(os.getenv("SKILL_TAXONOMY_REFRESH_INTERVAL", "30"))  # secondes
+
+    # Index inversé des compétences du matchmaking (écritures des autres processus)
+    SKILL_INDEX_REFRESH_INTERVAL: float = float(os.getenv("SKILL_INDEX_REFRESH_INTERVAL", "5"))  # secondes
+
+    # Rattrapage de la matrice des scores (lignes et colonnes périmées) ; 0 = désactivé dans l'API
+    MATCH_SCORES_REFRESH_INTERVAL: float = float(os.getenv("MATCH_SCORES_REFRESH_INTERVAL", "300"))  # secondes
+
+    # Cache des résultats d'analyse de CV (empreinte SHA-256 du fichier)
+    CV_CACHE_MAX_ENTRIES: int = int(os.getenv("CV_CACHE_MAX_ENTRIES", "1000"))  # LRU en mémoire, par processus
+    CV_CACHE_TTL: int = int(os.getenv("CV_CACHE_TTL", str(7 * 24 * 3600)))  # Durée de vie dans Redis (secondes)
+    CV_CACHE_REDIS_ENABLED: bool = os.getenv("CV_CACHE_REDIS_ENABLED", "true").lower() == "true"
+
+    # Base vectorielle locale (RAG)
+    VECTOR_STORE_DIR: str = os.getenv("VECTOR_STORE_DIR", "data/vector_store")
+    VECTOR_STORE_IVF_THRESHOLD: int = int(os.getenv("VECTOR_STORE_IVF_THRESHOLD", "20000"))  # Recherche exacte en dessous
+    VECTOR_STORE_NPROBE: int = int(os.getenv("VECTOR_STORE_NPROBE", "16"))  # Listes IVF parcourues par requête
+
+    # Embeddings (RAG) : "hashed" (n-grammes hachés, hors ligne) ou "sentence-transformers" (modèle local)
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "hashed")
+    EMBEDDING_MODEL_PATH: str = os.getenv("EMBEDDING_MODEL_PATH", "")  # Répertoire du modèle sentence-transformers
+    EMBEDDING_DIM: int = int(os.getenv("EMBEDDING_DIM", "768"))  # Dimension du backend "hashed"
+    EMBEDDING_DTYPE: str = os.getenv("EMBEDDING_DTYPE", "float32")  # float32 ou float16
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+    EMBEDDING_WORKERS: int = int(os.getenv("EMBEDDING_WORKERS", "0"))  # 0 = nombre de cœurs
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_MAX_BYTES: int = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # LRU en mémoire, par processus
+    EMBEDDING_CACHE_DIR: str = os.getenv("EMBEDDING_CACHE_DIR", "")  # Niveau persistant (vide = désactivé)
+
+    # Découpage des documents indexés pour le RAG
+    RAG_CHUNK_TOKENS: int = int(os.getenv("RAG_CHUNK_TOKENS", "256"))
+    RAG_CHUNK_OVERLAP: int = int(os.getenv("RAG_CHUNK_OVERLAP", "32"))  # Jetons communs à deux chunks consécutifs
+    RAG_CHUNKS_PER_DOCUMENT: int = int(os.getenv("RAG_CHUNKS_PER_DOCUMENT", "3"))
+    RAG_EMBEDDING_STORAGE_DTYPE: str = os.getenv("RAG_EMBEDDING_STORAGE_DTYPE", "float32")  # float16 divise le stockage par deux
+
+    # Modèle de langage local (génération RAG)
+    LLM_MODEL_PATH: str = os.getenv("LLM_MODEL_PATH", "/opt/models/llama-3-8b-instruct.Q4_K_M.gguf")
+    LLM_N_CTX: int = int(os.getenv("LLM_N_CTX", "4096"))
+    SERVICES_WARMUP: bool = os.getenv("SERVICES_WARMUP", "true").lower() == "true"  # Chargement des modèles au démarrage
+
+    # Recherche hybride : BM25 et vecteurs fusionnés par rang réciproque
+    RAG_HYBRID_SEARCH: bool = os.getenv("RAG_HYBRID_SEARCH", "true").lower() == "true"
+    RAG_VECTOR_K: int = int(os.getenv("RAG_VECTOR_K", "20"))  # Chunks demandés à la recherche vectorielle
+    RAG_LEXICAL_K: int = int(os.getenv("RAG_LEXICAL_K", "20"))  # Chunks demandés à la recherche BM25
+    RAG_RRF_K: int = int(os.getenv("RAG_RRF_K", "60"))  # Constante de lissage de la fusion
+    
     # Configuration de sécurité
     SECRET_KEY: str = os.getenv("SECRET_KEY", "supersecretkey")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
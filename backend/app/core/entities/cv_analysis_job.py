@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+from datetime import datetime
+from enum import Enum
+
+class CVAnalysisJobStatus(str, Enum):
+    UPLOADED = "uploaded"
+    QUEUED = "queued"
+    ANALYZING = "analyzing"
+    ANALYZED = "analyzed"
+    ERROR = "error"
+
+class CVAnalyzer(str, Enum):
+    ENHANCED = "enhanced"  # EnhancedCVAnalysisService (analyse locale)
+    AGENT = "agent"  # AgentIAMaisonService (extraction + analyse des compétences)
+
+class CVAnalysisJob(BaseModel):
+    id: int
+    job_key: str  # Identifiant opaque (execution_id)
+    file_name: str
+    file_type: str
+    file_size: int  # Octets
+    object_name: str  # Clé du fichier dans le stockage objet
+    analyzer: CVAnalyzer = CVAnalyzer.ENHANCED
+    status: CVAnalysisJobStatus
+    progress: int = 0
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
@@ -1,4 +1,4 @@
-from typing import Protocol, List, Optional, Dict, Any
+from typing import Protocol, List, Optional, Dict, Any, Tuple
 from datetime import date
 
 from app.core.entities.consultant import Consultant, ConsultantCreate, ConsultantUpdate
@@ -8,9 +8,23 @@ class ConsultantRepository(Protocol):
     async def get_all(self) -> List[Consultant]:
         ...
     
+    async def get_page(self, company_id: Optional[int] = None, skill_id: Optional[int] = None,
+                       availability: Optional[bool] = None, cursor: Optional[str] = None,
+                       skip: int = 0, limit: int = 100) -> Tuple[List[Consultant], Optional[str]]:
+        ...
+    
     async def get_by_id(self, consultant_id: int) -> Optional[Consultant]:
         ...
     
+    async def get_by_ids(self, consultant_ids: List[int]) -> List[Consultant]:
+        ...
+    
+    async def get_skill_pairs(self) -> List[Tuple[int, int]]:
+        ...
+    
+    async def get_skill_pairs_version(self) -> Tuple[int, int, int, int]:
+        ...
+    
     async def get_by_user_id(self, user_id: int) -> Optional[Consultant]:
         ...
     
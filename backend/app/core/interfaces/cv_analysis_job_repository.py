@@ -0,0 +1,60 @@
+from typing import Protocol, List, Optional, Dict, Any
+
+from app.core.entities.cv_analysis_job import CVAnalysisJob, CVAnalyzer
+
+class CVAnalysisJobRepository(Protocol):
+    """
+    Repository de la file d'attente des analyses de CV (persistée dans workflow_executions)
+    """
+
+    async def create(self, file_name: str, file_type: str, file_size: int, object_name: str,
+                     queued: bool = False, analyzer: CVAnalyzer = CVAnalyzer.ENHANCED) -> CVAnalysisJob:
+        """Crée un job pour un fichier déposé, éventuellement directement mis en file"""
+        ...
+
+    async def get(self, job_id: int) -> Optional[CVAnalysisJob]:
+        ...
+
+    async def get_many(self, job_ids: List[int]) -> List[CVAnalysisJob]:
+        """Récupère plusieurs jobs en une requête (suivi d'un lot)"""
+        ...
+
+    async def list(self, skip: int = 0, limit: int = 100) -> List[CVAnalysisJob]:
+        ...
+
+    async def enqueue(self, job_id: int) -> Optional[CVAnalysisJob]:
+        """Met en file un job déposé ou en erreur"""
+        ...
+
+    async def count_in_flight(self) -> int:
+        """Nombre de jobs en file ou en cours (mesure de la pression sur les workers)"""
+        ...
+
+    async def claim_next(self, worker_id: str) -> Optional[CVAnalysisJob]:
+        """Réserve le plus ancien job en file pour un worker"""
+        ...
+
+    async def update_progress(self, job_id: int, progress: int) -> None:
+        ...
+
+    async def heartbeat(self, job_id: int) -> None:
+        """Signale que le worker traite toujours le job"""
+        ...
+
+    async def complete(self, job_id: int, result: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """Enregistre le résultat d'un job encore détenu par worker_id (False si le bail est perdu)"""
+        ...
+
+    async def fail(self, job_id: int, error_message: str, max_attempts: int, worker_id: str) -> bool:
+        """
+        Remet le job en file tant que max_attempts n'est pas atteint, sinon le passe en erreur,
+        s'il est encore détenu par worker_id (False si le bail est perdu)
+        """
+        ...
+
+    async def requeue_stale(self, lease_timeout: int, max_attempts: int) -> int:
+        """Remet en file les jobs dont le worker ne donne plus signe de vie, ou les passe en erreur après max_attempts"""
+        ...
+
+    async def delete(self, job_id: int) -> Optional[CVAnalysisJob]:
+        ...
@@ -0,0 +1,50 @@
+from typing import Sequence
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class EmbeddingService(ABC):
+    """
+    Interface pour le calcul des embeddings (représentations vectorielles des textes)
+    """
+
+    @property
+    @abstractmethod
+    def model_id(self) -> str:
+        """
+        Identifiant du modèle et de sa configuration : deux services de même identifiant
+        produisent les mêmes vecteurs
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Dimension des vecteurs produits"""
+        pass
+
+    @abstractmethod
+    async def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Calcule les embeddings d'un lot de textes
+
+        Args:
+            texts: Textes à encoder
+
+        Returns:
+            Matrice (len(texts), dimension), une ligne normalisée par texte
+        """
+        pass
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Calcule l'embedding d'un texte
+
+        Args:
+            text: Texte à encoder
+
+        Returns:
+            Vecteur normalisé de taille dimension
+        """
+        return (await self.embed_many([text]))[0]
@@ -0,0 +1,38 @@
+from typing import Any, AsyncIterator, Dict
+from abc import ABC, abstractmethod
+
+
+class LLMService(ABC):
+    """
+    Interface pour l'inférence d'un modèle de langage
+    """
+
+    @abstractmethod
+    async def generate(self, prompt: str, **params: Any) -> Dict[str, Any]:
+        """
+        Génère une réponse à un prompt
+
+        Args:
+            prompt: Texte du prompt
+            params: Paramètres de génération (temperature, max_tokens, top_p, ...)
+
+        Returns:
+            Dictionnaire contenant au moins "text"
+        """
+        pass
+
+    async def stream(self, prompt: str, **params: Any) -> AsyncIterator[str]:
+        """
+        Génère une réponse morceau par morceau (par défaut : la réponse complète en un seul morceau)
+
+        Fermer l'itérateur interrompt la génération.
+        """
+        yield (await self.generate(prompt, **params)).get("text", "")
+
+    async def warm_up(self) -> None:
+        """Charge le modèle et exécute une première inférence (ne fait rien par défaut)"""
+        pass
+
+    def close(self) -> None:
+        """Libère le modèle (ne fait rien par défaut)"""
+        pass
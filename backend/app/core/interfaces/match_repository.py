@@ -1,4 +1,4 @@
-from typing import Protocol, List, Optional, Dict, Any
+from typing import Protocol, List, Optional, Dict, Any, Tuple
 
 from app.core.entities.match import Match, MatchCreate, MatchUpdate
 
@@ -6,6 +6,11 @@ class MatchRepository(Protocol):
     async def get_all(self) -> List[Match]:
         ...
     
+    async def get_page(self, consultant_id: Optional[int] = None, tender_id: Optional[int] = None,
+                       status: Optional[str] = None, cursor: Optional[str] = None,
+                       skip: int = 0, limit: int = 100) -> Tuple[List[Match], Optional[str]]:
+        ...
+    
     async def get_by_id(self, match_id: int) -> Optional[Match]:
         ...
     
@@ -0,0 +1,44 @@
+from typing import Protocol, List, Dict, Optional, Tuple
+
+class MatchScoreRepository(Protocol):
+    """
+    Repository de la matrice matérialisée des scores consultant x appel d'offres
+    """
+    
+    async def replace_consultant_scores(self, consultant_id: int, scores: Dict[int, float],
+                                        version: Optional[str] = None) -> None:
+        """Remplace la ligne d'un consultant (scores indexés par tender_id) et sa version"""
+        ...
+    
+    async def replace_tender_scores(self, tender_id: int, scores: Dict[int, float],
+                                    version: Optional[str] = None) -> None:
+        """Remplace la colonne d'un appel d'offres (scores indexés par consultant_id) et sa version"""
+        ...
+    
+    async def set_consultant_versions(self, versions: Dict[int, str]) -> None:
+        """Enregistre la version de lignes couvertes par un recalcul de toutes les colonnes"""
+        ...
+    
+    async def delete_consultant_scores(self, consultant_id: int) -> None:
+        ...
+    
+    async def delete_tender_scores(self, tender_id: int) -> None:
+        ...
+    
+    async def get_consultant_versions(self) -> Dict[int, str]:
+        """Retourne la version de chaque ligne calculée"""
+        ...
+    
+    async def get_tender_versions(self) -> Dict[int, str]:
+        """Retourne la version de chaque colonne calculée"""
+        ...
+    
+    async def get_top_for_tender(self, tender_id: int, min_score: float = 0.0,
+                                 skip: int = 0, limit: int = 100) -> List[Tuple[int, float]]:
+        """Retourne les couples (consultant_id, score) triés par score décroissant"""
+        ...
+    
+    async def get_top_for_company(self, company_id: int, min_score: float = 0.0,
+                                  limit: int = 10) -> List[Tuple[int, int, float]]:
+        """Retourne les triplets (consultant_id, tender_id, score) impliquant une entreprise"""
+        ...
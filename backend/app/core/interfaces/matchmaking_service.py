@@ -9,10 +9,12 @@ class MatchmakingService(Protocol):
     
     async def find_matches_for_tender(self, tender_id: int, 
                                      min_score: float = 0.6,
-                                     include_partner_consultants: bool = True) -> List[Dict[str, Any]]:
+                                     include_partner_consultants: bool = True,
+                                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Trouve les consultants qui correspondent à un appel d'offres
         Inclut les consultants des ESN partenaires si include_partner_consultants est True
+        Retourne au plus `limit` correspondances si limit est fourni
         """
         ...
     
@@ -37,6 +39,31 @@ class MatchmakingService(Protocol):
         """
         ...
     
+    async def get_stored_matches_for_tender(self, tender_id: int, min_score: float = 0.0,
+                                            skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Lit les correspondances précalculées d'un appel d'offres, triées par score décroissant
+        """
+        ...
+    
+    async def refresh_tender_scores(self, tender_id: int) -> int:
+        """
+        Recalcule les scores précalculés d'un appel d'offres
+        """
+        ...
+    
+    async def refresh_consultant_scores(self, consultant_id: int) -> int:
+        """
+        Recalcule les scores précalculés d'un consultant
+        """
+        ...
+    
+    async def refresh_stale_scores(self) -> int:
+        """
+        Recalcule les scores précalculés des consultants et appels d'offres modifiés depuis leur calcul
+        """
+        ...
+    
     async def update_match_status(self, match_id: int, new_status: str) -> bool:
         """
         Met à jour le statut d'une correspondance
@@ -0,0 +1,37 @@
+from typing import Protocol, List, Optional, Dict, Any, Callable, Awaitable, Tuple
+
+import numpy as np
+
+
+class RAGDocumentRepository(Protocol):
+    async def get_chunk_count(self, document_id: str) -> Optional[int]:
+        """Nombre de chunks d'un document indexé, ou None s'il est inconnu"""
+        ...
+
+    async def replace_document(self, document_id: str, document_type: str, title: str, content: str,
+                               metadata: Dict[str, Any], chunks: List[Dict[str, Any]],
+                               file_path: Optional[str] = None,
+                               before_commit: Optional[Callable[[], Awaitable[None]]] = None) -> int:
+        """Enregistre un document et remplace ses chunks dans une seule transaction"""
+        ...
+
+    async def get_chunk_embeddings(self, chunk_ids: List[str]) -> Dict[str, np.ndarray]:
+        """Vecteurs enregistrés des chunks demandés (décodés sans copie)"""
+        ...
+
+    async def load_embeddings(self, document_type: Optional[str] = None,
+                              batch_size: int = 1000) -> Tuple[List[str], np.ndarray]:
+        """Identifiants et matrice des vecteurs de tous les chunks (d'un type de document)"""
+        ...
+
+    async def get_document_types(self, document_ids: List[str]) -> Dict[str, str]:
+        """Type de chaque document connu, en une seule lecture"""
+        ...
+
+    async def delete_document(self, document_id: str) -> bool:
+        """Supprime un document et ses chunks"""
+        ...
+
+    async def delete_documents(self, document_ids: List[str]) -> int:
+        """Supprime des documents et leurs chunks ; renvoie le nombre de documents supprimés"""
+        ...
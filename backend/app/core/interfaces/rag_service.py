@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional, Protocol
+from typing import AsyncIterator, Dict, Any, List, Optional, Protocol
 from abc import ABC, abstractmethod
 
 class RAGService(ABC):
@@ -53,12 +53,31 @@ class RAGService(ABC):
         pass
     
     @abstractmethod
-    async def get_documents(self, document_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def generate_stream(self, text: str, filters: Dict[str, Any] = None, generation_params: Dict[str, Any] = None,
+                        top_k: int = 3) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Génère une réponse en flux : documents de contexte, puis tokens au fil de la génération
+        
+        Args:
+            text: Texte de la requête
+            filters: Filtres à appliquer à la recherche
+            generation_params: Paramètres de génération
+            top_k: Nombre de documents de contexte
+            
+        Returns:
+            Itérateur asynchrone d'événements {"event", "data"} (context, token, done ou error)
+        """
+        pass
+    
+    @abstractmethod
+    async def get_documents(self, document_type: Optional[str] = None,
+                            document_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Récupère la liste des documents indexés
         
         Args:
             document_type: Type de document à filtrer (optionnel)
+            document_ids: Identifiants des documents à récupérer (optionnel)
             
         Returns:
             Liste des documents
@@ -90,3 +109,16 @@ class RAGService(ABC):
             True si supprimé, False sinon
         """
         pass
+    
+    @abstractmethod
+    async def delete_documents(self, document_ids: List[str]) -> List[str]:
+        """
+        Supprime des documents indexés
+        
+        Args:
+            document_ids: Identifiants des documents
+            
+        Returns:
+            Identifiants des documents supprimés
+        """
+        pass
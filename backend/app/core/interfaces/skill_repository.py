@@ -24,6 +24,16 @@ class SkillRepository(Protocol):
     async def delete(self, skill_id: int) -> bool:
         ...
     
+    async def get_aliases(self, skill_id: int) -> List[str]:
+        """Récupère les synonymes d'une compétence reconnus dans les CV"""
+        ...
+    
+    async def add_alias(self, skill_id: int, alias: str) -> bool:
+        ...
+    
+    async def remove_alias(self, skill_id: int, alias: str) -> bool:
+        ...
+    
     async def search_skills(self, query: str) -> List[Skill]:
         ...
     
@@ -1,4 +1,4 @@
-from typing import Protocol, List, Optional, Dict, Any
+from typing import Protocol, List, Optional, Dict, Any, Tuple
 
 from app.core.entities.tender import Tender, TenderCreate, TenderUpdate
 
@@ -6,6 +6,11 @@ class TenderRepository(Protocol):
     async def get_all(self) -> List[Tender]:
         ...
     
+    async def get_page(self, company_id: Optional[int] = None, skill_id: Optional[int] = None,
+                       status: Optional[str] = None, cursor: Optional[str] = None,
+                       skip: int = 0, limit: int = 100) -> Tuple[List[Tender], Optional[str]]:
+        ...
+    
     async def get_by_id(self, tender_id: int) -> Optional[Tender]:
         ...
     
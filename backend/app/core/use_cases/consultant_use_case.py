@@ -1,4 +1,5 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import logging
 from fastapi import Depends
 
 from app.core.entities.consultant import Consultant, ConsultantCreate, ConsultantUpdate
@@ -7,6 +8,9 @@ from app.core.interfaces.consultant_repository import ConsultantRepository
 from app.core.interfaces.skill_repository import SkillRepository
 from app.core.interfaces.user_repository import UserRepository
 from app.core.interfaces.company_repository import CompanyRepository
+from app.core.interfaces.matchmaking_service import MatchmakingService
+
+logger = logging.getLogger(__name__)
 
 class ConsultantUseCase:
     """
@@ -18,12 +22,15 @@ class ConsultantUseCase:
         consultant_repository: ConsultantRepository,
         skill_repository: SkillRepository,
         user_repository: UserRepository,
-        company_repository: CompanyRepository
+        company_repository: CompanyRepository,
+        matchmaking_service: Optional[MatchmakingService] = None
     ):
         self.consultant_repository = consultant_repository
         self.skill_repository = skill_repository
         self.user_repository = user_repository
         self.company_repository = company_repository
+        # Service de matchmaking optionnel, utilisé pour maintenir la matrice des scores
+        self.matchmaking_service = matchmaking_service
     
     async def get_all_consultants(
         self,
@@ -36,25 +43,39 @@ class ConsultantUseCase:
         """
         Récupère tous les consultants, avec filtres optionnels
         """
-        # 1. Base: on récupère tous les consultants
-        consultants = await self.consultant_repository.get_all()
-
-        # 2. Filtres
-        if company_id is not None:
-            # ex : on peut récupérer la liste via get_by_company_id
-            consultants = await self.consultant_repository.get_by_company_id(company_id)
-
-        # si tu veux filtrer par skill_id => consultant_repository.search_consultants
-        # si tu veux filtrer par availability => 
-        #   ex. re-filtrer localement, ou un repository method get_by_availability
-
-        # 3. skip / limit
-        # s'il s'agit d'une simple liste Python:
-        # consultants = consultants[skip : skip + limit]
-        # ou s'il s'agit d'une query, on peut le faire avant un .all() (dans le repo)
-
+        consultants, _ = await self.get_consultants_page(
+            company_id=company_id,
+            skill_id=skill_id,
+            availability=availability,
+            skip=skip,
+            limit=limit
+        )
         return consultants
     
+    async def get_consultants_page(
+        self,
+        company_id: Optional[int] = None,
+        skill_id: Optional[int] = None,
+        availability: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Consultant], Optional[str]]:
+        """
+        Récupère une page de consultants ; filtres et pagination sont appliqués en base
+        
+        Returns:
+            Tuple (consultants, curseur opaque de la page suivante ou None)
+        """
+        return await self.consultant_repository.get_page(
+            company_id=company_id,
+            skill_id=skill_id,
+            availability=availability,
+            cursor=cursor,
+            skip=skip,
+            limit=limit
+        )
+    
     async def get_consultant_by_id(self, consultant_id: int) -> Optional[Consultant]:
         """Récupère un consultant par son ID"""
         return await self.consultant_repository.get_by_id(consultant_id)
@@ -117,6 +138,7 @@ class ConsultantUseCase:
                     consultant.id, skill_id, proficiency_level, years_experience, details
                 )
         
+        await self._refresh_match_scores(consultant.id)
         return consultant
     
     async def update_consultant(self, consultant_id: int, 
@@ -157,11 +179,16 @@ class ConsultantUseCase:
                         consultant_id, skill_id, proficiency_level, years_experience, details
                     )
         
+        if updated_consultant:
+            await self._refresh_match_scores(consultant_id)
         return updated_consultant
     
     async def delete_consultant(self, consultant_id: int) -> bool:
         """Supprime un consultant"""
-        return await self.consultant_repository.delete(consultant_id)
+        deleted = await self.consultant_repository.delete(consultant_id)
+        if deleted:
+            await self._refresh_match_scores(consultant_id)
+        return deleted
     
     async def get_consultant_skills(self, consultant_id: int) -> List[Dict[str, Any]]:
         """Récupère les compétences d'un consultant"""
@@ -181,13 +208,19 @@ class ConsultantUseCase:
         if not skill:
             raise ValueError("La compétence n'existe pas")
         
-        return await self.consultant_repository.add_skill(
+        added = await self.consultant_repository.add_skill(
             consultant_id, skill_id, proficiency_level, years_experience, details
         )
+        if added:
+            await self._refresh_match_scores(consultant_id)
+        return added
     
     async def remove_consultant_skill(self, consultant_id: int, skill_id: int) -> bool:
         """Supprime une compétence d'un consultant"""
-        return await self.consultant_repository.remove_skill(consultant_id, skill_id)
+        removed = await self.consultant_repository.remove_skill(consultant_id, skill_id)
+        if removed:
+            await self._refresh_match_scores(consultant_id)
+        return removed
     
     async def get_available_consultants(self) -> List[Consultant]:
         """Récupère les consultants disponibles"""
@@ -197,3 +230,12 @@ class ConsultantUseCase:
                                company_id: Optional[int] = None) -> List[Consultant]:
         """Recherche des consultants par critères"""
         return await self.consultant_repository.search_consultants(query, skills, company_id)
+    
+    async def _refresh_match_scores(self, consultant_id: int) -> None:
+        """Recalcule la ligne du consultant dans la matrice des scores (sans bloquer l'opération)"""
+        if self.matchmaking_service is None:
+            return
+        try:
+            await self.matchmaking_service.refresh_consultant_scores(consultant_id)
+        except Exception as e:
+            logger.error(f"Erreur lors du recalcul des scores du consultant {consultant_id}: {str(e)}")
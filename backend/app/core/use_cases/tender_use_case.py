@@ -1,4 +1,5 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import logging
 from fastapi import Depends
 
 from app.core.entities.tender import Tender, TenderCreate, TenderUpdate
@@ -6,6 +7,9 @@ from app.core.interfaces.tender_repository import TenderRepository
 from app.core.interfaces.skill_repository import SkillRepository
 from app.core.interfaces.company_repository import CompanyRepository
 from app.core.interfaces.collaboration_repository import CollaborationRepository
+from app.core.interfaces.matchmaking_service import MatchmakingService
+
+logger = logging.getLogger(__name__)
 
 class TenderUseCase:
     """
@@ -18,17 +22,44 @@ class TenderUseCase:
         tender_repository: TenderRepository,
         skill_repository: SkillRepository,
         company_repository: CompanyRepository,
-        collaboration_repository: CollaborationRepository
+        collaboration_repository: CollaborationRepository,
+        matchmaking_service: Optional[MatchmakingService] = None
     ):
         self.tender_repository = tender_repository
         self.skill_repository = skill_repository
         self.company_repository = company_repository
         self.collaboration_repository = collaboration_repository
+        # Service de matchmaking optionnel, utilisé pour maintenir la matrice des scores
+        self.matchmaking_service = matchmaking_service
     
     async def get_all_tenders(self) -> List[Tender]:
         """Récupère tous les appels d'offres"""
         return await self.tender_repository.get_all()
     
+    async def get_tenders(
+        self,
+        company_id: Optional[int] = None,
+        skill_id: Optional[int] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Tender], Optional[str]]:
+        """
+        Récupère une page d'appels d'offres ; filtres et pagination sont appliqués en base
+        
+        Returns:
+            Tuple (appels d'offres, curseur opaque de la page suivante ou None)
+        """
+        return await self.tender_repository.get_page(
+            company_id=company_id,
+            skill_id=skill_id,
+            status=status,
+            cursor=cursor,
+            skip=skip,
+            limit=limit
+        )
+    
     async def get_tender_by_id(self, tender_id: int) -> Optional[Tender]:
         """Récupère un appel d'offres par son ID"""
         return await self.tender_repository.get_by_id(tender_id)
@@ -63,6 +94,7 @@ class TenderUseCase:
                     tender.id, skill_id, importance, details
                 )
         
+        await self._refresh_match_scores(tender.id)
         return tender
     
     async def update_tender(self, tender_id: int, 
@@ -102,6 +134,8 @@ class TenderUseCase:
                         tender_id, skill_id, importance, details
                     )
         
+        if updated_tender:
+            await self._refresh_match_scores(tender_id)
         return updated_tender
     
     async def delete_tender(self, tender_id: int) -> bool:
@@ -125,13 +159,19 @@ class TenderUseCase:
         if not skill:
             raise ValueError("La compétence n'existe pas")
         
-        return await self.tender_repository.add_skill(
+        added = await self.tender_repository.add_skill(
             tender_id, skill_id, importance, details
         )
+        if added:
+            await self._refresh_match_scores(tender_id)
+        return added
     
     async def remove_tender_skill(self, tender_id: int, skill_id: int) -> bool:
         """Supprime une compétence requise d'un appel d'offres"""
-        return await self.tender_repository.remove_skill(tender_id, skill_id)
+        removed = await self.tender_repository.remove_skill(tender_id, skill_id)
+        if removed:
+            await self._refresh_match_scores(tender_id)
+        return removed
     
     async def get_active_tenders(self) -> List[Tender]:
         """Récupère les appels d'offres actifs"""
@@ -178,3 +218,35 @@ class TenderUseCase:
             # avec une référence à l'appel d'offres original
             
         return True
+    
+    async def get_tender_matches(self, tender_id: int, min_score: float = 0.0,
+                                 skip: int = 0, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
+        """
+        Récupère les correspondances d'un appel d'offres, triées par score décroissant
+        Retourne None si l'appel d'offres n'existe pas
+        """
+        tender = await self.tender_repository.get_by_id(tender_id)
+        if not tender:
+            return None
+        if self.matchmaking_service is None:
+            return []
+        return await self.matchmaking_service.get_stored_matches_for_tender(
+            tender_id, min_score=min_score, skip=skip, limit=limit
+        )
+    
+    async def run_matching(self, tender_id: int) -> bool:
+        """Recalcule l'ensemble des scores d'un appel d'offres"""
+        tender = await self.tender_repository.get_by_id(tender_id)
+        if not tender or self.matchmaking_service is None:
+            return False
+        await self.matchmaking_service.refresh_tender_scores(tender_id)
+        return True
+    
+    async def _refresh_match_scores(self, tender_id: int) -> None:
+        """Recalcule la colonne de l'appel d'offres dans la matrice des scores (sans bloquer l'opération)"""
+        if self.matchmaking_service is None:
+            return
+        try:
+            await self.matchmaking_service.refresh_tender_scores(tender_id)
+        except Exception as e:
+            logger.error(f"Erreur lors du recalcul des scores de l'appel d'offres {tender_id}: {str(e)}")
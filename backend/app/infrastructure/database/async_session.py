@@ -0,0 +1,77 @@
+from typing import AsyncGenerator, Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+
+# Moteur et fabrique de sessions créés à la première utilisation,
+# pour ne pas exiger le driver asyncpg à l'import du module
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def create_async_db_engine(url: Optional[str] = None) -> AsyncEngine:
+    """
+    Crée un moteur SQLAlchemy asynchrone configuré depuis les settings
+
+    Args:
+        url: URL de connexion (par défaut settings.ASYNC_DATABASE_URL)
+    """
+    db_url = make_url(url or settings.ASYNC_DATABASE_URL)
+    engine_options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    if db_url.get_backend_name() == "sqlite":
+        # SQLite (tests) : pool par défaut, pas de dimensionnement
+        return create_async_engine(db_url, **engine_options)
+
+    if db_url.get_driver_name() == "asyncpg":
+        # Cache des requêtes préparées du dialecte asyncpg
+        db_url = db_url.update_query_dict({
+            "prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)
+        })
+
+    return create_async_engine(
+        db_url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        **engine_options
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    """Retourne le moteur asynchrone partagé par l'application"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Retourne la fabrique de sessions asynchrones partagée"""
+    global _async_session_factory
+    if _async_session_factory is None:
+        # expire_on_commit=False : les objets restent lisibles après commit sans rechargement implicite
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Fournit une session asynchrone et assure sa fermeture après utilisation.
+    Équivalent asynchrone de get_db, à utiliser avec Depends.
+    """
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+async def dispose_async_engine() -> None:
+    """Ferme les connexions du pool (arrêt de l'application)"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float, Enum, JSON, Table, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float, Enum, JSON, Table, UniqueConstraint, Index, LargeBinary
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.sql import func
 import enum
@@ -104,6 +104,8 @@ class DocumentType(enum.Enum):
 
 # Énumération des statuts possibles pour un Workflow
 class WorkflowStatus(enum.Enum):
+    PENDING = "pending"  # Créée, en attente d'une demande de traitement
+    QUEUED = "queued"  # En file d'attente, en attente d'un worker
     RUNNING = "running"
     SUCCESS = "success"
     ERROR = "error"
@@ -162,7 +164,7 @@ class Consultant(Base):
     linkedin_url = Column(String(255))
     github_url = Column(String(255))
     photo_url = Column(String(255))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Clé de pagination
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     user = relationship("User", back_populates="consultant")
@@ -173,6 +175,9 @@ class Consultant(Base):
     matches = relationship("Match", back_populates="consultant")
     collaborations = relationship("Collaboration", back_populates="consultant")
     resumes = relationship("Resume", back_populates="consultant")
+    
+    # Index de pagination par clé (created_at, id)
+    __table_args__ = (Index('ix_consultants_created_at_id', 'created_at', 'id'),)
 
 class Skill(Base):
     __tablename__ = "skills"
@@ -188,6 +193,18 @@ class Skill(Base):
     tenders = relationship("Tender", secondary="tender_skills", back_populates="skills")
     consultant_skills = relationship("ConsultantSkill", back_populates="skill")
     tender_skills = relationship("TenderSkill", back_populates="skill")
+    aliases = relationship("SkillAlias", back_populates="skill", cascade="all, delete-orphan")
+
+# Synonymes d'une compétence reconnus dans les CV (ex: "k8s" -> "Kubernetes")
+class SkillAlias(Base):
+    __tablename__ = "skill_aliases"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False, index=True)
+    alias = Column(String(100), unique=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    skill = relationship("Skill", back_populates="aliases")
 
 class Tender(Base):
     __tablename__ = "tenders"
@@ -203,7 +220,7 @@ class Tender(Base):
     status = Column(Enum(TenderStatus), default=TenderStatus.DRAFT)
     budget_min = Column(Float)
     budget_max = Column(Float)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Clé de pagination
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     company = relationship("Company", back_populates="tenders")
@@ -211,6 +228,9 @@ class Tender(Base):
     matches = relationship("Match", back_populates="tender")
     collaborations = relationship("Collaboration", back_populates="tender")
     tender_skills = relationship("TenderSkill", back_populates="tender")
+    
+    # Index de pagination par clé (created_at, id)
+    __table_args__ = (Index('ix_tenders_created_at_id', 'created_at', 'id'),)
 
 class Match(Base):
     __tablename__ = "matches"
@@ -221,13 +241,47 @@ class Match(Base):
     score = Column(Float, default=0.0)  # Score du match (0-100)
     status = Column(Enum(MatchStatus), default=MatchStatus.PENDING)
     notes = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Clé de pagination
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     consultant = relationship("Consultant", back_populates="matches")
     tender = relationship("Tender", back_populates="matches")
     workflow_executions = relationship("WorkflowExecution", back_populates="match")
     collaboration = relationship("Collaboration", back_populates="match", uselist=False)
+    
+    # Index de pagination par clé (created_at, id)
+    __table_args__ = (Index('ix_matches_created_at_id', 'created_at', 'id'),)
+
+# Matrice matérialisée des scores consultant x appel d'offres, maintenue de façon incrémentale
+class MatchScore(Base):
+    __tablename__ = "match_scores"
+    
+    consultant_id = Column(Integer, ForeignKey("consultants.id", ondelete="CASCADE"), primary_key=True)
+    tender_id = Column(Integer, ForeignKey("tenders.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Float, nullable=False)  # Score arrondi à 2 décimales (0-1)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Index pour les lectures top-k par appel d'offres et par consultant
+    __table_args__ = (
+        Index('ix_match_scores_tender_score', 'tender_id', 'score'),
+        Index('ix_match_scores_consultant_score', 'consultant_id', 'score'),
+    )
+
+# Empreinte des champs du consultant avec laquelle sa ligne de match_scores a été calculée
+class MatchScoreConsultantVersion(Base):
+    __tablename__ = "match_score_consultant_versions"
+    
+    consultant_id = Column(Integer, ForeignKey("consultants.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(String(64), nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# Empreinte des champs de l'appel d'offres avec laquelle sa colonne de match_scores a été calculée
+class MatchScoreTenderVersion(Base):
+    __tablename__ = "match_score_tender_versions"
+    
+    tender_id = Column(Integer, ForeignKey("tenders.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(String(64), nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
 
 class Collaboration(Base):
     __tablename__ = "collaborations"
@@ -296,11 +350,20 @@ class WorkflowExecution(Base):
     match_id = Column(Integer, ForeignKey("matches.id"), nullable=True)
     portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=True)
     error_message = Column(Text)
+    progress = Column(Integer, nullable=False, default=0, server_default="0")  # Avancement en pourcentage
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")  # Nombre de prises en charge par un worker
+    worker_id = Column(String(255))  # Worker ayant réservé l'exécution
+    heartbeat_at = Column(DateTime(timezone=True))  # Dernier signe de vie du worker
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     finished_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Réservation des jobs en attente par ordre d'arrivée
+    __table_args__ = (
+        Index("ix_workflow_executions_queue", "workflow_id", "status", "created_at"),
+    )
+    
     resume = relationship("Resume", back_populates="workflow_executions")
     match = relationship("Match", back_populates="workflow_executions")
     portfolio = relationship("Portfolio", back_populates="workflow_executions")
@@ -330,7 +393,8 @@ class RAGChunk(Base):
     chunk_id = Column(String(255), unique=True, nullable=False)  # UUID du chunk
     document_id = Column(Integer, ForeignKey("rag_documents.id"), nullable=False)
     content = Column(Text, nullable=False)  # Contenu du chunk
-    embedding = Column(Text)  # Représentation vectorielle stockée sous forme de texte
+    embedding = Column(LargeBinary)  # Vecteur brut (octets du tableau NumPy, voir embedding_dtype)
+    embedding_dtype = Column(String(10))  # Type des composantes du vecteur (float32 ou float16)
     chunk_index = Column(Integer)  # Position du chunk dans le document
     token_count = Column(Integer)  # Nombre de tokens dans le chunk
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -342,7 +406,8 @@ class RAGQuery(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     query_text = Column(Text, nullable=False)  # Texte de la requête
-    embedding = Column(Text)  # Représentation vectorielle de la requête
+    embedding = Column(LargeBinary)  # Vecteur brut de la requête (voir embedding_dtype)
+    embedding_dtype = Column(String(10))  # Type des composantes du vecteur (float32 ou float16)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     generated_response = Column(Text)  # Réponse générée
     created_at = Column(DateTime(timezone=True), server_default=func.now())
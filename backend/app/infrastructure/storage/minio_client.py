@@ -83,6 +83,28 @@ class MinioClient:
             logger.error(f"Erreur lors de l'upload vers MinIO: {e}")
             raise
     
+    async def download_file(self, object_name: str) -> bytes:
+        """
+        Télécharge le contenu d'un fichier
+        
+        Args:
+            object_name: Nom de l'objet dans MinIO
+            
+        Returns:
+            Données binaires du fichier
+        """
+        response = None
+        try:
+            response = self.client.get_object(self.bucket_name, object_name)
+            return response.read()
+        except S3Error as e:
+            logger.error(f"Erreur lors du téléchargement du fichier {object_name}: {e}")
+            raise
+        finally:
+            if response is not None:
+                response.close()
+                response.release_conn()
+    
     async def delete_file(self, object_name: str) -> bool:
         """
         Supprime un fichier
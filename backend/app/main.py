@@ -1,14 +1,33 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from app.api.v1 import consultants, companies, tenders, matches, collaborations, cv_analysis, n8n, rag, upload, users
 from app.infrastructure.database.session import get_db
-from app.infrastructure.database.session import get_db
+from app.adapters.n8n.http_client import close_n8n_http_client
+from app.adapters.services.cv_parsing_executor import shutdown_cv_parsing_executor
+from app.adapters.services.match_score_refresher import start_match_score_refresher, stop_match_score_refresher
+from app.adapters.services.service_container import close_services, get_service_container, start_services
+from app.infrastructure.database.async_session import dispose_async_engine
+
+# Services partagés créés au démarrage (modèles chargés en tâche de fond) et rattrapage
+# de la matrice des scores ; connexions et pools fermés à l'arrêt
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.services = await start_services()
+    await start_match_score_refresher()
+    yield
+    await stop_match_score_refresher()
+    await close_services()
+    await close_n8n_http_client()
+    shutdown_cv_parsing_executor()
+    await dispose_async_engine()
 
 app = FastAPI(
     title="TalentMatch API",
     description="API pour la plateforme TalentMatch - Solution SaaS pour ESN",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configuration CORS
@@ -18,6 +37,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "Accept"],
+    expose_headers=["X-Next-Cursor"],  # Curseur de pagination des listes
 )
 
 # Route principale
@@ -39,6 +59,14 @@ async def health_check(db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Service indisponible: {str(e)}")
 
+# Sonde de readiness : les modèles et index sont chargés et ont servi une première fois
+@app.get("/health/ready")
+async def readiness_check():
+    services = get_service_container().status()
+    if not services["ready"]:
+        raise HTTPException(status_code=503, detail=services)
+    return {"status": "ready", "services": services}
+
 # Création d'un routeur API avec préfixe commun
 api_router = APIRouter(prefix="/api")
 
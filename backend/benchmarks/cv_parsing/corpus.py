@@ -0,0 +1,228 @@
+"""
+Générateur de CV synthétiques étiquetés pour le banc d'essai de l'analyse de CV
+
+Chaque CV est produit de façon déterministe à partir d'une graine, au format PDF, DOCX
+ou TXT, en français ou en anglais, avec une densité de compétences et une taille réglables.
+Les compétences insérées servent d'étiquettes pour mesurer la précision et le rappel.
+"""
+from typing import Iterator, List, Sequence, Tuple
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+import io
+import random
+import zipfile
+
+from app.adapters.services.skill_taxonomy import SKILLS_CATEGORIES
+
+FORMATS = ("pdf", "docx", "txt")
+
+HEADERS = {
+    "fr": {"experience": "EXPÉRIENCE PROFESSIONNELLE", "education": "FORMATION", "skills": "COMPÉTENCES"},
+    "en": {"experience": "PROFESSIONAL EXPERIENCE", "education": "EDUCATION", "skills": "SKILLS"},
+}
+
+FIRST_NAMES = ("Jean", "Marie", "Karim", "Sophie", "Lucas", "Amina", "Thomas", "Claire", "Yanis", "Emma")
+LAST_NAMES = ("Dupont", "Martin", "Benali", "Durand", "Moreau", "Lefebvre", "Garcia", "Roux", "Fontaine", "Petit")
+CITIES = ("Paris", "Lyon", "Marseille", "Lille", "Nantes", "Bordeaux", "Toulouse", "Rennes")
+COMPANIES = ("TechCorp", "DataLab", "WebAgency", "Innovatech", "CloudNine", "Numeria", "Softwise", "BlueOcean")
+
+TITLES = {
+    "fr": ("Développeur Backend", "Ingénieur Logiciel", "Consultant Data", "Architecte Cloud", "Chef de Projet"),
+    "en": ("Backend Developer", "Software Engineer", "Data Consultant", "Cloud Architect", "Project Lead"),
+}
+MONTHS = {
+    "fr": ("Janvier", "Mars", "Avril", "Juin", "Septembre", "Octobre", "Novembre"),
+    "en": ("Jan", "Mar", "Jun", "Sep", "Oct", "Nov"),
+}
+DEGREES = {
+    "fr": ("Master en Informatique", "Licence Mathématiques", "Diplôme d'Ingénieur"),
+    "en": ("MSc Computer Science", "BSc Mathematics", "Engineering Degree"),
+}
+SCHOOLS = ("Université de Lyon", "Université Paris Cité", "INSA Rennes", "Centrale Nantes", "Université de Lille")
+
+# Phrases de remplissage sans aucun mot du vocabulaire des compétences
+FILLER = {
+    "fr": (
+        "Participation à la refonte du système de facturation pour un client du secteur bancaire.",
+        "Rédaction des spécifications et accompagnement des équipes métier lors de la recette.",
+        "Mise en place de tableaux de bord de suivi pour la direction financière.",
+        "Animation des ateliers avec les utilisateurs et priorisation du carnet de produit.",
+        "Optimisation des traitements nocturnes et réduction des temps de calcul.",
+    ),
+    "en": (
+        "Contributed to the redesign of the billing platform for a retail banking client.",
+        "Wrote functional specifications and supported business teams during acceptance.",
+        "Built monitoring dashboards for the finance department.",
+        "Ran workshops with end users and prioritised the product backlog.",
+        "Tuned nightly batch jobs and reduced overall processing time.",
+    ),
+}
+
+# Mots courts du vocabulaire trop ambigus pour être insérés comme étiquettes
+_SKILL_POOL = tuple(sorted(skill for skill in SKILLS_CATEGORIES if len(skill) > 2))
+_LEVELS = ("beginner", "intermediate", "advanced", "expert")
+
+
+@dataclass
+class SyntheticCV:
+    """CV synthétique et ses étiquettes"""
+    name: str
+    file_type: str
+    language: str
+    content: bytes
+    text: str
+    skills: List[str] = field(default_factory=list)
+
+
+def _cv_lines(rng: random.Random, language: str, skill_density: int, experiences: int,
+              filler_lines: int) -> Tuple[List[str], List[str]]:
+    headers = HEADERS[language]
+    skills = rng.sample(_SKILL_POOL, min(skill_density, len(_SKILL_POOL)))
+    city = rng.choice(CITIES)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+    lines = [
+        f"{first} {last}",
+        f"{city}, France | {first.lower()}.{last.lower()}@example.com | 06 {rng.randint(10, 99)} "
+        f"{rng.randint(10, 99)} {rng.randint(10, 99)} {rng.randint(10, 99)}",
+        "",
+        headers["experience"],
+    ]
+    # Une partie des compétences est citée dans les expériences, le reste dans la section dédiée
+    cited = skills[: len(skills) // 2]
+    per_experience = max(1, -(-len(cited) // max(experiences, 1)))
+    year = 2024
+    for index in range(experiences):
+        start = year - rng.randint(1, 4)
+        lines += [
+            rng.choice(TITLES[language]),
+            f"{rng.choice(COMPANIES)}, {rng.choice(CITIES)}",
+            f"{rng.choice(MONTHS[language])} {start} - {rng.choice(MONTHS[language])} {year}",
+        ]
+        used = cited[index * per_experience:(index + 1) * per_experience]
+        if used:
+            lead = "Technologies utilisées" if language == "fr" else "Technologies used"
+            lines.append(f"{lead}: {', '.join(used)}.")
+        lines += [rng.choice(FILLER[language]) for _ in range(filler_lines)]
+        lines.append("")
+        year = start
+
+    lines += [headers["education"], rng.choice(DEGREES[language]), rng.choice(SCHOOLS),
+              f"{year - 5} - {year - 3}", "", headers["skills"]]
+    for skill in skills[len(cited):]:
+        unit = "ans" if language == "fr" else "years"
+        lines.append(f"{skill} ({rng.randint(1, 10)} {unit}), {rng.choice(_LEVELS)}")
+    return lines, skills
+
+
+def _pdf_string(line: str) -> bytes:
+    encoded = line.encode("cp1252", errors="replace")
+    return encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def render_pdf(lines: Sequence[str], lines_per_page: int = 50) -> bytes:
+    """PDF minimal (police standard Helvetica), une ligne de texte par ligne du CV"""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # arbre des pages, complété une fois les pages numérotées
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for page_lines in pages:
+        stream = b"BT /F1 10 Tf 14 TL 50 800 Td " + b"".join(
+            b"(" + _pdf_string(line) + b") Tj T* " for line in page_lines
+        ) + b"ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b"%010d 00000 n \n" % offset)
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
+
+
+def render_docx(lines: Sequence[str]) -> bytes:
+    """DOCX minimal, un paragraphe par ligne du CV"""
+    body = "".join(f"<w:p><w:r><w:t xml:space=\"preserve\">{escape(line)}</w:t></w:r></w:p>" for line in lines)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("word/document.xml", document)
+    return output.getvalue()
+
+
+def generate_cv(seed: int, file_type: str = "pdf", language: str = "fr", skill_density: int = 8,
+                experiences: int = 3, filler_lines: int = 2) -> SyntheticCV:
+    """
+    Génère un CV synthétique
+
+    Args:
+        seed: Graine (même graine, même CV)
+        file_type: pdf, docx ou txt
+        language: fr ou en
+        skill_density: Nombre de compétences distinctes citées
+        experiences: Nombre d'expériences (fait varier la taille)
+        filler_lines: Lignes de description par expérience (fait varier la taille)
+    """
+    if file_type not in FORMATS:
+        raise ValueError(f"Format non supporté: {file_type}")
+    rng = random.Random(seed)
+    lines, skills = _cv_lines(rng, language, skill_density, experiences, filler_lines)
+    text = "\n".join(lines)
+    if file_type == "pdf":
+        content = render_pdf(lines)
+    elif file_type == "docx":
+        content = render_docx(lines)
+    else:
+        content = text.encode("utf-8")
+    return SyntheticCV(
+        name=f"cv-{seed:05d}.{file_type}",
+        file_type=file_type,
+        language=language,
+        content=content,
+        text=text,
+        skills=skills,
+    )
+
+
+def generate_corpus(count: int, seed: int = 0, formats: Sequence[str] = FORMATS, fr_ratio: float = 0.7,
+                    skill_density: int = 8, experiences: int = 3, filler_lines: int = 2) -> Iterator[SyntheticCV]:
+    """Génère `count` CV, en alternant les formats et avec une part `fr_ratio` de CV en français"""
+    rng = random.Random(seed)
+    for index in range(count):
+        language = "fr" if rng.random() < fr_ratio else "en"
+        yield generate_cv(
+            seed * 100_000 + index,
+            file_type=formats[index % len(formats)],
+            language=language,
+            skill_density=skill_density,
+            experiences=experiences,
+            filler_lines=filler_lines,
+        )
@@ -0,0 +1,285 @@
+"""
+Banc d'essai de l'analyse de CV : débit, latence, mémoire par étape et qualité des compétences
+
+Usage (depuis backend/) :
+    python -m benchmarks.cv_parsing.runner --count 300 --output bench.json
+    python -m benchmarks.cv_parsing.runner --output bench.json --baseline bench-main.json
+
+Le résultat est écrit en JSON ; avec --baseline, les régressions de débit ou de rappel
+au-delà de la tolérance sont signalées et le code de sortie vaut 1.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from app.adapters.services.cv_analysis_service import BasicCVAnalysisService
+from app.adapters.services.cv_segmenter import segment_cv
+from app.adapters.services.document_text import iter_text_blocks
+from app.adapters.services.enhanced_cv_analysis_service import EnhancedCVAnalysisService
+from benchmarks.cv_parsing.corpus import FORMATS, SyntheticCV, generate_corpus
+
+GOLD_SET_PATH = Path(__file__).with_name("gold_set.json")
+
+# Étapes mesurées pour chaque service, dans l'ordre d'exécution
+ENHANCED_STAGES = ("extract", "segment", "skills", "experience", "education", "personal_info")
+BASIC_STAGES = ("analyze",)
+
+
+def percentile(values: Sequence[float], ratio: float) -> float:
+    """Percentile par rang le plus proche"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(ratio * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss est en kilo-octets sous Linux, en octets sous macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageRecorder:
+    """
+    Durées, pic d'allocation et pic RSS du processus, étape par étape
+
+    Le pic d'allocation (tracemalloc) est propre à l'étape ; le pic RSS est le maximum
+    atteint par le processus à la fin de l'étape.
+    """
+
+    def __init__(self, stages: Sequence[str], trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.latencies: Dict[str, List[float]] = {stage: [] for stage in stages}
+        self.peak_alloc: Dict[str, int] = {stage: 0 for stage in stages}
+        self.peak_rss: Dict[str, int] = {stage: 0 for stage in stages}
+
+    def run(self, stage: str, fn: Callable[[], Any]) -> Any:
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        result = fn()
+        self.latencies[stage].append(time.perf_counter() - started)
+        if self.trace_memory:
+            self.peak_alloc[stage] = max(
+                self.peak_alloc[stage], tracemalloc.get_traced_memory()[1] - baseline
+            )
+        self.peak_rss[stage] = max(self.peak_rss[stage], _peak_rss_bytes())
+        return result
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for stage, values in self.latencies.items():
+            report[stage] = {
+                "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+                "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+                "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+                "peak_alloc_bytes": self.peak_alloc[stage],
+                "peak_rss_bytes": self.peak_rss[stage],
+            }
+        return report
+
+
+def skill_scores(predicted: Iterable[Set[str]], expected: Iterable[Set[str]]) -> Dict[str, float]:
+    """Précision, rappel et F1 micro-moyennés des compétences extraites"""
+    true_positives = false_positives = false_negatives = 0
+    for found, labels in zip(predicted, expected):
+        true_positives += len(found & labels)
+        false_positives += len(found - labels)
+        false_negatives += len(labels - found)
+    precision = true_positives / (true_positives + false_positives) if true_positives + false_positives else 0.0
+    recall = true_positives / (true_positives + false_negatives) if true_positives + false_negatives else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": round(precision, 4), "recall": round(recall, 4), "f1": round(f1, 4)}
+
+
+def _skill_names(skills: List[Dict[str, Any]]) -> Set[str]:
+    return {skill["name"].lower() for skill in skills}
+
+
+def load_gold_set(path: Path = GOLD_SET_PATH) -> List[Dict[str, Any]]:
+    """CV annotés à la main : texte et compétences attendues (noms du vocabulaire)"""
+    with open(path, encoding="utf-8") as gold_file:
+        return json.load(gold_file)
+
+
+def _enhanced_pipeline(service: EnhancedCVAnalysisService, recorder: StageRecorder, cv: SyntheticCV) -> Set[str]:
+    text = recorder.run("extract", lambda: "\n".join(iter_text_blocks(cv.content, cv.file_type)))
+    segmentation = recorder.run("segment", lambda: segment_cv(text))
+    skills = recorder.run("skills", lambda: service._extract_skills_from_text(text))
+    recorder.run("experience", lambda: service._extract_experience_from_text(text, segmentation))
+    recorder.run("education", lambda: service._extract_education_from_text(text, segmentation))
+    recorder.run("personal_info", lambda: service._extract_personal_info(text, segmentation))
+    return _skill_names(skills)
+
+
+def _basic_pipeline(service: BasicCVAnalysisService, recorder: StageRecorder, cv: SyntheticCV) -> Set[str]:
+    analyze = service.analyze_docx if cv.file_type == "docx" else service.analyze_pdf
+    result = recorder.run("analyze", lambda: asyncio.run(analyze(cv.content)))
+    return _skill_names(result["skills"])
+
+
+def benchmark_service(name: str, corpus: Sequence[SyntheticCV], gold_set: List[Dict[str, Any]],
+                      memory_sample: int = 20) -> Dict[str, Any]:
+    """
+    Mesure un service sur le corpus synthétique puis sur le jeu annoté
+
+    Les durées sont mesurées sans traçage mémoire ; les pics d'allocation le sont ensuite
+    sur les `memory_sample` premiers CV, tracemalloc ralentissant l'exécution.
+    """
+    if name == "enhanced":
+        service, stages, pipeline = EnhancedCVAnalysisService(), ENHANCED_STAGES, _enhanced_pipeline
+    elif name == "basic":
+        service, stages, pipeline = BasicCVAnalysisService(), BASIC_STAGES, _basic_pipeline
+    else:
+        raise ValueError(f"Service inconnu: {name}")
+
+    # Premier passage hors mesure : automate des compétences et imports paresseux
+    if corpus:
+        pipeline(service, StageRecorder(stages), corpus[0])
+
+    recorder = StageRecorder(stages)
+    predicted = []
+    started = time.perf_counter()
+    for cv in corpus:
+        predicted.append(pipeline(service, recorder, cv))
+    elapsed = time.perf_counter() - started
+
+    memory = StageRecorder(stages, trace_memory=True)
+    tracemalloc.start()
+    try:
+        for cv in corpus[:memory_sample]:
+            pipeline(service, memory, cv)
+    finally:
+        tracemalloc.stop()
+    stages_report = recorder.report()
+    for stage, values in memory.report().items():
+        stages_report[stage]["peak_alloc_bytes"] = values["peak_alloc_bytes"]
+
+    gold_cvs = [
+        SyntheticCV(name=entry["id"], file_type="txt", language="", content=entry["text"].encode("utf-8"),
+                    text=entry["text"], skills=entry["skills"])
+        for entry in gold_set
+    ]
+    gold_predicted = [pipeline(service, StageRecorder(stages), cv) for cv in gold_cvs]
+
+    totals = [sum(values) for values in zip(*recorder.latencies.values())]
+    return {
+        "cvs": len(corpus),
+        "elapsed_seconds": round(elapsed, 3),
+        "cvs_per_second": round(len(corpus) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency": {
+            "p50_ms": round(percentile(totals, 0.50) * 1000, 3),
+            "p99_ms": round(percentile(totals, 0.99) * 1000, 3),
+        },
+        "stages": stages_report,
+        "accuracy": {
+            "synthetic": skill_scores(predicted, (set(cv.skills) for cv in corpus)),
+            "gold": skill_scores(gold_predicted, (set(cv.skills) for cv in gold_cvs)),
+        },
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(count: int = 100, seed: int = 0, formats: Sequence[str] = FORMATS, fr_ratio: float = 0.7,
+                  skill_density: int = 8, experiences: int = 3, filler_lines: int = 2,
+                  services: Sequence[str] = ("enhanced", "basic"), memory_sample: int = 20) -> Dict[str, Any]:
+    """Génère le corpus et mesure chaque service ; renvoie le rapport complet"""
+    parameters = {
+        "count": count, "seed": seed, "formats": list(formats), "fr_ratio": fr_ratio,
+        "skill_density": skill_density, "experiences": experiences, "filler_lines": filler_lines,
+    }
+    corpus = list(generate_corpus(count, seed, formats, fr_ratio, skill_density, experiences, filler_lines))
+    gold_set = load_gold_set()
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "corpus_bytes": sum(len(cv.content) for cv in corpus),
+            "parameters": parameters,
+        },
+        "services": {name: benchmark_service(name, corpus, gold_set, memory_sample) for name in services},
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[str]:
+    """Régressions par rapport à un rapport précédent : débit, p99 et rappel des compétences"""
+    regressions = []
+    for name, current in report["services"].items():
+        previous = baseline.get("services", {}).get(name)
+        if previous is None:
+            continue
+        if current["cvs_per_second"] < previous["cvs_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: débit {current['cvs_per_second']} CV/s (référence {previous['cvs_per_second']})"
+            )
+        if current["latency"]["p99_ms"] > previous["latency"]["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {current['latency']['p99_ms']} ms (référence {previous['latency']['p99_ms']})"
+            )
+        for dataset in ("synthetic", "gold"):
+            recall, previous_recall = current["accuracy"][dataset]["recall"], previous["accuracy"][dataset]["recall"]
+            if recall < previous_recall:
+                regressions.append(f"{name}: rappel {dataset} {recall} (référence {previous_recall})")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Banc d'essai de l'analyse de CV")
+    parser.add_argument("--count", type=int, default=100, help="Nombre de CV synthétiques")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--formats", default=",".join(FORMATS), help="Formats, séparés par des virgules")
+    parser.add_argument("--fr-ratio", type=float, default=0.7, help="Part de CV en français")
+    parser.add_argument("--skill-density", type=int, default=8, help="Compétences citées par CV")
+    parser.add_argument("--experiences", type=int, default=3, help="Expériences par CV")
+    parser.add_argument("--filler-lines", type=int, default=2, help="Lignes de description par expérience")
+    parser.add_argument("--services", default="enhanced,basic")
+    parser.add_argument("--memory-sample", type=int, default=20, help="CV mesurés sous tracemalloc")
+    parser.add_argument("--output", help="Fichier JSON du rapport (sortie standard sinon)")
+    parser.add_argument("--baseline", help="Rapport de référence à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Tolérance sur le débit et la latence")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        count=args.count, seed=args.seed, formats=args.formats.split(","), fr_ratio=args.fr_ratio,
+        skill_density=args.skill_density, experiences=args.experiences, filler_lines=args.filler_lines,
+        services=args.services.split(","), memory_sample=args.memory_sample,
+    )
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.tolerance)
+        for regression in regressions:
+            print(f"Régression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
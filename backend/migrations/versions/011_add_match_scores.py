@@ -0,0 +1,34 @@
+"""Add match_scores table
+
+Revision ID: 011_add_match_scores
+Revises: 010_clean_consultant_status_enum
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '011_add_match_scores'
+down_revision = '010_clean_consultant_status_enum'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Matrice matérialisée des scores consultant x appel d'offres
+    op.create_table('match_scores',
+        sa.Column('consultant_id', sa.Integer(), nullable=False),
+        sa.Column('tender_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['consultant_id'], ['consultants.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tender_id'], ['tenders.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('consultant_id', 'tender_id')
+    )
+    op.create_index('ix_match_scores_tender_score', 'match_scores', ['tender_id', 'score'], unique=False)
+    op.create_index('ix_match_scores_consultant_score', 'match_scores', ['consultant_id', 'score'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_match_scores_consultant_score', table_name='match_scores')
+    op.drop_index('ix_match_scores_tender_score', table_name='match_scores')
+    op.drop_table('match_scores')
@@ -0,0 +1,37 @@
+"""Add keyset pagination indexes
+
+Revision ID: 012_add_keyset_pagination_indexes
+Revises: 011_add_match_scores
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '012_add_keyset_pagination_indexes'
+down_revision = '011_add_match_scores'
+branch_labels = None
+depends_on = None
+
+# Tables paginées par curseur sur (created_at, id)
+KEYSET_TABLES = ('consultants', 'tenders', 'matches')
+
+def upgrade():
+    # created_at devient obligatoire : les lignes sans date la reçoivent maintenant,
+    # elles restent donc en fin de parcours, triées par id comme auparavant
+    for table in KEYSET_TABLES:
+        op.execute(f"UPDATE {table} SET created_at = now() WHERE created_at IS NULL")
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+    # Index composites (created_at, id) utilisés par la pagination par curseur
+    op.create_index('ix_consultants_created_at_id', 'consultants', ['created_at', 'id'], unique=False)
+    op.create_index('ix_tenders_created_at_id', 'tenders', ['created_at', 'id'], unique=False)
+    op.create_index('ix_matches_created_at_id', 'matches', ['created_at', 'id'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_matches_created_at_id', table_name='matches')
+    op.drop_index('ix_tenders_created_at_id', table_name='tenders')
+    op.drop_index('ix_consultants_created_at_id', table_name='consultants')
+    for table in KEYSET_TABLES:
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(timezone=True), nullable=True)
@@ -0,0 +1,38 @@
+"""Add job queue columns to workflow_executions
+
+Revision ID: 013_add_cv_analysis_job_queue
+Revises: 012_add_keyset_pagination_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '013_add_cv_analysis_job_queue'
+down_revision = '012_add_keyset_pagination_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # SQLAlchemy persiste les noms des membres de WorkflowStatus (comme pour consultantstatus)
+    # ADD VALUE doit être validé hors transaction avant d'être utilisable
+    with op.get_context().autocommit_block():
+        for value in ('PENDING', 'QUEUED', 'RUNNING', 'SUCCESS', 'ERROR', 'CANCELLED'):
+            op.execute(f"ALTER TYPE workflowstatus ADD VALUE IF NOT EXISTS '{value}'")
+
+    # Suivi de l'avancement et réservation des jobs par les workers
+    op.add_column('workflow_executions', sa.Column('progress', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('workflow_executions', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('workflow_executions', sa.Column('worker_id', sa.String(length=255), nullable=True))
+    op.add_column('workflow_executions', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_workflow_executions_queue', 'workflow_executions',
+                    ['workflow_id', 'status', 'created_at'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_workflow_executions_queue', table_name='workflow_executions')
+    op.drop_column('workflow_executions', 'heartbeat_at')
+    op.drop_column('workflow_executions', 'worker_id')
+    op.drop_column('workflow_executions', 'attempts')
+    op.drop_column('workflow_executions', 'progress')
+    # Les valeurs ajoutées à l'enum workflowstatus ne peuvent pas être supprimées directement
@@ -0,0 +1,58 @@
+"""Add skill_aliases table
+
+Revision ID: 014_add_skill_aliases
+Revises: 013_add_cv_analysis_job_queue
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '014_add_skill_aliases'
+down_revision = '013_add_cv_analysis_job_queue'
+branch_labels = None
+depends_on = None
+
+# Synonymes usuels, rattachés aux compétences déjà présentes en base
+DEFAULT_ALIASES = {
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'k8s': 'kubernetes',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'golang': 'go',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'nodejs': 'node.js',
+    'mongo': 'mongodb',
+    'sklearn': 'scikit-learn',
+    'ml': 'machine learning',
+}
+
+def upgrade():
+    # Synonymes des compétences utilisés par l'analyse des CV
+    op.create_table('skill_aliases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('skill_id', sa.Integer(), nullable=False),
+        sa.Column('alias', sa.String(length=100), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('alias')
+    )
+    op.create_index(op.f('ix_skill_aliases_id'), 'skill_aliases', ['id'], unique=False)
+    op.create_index(op.f('ix_skill_aliases_skill_id'), 'skill_aliases', ['skill_id'], unique=False)
+
+    for alias, skill_name in DEFAULT_ALIASES.items():
+        op.execute(sa.text(
+            "INSERT INTO skill_aliases (skill_id, alias) "
+            "SELECT id, :alias FROM skills WHERE lower(name) = :skill_name"
+        ).bindparams(alias=alias, skill_name=skill_name))
+
+def downgrade():
+    op.drop_index(op.f('ix_skill_aliases_skill_id'), table_name='skill_aliases')
+    op.drop_index(op.f('ix_skill_aliases_id'), table_name='skill_aliases')
+    op.drop_table('skill_aliases')
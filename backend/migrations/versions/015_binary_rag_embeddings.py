@@ -0,0 +1,30 @@
+"""Store RAG embeddings as raw binary vectors
+
+Revision ID: 015_binary_rag_embeddings
+Revises: 014_add_skill_aliases
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '015_binary_rag_embeddings'
+down_revision = '014_add_skill_aliases'
+branch_labels = None
+depends_on = None
+
+TABLES = ('rag_chunks', 'rag_queries')
+
+def upgrade():
+    # Les vecteurs texte ne sont pas convertis : ils sont recalculés en réindexant les documents
+    for table in TABLES:
+        op.drop_column(table, 'embedding')
+        op.add_column(table, sa.Column('embedding', sa.LargeBinary(), nullable=True))
+        op.add_column(table, sa.Column('embedding_dtype', sa.String(length=10), nullable=True))
+
+def downgrade():
+    for table in TABLES:
+        op.drop_column(table, 'embedding_dtype')
+        op.drop_column(table, 'embedding')
+        op.add_column(table, sa.Column('embedding', sa.Text(), nullable=True))
@@ -0,0 +1,28 @@
+"""Track the consultant_skills version of each match_scores column
+
+Revision ID: 016_add_match_score_versions
+Revises: 015_binary_rag_embeddings
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '016_add_match_score_versions'
+down_revision = '015_binary_rag_embeddings'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Aucune ligne : chaque colonne de match_scores est calculée à sa première lecture
+    op.create_table('match_score_versions',
+        sa.Column('tender_id', sa.Integer(), nullable=False),
+        sa.Column('skills_version', sa.String(length=255), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['tender_id'], ['tenders.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tender_id')
+    )
+
+def downgrade():
+    op.drop_table('match_score_versions')
@@ -0,0 +1,46 @@
+"""Track match_scores freshness per consultant row and per tender column
+
+Revision ID: 017_match_score_row_column_versions
+Revises: 016_add_match_score_versions
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '017_match_score_row_column_versions'
+down_revision = '016_add_match_score_versions'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Les versions globales (empreinte de consultant_skills) sont remplacées par l'empreinte
+    # de chaque consultant et de chaque appel d'offres ; la matrice est recalculée par
+    # refresh_stale_scores (lignes et colonnes sans version)
+    op.drop_table('match_score_versions')
+    op.create_table('match_score_consultant_versions',
+        sa.Column('consultant_id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.String(length=64), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['consultant_id'], ['consultants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('consultant_id')
+    )
+    op.create_table('match_score_tender_versions',
+        sa.Column('tender_id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.String(length=64), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['tender_id'], ['tenders.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tender_id')
+    )
+
+def downgrade():
+    op.drop_table('match_score_tender_versions')
+    op.drop_table('match_score_consultant_versions')
+    op.create_table('match_score_versions',
+        sa.Column('tender_id', sa.Integer(), nullable=False),
+        sa.Column('skills_version', sa.String(length=255), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['tender_id'], ['tenders.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tender_id')
+    )
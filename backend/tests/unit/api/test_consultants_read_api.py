@@ -0,0 +1,59 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import consultants
+from app.infrastructure.database.async_session import get_async_db
+from app.infrastructure.database.models import Base, Company, Consultant, ConsultantSkill, Skill
+from app.infrastructure.database.session import get_db
+
+
+@pytest.fixture
+def client():
+    """Application montant le router des consultants ; seule la session asynchrone a une base."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as session:
+            session.add_all([Company(id=1, name="ESN"), Skill(id=1, name="Python")])
+            session.add_all([
+                Consultant(id=i, company_id=1, title=f"Consultant {i}", created_at=datetime(2025, 1, i))
+                for i in (1, 2, 3)
+            ])
+            session.add(ConsultantSkill(consultant_id=2, skill_id=1))
+            await session.commit()
+
+    async def override_get_async_db():
+        async with factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(consultants.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Les lectures ne doivent pas toucher la session synchrone
+    app.dependency_overrides[get_db] = lambda: MagicMock(spec=Session)
+    with TestClient(app) as test_client:
+        test_client.portal.call(setup)
+        yield test_client
+
+
+def test_read_endpoints_use_the_async_session(client):
+    """
+    Liste paginée, détail et compétences d'un consultant sont servis par le repository asynchrone.
+    """
+    first = client.get("/consultants/", params={"limit": 2})
+    assert [c["id"] for c in first.json()] == [1, 2]
+    rest = client.get("/consultants/", params={"cursor": first.headers["X-Next-Cursor"]})
+    assert [c["id"] for c in rest.json()] == [3]
+
+    assert client.get("/consultants/2").json()["title"] == "Consultant 2"
+    assert client.get("/consultants/99").status_code == 404
+    assert [skill["name"] for skill in client.get("/consultants/2/skills").json()] == ["Python"]
@@ -0,0 +1,219 @@
+import io
+import json
+import zipfile
+
+import pytest
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import cv_analysis
+from app.adapters.services.cv_analysis_worker import CVAnalysisWorkerPool
+from app.adapters.repositories.cv_analysis_job_repository import SQLAlchemyCVAnalysisJobRepository
+from app.adapters.services.cv_batch_ingestion import CVBatchIngestionService, expand_batch
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.session import get_db
+from app.infrastructure.storage.minio_client import get_minio_client
+
+
+class InMemoryStorage:
+    """Stockage objet en mémoire."""
+
+    def __init__(self):
+        self.objects = {}
+
+    async def upload_file(self, object_name, file_data, content_type):
+        self.objects[object_name] = file_data
+        return object_name
+
+    async def download_file(self, object_name):
+        return self.objects[object_name]
+
+
+class StubAnalysisService:
+    """Service d'analyse renvoyant le contenu du fichier comme nom du candidat."""
+
+    async def analyze_pdf(self, content):
+        if content == b"corrompu":
+            raise RuntimeError("PDF illisible")
+        return {"personal_info": {"name": content.decode()}, "skills": []}
+
+    async def analyze_docx(self, content):
+        return await self.analyze_pdf(content)
+
+
+@pytest.fixture
+def storage():
+    return InMemoryStorage()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def client(session_factory, storage, monkeypatch):
+    """Application et pool de workers partageant la même boucle et la même base."""
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(cv_analysis.router)
+    monkeypatch.setattr(
+        cv_analysis, "CVBatchIngestionService",
+        lambda repository, storage: CVBatchIngestionService(repository, storage, concurrency=2)
+    )
+    monkeypatch.setattr(cv_analysis.settings, "CV_JOB_POLL_INTERVAL", 0.01)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_minio_client] = lambda: storage
+    pool = CVAnalysisWorkerPool(session_factory, storage, StubAnalysisService(), concurrency=2,
+                                poll_interval=0.01, max_attempts=1, worker_id="test")
+    with TestClient(app) as test_client:
+        test_client.portal.call(pool.start)
+        yield test_client
+        test_client.portal.call(pool.stop)
+
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def test_batch_streams_one_event_per_cv_and_a_summary(client, storage):
+    """
+    Les CV isolés et ceux des archives sont stockés, analysés par les workers et suivis un par un en NDJSON.
+    """
+    archive = make_zip({"lot/alice.pdf": b"alice", "lot/bob.docx": b"bob", "lot/notes.txt": b"x", "lot/": b""})
+
+    response = client.post(
+        "/api/v1/cv-analysis/batch",
+        files=[
+            ("files", ("carol.pdf", io.BytesIO(b"carol"), "application/pdf")),
+            ("files", ("dave.pdf", io.BytesIO(b"corrompu"), "application/pdf")),
+            ("files", ("lot.zip", archive, "application/zip")),
+        ]
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    files = {event["name"]: event for event in events[:-1]}
+
+    assert set(files) == {"carol.pdf", "dave.pdf", "alice.pdf", "bob.docx", "notes.txt"}
+    assert files["alice.pdf"]["status"] == "analyzed"
+    assert files["alice.pdf"]["candidate"]["name"] == "alice"
+    assert files["dave.pdf"]["status"] == "error"
+    assert "PDF illisible" in files["dave.pdf"]["error"]
+    assert files["notes.txt"]["status"] == "error"
+    assert len(storage.objects) == 4
+
+    summary = events[-1]
+    assert summary["event"] == "summary"
+    assert (summary["total"], summary["analyzed"], summary["analyzing"], summary["errors"]) == (5, 3, 0, 2)
+    assert summary["cvs_per_second"] > 0
+
+    # Les CV du lot sont consultables comme les autres
+    statuses = {file["name"]: file["status"] for file in client.get("/api/v1/cv-analysis/files").json()}
+    assert statuses == {"carol.pdf": "analyzed", "dave.pdf": "error", "alice.pdf": "analyzed", "bob.docx": "analyzed"}
+
+
+def test_batch_streams_server_sent_events(client):
+    """
+    Le format SSE renvoie un message typé par CV puis le bilan.
+    """
+    response = client.post(
+        "/api/v1/cv-analysis/batch?format=sse",
+        files=[("files", ("carol.pdf", io.BytesIO(b"carol"), "application/pdf"))]
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = response.text.strip().split("\n\n")
+    assert messages[0].startswith("event: file\ndata: ")
+    assert messages[-1].startswith("event: summary\n")
+
+
+def test_invalid_archive_is_rejected(client):
+    response = client.post(
+        "/api/v1/cv-analysis/batch",
+        files=[("files", ("lot.zip", io.BytesIO(b"pas une archive"), "application/zip"))]
+    )
+
+    assert response.status_code == 400
+
+
+def test_batch_larger_than_the_queue_is_rejected(client, storage, monkeypatch):
+    """
+    Un lot qui dépasserait CV_JOB_MAX_QUEUED est refusé (503) avant tout stockage.
+    """
+    monkeypatch.setattr(cv_analysis.settings, "CV_JOB_MAX_QUEUED", 1)
+
+    response = client.post(
+        "/api/v1/cv-analysis/batch",
+        files=[
+            ("files", ("carol.pdf", io.BytesIO(b"carol"), "application/pdf")),
+            ("files", ("dave.pdf", io.BytesIO(b"dave"), "application/pdf")),
+        ]
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"]
+    assert storage.objects == {}
+
+
+def test_oversized_file_is_rejected_before_being_read(client, storage, monkeypatch):
+    """
+    Un CV isolé plus grand que CV_MAX_BYTES est refusé sur sa taille, sans être lu ni stocké.
+    """
+    monkeypatch.setattr(cv_analysis.settings, "CV_MAX_BYTES", 8)
+
+    response = client.post(
+        "/api/v1/cv-analysis/batch",
+        files=[
+            ("files", ("carol.pdf", io.BytesIO(b"carol"), "application/pdf")),
+            ("files", ("gros.pdf", io.BytesIO(b"x" * 64), "application/pdf")),
+        ]
+    )
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    files = {event["name"]: event for event in events[:-1]}
+    assert files["carol.pdf"]["status"] == "analyzed"
+    assert files["gros.pdf"]["status"] == "error"
+    assert "64 octets" in files["gros.pdf"]["error"]
+    assert len(storage.objects) == 1
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_workers_does_not_hold_a_read_slot(session_factory, storage, monkeypatch):
+    """
+    Sans worker disponible, tout le lot est stocké et mis en file avant le premier événement,
+    même avec une seule place de lecture.
+    """
+    monkeypatch.setattr(cv_analysis.settings, "CV_JOB_POLL_INTERVAL", 0.01)
+    db = session_factory()
+    service = CVBatchIngestionService(SQLAlchemyCVAnalysisJobRepository(db), storage,
+                                      concurrency=1, wait_timeout=0.05)
+    archive = make_zip({"alice.pdf": b"alice", "bob.pdf": b"bob", "carol.pdf": b"carol"})
+    upload = UploadFile(archive, filename="lot.zip")
+
+    events = []
+    async for event in service.ingest(expand_batch([upload])):
+        if not events:
+            assert len(storage.objects) == 3
+        events.append(event)
+    db.close()
+
+    assert [event["status"] for event in events[:-1]] == ["analyzing"] * 3
+    assert events[-1]["analyzing"] == 3
@@ -0,0 +1,99 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.adapters.services import service_container
+from app.adapters.services.embedding_service import HashedNgramEmbeddingService
+from app.adapters.services.service_container import ServiceContainer
+from app.adapters.services.vector_store import LocalVectorStore
+from app.api.v1 import rag
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.session import get_db
+from app.main import app as main_app
+
+
+@pytest.fixture
+def container(monkeypatch):
+    """Conteneur de services en mémoire, installé comme conteneur partagé."""
+    container = ServiceContainer(
+        embedding_service=HashedNgramEmbeddingService(dimension=64, pool="thread"),
+        vector_store=LocalVectorStore(persistent=False),
+        load_llm=False
+    )
+    monkeypatch.setattr(service_container, "_service_container", container)
+    return container
+
+
+@pytest.fixture
+def client(container):
+    """Application montant le router RAG sur une base SQLite en mémoire."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(rag.router)
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def test_rag_endpoints_use_the_shared_services(client, container):
+    """
+    Indexation, lecture et suppression passent par les composants du conteneur partagé.
+    """
+    response = client.post(
+        "/api/v1/rag/index-document",
+        files={"file": ("cv.txt", "Consultante Python, certifiée ISTQB.".encode("utf-8"), "text/plain")},
+        data={"document_type": "cv"}
+    )
+    assert response.status_code == 200
+    document_id = response.json()["document_id"]
+
+    assert len(container.vector_store.collection("cv_embeddings")) == 1
+    assert client.get(f"/api/v1/rag/documents/{document_id}").json()["collection"] == "cv_embeddings"
+    assert client.delete(f"/api/v1/rag/documents/{document_id}").status_code == 200
+    assert client.get(f"/api/v1/rag/documents/{document_id}").status_code == 404
+
+
+def test_readiness_probe_waits_for_warm_up(container):
+    """
+    La sonde répond 503 tant que le warm-up n'est pas terminé, puis 200.
+    """
+    client = TestClient(main_app)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["detail"]["ready"] is False
+
+    container.ready = True
+    assert client.get("/health/ready").json()["status"] == "ready"
+
+
+def test_generate_stream_sends_server_sent_events(client, container):
+    """
+    /generate/stream répond en text/event-stream : contexte puis erreur ici (pas de LLM chargé).
+    """
+    client.post(
+        "/api/v1/rag/index-document",
+        files={"file": ("cv.txt", "Consultant SAP FICO.".encode("utf-8"), "text/plain")},
+        data={"document_type": "cv"}
+    )
+
+    response = client.post("/api/v1/rag/generate/stream", json={"text": "SAP"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n")[0] for block in response.text.strip().split("\n\n")]
+    assert events == ["event: context", "event: error"]
+    assert "SAP FICO" in response.text
+    assert client.post("/api/v1/rag/generate/stream", json={}).status_code == 400
@@ -0,0 +1,109 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+
+from app.adapters.repositories.async_consultant_repository import AsyncSQLAlchemyConsultantRepository
+from app.adapters.services.skill_index import skill_pairs_version
+from app.infrastructure.database.async_session import create_async_db_engine
+from app.infrastructure.database.models import (
+    Base, Company, Consultant, ConsultantSkill, ConsultantStatus, Skill, User, UserRole, ProficiencyLevel
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Crée une base SQLite asynchrone en mémoire peuplée de consultants."""
+    engine = create_async_db_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    base = datetime(2024, 1, 1)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(Company(id=1, name="ESN"))
+        session.add_all([Skill(id=1, name="Python"), Skill(id=2, name="Java")])
+        for i in range(1, 8):
+            session.add(User(id=i, email=f"user{i}@example.com", password_hash="x",
+                             full_name=f"User {i}", role=UserRole.CONSULTANT))
+            session.add(Consultant(id=i, user_id=i, company_id=1, title=f"Consultant {i}",
+                                   created_at=base + timedelta(minutes=i)))
+            session.add(ConsultantSkill(consultant_id=i, skill_id=1 + i % 2,
+                                        proficiency_level=ProficiencyLevel.ADVANCED, years_experience=i))
+        await session.commit()
+
+    yield factory
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_get_by_id_eager_loads_relations(session_factory):
+    """
+    Le mapping ne déclenche aucun chargement paresseux (interdit en asynchrone).
+    """
+    async with session_factory() as session:
+        repository = AsyncSQLAlchemyConsultantRepository(session)
+        consultant = await repository.get_by_id(3)
+        missing = await repository.get_by_id(999)
+
+    assert consultant.user["email"] == "user3@example.com"
+    assert consultant.skills[0]["skill_id"] == 2
+    assert consultant.skills[0]["level"] == "advanced"
+    assert missing is None
+
+@pytest.mark.asyncio
+async def test_get_page_follows_cursor(session_factory):
+    """
+    La pagination par curseur parcourt tous les consultants filtrés sans doublon.
+    """
+    async with session_factory() as session:
+        repository = AsyncSQLAlchemyConsultantRepository(session)
+
+        first, cursor = await repository.get_page(skill_id=1, limit=2)
+        second, last_cursor = await repository.get_page(skill_id=1, cursor=cursor, limit=2)
+
+    assert [c.id for c in first] == [2, 4]
+    assert [c.id for c in second] == [6]
+    assert last_cursor is None
+
+@pytest.mark.asyncio
+async def test_skill_changes_change_skill_pairs_version(session_factory):
+    """
+    Tout ajout ou suppression dans consultant_skills change l'empreinte lue par le matchmaking ;
+    revenir au même contenu redonne la même empreinte.
+    """
+    async with session_factory() as session:
+        repository = AsyncSQLAlchemyConsultantRepository(session)
+        versions = [await repository.get_skill_pairs_version()]
+
+        assert await repository.add_skill(1, 1, ProficiencyLevel.EXPERT, years_experience=5)
+        versions.append(await repository.get_skill_pairs_version())
+        assert (1, 1) in await repository.get_skill_pairs()
+
+        assert await repository.remove_skill(1, 1)
+        versions.append(await repository.get_skill_pairs_version())
+        assert not await repository.remove_skill(1, 1)
+
+        assert await repository.delete(2)
+        versions.append(await repository.get_skill_pairs_version())
+        assert await repository.get_by_id(2) is None
+        assert all(consultant_id != 2 for _, consultant_id in await repository.get_skill_pairs())
+
+        assert versions[3] == skill_pairs_version(await repository.get_skill_pairs())
+
+    assert versions[1] != versions[0] and versions[2] == versions[0]
+    assert versions[3] not in versions[:3]
+
+@pytest.mark.asyncio
+async def test_available_consultants_are_not_truncated(session_factory):
+    """
+    Les consultants disponibles sont tous renvoyés, comme par le repository synchrone (pas de limite de page).
+    """
+    async with session_factory() as session:
+        session.add_all([
+            Consultant(id=i, company_id=1, title=f"Consultant {i}", status=ConsultantStatus.QUALIFIED)
+            for i in range(100, 701)
+        ])
+        await session.commit()
+        repository = AsyncSQLAlchemyConsultantRepository(session)
+        available = await repository.get_available_consultants()
+
+    assert [c.id for c in available] == list(range(100, 701))
@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.repositories.consultant_repository import SQLAlchemyConsultantRepository
+from app.infrastructure.database.models import (
+    Base, Company, Consultant, ConsultantSkill, Skill, User, UserRole, ProficiencyLevel
+)
+
+@pytest.fixture
+def db_engine():
+    """Crée une base SQLite en mémoire peuplée de consultants avec utilisateurs et compétences."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    session.add(Company(id=1, name="ESN"))
+    session.add_all([Skill(id=1, name="Python"), Skill(id=2, name="Java")])
+    for i in range(1, 51):
+        session.add(User(id=i, email=f"user{i}@example.com", password_hash="x",
+                         full_name=f"User {i}", role=UserRole.CONSULTANT))
+        session.add(Consultant(id=i, user_id=i, company_id=1, title=f"Consultant {i}", years_experience=i % 10))
+        session.add(ConsultantSkill(consultant_id=i, skill_id=1,
+                                    proficiency_level=ProficiencyLevel.EXPERT, years_experience=i % 7))
+        if i % 2:
+            session.add(ConsultantSkill(consultant_id=i, skill_id=2,
+                                        proficiency_level=ProficiencyLevel.BEGINNER, years_experience=1))
+    session.commit()
+    session.close()
+    return engine
+
+def count_queries(engine):
+    """Compte les requêtes SQL exécutées sur le moteur."""
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+@pytest.mark.asyncio
+async def test_get_all_uses_constant_number_of_queries(db_engine):
+    """
+    Le chargement de la liste n'émet pas de requête par consultant (pas de N+1).
+    """
+    session = sessionmaker(bind=db_engine)()
+    repository = SQLAlchemyConsultantRepository(session)
+    statements = count_queries(db_engine)
+
+    consultants = await repository.get_all()
+
+    assert len(consultants) == 50
+    assert len(statements) <= 3
+    session.close()
+
+@pytest.mark.asyncio
+async def test_mapped_skills_carry_real_proficiency_and_years(db_engine):
+    """
+    Les compétences portent le niveau et les années d'expérience enregistrés.
+    """
+    session = sessionmaker(bind=db_engine)()
+    repository = SQLAlchemyConsultantRepository(session)
+
+    consultant = await repository.get_by_id(3)
+
+    assert consultant.user["email"] == "user3@example.com"
+    assert sorted(consultant.skills, key=lambda s: s["skill_id"]) == [
+        {"id": 1, "skill_id": 1, "name": "Python", "level": "expert", "years": 3},
+        {"id": 2, "skill_id": 2, "name": "Java", "level": "beginner", "years": 1},
+    ]
+    session.close()
+
+@pytest.mark.asyncio
+async def test_delete_removes_skill_rows(db_engine):
+    """
+    La suppression d'un consultant retire ses lignes consultant_skills, comme la version asynchrone.
+    """
+    session = sessionmaker(bind=db_engine)()
+    repository = SQLAlchemyConsultantRepository(session)
+    await repository.get_by_id(3)
+
+    assert await repository.delete(3)
+    assert await repository.get_by_id(3) is None
+    assert all(consultant_id != 3 for _, consultant_id in await repository.get_skill_pairs())
+    session.close()
@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.repositories.match_score_repository import SQLAlchemyMatchScoreRepository
+from app.infrastructure.database.models import Base, Company, Consultant, Tender
+
+@pytest.fixture
+def db_session():
+    """Crée une base SQLite en mémoire avec deux entreprises, des consultants et des appels d'offres."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    session.add_all([Company(id=1, name="ESN A"), Company(id=2, name="ESN B")])
+    session.add_all([
+        Consultant(id=1, company_id=1), Consultant(id=2, company_id=1), Consultant(id=3, company_id=2)
+    ])
+    session.add_all([
+        Tender(id=10, title="AO A", company_id=1), Tender(id=20, title="AO B", company_id=2)
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+@pytest.fixture
+def repository(db_session):
+    """Crée le repository de la matrice des scores."""
+    return SQLAlchemyMatchScoreRepository(db_session)
+
+@pytest.mark.asyncio
+async def test_replace_tender_scores_and_top_k_read(repository):
+    """
+    Le remplacement d'une colonne écrase les anciens scores et la lecture est triée par score décroissant.
+    """
+    await repository.replace_tender_scores(10, {1: 0.4, 2: 0.9, 3: 0.7})
+    await repository.replace_tender_scores(10, {1: 0.8, 2: 0.9, 3: 0.5})
+
+    assert await repository.get_top_for_tender(10) == [(2, 0.9), (1, 0.8), (3, 0.5)]
+    assert await repository.get_top_for_tender(10, min_score=0.6) == [(2, 0.9), (1, 0.8)]
+    assert await repository.get_top_for_tender(10, skip=1, limit=1) == [(1, 0.8)]
+
+@pytest.mark.asyncio
+async def test_replace_consultant_scores_updates_only_its_row(repository):
+    """
+    Le recalcul d'une ligne ne touche pas les scores des autres consultants.
+    """
+    await repository.replace_tender_scores(10, {1: 0.8, 2: 0.9})
+    await repository.replace_consultant_scores(1, {10: 0.3, 20: 0.75})
+
+    assert await repository.get_top_for_tender(10) == [(2, 0.9), (1, 0.3)]
+    assert await repository.get_top_for_tender(20) == [(1, 0.75)]
+
+    await repository.delete_consultant_scores(1)
+    assert await repository.get_top_for_tender(20) == []
+
+@pytest.mark.asyncio
+async def test_get_top_for_company(repository):
+    """
+    Les paires retenues impliquent un consultant ou un appel d'offres de l'entreprise.
+    """
+    await repository.replace_tender_scores(10, {1: 0.72, 2: 0.95, 3: 0.8})
+    await repository.replace_tender_scores(20, {1: 0.9, 2: 0.6, 3: 0.99})
+
+    assert await repository.get_top_for_company(1, min_score=0.7) == [
+        (2, 10, 0.95), (1, 20, 0.9), (3, 10, 0.8), (1, 10, 0.72)
+    ]
+    assert await repository.get_top_for_company(2, min_score=0.7, limit=2) == [
+        (3, 20, 0.99), (1, 20, 0.9)
+    ]
+
+@pytest.mark.asyncio
+async def test_zero_scores_are_not_stored_and_versions_follow_rows_and_columns(repository):
+    """
+    Les paires de score nul ne sont pas stockées ; la version d'une ligne ou d'une colonne
+    suit ses remplacements et disparaît avec elle.
+    """
+    await repository.replace_tender_scores(10, {1: 0.0, 2: 0.9}, version="t1")
+    await repository.replace_consultant_scores(3, {10: 0.0, 20: 0.4}, version="c1")
+
+    assert await repository.get_top_for_tender(10) == [(2, 0.9)]
+    assert await repository.get_top_for_tender(20) == [(3, 0.4)]
+    assert await repository.get_tender_versions() == {10: "t1"}
+    assert await repository.get_consultant_versions() == {3: "c1"}
+
+    await repository.replace_tender_scores(10, {2: 0.5}, version="t2")
+    await repository.set_consultant_versions({1: "c2", 3: "c3"})
+    assert await repository.get_tender_versions() == {10: "t2"}
+    assert await repository.get_consultant_versions() == {1: "c2", 3: "c3"}
+
+    await repository.delete_tender_scores(10)
+    await repository.delete_consultant_scores(3)
+    assert await repository.get_tender_versions() == {}
+    assert await repository.get_consultant_versions() == {1: "c2"}
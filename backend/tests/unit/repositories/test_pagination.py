@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.repositories.consultant_repository import SQLAlchemyConsultantRepository
+from app.adapters.repositories.pagination import apply_keyset, paginate, encode_cursor, decode_cursor
+from app.infrastructure.database.models import (
+    Base, Company, Consultant, ConsultantSkill, ConsultantStatus, Skill, Tender
+)
+
+@pytest.fixture
+def db_session():
+    """Crée une base SQLite en mémoire avec des consultants créés au même instant par paquets."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    session.add_all([Company(id=1, name="ESN A"), Company(id=2, name="ESN B"), Skill(id=1, name="Python")])
+    base = datetime(2025, 1, 1)
+    for i in range(1, 26):
+        session.add(Consultant(
+            id=i, company_id=1 if i % 5 else 2, title=f"Consultant {i}",
+            # Des dates identiques pour vérifier le départage par id
+            created_at=base + timedelta(minutes=i // 3),
+            status=ConsultantStatus.QUALIFIED if i % 2 else ConsultantStatus.MISSION
+        ))
+        if i % 3 == 0:
+            session.add(ConsultantSkill(consultant_id=i, skill_id=1))
+    session.add_all([
+        Tender(id=i, title=f"AO {i}", company_id=1, created_at=base + timedelta(minutes=i % 4))
+        for i in range(1, 11)
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+@pytest.fixture
+def repository(db_session):
+    """Crée un repository de consultants."""
+    return SQLAlchemyConsultantRepository(db_session)
+
+async def walk(repository, **filters):
+    """Parcourt toutes les pages en suivant les curseurs."""
+    ids, cursor, pages = [], None, 0
+    while True:
+        consultants, cursor = await repository.get_page(cursor=cursor, limit=4, **filters)
+        ids.extend(c.id for c in consultants)
+        pages += 1
+        if not cursor:
+            return ids, pages
+
+@pytest.mark.asyncio
+async def test_cursor_walk_returns_every_row_once(repository):
+    """
+    Le parcours par curseur retourne chaque consultant une seule fois, dans l'ordre (created_at, id).
+    """
+    ids, pages = await walk(repository)
+    assert ids == sorted(range(1, 26), key=lambda i: (i // 3, i))
+    assert pages == 7
+
+@pytest.mark.asyncio
+async def test_filters_are_applied_in_sql(repository):
+    """
+    Les filtres entreprise, compétence et disponibilité sont combinés à la pagination.
+    """
+    ids, _ = await walk(repository, company_id=2)
+    assert sorted(ids) == [5, 10, 15, 20, 25]
+
+    ids, _ = await walk(repository, skill_id=1)
+    assert sorted(ids) == [3, 6, 9, 12, 15, 18, 21, 24]
+
+    ids, _ = await walk(repository, availability=True, company_id=1)
+    assert sorted(ids) == [i for i in range(1, 26) if i % 2 and i % 5]
+
+@pytest.mark.asyncio
+async def test_skip_without_cursor_and_invalid_cursor(repository):
+    """
+    Sans curseur, skip reste supporté ; un curseur invalide est rejeté (400).
+    """
+    first_page, _ = await repository.get_page(limit=25)
+    skipped, _ = await repository.get_page(skip=10, limit=5)
+    assert [c.id for c in skipped] == [c.id for c in first_page[10:15]]
+
+    with pytest.raises(HTTPException) as excinfo:
+        await repository.get_page(cursor="pas-un-curseur")
+    assert excinfo.value.status_code == 400
+
+def test_paginate_generic_model(db_session):
+    """
+    Le helper de pagination fonctionne sur les autres modèles (appels d'offres).
+    """
+    rows, cursor = paginate(db_session.query(Tender), Tender, limit=6)
+    more, last_cursor = paginate(db_session.query(Tender), Tender, cursor=cursor, limit=6)
+    assert len(rows) == 6 and len(more) == 4 and last_cursor is None
+    assert {t.id for t in rows + more} == set(range(1, 11))
+
+def test_backfilled_rows_come_last_exactly_once(db_session):
+    """
+    Les lignes sans date, datées au même instant par la migration 012, sont parcourues
+    une seule fois, après les autres et par id, quelle que soit la page.
+    """
+    db_session.add_all([Tender(id=i, title=f"AO {i}", company_id=1) for i in range(11, 15)])
+    db_session.flush()
+    db_session.query(Tender).filter(Tender.id.in_([3, 11, 12, 13, 14])).update(
+        {Tender.created_at: datetime(2026, 1, 1)}, synchronize_session=False
+    )
+    db_session.commit()
+
+    ids, cursor = [], None
+    while True:
+        rows, cursor = paginate(db_session.query(Tender), Tender, cursor=cursor, limit=3)
+        ids.extend(t.id for t in rows)
+        if not cursor:
+            break
+
+    assert len(ids) == len(set(ids)) == 14
+    assert ids[-5:] == [3, 11, 12, 13, 14]
+
+def test_cursor_round_trip():
+    """
+    Un curseur encode la position (created_at, id) de façon opaque et réversible.
+    """
+    created_at = datetime(2025, 4, 1, 12, 30)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+def test_cursor_is_a_row_value_comparison(db_session):
+    """
+    La condition de curseur est une comparaison de ligne (created_at, id) > (...), sans OR.
+    """
+    cursor = encode_cursor(datetime(2025, 1, 1), 3)
+    sql = str(apply_keyset(db_session.query(Tender), Tender, cursor=cursor).statement.compile())
+    assert "(tenders.created_at, tenders.id) > (" in sql
+    assert " OR " not in sql
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.repositories.rag_document_repository import (
+    SQLAlchemyRAGDocumentRepository,
+    decode_embedding,
+    encode_embedding,
+)
+from app.infrastructure.database.models import Base, RAGChunk
+
+@pytest.fixture
+def db_session():
+    """Crée une base SQLite en mémoire avec les tables du RAG."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def repository(db_session):
+    return SQLAlchemyRAGDocumentRepository(db_session)
+
+def make_chunks(document_id, vectors):
+    return [
+        {"chunk_id": f"{document_id}:{i}", "content": f"chunk {i}", "chunk_index": i, "token_count": 2,
+         "embedding": vector}
+        for i, vector in enumerate(vectors)
+    ]
+
+def test_embedding_bytes_are_raw_and_decoded_without_copy():
+    """
+    Un vecteur float32 occupe 4 octets par composante et se relit sans copie ; float16 en occupe 2.
+    """
+    vector = np.linspace(-1, 1, 64, dtype=np.float32)
+
+    data, dtype = encode_embedding(vector, "float32")
+    decoded = decode_embedding(data, dtype)
+    assert len(data) == 64 * 4
+    assert np.array_equal(decoded, vector)
+    assert not decoded.flags.writeable and not decoded.flags.owndata
+
+    data, dtype = encode_embedding(vector, "float16")
+    assert len(data) == 64 * 2
+    assert np.allclose(decode_embedding(data, dtype), vector, atol=1e-3)
+
+@pytest.mark.asyncio
+async def test_chunk_vectors_are_stored_as_binary(repository, db_session):
+    """
+    Les vecteurs passés avec les chunks sont enregistrés en binaire et relus par identifiant.
+    """
+    vectors = np.random.default_rng(0).normal(size=(3, 16)).astype(np.float32)
+    await repository.replace_document("doc-1", "cv", "cv.txt", "texte", {}, make_chunks("doc-1", vectors))
+
+    row = db_session.query(RAGChunk).filter(RAGChunk.chunk_id == "doc-1:1").one()
+    assert isinstance(row.embedding, bytes) and row.embedding_dtype == "float32"
+
+    embeddings = await repository.get_chunk_embeddings(["doc-1:0", "doc-1:2", "inconnu"])
+    assert set(embeddings) == {"doc-1:0", "doc-1:2"}
+    assert np.array_equal(embeddings["doc-1:2"], vectors[2])
+
+@pytest.mark.asyncio
+async def test_load_embeddings_streams_into_one_matrix(repository):
+    """
+    Le chargement en masse remplit une matrice float32 par lots, filtrable par type de document.
+    """
+    rng = np.random.default_rng(1)
+    cv_vectors = rng.normal(size=(7, 8)).astype(np.float32)
+    tender_vectors = rng.normal(size=(2, 8)).astype(np.float16)
+    await repository.replace_document("cv-1", "cv", "cv.txt", "texte", {}, make_chunks("cv-1", cv_vectors))
+    await repository.replace_document("ao-1", "tender", "ao.txt", "texte", {}, make_chunks("ao-1", tender_vectors))
+
+    chunk_ids, matrix = await repository.load_embeddings(batch_size=3)
+    assert matrix.shape == (9, 8) and matrix.dtype == np.float32
+    assert chunk_ids[:7] == [f"cv-1:{i}" for i in range(7)]
+    assert np.array_equal(matrix[:7], cv_vectors)
+
+    chunk_ids, matrix = await repository.load_embeddings("tender", batch_size=3)
+    assert chunk_ids == ["ao-1:0", "ao-1:1"]
+    assert np.allclose(matrix, tender_vectors.astype(np.float32), atol=1e-3)
+
+    assert (await repository.load_embeddings("portfolio"))[1].shape == (0, 0)
@@ -0,0 +1,336 @@
+import asyncio
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.adapters.repositories.cv_analysis_job_repository import SQLAlchemyCVAnalysisJobRepository
+from app.adapters.services.cv_analysis_worker import CVAnalysisWorkerPool
+from app.api.v1 import cv_analysis
+from app.core.entities.cv_analysis_job import CVAnalysisJobStatus, CVAnalyzer
+from app.infrastructure.database.models import Base, WorkflowExecution
+
+
+class InMemoryStorage:
+    """Stockage objet en mémoire."""
+
+    def __init__(self):
+        self.objects = {}
+
+    async def upload_file(self, object_name, file_data, content_type):
+        self.objects[object_name] = file_data
+        return object_name
+
+    async def download_file(self, object_name):
+        return self.objects[object_name]
+
+
+class StubAnalysisService:
+    """Service d'analyse renvoyant le contenu du fichier comme nom du candidat."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+
+    async def analyze_pdf(self, content):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("PDF illisible")
+        return {"personal_info": {"name": content.decode()}, "skills": [{"name": "Python"}]}
+
+    async def analyze_docx(self, content):
+        return await self.analyze_pdf(content)
+
+
+class SlowAnalysisService(StubAnalysisService):
+    """Service d'analyse qui met `delay` secondes à répondre."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    async def analyze_pdf(self, content):
+        await asyncio.sleep(self.delay)
+        return await super().analyze_pdf(content)
+
+
+class StubAgentService:
+    """Agent IA maison : extraction puis analyse des compétences."""
+
+    def __init__(self):
+        self.extracted = []
+
+    async def extract_cv_data(self, file_content, file_name):
+        self.extracted.append(file_name)
+        return {"personal_info": {"name": file_content.decode()}, "skills": ["Python"]}
+
+    async def analyze_skills(self, cv_data):
+        return {"skills_count": len(cv_data["skills"])}
+
+
+@pytest.fixture
+def session_factory():
+    """Base SQLite en mémoire partagée entre les sessions de l'API et des workers."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def storage():
+    return InMemoryStorage()
+
+
+async def create_job(session_factory, storage, name, queued=True, analyzer=CVAnalyzer.ENHANCED):
+    storage.objects[f"cv/{name}.pdf"] = name.encode()
+    db = session_factory()
+    try:
+        return await SQLAlchemyCVAnalysisJobRepository(db).create(
+            file_name=f"{name}.pdf", file_type="pdf", file_size=len(name),
+            object_name=f"cv/{name}.pdf", queued=queued, analyzer=analyzer
+        )
+    finally:
+        db.close()
+
+
+async def get_job(session_factory, job_id):
+    db = session_factory()
+    try:
+        return await SQLAlchemyCVAnalysisJobRepository(db).get(job_id)
+    finally:
+        db.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_processes_queued_jobs_in_order(session_factory, storage):
+    """
+    Les jobs en file sont analysés et leur résultat persisté ; les CV simplement déposés restent en attente.
+    """
+    first = await create_job(session_factory, storage, "alice")
+    second = await create_job(session_factory, storage, "bob")
+    uploaded = await create_job(session_factory, storage, "carol", queued=False)
+    pool = CVAnalysisWorkerPool(session_factory, storage, StubAnalysisService(), worker_id="test")
+
+    assert await pool.run_until_empty() == 2
+
+    job = await get_job(session_factory, first.id)
+    assert job.status == CVAnalysisJobStatus.ANALYZED
+    assert job.progress == 100
+    assert job.result["name"] == "alice"
+    assert (await get_job(session_factory, second.id)).result["name"] == "bob"
+    assert (await get_job(session_factory, uploaded.id)).status == CVAnalysisJobStatus.UPLOADED
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_then_marked_as_error(session_factory, storage):
+    """
+    Un échec remet le job en file jusqu'à max_attempts, puis le passe en erreur.
+    """
+    job = await create_job(session_factory, storage, "alice")
+    analysis_service = StubAnalysisService(failures=5)
+    pool = CVAnalysisWorkerPool(session_factory, storage, analysis_service, max_attempts=2, worker_id="test")
+
+    assert await pool.run_until_empty() == 2
+
+    job = await get_job(session_factory, job.id)
+    assert job.status == CVAnalysisJobStatus.ERROR
+    assert job.attempts == 2
+    assert "PDF illisible" in job.error_message
+
+
+@pytest.mark.asyncio
+async def test_concurrent_workers_never_share_a_job(session_factory, storage):
+    """
+    Des workers concurrents traitent chaque job exactement une fois.
+    """
+    for i in range(6):
+        await create_job(session_factory, storage, f"cv{i}")
+    analysis_service = StubAnalysisService()
+    pool = CVAnalysisWorkerPool(session_factory, storage, analysis_service, concurrency=3, worker_id="test")
+
+    await asyncio.gather(*(pool.run_until_empty() for _ in range(3)))
+
+    assert analysis_service.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_stale_running_job_is_requeued(session_factory, storage):
+    """
+    Un job réservé par un worker qui ne donne plus signe de vie est remis en file.
+    """
+    job = await create_job(session_factory, storage, "alice")
+    db = session_factory()
+    claimed = await SQLAlchemyCVAnalysisJobRepository(db).claim_next("worker-disparu")
+    db.query(WorkflowExecution).filter(WorkflowExecution.id == claimed.id).update(
+        {"heartbeat_at": datetime.now(timezone.utc) - timedelta(hours=1)}
+    )
+    db.commit()
+    db.close()
+
+    pool = CVAnalysisWorkerPool(session_factory, storage, StubAnalysisService(), lease_timeout=60, worker_id="test")
+
+    assert await pool.requeue_stale() == 1
+    assert await pool.run_until_empty() == 1
+    assert (await get_job(session_factory, job.id)).status == CVAnalysisJobStatus.ANALYZED
+
+
+@pytest.mark.asyncio
+async def test_stale_job_is_failed_after_max_attempts(session_factory, storage):
+    """
+    Un job abandonné max_attempts fois (worker planté à chaque essai) passe en erreur au lieu de boucler.
+    """
+    job = await create_job(session_factory, storage, "alice")
+    db = session_factory()
+    repository = SQLAlchemyCVAnalysisJobRepository(db)
+    for _ in range(2):
+        await repository.claim_next("worker-disparu")
+        db.query(WorkflowExecution).filter(WorkflowExecution.id == job.id).update(
+            {"heartbeat_at": datetime.now(timezone.utc) - timedelta(hours=1)}
+        )
+        db.commit()
+        await repository.requeue_stale(lease_timeout=60, max_attempts=2)
+    db.close()
+
+    job = await get_job(session_factory, job.id)
+    assert job.status == CVAnalysisJobStatus.ERROR
+    assert job.attempts == 2
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_long_analysis_keeps_its_lease(session_factory, storage):
+    """
+    Le signe de vie est rafraîchi pendant l'analyse : un CV long à analyser n'est pas repris par un autre worker.
+    """
+    job = await create_job(session_factory, storage, "alice")
+    pool = CVAnalysisWorkerPool(session_factory, storage, SlowAnalysisService(delay=1.0),
+                                lease_timeout=0.6, worker_id="test")
+
+    processing = asyncio.create_task(pool.process_next())
+    await asyncio.sleep(0.8)
+    requeued = await pool.requeue_stale()
+    await processing
+
+    assert requeued == 0
+    assert (await get_job(session_factory, job.id)).status == CVAnalysisJobStatus.ANALYZED
+
+
+@pytest.mark.asyncio
+async def test_worker_that_lost_its_lease_does_not_overwrite_the_job(session_factory, storage):
+    """
+    Un worker dont le job a été repris puis réservé par un autre (bail expiré) n'écrase
+    ni son résultat ni son état, que son analyse aboutisse ou échoue.
+    """
+    job = await create_job(session_factory, storage, "alice")
+    db = session_factory()
+    repository = SQLAlchemyCVAnalysisJobRepository(db)
+    await repository.claim_next("worker-lent")
+    db.query(WorkflowExecution).filter(WorkflowExecution.id == job.id).update(
+        {"heartbeat_at": datetime.now(timezone.utc) - timedelta(hours=1)}
+    )
+    db.commit()
+    await repository.requeue_stale(lease_timeout=60, max_attempts=3)
+    await repository.claim_next("autre-worker")
+
+    assert not await repository.complete(job.id, {"name": "périmé"}, worker_id="worker-lent")
+    assert not await repository.fail(job.id, "erreur périmée", max_attempts=3, worker_id="worker-lent")
+    current = await repository.get(job.id)
+    assert current.status == CVAnalysisJobStatus.ANALYZING
+    assert current.result is None and current.error_message is None and current.attempts == 2
+
+    assert await repository.complete(job.id, {"name": "alice"}, worker_id="autre-worker")
+    db.close()
+    assert (await get_job(session_factory, job.id)).result == {"name": "alice"}
+
+
+@pytest.mark.asyncio
+async def test_pool_ignores_the_result_of_a_lost_lease(session_factory, storage):
+    """
+    Le pool termine le job au nom du worker qui l'a réservé : repris entre-temps, il reste à son nouveau worker.
+    """
+    job = await create_job(session_factory, storage, "alice")
+    pool = CVAnalysisWorkerPool(session_factory, storage, SlowAnalysisService(delay=0.3), worker_id="lent")
+
+    processing = asyncio.create_task(pool.process_next())
+    await asyncio.sleep(0.1)
+    db = session_factory()
+    db.query(WorkflowExecution).filter(WorkflowExecution.id == job.id).update({"worker_id": "autre-worker"})
+    db.commit()
+    db.close()
+
+    assert await processing
+    job = await get_job(session_factory, job.id)
+    assert job.status == CVAnalysisJobStatus.ANALYZING
+    assert job.result is None
+
+
+@pytest.mark.asyncio
+async def test_agent_jobs_are_analyzed_by_the_agent(session_factory, storage):
+    """
+    Les jobs déposés pour l'agent IA maison passent par son extraction et son analyse des compétences.
+    """
+    job = await create_job(session_factory, storage, "alice", analyzer=CVAnalyzer.AGENT)
+    analysis_service = StubAnalysisService()
+    agent_service = StubAgentService()
+    pool = CVAnalysisWorkerPool(session_factory, storage, analysis_service, agent_service=agent_service,
+                                worker_id="test")
+
+    assert await pool.run_until_empty() == 1
+
+    job = await get_job(session_factory, job.id)
+    assert job.analyzer == CVAnalyzer.AGENT
+    assert job.result["name"] == "alice"
+    assert job.result["skills_analysis"] == {"skills_count": 1}
+    assert agent_service.extracted == ["alice.pdf"]
+    assert analysis_service.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_text_cvs_are_accepted_for_the_agent_only(session_factory, storage):
+    """
+    Un CV en texte brut est accepté pour l'agent IA maison (/api/v1/n8n/cv-analysis) et analysé
+    par lui ; le service d'analyse de CV le refuse (400).
+    """
+    db = session_factory()
+    repository = SQLAlchemyCVAnalysisJobRepository(db)
+    with pytest.raises(HTTPException) as exc_info:
+        await cv_analysis.store_cv_file(UploadFile(io.BytesIO(b"alice"), filename="alice.txt"),
+                                        repository, storage, queued=True)
+    assert exc_info.value.status_code == 400
+    assert "PDF, DOCX et DOC" in exc_info.value.detail
+
+    job = await cv_analysis.store_cv_file(
+        UploadFile(io.BytesIO(b"alice"), filename="alice.txt"), repository, storage, queued=True,
+        analyzer=CVAnalyzer.AGENT, extensions=cv_analysis.AGENT_CV_EXTENSIONS
+    )
+    db.close()
+    assert job.file_type == "txt"
+
+    agent_service = StubAgentService()
+    pool = CVAnalysisWorkerPool(session_factory, storage, StubAnalysisService(), agent_service=agent_service,
+                                worker_id="test")
+    assert await pool.run_until_empty() == 1
+    assert agent_service.extracted == ["alice.txt"]
+    assert (await get_job(session_factory, job.id)).result["name"] == "alice"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_analyses(session_factory, storage, monkeypatch):
+    """
+    Au-delà de CV_JOB_MAX_QUEUED jobs en attente, les nouvelles analyses sont refusées (503).
+    """
+    monkeypatch.setattr(cv_analysis.settings, "CV_JOB_MAX_QUEUED", 2)
+    await create_job(session_factory, storage, "alice")
+    await create_job(session_factory, storage, "bob")
+
+    db = session_factory()
+    with pytest.raises(HTTPException) as exc_info:
+        await cv_analysis._ensure_queue_capacity(SQLAlchemyCVAnalysisJobRepository(db))
+    db.close()
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers["Retry-After"]
@@ -0,0 +1,41 @@
+import copy
+
+from app.adapters.services.document_text import iter_text_blocks
+from benchmarks.cv_parsing.corpus import generate_cv
+from benchmarks.cv_parsing.runner import ENHANCED_STAGES, compare, run_benchmark, skill_scores
+
+
+def test_synthetic_cv_is_deterministic_in_every_format():
+    """
+    Même graine, même CV ; le texte extrait du PDF et du DOCX contient les compétences étiquetées.
+    """
+    assert generate_cv(7, "pdf").content == generate_cv(7, "pdf").content
+    for file_type in ("pdf", "docx", "txt"):
+        cv = generate_cv(7, file_type, language="en", skill_density=6)
+        text = "\n".join(iter_text_blocks(cv.content, file_type))
+        assert len(cv.skills) == 6
+        assert all(skill in text for skill in cv.skills)
+
+
+def test_report_covers_stages_accuracy_and_regressions():
+    """
+    Le rapport JSON détaille chaque étape et la qualité ; une baisse de rappel est une régression.
+    """
+    report = run_benchmark(count=6, services=("enhanced", "basic"), memory_sample=2)
+
+    enhanced = report["services"]["enhanced"]
+    assert set(enhanced["stages"]) == set(ENHANCED_STAGES)
+    assert enhanced["cvs"] == 6
+    assert enhanced["stages"]["extract"]["peak_rss_bytes"] > 0
+    assert enhanced["accuracy"]["synthetic"]["recall"] > report["services"]["basic"]["accuracy"]["synthetic"]["recall"]
+
+    assert compare(report, report) == []
+    baseline = copy.deepcopy(report)
+    baseline["services"]["enhanced"]["accuracy"]["gold"]["recall"] = 1.01
+    assert compare(report, baseline) == [f"enhanced: rappel gold {enhanced['accuracy']['gold']['recall']} (référence 1.01)"]
+
+
+def test_skill_scores_are_micro_averaged():
+    scores = skill_scores([{"python", "java"}, {"go"}], [{"python"}, {"go", "rust"}])
+
+    assert scores == {"precision": 0.6667, "recall": 0.6667, "f1": 0.6667}
@@ -0,0 +1,93 @@
+import asyncio
+import io
+import time
+import zipfile
+
+import pytest
+from pypdf import PdfWriter
+
+from app.adapters.services.cv_parsing_executor import CVDocumentRejected, CVParsingExecutor
+from app.adapters.services.enhanced_cv_analysis_service import EnhancedCVAnalysisService
+
+
+def make_pdf(pages):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=595, height=842)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def make_docx(lines):
+    """DOCX minimal : un paragraphe par ligne."""
+    paragraphs = "".join(f"<w:p><w:r><w:t>{line}</w:t></w:r></w:p>" for line in lines)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{paragraphs}</w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def slow_task(delay):
+    time.sleep(delay)
+    return delay
+
+
+@pytest.fixture
+def executor():
+    executor = CVParsingExecutor(max_workers=2, timeout=10, max_pages=3, max_bytes=100_000)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_docx_is_parsed_in_worker_process(executor):
+    """
+    Le texte d'un DOCX est extrait et analysé dans le pool, et le service renvoie le résultat réel.
+    """
+    content = make_docx(["Jane Smith", "jane.smith@example.com", "Python, Docker et PostgreSQL"])
+
+    text, cv_data = await executor.parse(content, "docx")
+
+    assert "Jane Smith" in text
+    assert cv_data["personal_info"]["email"] == "jane.smith@example.com"
+    assert {"python", "docker"} <= {skill["name"].lower() for skill in cv_data["skills"]}
+
+    service = EnhancedCVAnalysisService(parsing_executor=executor)
+    assert (await service.analyze_docx(content))["personal_info"]["email"] == "jane.smith@example.com"
+
+
+@pytest.mark.asyncio
+async def test_oversized_documents_are_rejected(executor):
+    """
+    Les documents au-delà de max_pages ou max_bytes sont refusés, sans résultat de substitution.
+    """
+    text, _ = await executor.parse(make_pdf(3), "pdf")
+    assert text.strip() == ""
+
+    with pytest.raises(CVDocumentRejected, match="4 pages"):
+        await executor.parse(make_pdf(4), "pdf")
+    with pytest.raises(CVDocumentRejected, match="octets"):
+        await executor.parse(b"x" * 100_001, "pdf")
+
+    service = EnhancedCVAnalysisService(parsing_executor=executor)
+    with pytest.raises(CVDocumentRejected):
+        await service.analyze_pdf(make_pdf(4))
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_task_and_pool_recovers(executor):
+    """
+    Une tâche qui dépasse son délai est interrompue et le pool reste utilisable.
+    """
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.run(slow_task, 30, timeout=0.5)
+    assert time.monotonic() - started < 5
+
+    assert await executor.run(slow_task, 0) == 0
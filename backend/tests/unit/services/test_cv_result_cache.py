@@ -0,0 +1,195 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1 import cv_analysis
+from app.adapters.repositories.cv_analysis_job_repository import SQLAlchemyCVAnalysisJobRepository
+from app.adapters.services import agent_ia_maison_service
+from app.adapters.services.agent_ia_maison_service import AgentIAMaisonService
+from app.adapters.services.cv_analysis_worker import CVAnalysisWorkerPool
+from app.adapters.services.cv_result_cache import CVResultCache
+from app.adapters.services.enhanced_cv_analysis_service import EnhancedCVAnalysisService, get_cv_analysis_service
+from app.core.entities.cv_analysis_job import CVAnalyzer
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.session import get_db
+from app.infrastructure.storage.minio_client import get_minio_client
+
+
+class FakeRedis:
+    """Redis en mémoire partagé entre plusieurs caches (processus)."""
+
+    def __init__(self, available=True):
+        self.available = available
+        self.values = {}
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        if not self.available:
+            raise ConnectionError("Redis indisponible")
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.calls += 1
+        if not self.available:
+            raise ConnectionError("Redis indisponible")
+        self.values[key] = value.encode()
+
+
+class CountingExecutor:
+    """Exécuteur d'analyse comptant les documents réellement analysés."""
+
+    def __init__(self):
+        self.calls = 0
+        self.version = "1"
+
+    async def parser_version(self):
+        return self.version
+
+    async def parse(self, content, file_type):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return content.decode(), {"personal_info": {"name": content.decode()}, "skills": []}
+
+
+class CountingN8nService:
+    """Service n8n comptant les exécutions par workflow."""
+
+    def __init__(self):
+        self.executions = []
+
+    async def execute_workflow(self, workflow_id, data):
+        self.executions.append(workflow_id)
+        return {"personal_info": {"name": data["file_name"]}, "skills": [{"name": "Python"}]}
+
+
+@pytest.mark.asyncio
+async def test_two_tiers_share_results_between_processes():
+    """
+    Un résultat calculé dans un processus est retrouvé par un autre via Redis ; le LRU local est borné.
+    """
+    redis = FakeRedis()
+    first = CVResultCache(max_entries=2, redis_client=redis)
+    second = CVResultCache(max_entries=2, redis_client=redis)
+    key = CVResultCache.key("enhanced-pdf", "1", b"alice")
+
+    await first.set(key, {"name": "alice"})
+    result = await second.get(key)
+    result["name"] = "modifié"
+
+    assert await second.get(key) == {"name": "alice"}
+    for name in ("bob", "carol"):
+        await second.set(CVResultCache.key("enhanced-pdf", "1", name.encode()), {"name": name})
+    assert second._get_local(key) is None
+    assert key != CVResultCache.key("enhanced-pdf", "2", b"alice")
+
+
+@pytest.mark.asyncio
+async def test_unavailable_redis_falls_back_to_local_tier():
+    """
+    Si Redis est indisponible, le cache local reste utilisé et Redis n'est plus sollicité un moment.
+    """
+    redis = FakeRedis(available=False)
+    cache = CVResultCache(redis_client=redis, redis_retry_interval=60)
+    key = CVResultCache.key("enhanced-pdf", "1", b"alice")
+
+    await cache.set(key, {"name": "alice"})
+
+    assert await cache.get(key) == {"name": "alice"}
+    assert await cache.get(CVResultCache.key("enhanced-pdf", "1", b"bob")) is None
+    assert redis.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_cvs_are_analyzed_once_per_parser_version():
+    """
+    Un même CV n'est analysé qu'une fois, y compris pour des envois simultanés ; une nouvelle version l'analyse à nouveau.
+    """
+    executor = CountingExecutor()
+    service = EnhancedCVAnalysisService(parsing_executor=executor, result_cache=CVResultCache(redis_enabled=False))
+
+    results = await asyncio.gather(*(service.analyze_pdf(b"alice") for _ in range(3)))
+    assert await service.analyze_pdf(b"alice") == results[0]
+    assert executor.calls == 1
+    assert (await service.get_cached_analysis(b"alice", "pdf"))["personal_info"]["name"] == "alice"
+
+    executor.version = "2"
+    assert await service.get_cached_analysis(b"alice", "pdf") is None
+    await service.analyze_pdf(b"alice")
+    assert executor.calls == 2
+
+
+def test_upload_analyze_returns_cached_result_without_queueing():
+    """
+    Un CV déjà analysé est renvoyé immédiatement par /upload-analyze, sans attendre un worker.
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    executor = CountingExecutor()
+    service = EnhancedCVAnalysisService(parsing_executor=executor, result_cache=CVResultCache(redis_enabled=False))
+    asyncio.run(service.analyze_pdf(b"alice"))
+
+    class Storage:
+        async def upload_file(self, object_name, file_data, content_type):
+            return object_name
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(cv_analysis.router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_minio_client] = Storage
+    app.dependency_overrides[get_cv_analysis_service] = lambda: service
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/v1/cv-analysis/upload-analyze",
+        files={"file": ("alice.pdf", io.BytesIO(b"alice"), "application/pdf")}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["candidate"]["name"] == "alice"
+    assert executor.calls == 1
+    assert client.get(f"/api/v1/cv-analysis/status/{response.json()['fileId']}").json()["status"] == "analyzed"
+
+
+@pytest.mark.asyncio
+async def test_agent_jobs_reuse_cached_extractions(monkeypatch):
+    """
+    Les CV mis en file pour l'agent IA maison passent par son cache : un même fichier n'est extrait qu'une fois.
+    """
+    monkeypatch.setattr(agent_ia_maison_service.settings, "N8N_CV_EXTRACTION_WORKFLOW_ID", "cv-extraction")
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    n8n_service = CountingN8nService()
+    agent = AgentIAMaisonService(n8n_service, rag_service=None, result_cache=CVResultCache(redis_enabled=False))
+
+    class Storage:
+        async def download_file(self, object_name):
+            return b"alice"
+
+    db = session_factory()
+    for name in ("alice.pdf", "alice-copie.pdf"):
+        await SQLAlchemyCVAnalysisJobRepository(db).create(
+            file_name=name, file_type="pdf", file_size=5, object_name=f"cv/{name}",
+            queued=True, analyzer=CVAnalyzer.AGENT
+        )
+    db.close()
+    pool = CVAnalysisWorkerPool(session_factory, Storage(), EnhancedCVAnalysisService(), agent_service=agent,
+                                worker_id="test")
+
+    assert await pool.run_until_empty() == 2
+    assert n8n_service.executions.count("cv-extraction") == 1
@@ -0,0 +1,64 @@
+from app.adapters.services.cv_segmenter import BLANK, DATES, YEAR, segment_cv
+from app.adapters.services.enhanced_cv_analysis_service import EnhancedCVAnalysisService
+
+CV_TEXT = """Jean Dupont
+Paris, France | jean.dupont@example.com | 06 12 34 56 78
+
+EXPÉRIENCE PROFESSIONNELLE
+Développeur Python Senior
+TechCorp, Lyon
+Janvier 2020 - Présent
+Conception d'APIs FastAPI
+
+Développeur Java
+WebAgency, Paris
+Mars 2016 - Décembre 2019
+
+FORMATION
+Master en Informatique
+Université de Lyon
+2014 - 2016
+
+COMPÉTENCES
+Python (5 ans), Docker
+"""
+
+
+def test_lines_are_labelled_in_one_pass():
+    """
+    Chaque ligne reçoit sa section et son type d'entité ; les coordonnées sont relevées au passage.
+    """
+    segmentation = segment_cv(CV_TEXT)
+
+    labels = [(line.section, line.kind) for line in segmentation.lines if line.kind != BLANK]
+    assert labels[0] == (None, "text")
+    assert ("experience", DATES) in labels
+    assert ("education", YEAR) in labels
+    assert [len(block) for block in segmentation.blocks("experience")] == [4, 3]
+    assert segmentation.entities["email"] == "jean.dupont@example.com"
+    assert segmentation.entities["location_header"] == "Paris, France"
+
+
+def test_extractors_share_the_segmentation():
+    """
+    Expériences, formation et informations personnelles sont lues depuis le même découpage.
+    """
+    service = EnhancedCVAnalysisService()
+
+    cv_data = service._parse_cv_text(CV_TEXT)
+
+    assert [exp["title"] for exp in cv_data["experience"]] == ["Développeur Python Senior", "Développeur Java"]
+    assert cv_data["experience"][0]["location"] == "Lyon"
+    assert cv_data["experience"][0]["end_date"] == "Présent"
+    assert cv_data["experience"][0]["description"] == "Conception d'APIs FastAPI"
+    assert cv_data["experience"][1]["start_date"] == "Mars 2016"
+    assert cv_data["education"] == [
+        {"degree": "Master en Informatique", "institution": "Université de Lyon", "year": 2016}
+    ]
+    assert cv_data["personal_info"] == {
+        "name": "Jean Dupont",
+        "email": "jean.dupont@example.com",
+        "phone": "06 12 34 56 78",
+        "location": "Paris, France",
+    }
+    assert {skill["name"] for skill in cv_data["skills"]} >= {"Python", "Docker"}
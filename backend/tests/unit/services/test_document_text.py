@@ -0,0 +1,89 @@
+import io
+import zipfile
+
+import pytest
+from pypdf import PageObject, PdfWriter
+
+from app.adapters.services.document_text import (
+    CVDocumentRejected, iter_docx_paragraphs, iter_pdf_pages, iter_plain_text, iter_section_lines, iter_text_blocks
+)
+
+
+def make_pdf(pages):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=595, height=842)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def make_docx(paragraphs):
+    body = "".join(f"<w:p><w:r>{runs}</w:r></w:p>" for runs in paragraphs)
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def test_pdf_pages_are_extracted_lazily(monkeypatch):
+    """
+    Seules les pages consommées sont décodées ; max_pages tronque ou refuse selon strict.
+    """
+    extracted = []
+    monkeypatch.setattr(PageObject, "extract_text", lambda page, *args, **kwargs: extracted.append(1) or "page")
+    content = make_pdf(200)
+
+    pages = iter_pdf_pages(content)
+    assert [next(pages), next(pages)] == ["page", "page"]
+    assert len(extracted) == 2
+
+    assert len(list(iter_pdf_pages(content, max_pages=5))) == 5
+    with pytest.raises(CVDocumentRejected):
+        next(iter_pdf_pages(content, max_pages=5, strict=True))
+
+
+def test_docx_paragraphs_are_streamed():
+    """
+    Un paragraphe par bloc, tabulations et sauts de ligne conservés.
+    """
+    content = make_docx(["<w:t>Jean Dupont</w:t>", "<w:t>Python</w:t><w:tab/><w:t>5 ans</w:t>", "<w:t>a</w:t><w:br/><w:t>b</w:t>"])
+
+    assert list(iter_docx_paragraphs(content)) == ["Jean Dupont", "Python\t5 ans", "a\nb"]
+    with pytest.raises(CVDocumentRejected):
+        list(iter_docx_paragraphs(b"pas un zip"))
+
+
+def test_plain_text_keeps_characters_split_between_blocks():
+    """
+    Un caractère multi-octets à cheval sur deux blocs est conservé.
+    """
+    content = ("a" * 3 + "é\nPython\nDéveloppeur").encode("utf-8")
+
+    assert list(iter_plain_text(content, block_size=4)) == ["aaaé", "Python", "Développeur"]
+
+
+def test_sections_are_detected_incrementally():
+    """
+    Les lignes sont étiquetées au fil des blocs et l'appelant peut s'arrêter avant la fin.
+    """
+    consumed = []
+
+    def blocks():
+        for block in ["Jean Dupont\nEXPÉRIENCE PROFESSIONNELLE\nDéveloppeur", "FORMATION\nMaster", "COMPÉTENCES :\nPython"]:
+            consumed.append(block)
+            yield block
+
+    lines = []
+    for section, line in iter_section_lines(blocks()):
+        lines.append((section, line))
+        if section == "education":
+            break
+
+    assert lines == [(None, "Jean Dupont"), ("experience", "Développeur"), ("education", "Master")]
+    assert len(consumed) == 2
+    assert list(iter_section_lines(iter_text_blocks("Compétences\nGo\n".encode(), "txt"))) == [("skills", "Go")]
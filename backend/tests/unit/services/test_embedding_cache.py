@@ -0,0 +1,77 @@
+import asyncio
+
+import numpy as np
+
+from app.adapters.services.embedding_cache import CachedEmbeddingService, EmbeddingCache, embedding_key
+from app.adapters.services.embedding_service import HashedNgramEmbeddingService
+
+
+class CountingEmbeddingService(HashedNgramEmbeddingService):
+    """Embeddings hachés qui comptent les textes réellement encodés."""
+
+    def __init__(self, dimension=64):
+        super().__init__(dimension=dimension, pool="thread")
+        self.encoded = []
+
+    async def embed_many(self, texts):
+        self.encoded.extend(texts)
+        return await super().embed_many(texts)
+
+
+def test_keys_depend_on_model_and_normalized_text():
+    """
+    Deux textes qui ne diffèrent que par la casse ou les espaces partagent une clé, pas deux modèles.
+    """
+    assert embedding_key("m1", "Python  Django") == embedding_key("m1", " python django")
+    assert embedding_key("m1", "Python") != embedding_key("m2", "Python")
+
+
+def test_cached_service_encodes_each_text_once():
+    """
+    Les textes répétés (dans un lot ou entre appels) ne sont encodés qu'une fois, avec les mêmes vecteurs.
+    """
+    inner = CountingEmbeddingService()
+    service = CachedEmbeddingService(inner, EmbeddingCache(max_bytes=1 << 20, directory=""))
+
+    first = asyncio.run(service.embed_many(["Java", "SQL", "java"]))
+    second = asyncio.run(service.embed_many(["SQL", "Kotlin"]))
+
+    assert inner.encoded == ["Java", "SQL", "Kotlin"]
+    assert np.array_equal(first[0], first[2])
+    assert np.array_equal(first[1], second[0])
+    stats = service.cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 4)
+
+
+def test_local_tier_respects_byte_budget():
+    """
+    Le LRU évince les entrées les plus anciennes au-delà de son budget en octets.
+    """
+    cache = EmbeddingCache(max_bytes=3 * (64 * 4 + 200), directory="")
+    cache.set_many([(bytes([i]) * 32, np.full(64, i, dtype=np.float32)) for i in range(5)])
+
+    assert cache.get_many([bytes([0]) * 32])[0] is None
+    assert cache.get_many([bytes([4]) * 32])[0][0] == 4
+    stats = cache.stats()
+    assert stats["entries"] == 3 and stats["evictions"] == 2 and stats["bytes"] <= stats["max_bytes"]
+
+
+def test_persistent_tier_is_shared_across_instances(tmp_path):
+    """
+    Un second cache sur le même répertoire (autre processus, redémarrage) relit les vecteurs sans copie.
+    """
+    writer = EmbeddingCache(directory=str(tmp_path))
+    vectors = np.random.default_rng(0).normal(size=(3, 16)).astype(np.float32)
+    keys = [embedding_key("m", f"texte {i}") for i in range(3)]
+    writer.set_many(list(zip(keys, vectors)))
+    writer.set_many([(embedding_key("m", "float16"), vectors[0].astype(np.float16))])
+
+    reader = EmbeddingCache(directory=str(tmp_path))
+    found = reader.get_many(keys + [embedding_key("m", "absent")])
+
+    assert all(np.array_equal(vector, expected) for vector, expected in zip(found[:3], vectors))
+    assert found[3] is None and not found[0].flags.writeable
+    assert reader.get_many([embedding_key("m", "float16")])[0].dtype == np.float16
+    assert reader.stats()["persistent_hits"] == 4
+    reader.close()
+    writer.close()
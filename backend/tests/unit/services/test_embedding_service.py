@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+import numpy as np
+
+from app.adapters.services.embedding_service import (
+    HashedNgramEmbeddingService, PooledEmbeddingService, SentenceTransformerEmbeddingService,
+    hashed_ngram_vectors
+)
+from app.adapters.services.rag_service import VectorRAGService
+from app.adapters.services.vector_store import LocalVectorStore
+
+
+def test_hashed_embeddings_are_deterministic_and_similarity_preserving():
+    """
+    Même texte, même vecteur (indépendamment de la casse) ; les textes proches ont un cosinus plus élevé.
+    """
+    vectors = hashed_ngram_vectors(
+        ["Développeur Python FastAPI", "développeur  python fastapi", "Ingénieur Python FastAPI", "Comptable SAP FICO"],
+        dimension=256,
+    )
+
+    assert vectors.shape == (4, 256)
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-5)
+    assert np.array_equal(vectors[0], vectors[1])
+    assert vectors[0] @ vectors[2] > vectors[0] @ vectors[3]
+
+
+def test_embed_many_batches_across_the_pool():
+    """
+    Les lots répartis sur le pool donnent les mêmes vecteurs qu'un calcul direct, en float16 si demandé.
+    """
+    service = HashedNgramEmbeddingService(dimension=128, dtype="float16", batch_size=3, workers=2, pool="thread")
+    texts = [f"consultant {i} java spring" for i in range(10)]
+    try:
+        vectors = asyncio.run(service.embed_many(texts))
+    finally:
+        service.shutdown()
+
+    assert vectors.dtype == np.float16
+    assert np.array_equal(vectors, hashed_ngram_vectors(texts, 128, "float16"))
+    assert service.model_id == "hashed-ngram-v1-128-float16"
+    assert HashedNgramEmbeddingService(dimension=128, dtype="float32").model_id != service.model_id
+
+
+def test_single_batch_is_computed_off_the_event_loop():
+    """
+    Même un lot unique est calculé dans le pool, pas dans le thread de la boucle d'événements.
+    """
+    threads = []
+
+    class RecordingEmbeddingService(PooledEmbeddingService):
+        model_id = "recording"
+
+        def _encode(self, texts):
+            threads.append(threading.get_ident())
+            return np.zeros((len(texts), self.dimension), dtype=self.dtype)
+
+        def _batch_call(self):
+            return self._encode, ()
+
+    service = RecordingEmbeddingService(dimension=8, workers=1)
+    try:
+        asyncio.run(service.embed_many(["un seul texte"]))
+    finally:
+        service.shutdown()
+
+    assert threads and threads[0] != threading.get_ident()
+
+
+def test_rag_service_does_not_load_the_model_on_construction():
+    """
+    Construire le service RAG ne charge pas le modèle d'embedding : il l'est au premier calcul.
+    """
+    embedding_service = SentenceTransformerEmbeddingService(model_path="/modele/absent")
+
+    VectorRAGService(vector_db_client=LocalVectorStore(persistent=False), embedding_service=embedding_service)
+
+    assert embedding_service._model is None
+
+
+def test_rag_query_retrieves_the_matching_document():
+    """
+    Avec des embeddings déterministes, la requête retrouve le document qui en parle.
+    """
+    rag = VectorRAGService(
+        vector_db_client=LocalVectorStore(persistent=False),
+        embedding_service=HashedNgramEmbeddingService(dimension=512, pool="thread"),
+    )
+
+    async def scenario():
+        for name, text in [("sap.txt", "Consultant SAP FICO certifié"), ("qa.txt", "Testeur ISTQB automatisation"),
+                           ("dev.txt", "Développeur React TypeScript")]:
+            await rag.index_document(text.encode(), name, "cv", {})
+        return await rag.query("certification ISTQB", top_k=1)
+
+    results = asyncio.run(scenario())
+
+    assert results[0]["metadata"]["filename"] == "qa.txt"
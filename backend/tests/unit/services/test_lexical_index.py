@@ -0,0 +1,100 @@
+import asyncio
+
+import numpy as np
+
+from app.adapters.services.embedding_service import HashedNgramEmbeddingService
+from app.adapters.services.lexical_index import LexicalIndex, reciprocal_rank_fusion, tokenize
+from app.adapters.services.rag_service import VectorRAGService
+from app.adapters.services.vector_store import LocalVectorStore, VectorCollection
+
+TEXTS = [
+    "Consultant SAP FICO, clôtures comptables et reporting financier.",
+    "Testeur certifié ISTQB, automatisation Selenium et Cypress.",
+    "Développeur C++ et C#, applications temps réel.",
+    "Développeur Node.js, API REST et microservices SAP.",
+]
+
+
+def test_tokenize_keeps_technology_names():
+    """
+    Les noms du type c++, c# ou node.js restent des termes entiers ; la ponctuation finale est ignorée.
+    """
+    assert tokenize("Développeur C++ et C#, Node.js.") == ["développeur", "c++", "et", "c#", "node.js"]
+
+
+def test_bm25_ranks_rare_exact_terms_and_respects_alive_mask():
+    """
+    Le chunk contenant le terme rare arrive en tête ; une ligne supprimée ou hors filtre n'est plus renvoyée.
+    """
+    index = LexicalIndex()
+    for row, text in enumerate(TEXTS):
+        index.add(row, text)
+    alive = np.ones(len(TEXTS), dtype=bool)
+
+    rows, scores = index.search("SAP FICO", alive, limit=5)
+    assert rows.tolist() == [0, 3]
+    assert scores[0] > scores[1] > 0
+
+    alive[0] = False
+    assert index.search("SAP FICO", alive, limit=5)[0].tolist() == [3]
+    assert index.search("SAP", alive, limit=5, candidates=np.array([1, 2]))[0].tolist() == []
+    assert index.search("inconnu", alive, limit=5)[0].tolist() == []
+
+
+def test_collection_text_search_follows_vector_writes(tmp_path):
+    """
+    L'index lexical suit les ajouts, remplacements et suppressions, y compris après rechargement.
+    """
+    rng = np.random.default_rng(0)
+    collection = VectorCollection("chunks", tmp_path / "chunks")
+    collection.add([
+        {"id": f"c{i}", "embedding": rng.normal(size=8), "metadata": {"team": i % 2}, "content": text}
+        for i, text in enumerate(TEXTS)
+    ])
+    assert [hit["id"] for hit in collection.search_text("ISTQB")] == ["c1"]
+
+    collection.add([{"id": "c4", "embedding": rng.normal(size=8), "metadata": {"team": 0}, "content": "Audit ISTQB"}])
+    collection.delete(["c1"])
+    assert [hit["id"] for hit in collection.search_text("ISTQB")] == ["c4"]
+    assert [hit["id"] for hit in collection.search_text("SAP", filters={"team": 1})] == ["c3"]
+    collection.close()
+
+    reloaded = VectorCollection("chunks", tmp_path / "chunks")
+    assert [hit["id"] for hit in reloaded.search_text("ISTQB")] == ["c4"]
+    reloaded.close()
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    """
+    Un résultat présent dans les deux classements passe devant ceux qui n'en ont qu'un.
+    """
+    fused = reciprocal_rank_fusion([
+        [{"id": "a"}, {"id": "b"}],
+        [{"id": "c"}, {"id": "b"}],
+    ], k=60)
+
+    assert [result["id"] for result in fused] == ["b", "a", "c"]
+    assert fused[0]["ranks"] == [2, 2]
+    assert fused[1]["ranks"] == [1, None]
+
+
+def test_hybrid_query_finds_exact_certification():
+    """
+    La requête hybride fait remonter le chunk qui cite exactement la certification demandée.
+    """
+    service = VectorRAGService(
+        vector_db_client=LocalVectorStore(persistent=False),
+        embedding_service=HashedNgramEmbeddingService(dimension=256, pool="thread")
+    )
+    service.vector_k = service.lexical_k = 2
+
+    async def scenario():
+        ids = [
+            await service.index_document(text.encode("utf-8"), f"cv{i}.txt", "cv", {})
+            for i, text in enumerate(TEXTS)
+        ]
+        results = await service.query("profil ISTQB", {"document_type": "cv"}, top_k=2)
+        return ids, results
+
+    ids, results = asyncio.run(scenario())
+    assert results[0]["document_id"] == ids[1]
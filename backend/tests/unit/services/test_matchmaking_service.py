@@ -0,0 +1,338 @@
+import random
+import pytest
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.adapters.services.batch_match_scorer import consultant_scoring_version, tender_scoring_version
+from app.adapters.services.matchmaking_service import DefaultMatchmakingService
+from app.adapters.services.skill_index import SkillInvertedIndex, skill_pairs_version
+
+STATUSES = ["available", "partially_available", "unavailable", "on_mission", "qualified", None]
+LOCATIONS = ["Paris", "paris", "Lyon", "Nantes", None]
+IMPORTANCES = ["required", "preferred", "nice_to_have", "unknown"]
+
+def make_consultant(rng, consultant_id):
+    """Génère un consultant aléatoire couvrant toutes les branches du calcul de score."""
+    skills = [
+        {"skill_id": skill_id, "level": rng.choice([1, 2, 3, 4, 5, 7, "expert", "beginner"])}
+        for skill_id in rng.sample(range(1, 15), rng.randint(0, 6))
+    ]
+    return SimpleNamespace(
+        id=consultant_id,
+        company_id=rng.choice([1, 2]),
+        skills=skills,
+        experience_years=rng.choice([None, 0, 1, 2, 3, 4, 5, 8]),
+        location=rng.choice(LOCATIONS),
+        remote_work=rng.choice([True, False]),
+        max_travel_distance=rng.choice([None, 0, 50]),
+        availability_status=rng.choice(STATUSES),
+        availability_date=rng.choice([None, date(2024, 1, 1), date(2024, 12, 1)])
+    )
+
+def make_tender(rng, tender_id, remote_work=False):
+    """Génère un appel d'offres aléatoire."""
+    return SimpleNamespace(
+        id=tender_id,
+        company_id=1,
+        skills=[
+            {"skill_id": skill_id, "importance": rng.choice(IMPORTANCES)}
+            for skill_id in rng.sample(range(1, 15), rng.randint(1, 5))
+        ],
+        location="Paris",
+        remote_work=remote_work,
+        start_date=date(2024, 6, 1)
+    )
+
+def skill_pairs(consultants):
+    """Couples (skill_id, consultant_id) de consultant_skills."""
+    return [(skill["skill_id"], c.id) for c in consultants for skill in c.skills]
+
+def make_service(consultants, tender, skill_index=None):
+    """Crée le service de matchmaking avec des repositories mockés."""
+    by_id = {consultant.id: consultant for consultant in consultants}
+    consultant_repository = AsyncMock()
+    consultant_repository.get_all.return_value = consultants
+    consultant_repository.get_by_company_id.side_effect = lambda company_id: [
+        c for c in consultants if c.company_id == company_id
+    ]
+    consultant_repository.get_by_id.side_effect = lambda consultant_id: by_id.get(consultant_id)
+    consultant_repository.get_by_ids.side_effect = lambda consultant_ids: [by_id[i] for i in consultant_ids]
+    consultant_repository.get_skill_pairs.return_value = skill_pairs(consultants)
+    consultant_repository.get_skill_pairs_version.return_value = "v1"
+    tender_repository = AsyncMock()
+    tender_repository.get_by_id.return_value = tender
+    return DefaultMatchmakingService(consultant_repository, tender_repository, AsyncMock(), skill_index=skill_index)
+
+async def reference_matches(service, consultants, tender, min_score):
+    """Résultat attendu calculé paire par paire avec calculate_match_score."""
+    matches = []
+    for consultant in consultants:
+        score = await service.calculate_match_score(consultant.id, tender.id)
+        if score >= min_score:
+            matches.append((consultant.id, score))
+    matches.sort(key=lambda x: x[1], reverse=True)
+    return matches
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed,remote_work", [(1, False), (2, True), (3, False)])
+async def test_find_matches_for_tender_identical_to_pairwise_scoring(seed, remote_work):
+    """
+    Le scoring vectorisé doit produire exactement les mêmes scores et le même ordre
+    que le calcul paire par paire.
+    """
+    rng = random.Random(seed)
+    consultants = [make_consultant(rng, i) for i in range(1, 301)]
+    tender = make_tender(rng, 42, remote_work=remote_work)
+    service = make_service(consultants, tender)
+
+    for min_score in (0.0, 0.35, 0.6):
+        expected = await reference_matches(service, consultants, tender, min_score)
+        matches = await service.find_matches_for_tender(tender.id, min_score=min_score)
+
+        assert [(m["consultant"].id, m["score"]) for m in matches] == expected
+        assert all(m["tender"] is tender for m in matches)
+
+    # Le référentiel d'appels d'offres n'est interrogé qu'une fois par recherche
+    service.tender_repository.get_by_id.reset_mock()
+    await service.find_matches_for_tender(tender.id)
+    assert service.tender_repository.get_by_id.await_count == 1
+
+@pytest.mark.asyncio
+async def test_find_matches_for_tender_top_k():
+    """
+    Avec limit, seuls les k meilleurs résultats sont retournés, dans l'ordre du classement complet.
+    """
+    rng = random.Random(7)
+    consultants = [make_consultant(rng, i) for i in range(1, 201)]
+    tender = make_tender(rng, 1)
+    service = make_service(consultants, tender)
+
+    full = await service.find_matches_for_tender(tender.id, min_score=0.0)
+    top = await service.find_matches_for_tender(tender.id, min_score=0.0, limit=10)
+
+    assert [(m["consultant"].id, m["score"]) for m in top] == \
+        [(m["consultant"].id, m["score"]) for m in full[:10]]
+    assert await service.find_matches_for_tender(tender.id, limit=0) == []
+
+@pytest.mark.asyncio
+async def test_find_matches_for_tender_company_filter_and_missing_tender():
+    """
+    Vérifie le filtrage par entreprise et le cas d'un appel d'offres inexistant.
+    """
+    rng = random.Random(11)
+    consultants = [make_consultant(rng, i) for i in range(1, 51)]
+    tender = make_tender(rng, 1)
+    service = make_service(consultants, tender)
+
+    matches = await service.find_matches_for_tender(tender.id, min_score=0.0, include_partner_consultants=False)
+    assert matches
+    assert all(m["consultant"].company_id == tender.company_id for m in matches)
+
+    service.tender_repository.get_by_id.return_value = None
+    assert await service.find_matches_for_tender(999) == []
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("include_partner_consultants", [True, False])
+async def test_find_matches_for_tender_with_skill_index(include_partner_consultants):
+    """
+    L'index inversé ne doit évaluer que les candidats pouvant atteindre min_score,
+    sans changer le résultat.
+    """
+    rng = random.Random(5)
+    consultants = [make_consultant(rng, i) for i in range(1, 401)]
+    tender = make_tender(rng, 3)
+    reference_service = make_service(consultants, tender)
+    service = make_service(consultants, tender, skill_index=SkillInvertedIndex())
+
+    for min_score in (0.3, 0.6, 0.75):
+        expected = await reference_service.find_matches_for_tender(
+            tender.id, min_score=min_score, include_partner_consultants=include_partner_consultants
+        )
+        matches = await service.find_matches_for_tender(
+            tender.id, min_score=min_score, include_partner_consultants=include_partner_consultants
+        )
+        assert sorted((m["consultant"].id, m["score"]) for m in matches) == \
+            sorted((m["consultant"].id, m["score"]) for m in expected)
+
+    # L'index est construit une seule fois tant que consultant_skills ne change pas
+    assert service.consultant_repository.get_skill_pairs.await_count == 1
+    if include_partner_consultants:
+        # Au-dessus du score maximal sans compétence, les consultants sans compétence commune ne sont pas chargés
+        loaded = service.consultant_repository.get_by_ids.call_args.args[0]
+        tender_skill_ids = {skill["skill_id"] for skill in tender.skills}
+        assert len(loaded) < len(consultants)
+        assert all(
+            tender_skill_ids & {skill["skill_id"] for skill in consultants[i - 1].skills}
+            for i in loaded
+        )
+
+@pytest.mark.asyncio
+async def test_skill_index_follows_writes_from_other_processes():
+    """
+    Une compétence ajoutée hors de ce processus (empreinte modifiée) est vue dès la recherche suivante ;
+    si l'empreinte est illisible, aucun consultant n'est écarté.
+    """
+    rng = random.Random(11)
+    consultants = [make_consultant(rng, i) for i in range(1, 41)]
+    tender = make_tender(rng, 4)
+    service = make_service(consultants, tender, skill_index=SkillInvertedIndex(refresh_interval=0))
+    repository = service.consultant_repository
+    await service.find_matches_for_tender(tender.id, min_score=0.75)
+
+    newcomer = consultants[0]
+    newcomer.skills = [{"skill_id": skill["skill_id"], "level": 5} for skill in tender.skills]
+    newcomer.availability_status, newcomer.experience_years, newcomer.remote_work = "available", 10, True
+    repository.get_skill_pairs.return_value = skill_pairs(consultants)
+    repository.get_skill_pairs_version.return_value = "v2"
+    matches = await service.find_matches_for_tender(tender.id, min_score=0.75)
+    assert newcomer.id in {m["consultant"].id for m in matches}
+    assert repository.get_skill_pairs.await_count == 2
+
+    repository.get_skill_pairs_version.side_effect = RuntimeError("base indisponible")
+    repository.get_all.reset_mock()
+    await service.find_matches_for_tender(tender.id, min_score=0.75)
+    repository.get_all.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_skill_index_applies_writes_from_this_process():
+    """
+    Une compétence modifiée par ce processus est appliquée à l'index sans relire consultant_skills,
+    et l'empreinte vérifiée ensuite ne provoque pas de rechargement.
+    """
+    rng = random.Random(23)
+    consultants = [make_consultant(rng, i) for i in range(1, 41)]
+    tender = make_tender(rng, 4)
+    index = SkillInvertedIndex(refresh_interval=0)
+    service = make_service(consultants, tender, skill_index=index)
+    repository = service.consultant_repository
+    repository.get_skill_pairs.return_value = skill_pairs(consultants)
+    repository.get_skill_pairs_version.return_value = skill_pairs_version(skill_pairs(consultants))
+    await service.find_matches_for_tender(tender.id, min_score=0.75)
+
+    newcomer = consultants[0]
+    newcomer.skills = [{"skill_id": skill["skill_id"], "level": 5} for skill in tender.skills]
+    newcomer.availability_status, newcomer.experience_years, newcomer.remote_work = "available", 10, True
+    repository.get_skill_pairs_version.return_value = skill_pairs_version(skill_pairs(consultants))
+    await service.refresh_consultant_scores(newcomer.id)
+    assert index.version == skill_pairs_version(skill_pairs(consultants))
+
+    matches = await service.find_matches_for_tender(tender.id, min_score=0.75)
+    assert newcomer.id in {m["consultant"].id for m in matches}
+    repository.get_skill_pairs.assert_awaited_once()
+
+def test_score_tenders_matches_score_for_each_tender():
+    """
+    Le calcul vectorisé d'une ligne donne exactement le score de chaque paire.
+    """
+    rng = random.Random(29)
+    tenders = [make_tender(rng, i, remote_work=rng.choice([True, False])) for i in range(1, 31)]
+    tenders[0].skills = []
+    tenders[1].skills = tenders[1].skills + [{"skill_id": tenders[1].skills[0]["skill_id"], "importance": "preferred"}]
+    tenders[2].location, tenders[3].start_date = None, None
+    service = make_service([], tenders[0])
+
+    for consultant_id in range(1, 61):
+        consultant = make_consultant(rng, consultant_id)
+        row = service.batch_scorer.score_tenders(consultant, tenders)
+        expected = [service.batch_scorer.score(tender, [consultant])[0] for tender in tenders]
+        assert row.tolist() == expected
+
+@pytest.mark.asyncio
+async def test_refresh_scores_and_indexed_reads():
+    """
+    Le recalcul d'une colonne ou d'une ligne écrit les mêmes scores que le calcul unitaire avec
+    la version de l'appel d'offres ou du consultant, et les lectures n'interrogent que la matrice.
+    """
+    rng = random.Random(13)
+    consultants = [make_consultant(rng, i) for i in range(1, 21)]
+    tender = make_tender(rng, 7)
+    service = make_service(consultants, tender)
+    service.tender_repository.get_all.return_value = [tender]
+    score_repository = AsyncMock()
+    service.match_score_repository = score_repository
+
+    assert await service.refresh_tender_scores(tender.id) == len(consultants)
+    tender_id, scores = score_repository.replace_tender_scores.call_args.args
+    assert tender_id == tender.id
+    assert score_repository.replace_tender_scores.call_args.kwargs == {"version": tender_scoring_version(tender)}
+    for consultant in consultants:
+        assert scores.get(consultant.id, 0.0) == await service.calculate_match_score(consultant.id, tender.id)
+
+    await service.refresh_consultant_scores(5)
+    consultant_id, scores = score_repository.replace_consultant_scores.call_args.args
+    assert consultant_id == 5
+    assert scores == {tender.id: await service.calculate_match_score(5, tender.id)}
+    assert score_repository.replace_consultant_scores.call_args.kwargs == {
+        "version": consultant_scoring_version(consultants[4])
+    }
+
+    service.consultant_repository.reset_mock()
+    service.tender_repository.reset_mock()
+    score_repository.get_top_for_company.return_value = [(3, tender.id, 0.91), (1, tender.id, 0.8)]
+    score_repository.get_top_for_tender.return_value = [(3, 0.91)]
+    matches = await service.suggest_top_matches(company_id=1, limit=2)
+    score_repository.get_top_for_company.assert_awaited_once_with(1, min_score=0.7, limit=2)
+    assert [(m["consultant"].id, m["tender"].id, m["score"]) for m in matches] == \
+        [(3, tender.id, 0.91), (1, tender.id, 0.8)]
+    matches = await service.get_stored_matches_for_tender(tender.id)
+    assert [(m["consultant"].id, m["score"]) for m in matches] == [(3, 0.91)]
+    service.consultant_repository.get_all.assert_not_awaited()
+    service.tender_repository.get_all.assert_not_awaited()
+    score_repository.get_tender_versions.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_refresh_stale_scores_recomputes_only_changed_rows_and_columns():
+    """
+    Matrice vide : reconstruction colonne par colonne, lignes marquées sans second calcul ;
+    ensuite seuls le consultant et l'appel d'offres modifiés sont recalculés.
+    """
+    rng = random.Random(19)
+    consultants = [make_consultant(rng, i) for i in range(1, 21)]
+    tenders = [make_tender(rng, i) for i in range(1, 6)]
+    service = make_service(consultants, tenders[0])
+    service.tender_repository.get_all.return_value = tenders
+    score_repository = AsyncMock()
+    score_repository.get_consultant_versions.return_value = {}
+    score_repository.get_tender_versions.return_value = {}
+    service.match_score_repository = score_repository
+
+    assert await service.refresh_stale_scores() == len(consultants) + len(tenders)
+    assert score_repository.replace_tender_scores.await_count == len(tenders)
+    score_repository.replace_consultant_scores.assert_not_awaited()
+    consultant_versions = score_repository.set_consultant_versions.call_args.args[0]
+    assert consultant_versions == {c.id: consultant_scoring_version(c) for c in consultants}
+
+    score_repository.reset_mock()
+    score_repository.get_consultant_versions.return_value = consultant_versions
+    score_repository.get_tender_versions.return_value = {t.id: tender_scoring_version(t) for t in tenders}
+    assert await service.refresh_stale_scores() == 0
+
+    consultants[3].skills = consultants[3].skills + [{"skill_id": 99, "level": 4}]
+    tenders[2].remote_work = not tenders[2].remote_work
+    assert await service.refresh_stale_scores() == 2
+    assert [c.args[0] for c in score_repository.replace_tender_scores.call_args_list] == [tenders[2].id]
+    assert [c.args[0] for c in score_repository.replace_consultant_scores.call_args_list] == [consultants[3].id]
+    score_repository.set_consultant_versions.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_suggest_top_matches_without_score_table_deduplicates_pairs():
+    """
+    Sans matrice des scores, chaque paire consultant / appel d'offres n'apparaît qu'une fois.
+    """
+    rng = random.Random(17)
+    consultants = [make_consultant(rng, i) for i in range(1, 31)]
+    for consultant in consultants:
+        consultant.availability_status = "available"
+        consultant.experience_years = 8
+    tender = make_tender(rng, 9, remote_work=True)
+    for consultant in consultants:
+        consultant.remote_work = True
+        consultant.skills = [{"skill_id": skill["skill_id"], "level": 5} for skill in tender.skills]
+    service = make_service(consultants, tender)
+    service.tender_repository.get_all.return_value = [tender]
+    service.tender_repository.get_by_company_id.return_value = [tender]
+
+    matches = await service.suggest_top_matches(company_id=1, limit=100)
+    pairs = [(m["consultant"].id, m["tender"].id) for m in matches]
+    assert len(pairs) == len(set(pairs)) == len(consultants)
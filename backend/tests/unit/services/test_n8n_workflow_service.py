@@ -0,0 +1,182 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+from app.adapters.n8n.http_client import N8nHttpClient
+from app.adapters.n8n.workflow_service import N8nWorkflowService
+
+
+class StubN8nServer(ThreadingHTTPServer):
+    """Serveur n8n local : réponses programmables par chemin, comptage des connexions et requêtes."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubN8nHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # chemin -> liste de (statut, corps, délai) consommée à chaque appel ; le dernier élément est conservé
+        self.responses = {}
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def next_response(self, path):
+        with self.lock:
+            queue = self.responses.get(path, [(200, {}, 0)])
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+
+class StubN8nHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        path = self.path.split("?")[0]
+        with self.server.lock:
+            self.server.requests.append((self.command, path, body, self.headers.get("X-N8N-API-KEY")))
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+
+        status_code, payload, delay = self.server.next_response(path)
+        time.sleep(delay)
+        data = json.dumps(payload).encode()
+
+        with self.server.lock:
+            self.server.in_flight -= 1
+        try:
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+@pytest.fixture
+def n8n_server():
+    """Démarre le serveur n8n de test dans un thread."""
+    server = StubN8nServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest_asyncio.fixture
+async def http_client(n8n_server):
+    """Client HTTP n8n pointant vers le serveur de test, sans attente entre les reprises."""
+    client = N8nHttpClient(
+        base_url=n8n_server.url, headers={"X-N8N-API-KEY": "test-key"},
+        read_timeout=2, max_concurrency=2, max_retries=2, retry_backoff=0
+    )
+    yield client
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_calls_reuse_pooled_connection(n8n_server, http_client):
+    """
+    Les appels successifs réutilisent la même connexion keep-alive et portent la clé d'API.
+    """
+    n8n_server.responses["/api/v1/workflows"] = [(200, [{"id": "1"}], 0)]
+    service = N8nWorkflowService(http_client)
+
+    for _ in range(5):
+        assert await service.get_workflows() == [{"id": "1"}]
+
+    assert n8n_server.connections == 1
+    assert all(api_key == "test-key" for *_, api_key in n8n_server.requests)
+
+
+@pytest.mark.asyncio
+async def test_idempotent_call_is_retried_on_transient_status(n8n_server, http_client):
+    """
+    Un GET en 503 est rejoué jusqu'au succès.
+    """
+    n8n_server.responses["/api/v1/executions/42"] = [(503, {}, 0), (503, {}, 0), (200, {"id": "42"}, 0)]
+    service = N8nWorkflowService(http_client)
+
+    assert await service.get_execution("42") == {"id": "42"}
+    assert len(n8n_server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_workflow_execution_is_not_retried(n8n_server, http_client):
+    """
+    L'exécution d'un workflow (POST non idempotent) n'est jamais rejouée.
+    """
+    n8n_server.responses["/api/v1/workflows/7/execute"] = [(503, {}, 0), (200, {"ok": True}, 0)]
+    service = N8nWorkflowService(http_client)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.execute_workflow("7", {"cv": "x"})
+
+    assert exc_info.value.status_code == 500
+    assert n8n_server.requests == [("POST", "/api/v1/workflows/7/execute", {"data": {"cv": "x"}}, "test-key")]
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_reported_as_connection_error(n8n_server):
+    """
+    Un n8n trop lent déclenche le délai du client au lieu de bloquer, et l'erreur est convertie.
+    """
+    n8n_server.responses["/api/v1/workflows/slow"] = [(200, {}, 1)]
+    client = N8nHttpClient(base_url=n8n_server.url, headers={}, read_timeout=0.2, max_retries=0)
+    service = N8nWorkflowService(client)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_workflow("slow")
+
+    assert "Erreur de connexion à n8n" in exc_info.value.detail
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded(n8n_server, http_client):
+    """
+    Le nombre de requêtes simultanées vers n8n ne dépasse pas max_concurrency.
+    """
+    n8n_server.responses["/api/v1/workflows"] = [(200, [], 0.05)]
+    service = N8nWorkflowService(http_client)
+
+    await asyncio.gather(*(service.get_workflows() for _ in range(8)))
+
+    assert len(n8n_server.requests) == 8
+    assert n8n_server.max_in_flight <= 2
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    """
+    Le délai de reprise est aléatoire dans [0, min(max, base * 2^tentative)].
+    """
+    client = N8nHttpClient(base_url="http://n8n", headers={}, retry_backoff=0.5, retry_max_backoff=2)
+
+    delays = [client.backoff_delay(attempt) for attempt in range(6) for _ in range(20)]
+
+    assert all(0 <= delay <= 2 for delay in delays)
+    assert all(client.backoff_delay(0) <= 0.5 for _ in range(20))
+    assert len(set(delays)) > 1
@@ -0,0 +1,186 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.repositories.rag_document_repository import SQLAlchemyRAGDocumentRepository
+from app.adapters.services.embedding_service import HashedNgramEmbeddingService
+from app.adapters.services.rag_service import VectorRAGService
+from app.adapters.services.text_chunker import chunk_text, count_tokens
+from app.adapters.services.vector_store import LocalVectorStore
+from app.infrastructure.database.models import Base, DocumentType, RAGChunk, RAGDocument
+
+CV_TEXT = "\n".join(
+    f"Mission {i} : développement d'une plateforme Python et FastAPI pour le client {i}."
+    for i in range(40)
+) + "\nCompétences : Kubernetes, PostgreSQL, Terraform."
+
+@pytest.fixture
+def db_session():
+    """Crée une base SQLite en mémoire avec les tables du RAG."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def rag_service(db_session):
+    """Service RAG sur un index vectoriel en mémoire et des embeddings hachés."""
+    service = VectorRAGService(
+        vector_db_client=LocalVectorStore(persistent=False),
+        embedding_service=HashedNgramEmbeddingService(dimension=256, pool="thread"),
+        document_repository=SQLAlchemyRAGDocumentRepository(db_session)
+    )
+    service.chunk_tokens = 40
+    service.chunk_overlap = 8
+    return service
+
+def test_chunks_are_bounded_and_overlap():
+    """
+    Chaque chunk respecte la borne de jetons, coupe en fin de ligne et reprend la fin du précédent.
+    """
+    chunks = chunk_text(CV_TEXT, max_tokens=40, overlap=8)
+
+    assert len(chunks) > 1
+    assert all(chunk.token_count == count_tokens(chunk.content) <= 40 for chunk in chunks)
+    assert all(chunk.content.endswith(".") for chunk in chunks)
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.start < previous.end
+    assert chunks[-1].end == len(CV_TEXT)
+
+@pytest.mark.asyncio
+async def test_index_document_writes_chunk_rows_and_vectors(rag_service, db_session):
+    """
+    L'indexation enregistre le document, ses chunks et leurs vecteurs avec le même nombre de chunks.
+    """
+    document_id = await rag_service.index_document(CV_TEXT.encode("utf-8"), "cv.txt", "cv", {"consultant_id": 7})
+
+    document = db_session.query(RAGDocument).filter(RAGDocument.document_id == document_id).one()
+    rows = db_session.query(RAGChunk).order_by(RAGChunk.chunk_index).all()
+    vectors = await rag_service.vector_db_client.list_documents("cv_embeddings", {"document_id": document_id})
+
+    assert document.chunk_count == len(rows) > 1
+    assert [row.chunk_id for row in rows] == [f"{document_id}:{i}" for i in range(len(rows))]
+    assert sorted(vector["id"] for vector in vectors) == sorted(row.chunk_id for row in rows)
+    assert all(vector["metadata"]["consultant_id"] == 7 for vector in vectors)
+
+@pytest.mark.asyncio
+async def test_reindexing_replaces_chunks_without_duplicates(rag_service, db_session):
+    """
+    Réindexer le même contenu redonne le même identifiant ; un découpage plus grossier supprime les chunks en trop.
+    """
+    content = CV_TEXT.encode("utf-8")
+    first_id = await rag_service.index_document(content, "cv.txt", "cv", {})
+    first_count = db_session.query(RAGChunk).count()
+    assert await rag_service.index_document(content, "cv.txt", "cv", {}) == first_id
+    assert db_session.query(RAGChunk).count() == first_count
+
+    rag_service.chunk_tokens = 400
+    assert await rag_service.index_document(content, "cv.txt", "cv", {}) == first_id
+
+    vectors = await rag_service.vector_db_client.list_documents("cv_embeddings", {"document_id": first_id})
+    assert db_session.query(RAGDocument).count() == 1
+    assert db_session.query(RAGDocument).one().chunk_count == len(vectors) == db_session.query(RAGChunk).count()
+    assert len(vectors) < first_count
+
+@pytest.mark.asyncio
+async def test_query_groups_chunk_hits_by_document(rag_service):
+    """
+    La recherche renvoie un résultat par document, avec ses meilleurs chunks dans l'ordre du texte.
+    """
+    cv_id = await rag_service.index_document(CV_TEXT.encode("utf-8"), "cv.txt", "cv", {})
+    other_id = await rag_service.index_document(
+        "Consultant data : Spark, Airflow et BigQuery.".encode("utf-8"), "data.txt", "cv", {}
+    )
+
+    results = await rag_service.query("plateforme Python FastAPI", {"document_type": "cv"}, top_k=2)
+
+    assert results[0]["document_id"] == cv_id
+    assert len({result["document_id"] for result in results}) == len(results) <= 2
+    assert len(results[0]["chunks"]) == rag_service.chunks_per_document
+    indexes = [chunk["chunk_index"] for chunk in results[0]["chunks"]]
+    assert indexes == sorted(indexes)
+    assert "chunk_index" not in results[0]["metadata"]
+    assert (await rag_service.query("Spark Airflow BigQuery", {"document_type": "cv"}))[0]["document_id"] == other_id
+
+    document = await rag_service.get_document(cv_id)
+    assert document["chunk_count"] > rag_service.chunks_per_document
+    assert await rag_service.delete_document(cv_id)
+    assert await rag_service.get_document(cv_id) is None
+
+class CountingVectorStore(LocalVectorStore):
+    """Base vectorielle en mémoire qui compte les appels par collection."""
+
+    def __init__(self):
+        super().__init__(persistent=False)
+        self.calls = []
+
+    async def list_documents(self, collection_name, filters=None):
+        self.calls.append(("list", collection_name))
+        return await super().list_documents(collection_name, filters)
+
+    async def delete_documents(self, collection_name, filters):
+        self.calls.append(("delete", collection_name))
+        return await super().delete_documents(collection_name, filters)
+
+@pytest.mark.asyncio
+async def test_batch_get_and_delete_use_one_call_per_collection(rag_service):
+    """
+    L'annuaire rag_documents résout la collection de chaque document : un appel par collection concernée.
+    """
+    store = rag_service.vector_db_client = CountingVectorStore()
+    cv_ids = [
+        await rag_service.index_document(f"CV {i} : Python et Django.".encode("utf-8"), f"cv{i}.txt", "cv", {})
+        for i in range(3)
+    ]
+    tender_id = await rag_service.index_document("AO : plateforme data.".encode("utf-8"), "ao.txt", "tender", {})
+    store.calls.clear()
+
+    documents = await rag_service.get_documents(document_ids=[tender_id, *cv_ids, "inconnu"])
+    assert [document["id"] for document in documents] == [tender_id, *cv_ids]
+    assert documents[0]["collection"] == "tender_embeddings"
+    # "inconnu" n'est pas dans l'annuaire : il est cherché dans toutes les collections
+    assert sorted(store.calls) == sorted(("list", name) for name in {*rag_service.collection_names.values(), "general"})
+
+    store.calls.clear()
+    assert await rag_service.get_document(cv_ids[0]) is not None
+    assert store.calls == [("list", "cv_embeddings")]
+
+    store.calls.clear()
+    assert sorted(await rag_service.delete_documents([cv_ids[0], tender_id])) == sorted([cv_ids[0], tender_id])
+    assert sorted(store.calls) == [("delete", "cv_embeddings"), ("delete", "tender_embeddings")]
+    assert await rag_service.get_documents(document_ids=[cv_ids[0], cv_ids[1]]) != []
+    assert await rag_service.document_repository.get_document_types([cv_ids[0], cv_ids[1], tender_id]) == {
+        cv_ids[1]: "cv"
+    }
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("document_type", [document_type.value for document_type in DocumentType] + ["skills"])
+async def test_every_document_type_is_deleted_from_the_collection_it_was_indexed_in(rag_service, db_session,
+                                                                                    document_type):
+    """
+    L'indexation et l'annuaire rag_documents désignent la même collection pour chaque type ("skill" comme "skills").
+    """
+    document_id = await rag_service.index_document(CV_TEXT.encode("utf-8"), "doc.txt", document_type, {})
+    collection_name = rag_service._collection_for(document_type)
+    if document_type in ("skill", "skills"):
+        assert collection_name == "skill_embeddings"
+
+    assert await rag_service.vector_db_client.list_documents(collection_name, {"document_id": document_id})
+    assert await rag_service.delete_document(document_id)
+    assert await rag_service.vector_db_client.list_documents(collection_name, {"document_id": document_id}) == []
+    assert db_session.query(RAGDocument).count() == db_session.query(RAGChunk).count() == 0
+
+@pytest.mark.asyncio
+async def test_rows_are_kept_when_the_vectors_were_not_deleted(rag_service, db_session):
+    """
+    Seules les lignes des documents effectivement supprimés de la base vectorielle sont supprimées.
+    """
+    kept_id = await rag_service.index_document(CV_TEXT.encode("utf-8"), "cv.txt", "cv", {})
+    deleted_id = await rag_service.index_document("AO : plateforme data.".encode("utf-8"), "ao.txt", "tender", {})
+    # Vecteurs du CV déjà absents de la base vectorielle
+    await rag_service.vector_db_client.delete_documents("cv_embeddings", {"document_id": [kept_id]})
+
+    assert await rag_service.delete_documents([kept_id, deleted_id]) == [deleted_id]
+    assert await rag_service.document_repository.get_document_types([kept_id, deleted_id]) == {kept_id: "cv"}
+
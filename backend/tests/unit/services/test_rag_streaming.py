@@ -0,0 +1,142 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.adapters.services import agent_ia_maison_service
+from app.adapters.services.agent_ia_maison_service import AgentIAMaisonService
+from app.adapters.services.embedding_service import HashedNgramEmbeddingService
+from app.adapters.services.rag_service import VectorRAGService
+from app.adapters.services.vector_store import LocalVectorStore
+from app.core.interfaces.llm_service import LLMService
+
+
+class FakeStreamingLLM(LLMService):
+    """LLM qui produit ses tokens un par un et note la fermeture du flux."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.prompts = []
+        self.produced = 0
+        self.closed = False
+
+    async def generate(self, prompt, **params):
+        return {"text": "".join(self.tokens)}
+
+    async def stream(self, prompt, **params):
+        self.prompts.append(prompt)
+        try:
+            for token in self.tokens:
+                self.produced += 1
+                yield token
+        finally:
+            self.closed = True
+
+
+class CountingRAGService(VectorRAGService):
+    """Service RAG qui compte les recherches."""
+
+    queries = 0
+
+    async def query(self, text, filters=None, top_k=5):
+        self.queries += 1
+        return await super().query(text, filters, top_k)
+
+
+def make_service(llm):
+    return CountingRAGService(
+        vector_db_client=LocalVectorStore(persistent=False),
+        llm_service=llm,
+        embedding_service=HashedNgramEmbeddingService(dimension=64, pool="thread")
+    )
+
+
+async def index(service):
+    return await service.index_document(
+        "Consultante Python, certifiée ISTQB.".encode("utf-8"), "cv.txt", "cv", {}
+    )
+
+
+def test_stream_sends_context_before_tokens():
+    """
+    Le contexte arrive en premier, puis chaque token, puis la configuration de génération.
+    """
+    llm = FakeStreamingLLM(["Oui", ", ", "ISTQB."])
+    service = make_service(llm)
+
+    async def scenario():
+        document_id = await index(service)
+        events = [event async for event in service.generate_stream("ISTQB ?", {"document_type": "cv"}, {})]
+        return document_id, events
+
+    document_id, events = asyncio.run(scenario())
+
+    assert [event["event"] for event in events] == ["context", "token", "token", "token", "done"]
+    assert events[0]["data"]["context_documents"][0]["id"] == document_id
+    assert "ISTQB" in events[0]["data"]["context_documents"][0]["content"]
+    assert "".join(event["data"]["text"] for event in events[1:4]) == "Oui, ISTQB."
+    assert events[-1]["data"]["generation_config"]["temperature"] == 0.3
+
+
+def test_closing_the_stream_stops_the_llm():
+    """
+    Fermer le flux (client déconnecté) ferme aussi le flux du LLM sans produire les tokens restants.
+    """
+    llm = FakeStreamingLLM(["a", "b", "c", "d"])
+    service = make_service(llm)
+
+    async def scenario():
+        await index(service)
+        events = service.generate_stream("Python", None, {})
+        received = [await events.__anext__(), await events.__anext__()]
+        await events.aclose()
+        return received
+
+    received = asyncio.run(scenario())
+
+    assert [event["event"] for event in received] == ["context", "token"]
+    assert llm.closed and llm.produced == 1
+
+
+def test_generate_and_knowledge_base_share_the_streaming_path(monkeypatch):
+    """
+    generate garde sa réponse complète ; l'agent n'exécute qu'une recherche pour résultats et génération.
+    """
+    workflows = ("CV_EXTRACTION", "SKILL_ANALYSIS", "CONSULTANT_MATCHING", "PORTFOLIO_GENERATION", "RAG_QUERY")
+    monkeypatch.setattr(agent_ia_maison_service, "settings",
+                        SimpleNamespace(**{f"N8N_{name}_WORKFLOW_ID": name.lower() for name in workflows}))
+    llm = FakeStreamingLLM(["Réponse"])
+    service = make_service(llm)
+    agent = AgentIAMaisonService(n8n_service=None, rag_service=service)
+
+    async def scenario():
+        document_id = await index(service)
+        generation = await service.generate("Python", None, {"temperature": 0.1})
+        service.queries = 0
+        knowledge = await agent.query_knowledge_base("Python")
+        return document_id, generation, knowledge
+
+    document_id, generation, knowledge = asyncio.run(scenario())
+
+    assert generation["generated_text"] == "Réponse"
+    assert generation["context_documents"][0]["id"] == document_id
+    assert set(generation["context_documents"][0]) == {"id", "score"}
+    assert generation["generation_config"]["temperature"] == 0.1
+    assert service.queries == 1
+    assert knowledge["query_results"][0]["id"] == document_id
+    assert knowledge["generation"]["generated_text"] == "Réponse"
+    assert knowledge["generation"]["generation_config"]["temperature"] == 0.2
+
+
+def test_stream_without_llm_still_sends_context():
+    """
+    Sans LLM, les documents de contexte sont transmis avant l'erreur.
+    """
+    service = make_service(None)
+
+    async def scenario():
+        await index(service)
+        return [event async for event in service.generate_stream("Python")]
+
+    events = asyncio.run(scenario())
+
+    assert [event["event"] for event in events] == ["context", "error"]
+    assert asyncio.run(service.generate("Python")) == {"error": "Service LLM non disponible"}
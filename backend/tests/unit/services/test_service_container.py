@@ -0,0 +1,98 @@
+import asyncio
+
+from app.adapters.services import embedding_service as embedding_module
+from app.adapters.services.embedding_cache import CachedEmbeddingService
+from app.adapters.services.embedding_service import HashedNgramEmbeddingService
+from app.adapters.services.service_container import ServiceContainer
+from app.adapters.services.vector_store import LocalVectorStore
+from app.core.interfaces.llm_service import LLMService
+
+
+class EchoLLMService(LLMService):
+    """LLM de test qui compte ses chargements et renvoie le prompt."""
+
+    def __init__(self):
+        self.warm_ups = 0
+        self.closed = False
+
+    async def generate(self, prompt, **params):
+        return {"text": prompt[-20:]}
+
+    async def warm_up(self):
+        self.warm_ups += 1
+
+    def close(self):
+        self.closed = True
+
+
+class ClosableCache:
+    """Cache d'embeddings de test qui note sa fermeture."""
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def make_container():
+    return ServiceContainer(
+        embedding_service=HashedNgramEmbeddingService(dimension=64, pool="thread"),
+        vector_store=LocalVectorStore(persistent=False),
+        llm_service=EchoLLMService()
+    )
+
+
+def test_warm_up_loads_each_component_once_and_reports_ready():
+    """
+    Le warm-up en tâche de fond prépare embeddings, index et LLM, puis la sonde passe à prêt.
+    """
+    container = make_container()
+
+    async def scenario():
+        assert not container.status()["ready"]
+        container.start()
+        container.start()
+        await container._warm_up_task
+        return container.status()
+
+    status = asyncio.run(scenario())
+    assert status["ready"] and status["error"] is None
+    assert set(status["warm_up_seconds"]) == {"embeddings", "vector_store", "llm"}
+    assert container.llm_service.warm_ups == 1
+
+
+def test_request_services_share_the_loaded_components():
+    """
+    Les services RAG par requête réutilisent les modèles et l'index du conteneur.
+    """
+    container = make_container()
+    first, second = container.rag_service_for(db=None), container.rag_service_for(db=None)
+
+    assert first is not second
+    assert first.embedding_service is second.embedding_service is container.embedding_service
+    assert first.vector_db_client is container.vector_store
+    assert first.llm_service is container.llm_service
+
+    asyncio.run(container.close())
+    assert container.llm_service.closed and not container.ready
+
+
+def test_close_releases_the_injected_embedding_service(monkeypatch):
+    """
+    Le conteneur ferme son propre service d'embedding (pool et cache), pas le service partagé du processus.
+    """
+    shared = HashedNgramEmbeddingService(dimension=64, pool="thread")
+    monkeypatch.setattr(embedding_module, "_embedding_service", shared)
+    pooled = HashedNgramEmbeddingService(dimension=64, pool="thread")
+    cache = ClosableCache()
+    container = ServiceContainer(
+        embedding_service=CachedEmbeddingService(pooled, cache),
+        vector_store=LocalVectorStore(persistent=False),
+        llm_service=EchoLLMService()
+    )
+    pooled._get_executor()
+
+    asyncio.run(container.close())
+
+    assert pooled._executor is None and cache.closed
+    assert embedding_module._embedding_service is shared
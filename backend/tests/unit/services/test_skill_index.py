@@ -0,0 +1,66 @@
+import pytest
+
+from app.adapters.services.skill_index import SkillInvertedIndex, skill_pairs_version
+
+@pytest.fixture
+def skill_index():
+    """Crée un index chargé avec quelques compétences."""
+    index = SkillInvertedIndex()
+    index.load([(1, 30), (1, 10), (2, 20), (1, 20), (3, 10), (1, 10)])
+    return index
+
+def test_load_builds_sorted_unique_postings(skill_index):
+    """
+    Les listes sont triées et sans doublon.
+    """
+    assert skill_index.postings(1).tolist() == [10, 20, 30]
+    assert skill_index.postings(2).tolist() == [20]
+    assert skill_index.postings(99).tolist() == []
+
+def test_load_records_version_and_clear_resets_it(skill_index):
+    """
+    L'index garde l'empreinte de consultant_skills correspondant à son chargement.
+    """
+    skill_index.load([(1, 15), (4, 5)], version="v2")
+    assert skill_index.version == "v2"
+    assert skill_index.postings(1).tolist() == [15]
+    assert skill_index.postings(2).tolist() == []
+
+    skill_index.clear()
+    assert not skill_index.is_loaded and skill_index.version is None
+
+def test_weighted_candidates_union(skill_index):
+    """
+    L'union des listes cumule les poids des compétences possédées.
+    """
+    ids, weights = skill_index.weighted_candidates({1: 1.0, 2: 0.7, 5: 0.3})
+    assert ids.tolist() == [10, 20, 30]
+    assert weights.tolist() == pytest.approx([1.0, 1.7, 1.0])
+    assert skill_index.candidates([2, 3]).tolist() == [10, 20]
+
+def test_set_consultant_skills_updates_postings_and_version():
+    """
+    Les écritures de ce processus modifient les seules listes concernées et décalent l'empreinte
+    de l'écart correspondant ; supprimer un consultant le retire de toutes ses listes.
+    """
+    pairs = [(1, 30), (1, 10), (2, 20), (1, 20), (3, 10)]
+    index = SkillInvertedIndex()
+    index.load(pairs, version=skill_pairs_version(pairs))
+
+    index.set_consultant_skills(20, [2, 4])
+    assert index.postings(1).tolist() == [10, 30]
+    assert index.postings(4).tolist() == [20]
+    assert index.version == skill_pairs_version([(1, 30), (1, 10), (2, 20), (4, 20), (3, 10)])
+
+    index.set_consultant_skills(10, [])
+    assert index.postings(3).tolist() == []
+    assert index.candidates([1, 2, 3, 4]).tolist() == [20, 30]
+    assert index.version == skill_pairs_version([(1, 30), (2, 20), (4, 20)])
+
+def test_set_consultant_skills_before_load_is_ignored():
+    """
+    Tant que l'index n'est pas chargé, il n'y a rien à mettre à jour.
+    """
+    index = SkillInvertedIndex()
+    index.set_consultant_skills(1, [1])
+    assert not index.is_loaded and index.postings(1).tolist() == []
@@ -0,0 +1,78 @@
+from app.adapters.services.skill_matcher import AhoCorasick, SkillMatcher
+
+SKILLS = {
+    "python": "programming_language",
+    "java": "programming_language",
+    "javascript": "programming_language",
+    "go": "programming_language",
+    "c++": "programming_language",
+    "ruby": "programming_language",
+    "ruby on rails": "backend_framework",
+    "docker": "devops",
+}
+
+LEVELS = {"beginner": 1, "intermediate": 2, "advanced": 3, "expert": 4}
+
+
+def by_name(skills):
+    return {skill["name"]: skill for skill in skills}
+
+
+def test_automaton_finds_overlapping_patterns_on_word_boundaries():
+    """
+    Tous les motifs sont trouvés en un passage, y compris les suffixes, mais jamais au milieu d'un mot.
+    """
+    automaton = AhoCorasick([("he", 1), ("she", 2), ("hers", 3)])
+
+    assert list(automaton.iter_matches("she hers usher")) == [(0, 3, 2), (4, 8, 3)]
+
+
+def test_skills_match_whole_words_only():
+    """
+    "go" n'est pas trouvé dans "google" ni "java" dans "javascript".
+    """
+    matcher = SkillMatcher(SKILLS, LEVELS)
+
+    skills = by_name(matcher.extract("JavaScript chez Google, C++ et Ruby on Rails"))
+
+    assert set(skills) == {"Javascript", "C++", "Ruby", "Ruby On Rails"}
+
+
+def test_levels_and_years_are_associated_by_position():
+    """
+    Chaque compétence reçoit le niveau le plus proche et la durée écrite juste après elle.
+    """
+    matcher = SkillMatcher(SKILLS, LEVELS)
+    text = (
+        "Python (5 ans) expert. "
+        + "x" * 120
+        + " Docker: 2 ans, Java - 3 years, Go 4 ans. "
+        + "y" * 120
+        + " Ruby depuis 6 ans, beginner"
+    )
+
+    skills = by_name(matcher.extract(text))
+
+    assert skills["Python"]["years_experience"] == 5
+    assert skills["Python"]["level"] == "expert"
+    assert skills["Docker"]["years_experience"] == 2
+    assert skills["Docker"]["level"] == "intermediate"
+    assert skills["Java"]["years_experience"] == 3
+    assert skills["Go"]["years_experience"] == 4
+    assert skills["Ruby"]["years_experience"] is None
+    assert skills["Ruby"]["level"] == "beginner"
+    assert list(skills) == ["Python", "Docker", "Java", "Go", "Ruby"]
+
+
+def test_large_taxonomy_keeps_results_exact():
+    """
+    Un vocabulaire de plusieurs dizaines de milliers de compétences ne change pas les résultats.
+    """
+    taxonomy = {f"skill{i}": "generated" for i in range(50_000)}
+    taxonomy.update(SKILLS)
+    matcher = SkillMatcher(taxonomy, LEVELS)
+
+    skills = by_name(matcher.extract("Python, skill42 et skill49999 (2 ans), pas skill420000"))
+
+    assert set(skills) == {"Python", "Skill42", "Skill49999"}
+    assert skills["Skill49999"]["years_experience"] == 2
@@ -0,0 +1,134 @@
+import io
+import os
+import zipfile
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.adapters.repositories.skill_repository import SQLAlchemySkillRepository
+from app.adapters.services.cv_parsing_executor import CVParsingExecutor
+from app.adapters.services.skill_taxonomy import SkillTaxonomy, load_skill_matcher
+from app.core.entities.skill import SkillCategory, SkillCreate
+from app.infrastructure.database.models import Base, SkillAlias
+
+
+def make_docx(text):
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def taxonomy(session_factory, tmp_path):
+    return SkillTaxonomy(session_factory, cache_dir=str(tmp_path), refresh_interval=3600)
+
+
+@pytest.fixture
+def repository(session_factory, taxonomy):
+    db = session_factory()
+    yield SQLAlchemySkillRepository(db, skill_taxonomy=taxonomy)
+    db.close()
+
+
+async def create_skill(repository, name, category=SkillCategory.DEVOPS):
+    return await repository.create(SkillCreate(name=name, category=category))
+
+
+def skill_names(matcher, text):
+    return {skill["name"] for skill in matcher.extract(text)}
+
+
+@pytest.mark.asyncio
+async def test_matcher_is_compiled_from_skills_and_aliases(taxonomy, repository):
+    """
+    Les compétences de la base et leurs synonymes sont reconnus, sous le nom de la base.
+    """
+    kubernetes = await create_skill(repository, "Kubernetes")
+    await create_skill(repository, "PostgreSQL", SkillCategory.DATABASE)
+    await create_skill(repository, "Terraform")
+    await repository.add_alias(kubernetes.id, "K8s")
+
+    matcher = load_skill_matcher(await taxonomy.matcher_path())
+
+    assert skill_names(matcher, "Terraform, k8s, postgres et Python") == {"Terraform", "Kubernetes", "PostgreSQL", "Python"}
+    assert await repository.get_aliases(kubernetes.id) == ["k8s"]
+
+
+@pytest.mark.asyncio
+async def test_skill_changes_publish_a_new_matcher(taxonomy, repository, session_factory, tmp_path, monkeypatch):
+    """
+    Une modification des compétences publie un nouvel automate ; un autre processus réutilise celui sur disque.
+    """
+    await create_skill(repository, "Terraform")
+    first_path = await taxonomy.matcher_path()
+    assert await taxonomy.matcher_path() == first_path
+
+    ansible = await create_skill(repository, "Ansible")
+    second_path = await taxonomy.matcher_path()
+    assert second_path != first_path
+    assert "Ansible" in skill_names(load_skill_matcher(second_path), "Ansible et Terraform")
+
+    await repository.remove_alias(ansible.id, "absent")
+    assert await taxonomy.matcher_path() == second_path
+
+    restarted = SkillTaxonomy(session_factory, cache_dir=str(tmp_path), refresh_interval=0)
+    monkeypatch.setattr(restarted, "compile", lambda db: pytest.fail("automate recompilé"))
+    assert await restarted.matcher_path() == second_path
+    assert os.path.exists(first_path)
+
+
+@pytest.mark.asyncio
+async def test_retargeted_alias_publishes_a_new_matcher(taxonomy, repository, session_factory):
+    """
+    Un alias rattaché à une autre compétence (même nombre d'alias, même identifiant) change l'empreinte.
+    """
+    kubernetes = await create_skill(repository, "Kubernetes")
+    openshift = await create_skill(repository, "OpenShift")
+    await repository.add_alias(kubernetes.id, "ocp")
+    first_path = await taxonomy.matcher_path()
+
+    db = session_factory()
+    db.query(SkillAlias).filter(SkillAlias.alias == "ocp").update({"skill_id": openshift.id})
+    db.commit()
+    db.close()
+    taxonomy.invalidate()
+
+    second_path = await taxonomy.matcher_path()
+    assert second_path != first_path
+    assert skill_names(load_skill_matcher(second_path), "Migration vers ocp") == {"OpenShift"}
+
+
+@pytest.mark.asyncio
+async def test_pool_processes_reload_the_taxonomy(taxonomy, repository):
+    """
+    Les processus d'analyse chargent l'automate courant sans redémarrer.
+    """
+    executor = CVParsingExecutor(max_workers=1, timeout=10, taxonomy=taxonomy)
+    try:
+        content = make_docx("Infrastructure avec Pulumi et tf")
+        _, cv_data = await executor.parse(content, "docx")
+        assert {skill["name"] for skill in cv_data["skills"]} == set()
+
+        terraform = await create_skill(repository, "Terraform")
+        await create_skill(repository, "Pulumi")
+        await repository.add_alias(terraform.id, "tf")
+
+        _, cv_data = await executor.parse(content, "docx")
+        assert {skill["name"] for skill in cv_data["skills"]} == {"Pulumi", "Terraform"}
+    finally:
+        executor.shutdown()
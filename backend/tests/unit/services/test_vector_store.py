@@ -0,0 +1,131 @@
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from app.adapters.services.vector_store import LocalVectorStore, VectorCollection
+
+
+def random_documents(count, dim=32, seed=0, start=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dim)).astype(np.float32)
+    return [
+        {"id": f"doc-{start + i}", "embedding": vectors[i], "metadata": {"team": "a" if i % 4 == 0 else "b"},
+         "content": f"contenu {start + i}"}
+        for i in range(count)
+    ]
+
+
+def test_store_implements_vector_db_client_contract(tmp_path):
+    """
+    insert / search / get_document / list_documents / delete_document, avec filtres de métadonnées.
+    """
+    store = LocalVectorStore(str(tmp_path))
+    documents = random_documents(20)
+
+    async def scenario():
+        assert (await store.insert("cv_embeddings", documents))["inserted"] == 20
+        hits = await store.search("cv_embeddings", documents[5]["embedding"], limit=3)
+        assert hits[0]["id"] == "doc-5"
+        assert hits[0]["score"] == pytest.approx(1.0, abs=1e-5)
+        assert hits[0]["content"] == "contenu 5"
+
+        filtered = await store.search("cv_embeddings", documents[5]["embedding"], filters={"team": "a"}, limit=20)
+        assert {hit["id"] for hit in filtered} == {f"doc-{i}" for i in range(0, 20, 4)}
+
+        assert await store.delete_document("cv_embeddings", "doc-5")
+        assert await store.get_document("cv_embeddings", "doc-5") is None
+        assert len(await store.list_documents("cv_embeddings", {"team": "b"})) == 14
+
+    asyncio.run(scenario())
+
+
+def test_collection_is_reloaded_from_disk_without_rebuilding(tmp_path):
+    """
+    Vecteurs projetés en mémoire, journal rejoué dans l'ordre et index IVF relu au redémarrage.
+    """
+    collection = VectorCollection("cvs", tmp_path / "cvs", ivf_threshold=200, nprobe=4)
+    documents = random_documents(300)
+    collection.add(documents)
+    collection.delete(["doc-1"])
+    collection.add([{**documents[2], "content": "remplacé"}])
+    assert collection.indexed
+    collection.close()
+
+    reloaded = VectorCollection("cvs", tmp_path / "cvs", ivf_threshold=200, nprobe=4)
+
+    assert len(reloaded) == 299
+    assert reloaded.indexed
+    assert isinstance(reloaded._vectors, np.memmap)
+    assert reloaded.get("doc-1") is None
+    assert reloaded.get("doc-2")["content"] == "remplacé"
+    assert reloaded.search(documents[42]["embedding"], limit=1)[0]["id"] == "doc-42"
+
+
+def test_ivf_search_keeps_high_recall():
+    """
+    Au-delà du seuil, la recherche IVF retrouve l'essentiel des voisins exacts.
+    """
+    rng = np.random.default_rng(1)
+    centers = rng.normal(size=(50, 32))
+    vectors = centers[rng.integers(0, 50, size=5000)] + 0.3 * rng.normal(size=(5000, 32))
+    collection = VectorCollection("ivf", ivf_threshold=1000, nprobe=8)
+    collection.add([{"id": str(i), "embedding": vector} for i, vector in enumerate(vectors)])
+    exact = VectorCollection("exact", ivf_threshold=10**9)
+    exact.add([{"id": str(i), "embedding": vector} for i, vector in enumerate(vectors)])
+
+    recall = []
+    for query in rng.normal(size=(20, 32)) + centers[:20]:
+        expected = {hit["id"] for hit in exact.search(query, limit=10)}
+        found = {hit["id"] for hit in collection.search(query, limit=10)}
+        recall.append(len(expected & found) / 10)
+
+    assert collection.indexed
+    assert np.mean(recall) >= 0.9
+
+
+def test_compaction_swaps_the_directory_and_recovers_after_a_crash(tmp_path, monkeypatch):
+    """
+    La compaction remplace la collection d'un bloc ; un arrêt entre les deux renommages est réparé au chargement.
+    """
+    collection = VectorCollection("cvs", tmp_path / "cvs")
+    documents = random_documents(20)
+    collection.add(documents)
+    collection.delete([f"doc-{i}" for i in range(10)])
+    collection.compact()
+
+    assert len(collection) == 10
+    assert collection.get("doc-15")["content"] == "contenu 15"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cvs", "cvs.lock"]
+
+    collection.delete(["doc-10"])
+    replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda src, dst: replace(src, dst) if str(dst).endswith(".old")
+                        else pytest.fail("arrêt"))
+    with pytest.raises(pytest.fail.Exception):
+        collection.compact()
+    monkeypatch.setattr(os, "replace", replace)
+    collection.close()
+
+    reloaded = VectorCollection("cvs", tmp_path / "cvs")
+    assert len(reloaded) == 9
+    assert reloaded.search(documents[12]["embedding"], limit=1)[0]["id"] == "doc-12"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cvs", "cvs.lock"]
+
+
+def test_only_one_process_writes_to_a_collection(tmp_path):
+    """
+    Une seconde écriture concurrente sur la même collection est refusée ; la lecture reste possible.
+    """
+    writer = VectorCollection("cvs", tmp_path / "cvs")
+    writer.add(random_documents(3))
+    other = VectorCollection("cvs", tmp_path / "cvs")
+
+    assert len(other) == 3
+    with pytest.raises(RuntimeError):
+        other.add(random_documents(1, start=3))
+
+    writer.close()
+    other.add(random_documents(1, start=3))
+    assert len(other) == 4
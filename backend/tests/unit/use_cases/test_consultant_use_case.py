@@ -181,4 +181,31 @@ async def test_update_consultant_photo_url(consultant_use_case, mock_repositorie
     
     # Assert
     mock_repositories["consultant_repository"].update.assert_called_once_with(consultant_id, update_data)
-    assert result.photo_url == new_photo_url
\ No newline at end of file
+    assert result.photo_url == new_photo_url
+
+
+@pytest.mark.asyncio
+async def test_add_consultant_skill_refreshes_match_scores(mock_repositories):
+    """
+    Test de maintenance de la matrice des scores.
+    Vérifie que l'ajout d'une compétence recalcule la ligne du consultant.
+    """
+    # Arrange
+    matchmaking_service = AsyncMock()
+    use_case = ConsultantUseCase(
+        consultant_repository=mock_repositories["consultant_repository"],
+        skill_repository=mock_repositories["skill_repository"],
+        user_repository=mock_repositories["user_repository"],
+        company_repository=mock_repositories["company_repository"],
+        matchmaking_service=matchmaking_service
+    )
+    mock_repositories["consultant_repository"].get_by_id.return_value = MagicMock(id=1)
+    mock_repositories["skill_repository"].get_by_id.return_value = MagicMock(id=2)
+    mock_repositories["consultant_repository"].add_skill.return_value = True
+    
+    # Act
+    result = await use_case.add_consultant_skill(1, 2, "expert")
+    
+    # Assert
+    assert result is True
+    matchmaking_service.refresh_consultant_scores.assert_awaited_once_with(1)